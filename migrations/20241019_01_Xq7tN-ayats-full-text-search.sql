@@ -0,0 +1,32 @@
+-- The MIT License (MIT)
+-- Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+--
+-- Permission is hereby granted, free of charge, to any person obtaining a copy
+-- of this software and associated documentation files (the "Software"), to deal
+-- in the Software without restriction, including without limitation the rights
+-- to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+-- copies of the Software, and to permit persons to whom the Software is
+-- furnished to do so, subject to the following conditions:
+--
+-- The above copyright notice and this permission notice shall be included in all
+-- copies or substantial portions of the Software.
+--
+-- THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+-- EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+-- MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+-- IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+-- DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+-- OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+-- OR OTHER DEALINGS IN THE SOFTWARE.
+
+-- Ayats full text search
+-- depends: 20241018_01_Kd3mR-mailing-checkpoints
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE ayats
+ADD COLUMN content_tsv tsvector GENERATED ALWAYS AS (to_tsvector('russian', content)) STORED;
+
+CREATE INDEX ayats_content_tsv_idx ON ayats USING gin (content_tsv);
+
+CREATE INDEX ayats_content_trgm_idx ON ayats USING gin (content gin_trgm_ops);
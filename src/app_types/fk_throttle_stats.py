@@ -0,0 +1,63 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from app_types.throttle_stats import ThrottleStats
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class FkThrottleStats(ThrottleStats):
+    """Фейковая статистика ограничения частоты запросов."""
+
+    _throttled: int = 0
+    _waited: float = 0
+    _retried: int = 0
+
+    @override
+    def throttled(self) -> int:
+        """Кол-во запросов, ожидавших разрешения.
+
+        :return: int
+        """
+        return self._throttled
+
+    @override
+    def waited(self) -> float:
+        """Суммарное время ожидания в секундах.
+
+        :return: float
+        """
+        return self._waited
+
+    @override
+    def retried(self) -> int:
+        """Кол-во повторов после ответа 429.
+
+        :return: int
+        """
+        return self._retried
@@ -26,6 +26,7 @@ import attrs
 import ujson
 from pyeo import elegant
 
+from app_types.parsed_tg_update import ParsedTgUpdate
 from app_types.stringable import SupportsStr
 from app_types.update import Update
 
@@ -61,3 +62,11 @@ class FkUpdate(Update):
         :return: dict
         """
         return ujson.loads(str(self._raw))
+
+    @override
+    def parsed(self) -> ParsedTgUpdate:
+        """Разобранное обновление.
+
+        :return: ParsedTgUpdate
+        """
+        return ParsedTgUpdate.dict_ctor(self.asdict())
@@ -0,0 +1,105 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+# flake8: noqa: WPS226
+
+from typing import Final, final
+
+import attrs
+
+# Атрибут -> путь от любого узла обновления. Соответствует запросам вида '$..message.text'
+_PATHS: Final = (
+    ('update_id', ('update_id',)),
+    ('chat_id', ('chat', 'id')),
+    ('from_id', ('from', 'id')),
+    ('message_id', ('message', 'message_id')),
+    ('message_text', ('message', 'text')),
+    ('message_audio', ('message', 'audio')),
+    ('callback_query_data', ('callback_query', 'data')),
+    ('inline_query_id', ('inline_query', 'id')),
+    ('inline_query', ('query',)),
+    ('latitude', ('latitude',)),
+    ('longitude', ('longitude',)),
+    ('date', ('date',)),
+)
+
+
+@final
+@attrs.define(frozen=True, slots=True)
+class ParsedTgUpdate:
+    """Разобранное обновление от телеграма.
+
+    Значения извлекаются один раз при создании объекта
+    и совпадают с первым результатом поиска '$..<путь>' по обновлению.
+    Отсутствующие значения равны None.
+    """
+
+    update_id: int | None = None
+    chat_id: int | None = None
+    from_id: int | None = None
+    message_id: int | None = None
+    message_text: str | None = None
+    message_audio: dict | None = None
+    callback_query_data: str | None = None
+    inline_query_id: str | None = None
+    inline_query: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    date: int | None = None
+    is_callback_query: bool = False
+
+    @classmethod
+    def dict_ctor(cls, update_dict: dict) -> 'ParsedTgUpdate':
+        """Конструктор для словаря.
+
+        :param update_dict: dict
+        :return: ParsedTgUpdate
+        """
+        found: dict = {}
+        cls._walk(update_dict, found)
+        return cls(**found, is_callback_query='callback_query' in update_dict)
+
+    @classmethod
+    def _walk(cls, node: object, found: dict) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_walk"
+        if isinstance(node, list):
+            for elem in node:
+                cls._walk(elem, found)
+        if not isinstance(node, dict):
+            return
+        for name, path in _PATHS:
+            if name not in found:
+                path_value = cls._path_value(node, path)
+                if path_value is not None:
+                    found[name] = path_value
+        for child in node.values():
+            cls._walk(child, found)
+
+    @classmethod
+    def _path_value(cls, node: dict, path: tuple[str, ...]) -> object:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_path_value"
+        path_value: object = node
+        for key in path:
+            if not isinstance(path_value, dict):
+                return None
+            path_value = path_value.get(key)
+        return path_value
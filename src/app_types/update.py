@@ -24,6 +24,7 @@ from typing import Protocol
 
 from pyeo import elegant
 
+from app_types.parsed_tg_update import ParsedTgUpdate
 from app_types.stringable import SupportsStr
 
 
@@ -36,3 +37,6 @@ class Update(SupportsStr, Protocol):
 
     def asdict(self) -> dict:
         """Словарь."""
+
+    def parsed(self) -> ParsedTgUpdate:
+        """Разобранное обновление."""
@@ -0,0 +1,97 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+"""Замер пропускной способности проверки событий по схеме.
+
+Запуск: python src/benchmarks/event_validation.py
+"""
+
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+import ujson
+from eljson.json_doc import JsonDoc
+from quranbot_schema_registry import validate_schema
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from services.json_path_cache import JsonPathCache  # noqa: E402
+from srv.events.cached_schema_validation import CachedSchemaValidation  # noqa: E402
+from srv.events.compiled_paths_json import CompiledPathsJson  # noqa: E402
+
+ITERATIONS = 5000
+JSON_PATH_CACHE_SIZE = 256
+RAW_EVENT = ujson.dumps({
+    'event_id': 'e7b8c1d2-5a4f-4c3e-9b1a-2f6d8e0c4a71',
+    'event_version': 1,
+    'event_name': 'Messages.Created',
+    'event_time': '1700000000',
+    'producer': 'quranbot',
+    'data': {
+        'messages': [
+            {
+                'message_json': '{}',  # noqa: P103 it is empty json
+                'is_unknown': False,
+                'trigger_message_id': None,
+                'trigger_callback_id': None,
+                'mailing_id': None,
+            }
+            for _ in range(10)
+        ],
+    },
+})
+
+
+def _events_per_second(started: float) -> str:
+    return '{0:.0f} events/s'.format(ITERATIONS / (time.perf_counter() - started))
+
+
+def main() -> None:
+    """Точка входа."""
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(ITERATIONS):
+            body_json = JsonDoc.from_string(RAW_EVENT)  # type: ignore [no-untyped-call]
+            validate_schema(
+                ujson.loads(RAW_EVENT),
+                body_json.path('$.event_name')[0],
+                body_json.path('$.event_version')[0],
+            )
+    sys.stdout.write('validate_schema: {0}\n'.format(_events_per_second(started)))
+    validation = CachedSchemaValidation()
+    json_paths = JsonPathCache(JSON_PATH_CACHE_SIZE)
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):  # noqa: WPS440
+        body = ujson.loads(RAW_EVENT)
+        body_json = CompiledPathsJson(body, json_paths)  # noqa: WPS440
+        validation.validate(
+            body,
+            body_json.path('$.event_name')[0],
+            body_json.path('$.event_version')[0],
+        )
+    sys.stdout.write('CachedSchemaValidation: {0}\n'.format(_events_per_second(started)))
+
+
+if __name__ == '__main__':
+    main()
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -34,6 +33,7 @@ from app_types.supports_bool import SupportsBool
 from app_types.update import Update
 from integrations.tg.message_text import MessageText
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from services.regular_expression import IntableRegularExpression
 from srv.podcasts.markupped_podcast_answer import MarkuppedPodcastAnswer
 from srv.podcasts.pg_podcast import PgPodcast
@@ -53,11 +53,11 @@ class ConcretePodcastAnswer(TgAnswer):
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Трансформация в ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         podcast = PgPodcast(
             FkAsyncInt(IntableRegularExpression(str(MessageText(update)))),
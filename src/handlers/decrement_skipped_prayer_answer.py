@@ -23,7 +23,6 @@
 from typing import final
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 
@@ -34,6 +33,7 @@ from integrations.tg.callback_query import CallbackQueryData
 from integrations.tg.message_id import TgMessageId
 from integrations.tg.tg_answers import TgAnswer, TgAnswerMarkup, TgAnswerToSender, TgMessageIdAnswer, TgTextAnswer
 from integrations.tg.tg_answers.edit_message_text import TgEditMessageText
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from srv.prayers.pg_new_prayers_at_user import PgNewPrayersAtUser
 
@@ -47,11 +47,11 @@ class DecrementSkippedPrayerAnswer(TgAnswer):
     _empty_answer: TgAnswer
     _pgsql: Database
 
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         query = '\n'.join([
             'UPDATE prayers_at_user AS pau',
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -32,9 +31,11 @@ from app_types.logger import LogSink
 from app_types.supports_bool import SupportsBool
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer, TgAnswerToSender, TgMessageAnswer, TgTextAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from services.answers.change_state_answer import ChangeStateAnswer
 from srv.ayats.favorite_ayat_answer import FavoriteAyatAnswer
 from srv.ayats.favorite_ayat_empty_safe import FavoriteAyatEmptySafeAnswer
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.users.user_step import UserStep
 
 
@@ -46,16 +47,17 @@ class FavoriteAyatsAnswer(TgAnswer):
 
     _debug_mode: SupportsBool
     _pgsql: Database
+    _corpus: QuranCorpus
     _redis: Redis
     _empty_answer: TgAnswer
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         answer_to_sender = TgAnswerToSender(TgMessageAnswer(self._empty_answer))
         return await ChangeStateAnswer(
@@ -64,6 +66,7 @@ class FavoriteAyatsAnswer(TgAnswer):
                     self._debug_mode,
                     self._empty_answer,
                     self._pgsql,
+                    self._corpus,
                 ),
                 TgTextAnswer.str_ctor(
                     answer_to_sender,
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -31,12 +30,14 @@ from redis.asyncio import Redis
 from app_types.logger import LogSink
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer, TgAnswerMarkup, TgAnswerToSender, TgHtmlParseAnswer, TgMessageAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from services.answers.default_keyboard import DefaultKeyboard
 from services.answers.resized_keyboard import ResizedKeyboard
 from services.reset_state_answer import ResetStateAnswer
 from settings import Settings
 from srv.admin_messages.pg_admin_message import PgAdminMessage
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.events.sink import Sink
 from srv.start.new_tg_user import NewTgUser
 from srv.start.start_answer import StartAnswer
@@ -53,6 +54,7 @@ class FullStartAnswer(TgAnswer):
     """Ответ на команду /start."""
 
     _pgsql: Database
+    _corpus: QuranCorpus
     _empty_answer: TgAnswer
     _event_sink: Sink
     _redis: Redis
@@ -60,11 +62,11 @@ class FullStartAnswer(TgAnswer):
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         answer_to_sender = TgAnswerToSender(TgMessageAnswer(self._empty_answer))
         return await ResetStateAnswer(
@@ -83,6 +85,7 @@ class FullStartAnswer(TgAnswer):
                                 update,
                             ),
                             self._pgsql,
+                            self._corpus,
                             self._settings.admin_chat_ids(),
                         ),
                         answer_to_sender,
@@ -23,12 +23,12 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.exceptions.update_parse_exceptions import MessageTextNotFoundError
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -41,11 +41,11 @@ class MessageNotFoundSafeAnswer(TgAnswer):
     _new_message_answer: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         try:
             return await self._origin.build(update)
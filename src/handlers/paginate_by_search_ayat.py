@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -32,10 +31,13 @@ from app_types.logger import LogSink
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer, TgMessageAnswer, TgTextAnswer
 from integrations.tg.tg_answers.answer_to_sender import TgAnswerToSender
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from settings import Settings
 from srv.ayats.ayat_text_search_query import AyatTextSearchQuery
+from srv.ayats.ayats_search import AyatsSearch
 from srv.ayats.highlighted_search_answer import HighlightedSearchAnswer
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.search_ayat_by_text_callback_answer import SearchAyatByTextCallbackAnswer
 from srv.ayats.user_has_not_search_query_safe_answer import UserHasNotSearchQuerySafeAnswer
 
@@ -49,15 +51,17 @@ class PaginateBySearchAyat(TgAnswer):
     _empty_answer: TgAnswer
     _redis: Redis
     _pgsql: Database
+    _corpus: QuranCorpus
+    _search: AyatsSearch
     _settings: Settings
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await UserHasNotSearchQuerySafeAnswer(
             HighlightedSearchAnswer(
@@ -66,6 +70,8 @@ class PaginateBySearchAyat(TgAnswer):
                     self._empty_answer,
                     self._redis,
                     self._pgsql,
+                    self._corpus,
+                    self._search,
                     self._logger,
                 ),
                 AyatTextSearchQuery(self._redis, TgChatId(update), self._logger),
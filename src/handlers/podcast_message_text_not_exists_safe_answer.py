@@ -23,12 +23,11 @@
 from typing import final
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers.tg_answer import TgAnswer
-from services.match_many_json_path import MatchManyJsonPath
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -40,21 +39,13 @@ class PodcastMessageTextNotExistsSafeAnswer(TgAnswer):
     _edited_markup_answer: TgAnswer
     _new_podcast_message_answer: TgAnswer
 
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Трансформация в ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
-        try:
-            return await self._message_text_exists_case(update)
-        except ValueError:
+        parsed_update = update.parsed()
+        if parsed_update.message_text is None and parsed_update.message_audio is None:
             return await self._new_podcast_message_answer.build(update)
-
-    async def _message_text_exists_case(self, update: Update) -> list[httpx.Request]:
-        # TODO #802 Удалить или задокументировать необходимость приватного метода "_message_text_exists_case"
-        MatchManyJsonPath(
-            update.asdict(),
-            ('$..message.text', '$..message.audio'),
-        ).evaluate()
         return await self._edited_markup_answer.build(update)
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -38,6 +37,7 @@ from integrations.tg.message_id import TgMessageId
 from integrations.tg.tg_answers import TgAnswerToSender, TgKeyboardEditAnswer, TgMessageIdAnswer
 from integrations.tg.tg_answers.markup_answer import TgAnswerMarkup
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from services.reset_state_answer import ResetStateAnswer
 from srv.podcasts.markupped_podcast_answer import MarkuppedPodcastAnswer
@@ -63,11 +63,11 @@ class PodcastReactionChangeAnswer(TgAnswer):
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Трансформация в ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         reaction = ParsedPodcastReaction(CallbackQueryData(update))
         podcast = PgPodcast(
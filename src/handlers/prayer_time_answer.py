@@ -24,7 +24,6 @@ from collections.abc import Sequence
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -44,6 +43,7 @@ from integrations.tg.tg_answers import (
     TgTextAnswer,
 )
 from integrations.tg.tg_answers.message_answer_to_sender import TgHtmlMessageAnswerToSender
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from services.user_prayer_keyboard import UserPrayersKeyboard
 from settings import Settings
@@ -154,11 +154,11 @@ class PrayerTimeAnswer(TgAnswer):
         )
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await UserWithoutCitySafeAnswer(
             PrayersExpiredAnswer(
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -32,10 +31,13 @@ from app_types.logger import LogSink
 from app_types.supports_bool import SupportsBool
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer, TgMessageRegexAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from srv.ayats.ayat_text_search_query import AyatTextSearchQuery
+from srv.ayats.ayats_search import AyatsSearch
 from srv.ayats.cached_ayat_search_query import CachedAyatSearchQueryAnswer
 from srv.ayats.highlighted_search_answer import HighlightedSearchAnswer
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.search_ayat_by_text import SearchAyatByTextAnswer
 
 
@@ -49,14 +51,16 @@ class SearchAyatByKeywordAnswer(TgAnswer):
     _empty_answer: TgAnswer
     _redis: Redis
     _pgsql: Database
+    _corpus: QuranCorpus
+    _search: AyatsSearch
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await TgMessageRegexAnswer(
             '.+',
@@ -67,6 +71,8 @@ class SearchAyatByKeywordAnswer(TgAnswer):
                         self._empty_answer,
                         self._redis,
                         self._pgsql,
+                        self._corpus,
+                        self._search,
                         self._logger,
                     ),
                     self._redis,
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -33,10 +32,12 @@ from app_types.supports_bool import SupportsBool
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer, TgAnswerToSender, TgAudioAnswer
 from integrations.tg.tg_answers.message_answer_to_sender import TgHtmlMessageAnswerToSender
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from services.reset_state_answer import ResetStateAnswer
 from srv.ayats.ayat_by_sura_ayat_num_answer import AyatBySuraAyatNumAnswer
 from srv.ayats.ayat_not_found_safe_answer import AyatNotFoundSafeAnswer
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.sura_not_found_safe_answer import SuraNotFoundSafeAnswer
 from srv.users.cached_user_state import CachedUserState
 from srv.users.redis_user_state import RedisUserState
@@ -52,14 +53,15 @@ class SearchAyatByNumbersAnswer(TgAnswer):
     _empty_answer: TgAnswer
     _redis: Redis
     _pgsql: Database
+    _corpus: QuranCorpus
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await ResetStateAnswer(
             SuraNotFoundSafeAnswer(
@@ -69,6 +71,7 @@ class SearchAyatByNumbersAnswer(TgAnswer):
                         self._empty_answer,
                         TgAnswerToSender(TgAudioAnswer(self._empty_answer)),
                         self._pgsql,
+                        self._corpus,
                     ),
                     TgHtmlMessageAnswerToSender(self._empty_answer),
                 ),
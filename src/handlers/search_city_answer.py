@@ -37,6 +37,7 @@ from integrations.tg.tg_answers import TgAnswerFork, TgAnswerToSender, TgMessage
 from integrations.tg.tg_answers.location_answer import TgLocationAnswer
 from integrations.tg.tg_answers.skip_not_processable import TgSkipNotProcessable
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from integrations.tg.tg_message_coordinates import TgMessageCoordinates
 from services.reset_state_answer import ResetStateAnswer
@@ -58,22 +59,23 @@ class SearchCityAnswer(TgAnswer):
 
     _pgsql: Database
     _empty_answer: TgAnswer
+    _http_client: httpx.AsyncClient
     _debug_mode: SupportsBool
     _redis: Redis
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Обработка запроса.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         answer_to_sender = TgAnswerToSender(TgMessageAnswer(self._empty_answer))
         try:
             city = PgCity.name_ctor(str(MessageText(update)), self._pgsql)
         except MessageTextNotFoundError:
-            city = PgCity.location_ctor(TgMessageCoordinates(update), self._pgsql)
+            city = PgCity.location_ctor(TgMessageCoordinates(update), self._http_client, self._pgsql)
         return await UserNotRegisteredSafeAnswer(
             PgNewUser.ctor(TgChatId(update), self._pgsql, self._logger),
             TgSkipNotProcessable(
@@ -23,7 +23,6 @@
 from typing import Final, final
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 
@@ -31,6 +30,7 @@ from app_types.update import Update
 from handlers.prayers_statistic import PrayersStatistic
 from handlers.skipped_prayers_keyboard import SkippedPrayersKeyboard
 from integrations.tg.tg_answers import TgAnswer, TgAnswerMarkup, TgAnswerToSender, TgMessageAnswer, TgTextAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from srv.prayers.pg_new_prayers_at_user import PgNewPrayersAtUser
 
@@ -46,11 +46,11 @@ class SkippedPrayersAnswer(TgAnswer):
     _empty_answer: TgAnswer
     _pgsql: Database
 
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await TgAnswerMarkup(
             TgTextAnswer(
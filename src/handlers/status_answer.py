@@ -24,7 +24,6 @@ import time
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -33,6 +32,7 @@ from app_types.millis import Millis
 from app_types.rounded_float import RoundedFloat
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer, TgAnswerToSender, TgMessageAnswer, TgTextAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -46,11 +46,11 @@ class StatusAnswer(TgAnswer):
     _redis: Redis
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await TgTextAnswer.str_ctor(
             TgAnswerToSender(
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -32,6 +31,7 @@ from app_types.logger import LogSink
 from app_types.update import Update
 from handlers.prayer_time_answer import PrayerTimeAnswer
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from settings import Settings
 from srv.prayers.prayer_status import PrayerStatus
 from srv.prayers.user_prayer_status import UserPrayerStatus
@@ -50,11 +50,11 @@ class UserPrayerStatusChangeAnswer(TgAnswer):
     _settings: Settings
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Обработка запроса.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         prayer_status = PrayerStatus.update_ctor(update)
         await UserPrayerStatus(self._pgsql).change(prayer_status)
@@ -37,6 +37,7 @@ class NominatimCityName(CityName):
     """Интеграция с https://nominatim.openstreetmap.org ."""
 
     _coordinates: Coordinates
+    _http_client: httpx.AsyncClient
 
     @override
     async def to_str(self) -> str:
@@ -51,6 +52,5 @@ class NominatimCityName(CityName):
             latitude=self._coordinates.latitude(),
             longitude=self._coordinates.longitude(),
         )
-        async with httpx.AsyncClient() as http_client:
-            response = await http_client.get(url)
+        response = await self._http_client.get(url)
         return response.json()['address']['city']
@@ -0,0 +1,77 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import time
+from collections import deque
+from functools import partial
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from integrations.tg.concurrency_limit import ConcurrencyLimit
+
+
+@final
+@attrs.define(slots=True)
+@elegant
+class AimdConcurrencyLimit(ConcurrencyLimit):
+    """Лимит одновременных запросов по схеме AIMD (additive increase/multiplicative decrease).
+
+    Быстрый успешный ответ увеличивает лимит на 1/лимит, т.е. примерно на единицу за "поколение" запросов.
+    Ответ 429 или таймаут уменьшают лимит в `decrease` раз, но не чаще раза в `target_latency` секунд,
+    чтобы пачка ошибок от одного поколения запросов не сбрасывала лимит до минимума.
+    Медленный успешный ответ и ответ, ждавший в очереди лимитов транспорта, лимит не меняют:
+    больше одновременных запросов тут не помогут.
+    """
+
+    _min: int
+    _max: int
+    _target_latency: float
+    _limit: float
+    _decrease: float = 0.5
+    _decreased_at: deque[float] = attrs.field(factory=partial(deque, (0,), maxlen=1))
+
+    @override
+    def current(self) -> int:
+        """Текущий лимит.
+
+        :return: int
+        """
+        return int(self._limit)
+
+    @override
+    def record(self, latency: float, *, ok: bool, throttled: bool) -> None:
+        """Учесть результат запроса.
+
+        :param latency: float - время выполнения запроса в секундах
+        :param ok: bool - запрос выполнен без ограничения частоты и таймаута
+        :param throttled: bool - запрос ждал в очереди лимитов транспорта
+        """
+        if not ok:
+            now = time.monotonic()
+            if now - self._decreased_at[0] >= self._target_latency:
+                self._limit = max(self._min, self._limit * self._decrease)
+                self._decreased_at.append(now)
+            return
+        if not throttled and latency <= self._target_latency:
+            self._limit = min(self._max, self._limit + 1 / self._limit)
@@ -39,6 +39,7 @@ class AppWithGetMe(Runable):
 
     _origin: Runable
     _token: str
+    _http_client: httpx.AsyncClient
     _logger: LogSink
 
     @override
@@ -47,9 +48,8 @@ class AppWithGetMe(Runable):
 
         :raises InternalBotError: в случае не успешного запроса к getMe
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get('https://api.telegram.org/bot{0}/getMe'.format(self._token))
-            if response.status_code != httpx.codes.OK:
-                raise InternalBotError(response.text)
-            self._logger.info(response.content)
+        response = await self._http_client.get('https://api.telegram.org/bot{0}/getMe'.format(self._token))
+        if response.status_code != httpx.codes.OK:
+            raise InternalBotError(response.text)
+        self._logger.info(response.content)
         await self._origin.run()
@@ -0,0 +1,67 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+import httpx
+from pyeo import elegant
+
+from app_types.logger import LogSink
+from app_types.runable import Runable
+from exceptions.base_exception import InternalBotError
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class AppWithSetWebhook(Runable):
+    """Объект для запуска с предварительной регистрацией webhook.
+
+    Если адрес не указан, регистрация пропускается (webhook настроен вручную)
+    """
+
+    _origin: Runable
+    _token: str
+    _url: str
+    _secret: str
+    _http_client: httpx.AsyncClient
+    _logger: LogSink
+
+    @override
+    async def run(self) -> None:
+        """Запуск.
+
+        :raises InternalBotError: в случае не успешного запроса к setWebhook
+        """
+        if self._url:
+            webhook_params = {'url': self._url}
+            if self._secret:
+                webhook_params['secret_token'] = self._secret
+            response = await self._http_client.post(
+                'https://api.telegram.org/bot{0}/setWebhook'.format(self._token),
+                json=webhook_params,
+            )
+            if response.status_code != httpx.codes.OK:
+                raise InternalBotError(response.text)
+            self._logger.info('Webhook registered: {0}'.format(response.text))
+        await self._origin.run()
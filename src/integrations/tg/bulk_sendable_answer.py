@@ -21,15 +21,19 @@
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
 import asyncio
+from collections.abc import Sequence
 from itertools import chain
 from typing import final, override
 
 import attrs
-from more_itertools import distribute
+import httpx
 from pyeo import elegant
 
 from app_types.logger import LogSink
+from app_types.throttle_stats import ThrottleStats
 from app_types.update import Update
+from integrations.tg.concurrency_limit import ConcurrencyLimit
+from integrations.tg.limit_recorded_sendable import LimitRecordedSendable
 from integrations.tg.sendable import Sendable
 from integrations.tg.sendable_answer import SendableAnswer
 from integrations.tg.tg_answers.tg_answer import TgAnswer
@@ -40,9 +44,18 @@ from integrations.tg.user_not_subscribed_safe_sendable import UserNotSubscribedS
 @attrs.define(frozen=True)
 @elegant
 class BulkSendableAnswer(Sendable):
-    """Массовая отправка."""
+    """Массовая отправка.
 
-    _answers: list[TgAnswer]
+    Одновременно выполняется не больше запросов, чем разрешает `limit`,
+    лимит подстраивается по результату каждой отправки (LimitRecordedSendable).
+    Ошибка одной отправки не отменяет остальные, после завершения всех отправок пробрасывается первая ошибка.
+    Ответы возвращаются в порядке ответов на входе.
+    """
+
+    _answers: Sequence[TgAnswer]
+    _http_client: httpx.AsyncClient
+    _limit: ConcurrencyLimit
+    _throttle_stats: ThrottleStats
     _logger: LogSink
 
     @override
@@ -51,15 +64,51 @@ class BulkSendableAnswer(Sendable):
 
         :param update: Update
         :return: list[dict]
+        :raises Exception: первая ошибка отправки после завершения всех отправок
+
+        # noqa: DAR401 errors[]
+        # noqa: DAR402 Exception
         """
-        tasks = [
-            UserNotSubscribedSafeSendable(
-                SendableAnswer(answer, self._logger),
+        responses: list[list[dict]] = [[] for _ in self._answers]
+        errors: list[Exception] = []
+        async with asyncio.TaskGroup() as task_group:
+            await self._started(task_group, update, responses, errors)
+        if errors:
+            raise errors[0]
+        return list(chain.from_iterable(responses))
+
+    async def _started(
+        self,
+        task_group: asyncio.TaskGroup,
+        update: Update,
+        responses: list[list[dict]],
+        errors: list[Exception],
+    ) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_started"
+        in_flight: set[asyncio.Task] = set()
+        for idx, answer in enumerate(self._answers):
+            while len(in_flight) >= max(self._limit.current(), 1):
+                _, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            sent = self._sent(answer, update, responses, idx, errors)
+            in_flight.add(task_group.create_task(sent))
+
+    async def _sent(  # noqa: PLR0913
+        self,
+        answer: TgAnswer,
+        update: Update,
+        responses: list[list[dict]],
+        idx: int,
+        errors: list[Exception],
+    ) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_sent"
+        try:
+            responses[idx] = await LimitRecordedSendable(
+                UserNotSubscribedSafeSendable(
+                    SendableAnswer(answer, self._http_client, self._logger),
+                ),
+                self._limit,
+                self._throttle_stats,
             ).send(update)
-            for answer in self._answers
-        ]
-        responses: list[dict] = []
-        for sendable_slice in distribute(10, tasks):
-            res_list = await asyncio.gather(*sendable_slice)
-            responses.extend(list(chain.from_iterable(res_list)))
-        return responses
+        except Exception as err:  # noqa: BLE001 pylint: disable=broad-exception-caught
+            # Other sends of the batch must finish, the error is raised after them
+            errors.append(err)
@@ -26,13 +26,14 @@ from typing import TypedDict, final, override
 
 from pyeo import elegant
 
+from app_types.parsed_tg_update import ParsedTgUpdate
 from app_types.update import Update
 
 
 class _CacheDict(TypedDict):
 
     str: str
-    parsed: None
+    parsed: ParsedTgUpdate | None
     asdict: dict
 
 
@@ -72,3 +73,15 @@ class CachedTgUpdate(Update):
         if not self._cache['asdict']:
             self._cache['asdict'] = self._origin.asdict()
         return self._cache['asdict']
+
+    @override
+    def parsed(self) -> ParsedTgUpdate:
+        """Разобранное обновление.
+
+        :return: ParsedTgUpdate
+        """
+        parsed_update = self._cache['parsed']
+        if parsed_update is None:
+            parsed_update = self._origin.parsed()
+            self._cache['parsed'] = parsed_update
+        return parsed_update
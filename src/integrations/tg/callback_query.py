@@ -28,8 +28,6 @@ from pyeo import elegant
 from app_types.stringable import SupportsStr
 from app_types.update import Update
 from integrations.tg.exceptions.update_parse_exceptions import CallbackQueryNotFoundError
-from services.err_redirect_json_path import ErrRedirectJsonPath
-from services.json_path_value import JsonPathValue
 
 
 @final
@@ -45,13 +43,9 @@ class CallbackQueryData(SupportsStr):
         """Строковое представление.
 
         :return: str
+        :raises CallbackQueryNotFoundError: если в обновлении нет данных с кнопки
         """
-        return str(
-            ErrRedirectJsonPath(
-                JsonPathValue(
-                    self._update.asdict(),
-                    '$..callback_query.data',
-                ),
-                CallbackQueryNotFoundError(),
-            ).evaluate(),
-        )
+        callback_query_data = self._update.parsed().callback_query_data
+        if callback_query_data is None:
+            raise CallbackQueryNotFoundError
+        return str(callback_query_data)
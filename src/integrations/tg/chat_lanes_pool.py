@@ -0,0 +1,113 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from collections import deque
+from typing import final, override
+
+from pyeo import elegant
+
+from app_types.flushable import Flushable
+from app_types.logger import LogSink
+from app_types.update import Update
+from integrations.tg.chat_lane_key import ChatLaneKey
+from integrations.tg.sendable import Sendable
+from integrations.tg.updates_pool import UpdatesPool
+
+
+@final
+@elegant
+class ChatLanesPool(UpdatesPool, Flushable):
+    """Конкурентная обработка обновлений с сохранением порядка внутри чата.
+
+    Обновления одного чата обрабатываются последовательно,
+    обновления разных чатов - параллельно.
+    Одновременно в обработке (или в очереди чата) находится не более `concurrency` обновлений,
+    при достижении лимита `dispatch` ожидает освобождения места, тем самым
+    приостанавливая получение новых обновлений.
+    При остановке приложения `flush` дожидается обработки принятых обновлений.
+    Ошибка `sendable` останавливает очередь чата, поэтому ошибки обработки
+    обновления должны перехватываться декоратором (`ExceptionLoggedSendable`).
+    """
+
+    def __init__(self, sendable: Sendable, concurrency: int, shutdown_timeout: float, logger: LogSink) -> None:
+        """Ctor.
+
+        :param sendable: Sendable
+        :param concurrency: int - максимальное кол-во обновлений в обработке
+        :param shutdown_timeout: float - сколько ждать обработки обновлений при остановке
+        :param logger: LogSink
+        """
+        self._sendable = sendable
+        self._slots = asyncio.Semaphore(concurrency)
+        self._shutdown_timeout = shutdown_timeout
+        self._lanes: dict[str, deque[Update]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._logger = logger
+
+    @override
+    async def dispatch(self, update: Update) -> None:
+        """Передать обновление на обработку.
+
+        :param update: Update
+        """
+        await self._slots.acquire()
+        lane_key = str(ChatLaneKey(update))
+        lane = self._lanes.get(lane_key)
+        if lane is not None:
+            lane.append(update)
+            return
+        self._lanes[lane_key] = deque([update])
+        task = asyncio.create_task(self._drain(lane_key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @override
+    async def flush(self) -> None:
+        """Дождаться обработки обновлений, отмена незавершенных по таймауту."""
+        if not self._tasks:
+            return
+        running = set(self._tasks)
+        _, pending = await asyncio.wait(running, timeout=self._shutdown_timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _drain(self, lane_key: str) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_drain"
+        lane = self._lanes[lane_key]
+        try:
+            await self._sent(lane)
+        except asyncio.CancelledError:
+            self._logger.error('Lane {0} cancelled, {1} updates lost'.format(lane_key, len(lane)))
+            raise
+        finally:
+            self._lanes.pop(lane_key)
+            for _ in lane:
+                self._slots.release()
+
+    async def _sent(self, lane: deque[Update]) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_sent"
+        while lane:
+            await self._sendable.send(lane[0])
+            lane.popleft()
+            self._slots.release()
@@ -0,0 +1,77 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from collections import Counter
+from typing import final, override
+
+from pyeo import elegant
+
+from app_types.update import Update
+from integrations.tg.chat_lane_key import ChatLaneKey
+from integrations.tg.webhook_answer import WebhookAnswer
+
+
+@final
+@elegant
+class ChatLanesWebhookAnswer(WebhookAnswer):
+    """Ответ на webhook с сохранением порядка внутри чата.
+
+    Аналог `ChatLanesPool` для ответов, возвращаемых в теле webhook запроса:
+    обновления одного чата обрабатываются последовательно в порядке поступления,
+    одновременно обрабатывается не более `concurrency` обновлений.
+    """
+
+    def __init__(self, origin: WebhookAnswer, concurrency: int) -> None:
+        """Ctor.
+
+        :param origin: WebhookAnswer
+        :param concurrency: int - максимальное кол-во обновлений в обработке
+        """
+        self._origin = origin
+        self._slots = asyncio.Semaphore(concurrency)
+        self._lanes: dict[str, asyncio.Lock] = {}
+        self._waiting: Counter[str] = Counter()
+
+    @override
+    async def reply(self, update: Update) -> str:
+        """Тело ответа на запрос от телеграма.
+
+        :param update: Update
+        :return: str
+        """
+        lane_key = str(ChatLaneKey(update))
+        lane = self._lanes.setdefault(lane_key, asyncio.Lock())
+        self._waiting[lane_key] += 1
+        try:
+            async with lane:
+                return await self._slot_reply(update)
+        finally:
+            self._waiting[lane_key] -= 1
+            if not self._waiting[lane_key]:
+                self._waiting.pop(lane_key)
+                self._lanes.pop(lane_key)
+
+    async def _slot_reply(self, update: Update) -> str:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_slot_reply"
+        async with self._slots:
+            return await self._origin.reply(update)
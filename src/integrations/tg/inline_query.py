@@ -28,8 +28,6 @@ from pyeo import elegant
 from app_types.stringable import SupportsStr
 from app_types.update import Update
 from integrations.tg.exceptions.update_parse_exceptions import InlineQueryNotFoundError
-from services.err_redirect_json_path import ErrRedirectJsonPath
-from services.json_path_value import JsonPathValue
 
 
 @final
@@ -45,13 +43,9 @@ class InlineQuery(SupportsStr):
         """Строковое представление.
 
         :return: str
+        :raises InlineQueryNotFoundError: если в обновлении нет inline запроса
         """
-        return str(
-            ErrRedirectJsonPath(
-                JsonPathValue(
-                    self._update.asdict(),
-                    '$..query',
-                ),
-                InlineQueryNotFoundError(),
-            ).evaluate(),
-        )
+        inline_query = self._update.parsed().inline_query
+        if inline_query is None:
+            raise InlineQueryNotFoundError
+        return str(inline_query)
@@ -27,8 +27,6 @@ from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.exceptions.update_parse_exceptions import InlineQueryNotFoundError
-from services.err_redirect_json_path import ErrRedirectJsonPath
-from services.json_path_value import JsonPathValue
 
 
 @final
@@ -44,13 +42,9 @@ class InlineQueryId(SupportsInt):
         """Числовое представление.
 
         :return: int
+        :raises InlineQueryNotFoundError: если в обновлении нет inline запроса
         """
-        return int(
-            ErrRedirectJsonPath(
-                JsonPathValue(
-                    self._update.asdict(),
-                    '$..inline_query.id',
-                ),
-                InlineQueryNotFoundError(),
-            ).evaluate(),
-        )
+        inline_query_id = self._update.parsed().inline_query_id
+        if inline_query_id is None:
+            raise InlineQueryNotFoundError
+        return int(inline_query_id)
@@ -0,0 +1,77 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+import httpx
+from pyeo import elegant
+
+from app_types.logger import LogSink
+from app_types.update import Update
+from integrations.tg.sendable_answer import SendableAnswer
+from integrations.tg.tg_answers.requests_answer import TgRequestsAnswer
+from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.webhook_answer import WebhookAnswer
+from integrations.tg.webhook_reply_body import WebhookReplyBody
+from services.logged_answer import LoggedAnswer
+from srv.events.sink import Sink
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class InlineWebhookAnswer(WebhookAnswer):
+    """Ответ, возвращаемый в теле ответа на webhook запрос.
+
+    Если ответ состоит из одного запроса к API, он не отправляется отдельно,
+    а возвращается телеграму в ответе на webhook.
+    Результат такого запроса телеграм не возвращает, поэтому в лог
+    отправленных сообщений он не попадает.
+    Ответы из нескольких запросов отправляются как обычно.
+    """
+
+    _answer: TgAnswer
+    _http_client: httpx.AsyncClient
+    _event_sink: Sink
+    _logger: LogSink
+
+    @override
+    async def reply(self, update: Update) -> str:
+        """Тело ответа на запрос от телеграма.
+
+        :param update: Update
+        :return: str
+        """
+        requests = await self._answer.build(update)
+        inline = len(requests) == 1
+        await LoggedAnswer(
+            SendableAnswer(
+                TgRequestsAnswer([] if inline else requests),
+                self._http_client,
+                self._logger,
+            ),
+            self._event_sink,
+        ).send(update)
+        if inline:
+            return str(WebhookReplyBody(requests[0]))
+        return ''
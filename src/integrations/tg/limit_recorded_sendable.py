@@ -0,0 +1,87 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import time
+from http import HTTPStatus
+from typing import final, override
+
+import attrs
+import httpx
+import ujson
+from pyeo import elegant
+
+from app_types.throttle_stats import ThrottleStats
+from app_types.update import Update
+from exceptions.internal_exceptions import TelegramIntegrationsError
+from integrations.tg.concurrency_limit import ConcurrencyLimit
+from integrations.tg.sendable import Sendable
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class LimitRecordedSendable(Sendable):
+    """Отправка, результат которой учитывается в лимите одновременных запросов.
+
+    Ответ с error_code 429 и таймаут уменьшают лимит. Так же учитываются повтор после 429
+    и ожидание в очереди лимитов транспорта, которые транспорт скрывает от отправки.
+    `throttle_stats` должна считать запросы текущей задачи (TaskThrottleStats),
+    тогда разница счетчиков не включает параллельные отправки.
+    """
+
+    _origin: Sendable
+    _limit: ConcurrencyLimit
+    _throttle_stats: ThrottleStats
+
+    @override
+    async def send(self, update: Update) -> list[dict]:
+        """Отправка.
+
+        :param update: Update
+        :return: list[dict]
+        :raises httpx.TimeoutException: таймаут запроса, лимит уменьшается
+        """
+        started = time.monotonic()
+        retried = self._throttle_stats.retried()
+        throttled = self._throttle_stats.throttled()
+        ok = True
+        try:
+            return await self._origin.send(update)
+        except httpx.TimeoutException:
+            ok = False
+            raise
+        except TelegramIntegrationsError as err:
+            ok = self._error_code(str(err)) != HTTPStatus.TOO_MANY_REQUESTS
+            raise
+        finally:
+            self._limit.record(
+                time.monotonic() - started,
+                ok=ok and self._throttle_stats.retried() == retried,
+                throttled=self._throttle_stats.throttled() != throttled,
+            )
+
+    def _error_code(self, error_text: str) -> int:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_error_code"
+        try:
+            return int(ujson.loads(error_text)['error_code'])
+        except (ValueError, KeyError, TypeError):
+            return 0
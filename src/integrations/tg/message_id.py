@@ -27,8 +27,6 @@ from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.exceptions.update_parse_exceptions import MessageIdNotFoundError
-from services.err_redirect_json_path import ErrRedirectJsonPath
-from services.json_path_value import JsonPathValue
 
 MessageId: TypeAlias = SupportsInt
 
@@ -46,13 +44,9 @@ class TgMessageId(MessageId):
         """Числовое представление.
 
         :return: int
+        :raises MessageIdNotFoundError: если в обновлении нет идентификатора сообщения
         """
-        return int(
-            ErrRedirectJsonPath(
-                JsonPathValue(
-                    self._update.asdict(),
-                    '$..message.message_id',
-                ),
-                MessageIdNotFoundError(),
-            ).evaluate(),
-        )
+        message_id = self._update.parsed().message_id
+        if message_id is None:
+            raise MessageIdNotFoundError
+        return int(message_id)
@@ -28,8 +28,6 @@ from pyeo import elegant
 from app_types.stringable import SupportsStr
 from app_types.update import Update
 from integrations.tg.exceptions.update_parse_exceptions import MessageTextNotFoundError
-from services.err_redirect_json_path import ErrRedirectJsonPath
-from services.json_path_value import JsonPathValue
 
 
 @final
@@ -45,13 +43,9 @@ class MessageText(SupportsStr):
         """Строковое представление.
 
         :return: str
+        :raises MessageTextNotFoundError: если в обновлении нет текста сообщения
         """
-        return str(
-            ErrRedirectJsonPath(
-                JsonPathValue(
-                    self._update.asdict(),
-                    '$..message.text',
-                ),
-                MessageTextNotFoundError(),
-            ).evaluate(),
-        )
+        message_text = self._update.parsed().message_text
+        if message_text is None:
+            raise MessageTextNotFoundError
+        return str(message_text)
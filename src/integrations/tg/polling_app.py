@@ -20,7 +20,6 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
-import asyncio
 from typing import final, override
 
 import attrs
@@ -29,7 +28,7 @@ from pyeo import elegant
 from app_types.logger import LogSink
 from app_types.runable import Runable
 from integrations.tg.polling_updates import PollingUpdatesIterator
-from integrations.tg.sendable import Sendable
+from integrations.tg.updates_pool import UpdatesPool
 
 
 @final
@@ -39,18 +38,14 @@ class PollingApp(Runable):
     """Приложение на long polling."""
 
     _updates: PollingUpdatesIterator
-    _sendable: Sendable
+    _updates_pool: UpdatesPool
     _logger: LogSink
 
     @override
     async def run(self) -> None:
         """Запуск."""
         self._logger.info('Start app on polling')
-        background_tasks = set()
         async for update_list in self._updates:
             for update in update_list:
                 self._logger.debug('Update: {update}', update=update)
-                task = asyncio.create_task(self._sendable.send(update))
-                background_tasks.add(task)
-                task.add_done_callback(background_tasks.discard)
-                await asyncio.sleep(0.1)
+                await self._updates_pool.dispatch(update)
@@ -41,6 +41,7 @@ class PollingUpdatesIterator(UpdatesIterator):
 
     _updates_url: UpdatesURLInterface
     _updates_timeout: SupportsInt
+    _http_client: httpx.AsyncClient
 
     _offset: int = 0
 
@@ -58,20 +59,19 @@ class PollingUpdatesIterator(UpdatesIterator):
 
         :return: list[Update]
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.get(
-                    self._updates_url.generate(self._offset),
-                    timeout=int(self._updates_timeout),
-                )
-            except (httpx.ReadTimeout, httpx.ConnectTimeout):
-                return []
-            resp_content = resp.text
-            try:
-                parsed_result = ujson.loads(resp_content)['result']
-            except KeyError:
-                return []
-            if not parsed_result:
-                return []
-            self._offset = parsed_result[-1]['update_id'] + 1  # noqa: WPS601
-            return [TgUpdate(elem) for elem in parsed_result]
+        try:
+            resp = await self._http_client.get(
+                self._updates_url.generate(self._offset),
+                timeout=int(self._updates_timeout),
+            )
+        except (httpx.ReadTimeout, httpx.ConnectTimeout):
+            return []
+        resp_content = resp.text
+        try:
+            parsed_result = ujson.loads(resp_content)['result']
+        except KeyError:
+            return []
+        if not parsed_result:
+            return []
+        self._offset = parsed_result[-1]['update_id'] + 1  # noqa: WPS601
+        return [TgUpdate(elem) for elem in parsed_result]
@@ -0,0 +1,67 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import Final, final, override
+
+import attrs
+from pyeo import elegant
+from redis.asyncio import Redis
+
+from integrations.tg.chat_rate_limits import ChatRateLimits
+from integrations.tg.rate_limit import RateLimit
+from integrations.tg.redis_token_bucket import RedisTokenBucket
+from integrations.tg.token_bucket_rate import TokenBucketRate
+
+GLOBAL_KEY: Final = 'tg:rate:global'
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class RedisChatRateLimits(ChatRateLimits):
+    """Ограничения частоты запросов к API телеграма в redis.
+
+    Каждый запрос расходует токен общего лимита бота, запрос в чат - еще и токен лимита чата.
+    Идентификаторы групп и каналов отрицательны, для них действует отдельный, более строгий лимит.
+    Корзины хранятся в redis и общие для всех процессов бота,
+    ключи истекают сами, когда корзина полностью восстановилась.
+    """
+
+    _redis: Redis
+    _global_rate: TokenBucketRate
+    _chat_rate: TokenBucketRate
+    _group_rate: TokenBucketRate
+
+    @override
+    def limit(self, chat_id: int | None) -> RateLimit:
+        """Ограничение для запроса.
+
+        :param chat_id: int | None
+        :return: RateLimit
+        """
+        if chat_id is None:
+            return RedisTokenBucket(self._redis, {GLOBAL_KEY: self._global_rate})
+        chat_rate = self._group_rate if chat_id < 0 else self._chat_rate
+        return RedisTokenBucket(self._redis, {
+            'tg:rate:chat:{0}'.format(chat_id): chat_rate,
+            GLOBAL_KEY: self._global_rate,
+        })
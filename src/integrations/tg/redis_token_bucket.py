@@ -0,0 +1,113 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import itertools
+from collections.abc import Mapping
+from typing import Final, final, override
+
+import attrs
+from pyeo import elegant
+from redis.asyncio import Redis
+
+from integrations.tg.rate_limit import RateLimit
+from integrations.tg.token_bucket_rate import MICROSECONDS, TokenBucketRate
+
+# Returns 0 and takes a token from every bucket when all of them allow the request,
+# otherwise returns microseconds to wait before the next try and changes nothing.
+# Numeric arguments of redis.call are passed as integers without precision loss
+ACQUIRE_SCRIPT: Final = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+local wait = 0
+for idx, key in ipairs(KEYS) do
+    local tat = math.max(tonumber(redis.call('GET', key) or now), now)
+    wait = math.max(wait, tat - tonumber(ARGV[idx * 2]) - now)
+end
+if wait > 0 then
+    return wait
+end
+for idx, key in ipairs(KEYS) do
+    local tat = math.max(tonumber(redis.call('GET', key) or now), now) + tonumber(ARGV[idx * 2 - 1])
+    redis.call('SET', key, tat, 'PX', math.ceil((tat - now) / 1000) + 1)
+end
+return 0
+"""
+PAUSE_SCRIPT: Final = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+local tat = math.max(tonumber(redis.call('GET', KEYS[1]) or now), now + tonumber(ARGV[1]) + tonumber(ARGV[2]))
+redis.call('SET', KEYS[1], tat, 'PX', math.ceil((tat - now) / 1000) + 1)
+return 0
+"""
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class RedisTokenBucket(RateLimit):
+    """Корзины токенов в redis, проверяемые одним скриптом.
+
+    Реализованы через теоретическое время прихода (GCRA), состояние корзины - одно число в ключе,
+    время берется у redis. Поэтому лимиты общие для всех процессов бота:
+    ответы пользователям и рассылки расходуют одни и те же токены.
+    Разрешение выдается, только если его дают все корзины, за один вызов EVAL.
+    Ожидание не резервирует слот: после сна корутина запрашивает разрешение заново,
+    так что пауза после ответа 429 задерживает и уже ожидающие запросы.
+    Пауза применяется к первой корзине.
+    Ключ живет, пока корзина не восстановится полностью.
+    """
+
+    _redis: Redis
+    _buckets: Mapping[str, TokenBucketRate]
+
+    @override
+    async def acquire(self) -> float:
+        """Дождаться разрешения на запрос.
+
+        :return: float - время ожидания в секундах
+        """
+        waited: float = 0
+        rates = itertools.chain.from_iterable(
+            (bucket_rate.interval(), bucket_rate.tolerance())
+            for bucket_rate in self._buckets.values()
+        )
+        script_args = [*self._buckets, *rates]
+        while True:  # noqa: WPS457
+            wait = int(await self._redis.eval(  # type: ignore [no-untyped-call]
+                ACQUIRE_SCRIPT, len(self._buckets), *script_args,
+            )) / MICROSECONDS
+            if not wait:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    @override
+    async def pause(self, seconds: float) -> None:
+        """Приостановить выдачу разрешений первой корзиной.
+
+        :param seconds: float
+        """
+        key, bucket_rate = next(iter(self._buckets.items()))
+        await self._redis.eval(  # type: ignore [no-untyped-call]
+            PAUSE_SCRIPT, 1, key, int(seconds * MICROSECONDS), bucket_rate.tolerance(),
+        )
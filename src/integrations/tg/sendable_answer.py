@@ -21,7 +21,6 @@
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
 from typing import final, override
-from urllib import parse as url_parse
 
 import attrs
 import httpx
@@ -42,6 +41,7 @@ class SendableAnswer(Sendable):
     """Объект, отправляющий ответы в API."""
 
     _answer: TgAnswer
+    _http_client: httpx.AsyncClient
     _logger: LogSink
 
     @override
@@ -54,13 +54,10 @@ class SendableAnswer(Sendable):
         """
         responses = []
         success_status = 200
-        async with httpx.AsyncClient() as client:
-            for request in await self._answer.build(update):
-                self._logger.debug('Try send request to: {0}'.format(
-                    url_parse.unquote(str(request.url)),
-                ))
-                resp = await client.send(request)
-                responses.append(resp.text)
-                if resp.status_code != success_status:
-                    raise TelegramIntegrationsError(resp.text)
-            return [ujson.loads(response) for response in responses]
+        for request in await self._answer.build(update):
+            self._logger.debug('Try send request to: {0} {1}'.format(request.api_method(), request.fields()))
+            resp = await self._http_client.send(request.httpx_request())
+            responses.append(resp.text)
+            if resp.status_code != success_status:
+                raise TelegramIntegrationsError(resp.text)
+        return [ujson.loads(response) for response in responses]
@@ -0,0 +1,83 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from typing import Final, final, override
+from urllib.parse import urlsplit
+
+import attrs
+from pyeo import elegant
+
+from integrations.tg.webhook_request import WebhookRequest
+from integrations.tg.webhook_requests import WebhookRequests
+
+MAX_HEADERS: Final = 100
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class StreamWebhookRequests(WebhookRequests):
+    """Запросы к webhook, прочитанные из потока.
+
+    Чтение стартовой строки с заголовками и чтение тела ограничены `read_timeout`,
+    кол-во заголовков ограничено, длина строки ограничена буфером потока.
+    """
+
+    _reader: asyncio.StreamReader
+    _read_timeout: float
+
+    @override
+    async def next_request(self) -> WebhookRequest | None:
+        """Следующий запрос, None если клиент закрыл соединение.
+
+        :return: WebhookRequest | None
+        """
+        async with asyncio.timeout(self._read_timeout):
+            request_line = await self._reader.readline()
+            if not request_line:
+                return None
+            method, _, target = request_line.decode('latin-1').partition(' ')
+            path = urlsplit(target.partition(' ')[0]).path
+            return WebhookRequest(method, path, await self._headers())
+
+    @override
+    async def body(self, request: WebhookRequest) -> bytes:
+        """Тело запроса.
+
+        :param request: WebhookRequest
+        :return: bytes
+        """
+        async with asyncio.timeout(self._read_timeout):
+            return await self._reader.readexactly(request.content_length())
+
+    async def _headers(self) -> dict[str, str]:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_headers"
+        headers: dict[str, str] = {}
+        while len(headers) <= MAX_HEADERS:
+            line = await self._reader.readline()
+            if line in {b'\r\n', b'\n', b''}:
+                return headers
+            name, _, header_value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = header_value.strip()
+        msg = 'Too many headers'
+        raise asyncio.LimitOverrunError(msg, len(headers))
@@ -0,0 +1,60 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from http import HTTPStatus
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from integrations.tg.webhook_responses import WebhookResponses
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class StreamWebhookResponses(WebhookResponses):
+    """Ответы на запросы к webhook, записанные в поток."""
+
+    _writer: asyncio.StreamWriter
+
+    @override
+    async def send(self, status: HTTPStatus, response_body: str, *, keep_alive: bool) -> None:
+        """Отправить ответ.
+
+        :param status: HTTPStatus
+        :param response_body: str
+        :param keep_alive: bool
+        """
+        encoded_body = response_body.encode('utf-8')
+        connection = 'keep-alive' if keep_alive else 'close'
+        head = '\r\n'.join([
+            'HTTP/1.1 {0} {1}'.format(status.value, status.phrase),
+            'Content-Type: application/json',
+            'Content-Length: {0}'.format(len(encoded_body)),
+            'Connection: {0}'.format(connection),
+            '',
+            '',
+        ])
+        self._writer.write(head.encode('latin-1') + encoded_body)
+        await self._writer.drain()
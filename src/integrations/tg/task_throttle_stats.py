@@ -0,0 +1,86 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from contextvars import ContextVar
+from functools import partial
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from integrations.tg.throttle_counter import ThrottleCounter
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class TaskThrottleStats(ThrottleCounter):
+    """Статистика ограничения частоты запросов текущей asyncio задачи.
+
+    Счетчики хранятся в contextvars: задача получает копию контекста при создании,
+    и запись внутри задачи не видна ни создавшей ее задаче, ни параллельным.
+    Поэтому разница счетчиков до и после запроса относится только к нему,
+    сколько бы запросов процесс ни отправлял одновременно.
+    """
+
+    _counters: ContextVar[tuple[int, float, int]] = attrs.field(
+        factory=partial(ContextVar, 'tg_throttle_stats', default=(0, 0, 0)),
+    )
+
+    @override
+    def throttle(self, waited: float) -> None:
+        """Запрос ждал разрешения.
+
+        :param waited: float - время ожидания в секундах
+        """
+        throttled, total_waited, retried = self._counters.get()
+        self._counters.set((throttled + 1, total_waited + waited, retried))
+
+    @override
+    def retry(self) -> None:
+        """Запрос повторен после ответа 429."""
+        throttled, waited, retried = self._counters.get()
+        self._counters.set((throttled, waited, retried + 1))
+
+    @override
+    def throttled(self) -> int:
+        """Кол-во запросов, ожидавших разрешения.
+
+        :return: int
+        """
+        return self._counters.get()[0]
+
+    @override
+    def waited(self) -> float:
+        """Суммарное время ожидания в секундах.
+
+        :return: float
+        """
+        return self._counters.get()[1]
+
+    @override
+    def retried(self) -> int:
+        """Кол-во повторов после ответа 429.
+
+        :return: int
+        """
+        return self._counters.get()[2]
@@ -23,7 +23,6 @@
 from contextlib import suppress
 from typing import final, override
 
-import httpx
 from pyeo import elegant
 
 from app_types.logger import LogSink
@@ -36,6 +35,7 @@ from integrations.tg.exceptions.update_parse_exceptions import (
     MessageIdNotFoundError,
 )
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -54,11 +54,11 @@ class TgAnswerFork(TgAnswer):
         self._logger = logger
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         :raises NotProcessableUpdateError: if not found matches
         """
         for answer in self._answers:
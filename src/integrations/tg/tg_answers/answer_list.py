@@ -22,11 +22,11 @@
 
 from typing import final, override
 
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -43,11 +43,11 @@ class TgAnswerList(TgAnswer):
         self._answers = answers
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         rebuilded_requests = []
         for answer in self._answers:
@@ -23,11 +23,10 @@
 from typing import final, override
 
 import attrs
-import httpx
-from furl import furl
 
 from app_types.update import Update
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 
 
@@ -39,16 +38,13 @@ class TgAnswerToSender(TgAnswer):
     _origin: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return [
-            httpx.Request(
-                request.method,
-                furl(request.url).add({'chat_id': int(TgChatId(update))}).url,
-            )
+            request.with_fields({'chat_id': int(TgChatId(update))})
             for request in await self._origin.build(update)
         ]
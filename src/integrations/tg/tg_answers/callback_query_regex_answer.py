@@ -24,13 +24,13 @@ import re
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.callback_query import CallbackQueryData
 from integrations.tg.exceptions.update_parse_exceptions import CallbackQueryNotFoundError
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -43,11 +43,11 @@ class TgCallbackQueryRegexAnswer(TgAnswer):
     _answer: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         try:
             regex_result = re.search(self._pattern, str(CallbackQueryData(update)))
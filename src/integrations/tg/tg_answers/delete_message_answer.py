@@ -23,12 +23,11 @@
 from typing import final, override
 
 import attrs
-import httpx
-from furl import furl
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -40,18 +39,13 @@ class TgMessageDeleteAnswer(TgAnswer):
     _origin: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return [
-            httpx.Request(
-                request.method,
-                str(furl(request.url) / 'deleteMessage'),
-                stream=request.stream,
-                headers=request.headers,
-            )
+            request.with_api_method('deleteMessage')
             for request in await self._origin.build(update)
         ]
@@ -23,12 +23,13 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.stringable import SupportsStr
 from app_types.update import Update
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_api_request import TgApiRequest
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -40,13 +41,13 @@ class TgEmptyAnswer(TgAnswer, SupportsStr):
     _token: str
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Создать ответ с токеном.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
-        return [httpx.Request('GET', httpx.URL('https://api.telegram.org/bot{0}/'.format(self._token)))]
+        return [TgApiRequest('https://api.telegram.org/bot{0}/'.format(self._token))]
 
     @override
     def __str__(self) -> str:
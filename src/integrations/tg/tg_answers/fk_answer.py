@@ -23,11 +23,12 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_api_request import TgApiRequest
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -39,13 +40,13 @@ class FkAnswer(TgAnswer):
     _url: str | None = 'https://some.domain'
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         :raises ValueError: if self._url is None
         """
         if self._url is None:
             raise ValueError
-        return [httpx.Request('GET', self._url)]
+        return [TgApiRequest(self._url)]
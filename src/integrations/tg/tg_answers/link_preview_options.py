@@ -23,13 +23,12 @@
 from typing import final, override
 
 import attrs
-import httpx
 import ujson
-from furl import furl
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -42,18 +41,13 @@ class TgLinkPreviewOptions(TgAnswer):
     _disabled: bool
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Формирование запросов.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return [
-            httpx.Request(
-                request.method,
-                furl(request.url).add({
-                    'link_preview_options': ujson.dumps({'is_disabled': self._disabled}),
-                }).url,
-            )
+            request.with_fields({'link_preview_options': ujson.dumps({'is_disabled': self._disabled})})
             for request in await self._origin.build(update)
         ]
@@ -23,12 +23,12 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.exceptions.update_parse_exceptions import CoordinatesNotFoundError
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_message_coordinates import TgMessageCoordinates
 
 
@@ -41,11 +41,11 @@ class TgLocationAnswer(TgAnswer):
     _answer: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         try:
             TgMessageCoordinates(update).latitude()
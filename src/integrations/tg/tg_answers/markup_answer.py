@@ -23,13 +23,12 @@
 from typing import final, override
 
 import attrs
-import httpx
-from furl import furl
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.keyboard import Keyboard
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -42,20 +41,13 @@ class TgAnswerMarkup(TgAnswer):
     _keyboard: Keyboard
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ для пользователя.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return [
-            httpx.Request(
-                request.method,
-                furl(request.url).add(
-                    {'reply_markup': await self._keyboard.generate(update)},
-                ).url,
-                stream=request.stream,
-                headers=request.headers,
-            )
+            request.with_fields({'reply_markup': await self._keyboard.generate(update)})
             for request in await self._origin.build(update)
         ]
@@ -24,7 +24,6 @@ import time
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.logger import LogSink
@@ -32,6 +31,7 @@ from app_types.millis import Millis
 from app_types.rounded_float import RoundedFloat
 from app_types.update import Update
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.update_id import UpdateId
 
 
@@ -45,11 +45,11 @@ class TgMeasureAnswer(TgAnswer):
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :returns: list[httpx.Request]
+        :returns: list[TgRequest]
         """
         start = time.time()
         self._logger.info('Start process update <{0}>'.format(int(UpdateId(update))))
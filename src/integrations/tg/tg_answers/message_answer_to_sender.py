@@ -23,11 +23,11 @@
 from typing import final, override
 
 import attrs
-import httpx
 
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswerToSender, TgHtmlParseAnswer, TgMessageAnswer
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -38,11 +38,11 @@ class TgHtmlMessageAnswerToSender(TgAnswer):
     _origin: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await TgAnswerToSender(
             TgHtmlParseAnswer(
@@ -23,13 +23,12 @@
 from typing import final, override
 
 import attrs
-import httpx
-from furl import furl
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.message_id import MessageId
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -42,18 +41,13 @@ class TgMessageIdAnswer(TgAnswer):
     _message_id: MessageId
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return [
-            httpx.Request(
-                request.method,
-                furl(request.url).add({'message_id': int(self._message_id)}).url,
-                stream=request.stream,
-                headers=request.headers,
-            )
+            request.with_fields({'message_id': int(self._message_id)})
             for request in await self._origin.build(update)
         ]
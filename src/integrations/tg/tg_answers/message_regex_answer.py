@@ -24,7 +24,6 @@ import re
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.stringable import SupportsStr
@@ -32,6 +31,7 @@ from app_types.update import Update
 from integrations.tg.exceptions.update_parse_exceptions import MessageTextNotFoundError
 from integrations.tg.message_text import MessageText
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -44,13 +44,13 @@ class TgMessageRegexAnswer(TgAnswer, SupportsStr):
     _answer: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
-        if 'callback_query' in str(update):
+        if update.parsed().is_callback_query:
             return []
         try:
             regex_result = re.search(self._pattern, str(MessageText(update)))
@@ -23,12 +23,11 @@
 from typing import final, override
 
 import attrs
-import httpx
-from furl import furl
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -40,16 +39,13 @@ class TgReplySourceAnswer(TgAnswer):
     _origin: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :returns: list[httpx.Request]
+        :returns: list[TgRequest]
         """
         return [
-            httpx.Request(
-                request.method,
-                (furl(request.url).add({'reply_to_message_id': 4})).url,
-            )
+            request.with_fields({'reply_to_message_id': 4})
             for request in await self._origin.build(update)
         ]
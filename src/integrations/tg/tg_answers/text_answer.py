@@ -23,14 +23,13 @@
 from typing import final, override
 
 import attrs
-import httpx
-from furl import furl
 from pyeo import elegant
 
 from app_types.async_supports_str import AsyncSupportsStr
 from app_types.fk_async_str import FkAsyncStr
 from app_types.update import Update
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -55,16 +54,13 @@ class TgTextAnswer(TgAnswer):
         )
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return [
-            httpx.Request(
-                request.method,
-                furl(request.url).add({'text': await self._text.to_str()}).url,
-            )
+            request.with_fields({'text': await self._text.to_str()})
             for request in await self._origin.build(update)
         ]
@@ -22,17 +22,17 @@
 
 from typing import Protocol
 
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @elegant
 class TgAnswer(Protocol):
     """Интерфейс ответа пользователю."""
 
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
@@ -0,0 +1,98 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections import ChainMap
+from typing import final, override
+
+import attrs
+import httpx
+import ujson
+from pyeo import elegant
+
+from integrations.tg.tg_answers.tg_request import TgRequest
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class TgApiRequest(TgRequest):
+    """Запрос к API телеграма: метод и параметры.
+
+    Параметры передаются JSON телом POST запроса,
+    поэтому длинные тексты и клавиатуры не попадают в URL.
+    Идентификатор чата дублируется в расширение запроса tg_chat_id для лимитов транспорта.
+    Объект неизменяем, `with_api_method` и `with_fields` возвращают новый запрос.
+    Декораторы добавляют параметры слоями, слои объединяются один раз при чтении параметров.
+    """
+
+    _base_url: str
+    _api_method: str = ''
+    _layers: tuple[dict, ...] = ()
+
+    @override
+    def with_api_method(self, api_method: str) -> TgRequest:
+        """Запрос с методом API.
+
+        :param api_method: str
+        :return: TgRequest
+        """
+        return TgApiRequest(self._base_url, api_method, self._layers)
+
+    @override
+    def with_fields(self, fields: dict) -> TgRequest:
+        """Запрос с дополнительными параметрами.
+
+        :param fields: dict
+        :return: TgRequest
+        """
+        return TgApiRequest(self._base_url, self._api_method, (*self._layers, fields))
+
+    @override
+    def api_method(self) -> str:
+        """Метод API.
+
+        :return: str
+        """
+        return self._api_method
+
+    @override
+    def fields(self) -> dict:
+        """Параметры, более поздние слои перекрывают ранние.
+
+        :return: dict
+        """
+        return dict(ChainMap(*reversed(self._layers)))
+
+    @override
+    def httpx_request(self) -> httpx.Request:
+        """Запрос для отправки.
+
+        :return: httpx.Request
+        """
+        fields = self.fields()
+        return httpx.Request(
+            'POST',
+            httpx.URL(self._base_url).join(self._api_method) if self._api_method else self._base_url,
+            content=ujson.dumps(fields, ensure_ascii=False),
+            headers={'Content-Type': 'application/json'},
+            extensions={'tg_chat_id': fields['chat_id']} if 'chat_id' in fields else {},
+        )
@@ -0,0 +1,56 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import Protocol
+
+import httpx
+from pyeo import elegant
+
+
+@elegant
+class TgRequest(Protocol):
+    """Интерфейс запроса к API телеграма.
+
+    Декораторы ответов получают дополненную копию запроса,
+    httpx.Request собирается только при отправке.
+    """
+
+    def with_api_method(self, api_method: str) -> 'TgRequest':
+        """Запрос с методом API.
+
+        :param api_method: str
+        """
+
+    def with_fields(self, fields: dict) -> 'TgRequest':
+        """Запрос с дополнительными параметрами.
+
+        :param fields: dict
+        """
+
+    def api_method(self) -> str:
+        """Метод API."""
+
+    def fields(self) -> dict:
+        """Параметры."""
+
+    def httpx_request(self) -> httpx.Request:
+        """Запрос для отправки."""
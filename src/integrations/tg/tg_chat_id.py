@@ -28,8 +28,6 @@ from pyeo import elegant
 from app_types.update import Update
 from exceptions.base_exception import InternalBotError
 from integrations.tg.fk_chat_id import ChatId
-from services.err_redirect_json_path import ErrRedirectJsonPath
-from services.match_many_json_path import MatchManyJsonPath
 
 
 @final
@@ -45,13 +43,10 @@ class TgChatId(ChatId):
         """Числовое представление.
 
         :return: int
+        :raises InternalBotError: если в обновлении нет идентификатора чата
         """
-        return int(
-            ErrRedirectJsonPath(
-                MatchManyJsonPath(
-                    self._update.asdict(),
-                    ('$..chat.id', '$..from.id'),
-                ),
-                InternalBotError(),
-            ).evaluate(),
-        )
+        parsed_update = self._update.parsed()
+        chat_id = parsed_update.from_id if parsed_update.chat_id is None else parsed_update.chat_id
+        if chat_id is None:
+            raise InternalBotError
+        return int(chat_id)
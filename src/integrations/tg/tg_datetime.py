@@ -30,8 +30,6 @@ from pyeo import elegant
 from app_types.date_time import DateTime
 from app_types.update import Update
 from exceptions.base_exception import InternalBotError
-from services.err_redirect_json_path import ErrRedirectJsonPath
-from services.json_path_value import JsonPathValue
 
 
 @final
@@ -47,16 +45,9 @@ class TgDateTime(DateTime):
         """Дата/время.
 
         :return: datetime.datetime
+        :raises InternalBotError: если в обновлении нет даты
         """
-        return datetime.datetime.fromtimestamp(
-            int(
-                ErrRedirectJsonPath(
-                    JsonPathValue(
-                        self._update.asdict(),
-                        '$..date',
-                    ),
-                    InternalBotError(),
-                ).evaluate(),
-            ),
-            tz=pytz.timezone('UTC'),
-        )
+        update_date = self._update.parsed().date
+        if update_date is None:
+            raise InternalBotError
+        return datetime.datetime.fromtimestamp(int(update_date), tz=pytz.timezone('UTC'))
@@ -0,0 +1,50 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import SupportsFloat, final, override
+
+import attrs
+import httpx
+from pyeo import elegant
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class TgFloodWait(SupportsFloat):
+    """Время ожидания из ответа телеграма 429.
+
+    Тело ответа должно быть прочитано. Если поле parameters.retry_after не найдено - 1 секунда.
+    """
+
+    _response: httpx.Response
+
+    @override
+    def __float__(self) -> float:
+        """Время ожидания в секундах.
+
+        :return: float
+        """
+        try:
+            return float(self._response.json()['parameters']['retry_after'])
+        except (ValueError, KeyError, TypeError):
+            return 1
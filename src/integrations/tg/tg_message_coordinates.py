@@ -28,8 +28,6 @@ from pyeo import elegant
 from app_types.update import Update
 from integrations.tg.coordinates import Coordinates
 from integrations.tg.exceptions.update_parse_exceptions import CoordinatesNotFoundError
-from services.err_redirect_json_path import ErrRedirectJsonPath
-from services.json_path_value import JsonPathValue
 
 
 @final
@@ -45,29 +43,21 @@ class TgMessageCoordinates(Coordinates):
         """Ширина.
 
         :return: float
+        :raises CoordinatesNotFoundError: если в обновлении нет координат
         """
-        return float(
-            ErrRedirectJsonPath(
-                JsonPathValue(
-                    self._update.asdict(),
-                    '$..[latitude]',
-                ),
-                CoordinatesNotFoundError(),
-            ).evaluate(),
-        )
+        latitude = self._update.parsed().latitude
+        if latitude is None:
+            raise CoordinatesNotFoundError
+        return float(latitude)
 
     @override
     def longitude(self) -> float:
         """Долгота.
 
         :return: float
+        :raises CoordinatesNotFoundError: если в обновлении нет координат
         """
-        return float(
-            ErrRedirectJsonPath(
-                JsonPathValue(
-                    self._update.asdict(),
-                    '$..[longitude]',
-                ),
-                CoordinatesNotFoundError(),
-            ).evaluate(),
-        )
+        longitude = self._update.parsed().longitude
+        if longitude is None:
+            raise CoordinatesNotFoundError
+        return float(longitude)
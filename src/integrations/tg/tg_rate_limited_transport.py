@@ -0,0 +1,138 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from http import HTTPStatus
+from typing import final, override
+
+import httpx
+from pyeo import elegant
+
+from app_types.logger import LogSink
+from app_types.throttle_stats import ThrottleStats
+from integrations.tg.chat_rate_limits import ChatRateLimits
+from integrations.tg.rate_limit import RateLimit
+from integrations.tg.tg_flood_wait import TgFloodWait
+from integrations.tg.throttle_counter import ThrottleCounter
+
+
+@final
+@elegant
+class TgRateLimitedTransport(ThrottleStats, httpx.AsyncBaseTransport):
+    """HTTP транспорт, соблюдающий лимиты API телеграма.
+
+    Каждый запрос ограничивается общим лимитом бота, запрос, адресованный чату (с расширением tg_chat_id,
+    которое проставляет TgApiRequest), - еще и лимитом чата или группы.
+    На ответ 429 запрос отправляется повторно через `parameters.retry_after` секунд.
+    Для запроса в чат приостанавливается только лимит чата: retry_after телеграма
+    относится к чату, получившему ответ, и остальные чаты ждать не должны.
+    Счетчики ожиданий и повторов ведутся на весь процесс и отдельно для задачи,
+    отправившей запрос (`task_stats`), по ним подстраиваются лимиты одновременных отправок.
+    Сами лимиты должны храниться вне процесса (RedisTokenBucket, RedisChatRateLimits):
+    ответы пользователям и рассылки отправляются из разных процессов и делят лимит только через redis.
+    """
+
+    def __init__(
+        self,
+        origin: httpx.AsyncBaseTransport,
+        limits: ChatRateLimits,
+        max_retries: int,
+        task_stats: ThrottleCounter,
+        logger: LogSink,
+    ) -> None:
+        """Ctor.
+
+        :param origin: httpx.AsyncBaseTransport
+        :param limits: ChatRateLimits - общий лимит бота и лимиты чатов и групп
+        :param max_retries: int - максимальное кол-во повторов после ответа 429
+        :param task_stats: ThrottleCounter - счетчики задачи, отправляющей запрос
+        :param logger: LogSink
+        """
+        self._origin = origin
+        self._limits = limits
+        self._max_retries = max_retries
+        self._task_stats = task_stats
+        self._logger = logger
+        self._throttled = 0
+        self._waited: float = 0
+        self._retried = 0
+
+    @override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Отправка запроса.
+
+        :param request: httpx.Request
+        :return: httpx.Response
+        """
+        chat_id: int | None = request.extensions.get('tg_chat_id')
+        limit = self._limits.limit(chat_id)
+        attempt = 0
+        while True:  # noqa: WPS457
+            await self._acquire(limit, chat_id)
+            response = await self._origin.handle_async_request(request)
+            if response.status_code != HTTPStatus.TOO_MANY_REQUESTS or attempt == self._max_retries:
+                return response
+            await response.aread()
+            retry_after = float(TgFloodWait(response))
+            await response.aclose()
+            self._logger.info('Telegram flood limit for chat {0}, retry after {1}s'.format(chat_id, retry_after))
+            await limit.pause(retry_after)
+            self._retried += 1
+            self._task_stats.retry()
+            attempt += 1
+
+    @override
+    async def aclose(self) -> None:
+        """Закрытие транспорта."""
+        await self._origin.aclose()
+
+    @override
+    def throttled(self) -> int:
+        """Кол-во запросов, ожидавших разрешения.
+
+        :return: int
+        """
+        return self._throttled
+
+    @override
+    def waited(self) -> float:
+        """Суммарное время ожидания в секундах.
+
+        :return: float
+        """
+        return self._waited
+
+    @override
+    def retried(self) -> int:
+        """Кол-во повторов после ответа 429.
+
+        :return: int
+        """
+        return self._retried
+
+    async def _acquire(self, limit: RateLimit, chat_id: int | None) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_acquire"
+        waited = await limit.acquire()
+        if waited:
+            self._throttled += 1
+            self._waited += waited
+            self._task_stats.throttle(waited)
+            self._logger.debug('Telegram request to chat {0} throttled for {1:.3f}s'.format(chat_id, waited))
@@ -26,6 +26,7 @@ import attrs
 import ujson
 from pyeo import elegant
 
+from app_types.parsed_tg_update import ParsedTgUpdate
 from app_types.stringable import SupportsStr
 from app_types.update import Update
 
@@ -34,9 +35,13 @@ from app_types.update import Update
 @attrs.define(frozen=True)
 @elegant
 class TgUpdate(Update):
-    """Объект обновления от телеграмма."""
+    """Объект обновления от телеграмма.
+
+    Обновление разбирается один раз при создании объекта.
+    """
 
     _update_dict: dict
+    _parsed: ParsedTgUpdate = attrs.field()
 
     @classmethod
     def str_ctor(cls, raw_update: SupportsStr) -> Update:
@@ -65,3 +70,16 @@ class TgUpdate(Update):
         :return: dict
         """
         return self._update_dict
+
+    @override
+    def parsed(self) -> ParsedTgUpdate:
+        """Разобранное обновление.
+
+        :return: ParsedTgUpdate
+        """
+        return self._parsed
+
+    @_parsed.default
+    def _parsed_update(self) -> ParsedTgUpdate:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_parsed_update"
+        return ParsedTgUpdate.dict_ctor(self._update_dict)
@@ -27,8 +27,6 @@ from pyeo import elegant
 
 from app_types.update import Update
 from exceptions.base_exception import InternalBotError
-from services.err_redirect_json_path import ErrRedirectJsonPath
-from services.json_path_value import JsonPathValue
 
 
 @final
@@ -44,13 +42,9 @@ class UpdateId(SupportsInt):
         """Числовое представление.
 
         :return: int
+        :raises InternalBotError: если в обновлении нет идентификатора
         """
-        return int(
-            ErrRedirectJsonPath(
-                JsonPathValue(
-                    self._update.asdict(),
-                    '$..update_id',
-                ),
-                InternalBotError(),
-            ).evaluate(),
-        )
+        update_id = self._update.parsed().update_id
+        if update_id is None:
+            raise InternalBotError
+        return int(update_id)
@@ -0,0 +1,143 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import hmac
+from contextlib import suppress
+from http import HTTPStatus
+from typing import Final, final, override
+
+import attrs
+import ujson
+from pyeo import elegant
+
+from app_types.logger import LogSink
+from app_types.runable import Runable
+from exceptions.base_exception import InternalBotError
+from integrations.tg.stream_webhook_requests import StreamWebhookRequests
+from integrations.tg.stream_webhook_responses import StreamWebhookResponses
+from integrations.tg.update import TgUpdate
+from integrations.tg.webhook_answer import WebhookAnswer
+from integrations.tg.webhook_request import WebhookRequest
+from integrations.tg.webhook_requests import WebhookRequests
+from integrations.tg.webhook_responses import WebhookResponses
+
+MAX_BODY_SIZE: Final = 1024 * 1024
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class WebhookApp(Runable):
+    """Приложение, принимающее обновления через webhook.
+
+    Минимальный HTTP/1.1 сервер: принимает POST запросы от телеграма на `path`,
+    проверяет заголовок X-Telegram-Bot-Api-Secret-Token и передает обновление в `WebhookAnswer`.
+    Чтение запроса и ожидание следующего запроса в keep-alive соединении ограничены `read_timeout`,
+    кол-во и длина заголовков ограничены, тело запроса читается только после проверки секретного токена.
+    """
+
+    _host: str
+    _port: int
+    _path: str
+    _secret: str
+    _answer: WebhookAnswer
+    _read_timeout: float
+    _logger: LogSink
+
+    @override
+    async def run(self) -> None:
+        """Запуск.
+
+        :raises InternalBotError: если не задан секретный токен
+        """
+        if not self._secret:
+            msg = 'Webhook secret token is not set'
+            raise InternalBotError(msg)
+        server = await asyncio.start_server(self._connection, self._host, self._port)
+        self._logger.info('Start app on webhook {0}:{1}{2}'.format(self._host, self._port, self._path))
+        async with server:
+            await server.serve_forever()
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_connection"
+        responses = StreamWebhookResponses(writer)
+        try:
+            await self._serve(StreamWebhookRequests(reader, self._read_timeout), responses)
+        except (ValueError, asyncio.LimitOverrunError):
+            self._logger.debug('Webhook request headers too large')
+            with suppress(ConnectionError):
+                await responses.send(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, '', keep_alive=False)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            self._logger.debug('Webhook connection closed by client')
+        except TimeoutError:
+            self._logger.debug('Webhook connection timed out')
+        finally:
+            writer.close()
+
+    async def _serve(self, requests: WebhookRequests, responses: WebhookResponses) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_serve"
+        request = await requests.next_request()
+        while request:
+            status, response_body = await self._response(request, requests)
+            keep_alive = status == HTTPStatus.OK and request.keep_alive()
+            await responses.send(status, response_body, keep_alive=keep_alive)
+            if not keep_alive:
+                return
+            request = await requests.next_request()
+
+    async def _response(self, request: WebhookRequest, requests: WebhookRequests) -> tuple[HTTPStatus, str]:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_response"
+        status = self._status(request)
+        if status != HTTPStatus.OK:
+            return status, ''
+        try:
+            update = TgUpdate(ujson.loads(await requests.body(request)))
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, ''
+        self._logger.debug('Update: {update}', update=update)
+        try:
+            return HTTPStatus.OK, await self._answer.reply(update)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Catching all exceptions, because telegram resends update on non 2xx response
+            self._logger.exception('Fail on process update')
+            return HTTPStatus.OK, ''
+
+    def _status(self, request: WebhookRequest) -> HTTPStatus:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_status"
+        if request.path != self._path:
+            return HTTPStatus.NOT_FOUND
+        if request.method != 'POST':
+            return HTTPStatus.METHOD_NOT_ALLOWED
+        if not hmac.compare_digest(request.secret().encode(), self._secret.encode()):
+            return HTTPStatus.UNAUTHORIZED
+        return self._length_status(request)
+
+    def _length_status(self, request: WebhookRequest) -> HTTPStatus:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_length_status"
+        try:
+            content_length = request.content_length()
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST
+        if content_length > MAX_BODY_SIZE:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+        return HTTPStatus.OK
@@ -0,0 +1,63 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import Final, final
+
+import attrs
+
+SECRET_TOKEN_HEADER: Final = 'x-telegram-bot-api-secret-token'
+
+
+@final
+@attrs.define(frozen=True)
+class WebhookRequest:
+    """Стартовая строка и заголовки HTTP запроса к webhook."""
+
+    method: str
+    path: str
+    headers: dict[str, str]
+
+    def secret(self) -> str:
+        """Секретный токен телеграма.
+
+        :return: str
+        """
+        return self.headers.get(SECRET_TOKEN_HEADER, '')
+
+    def content_length(self) -> int:
+        """Длина тела запроса.
+
+        :return: int
+        :raises ValueError: если заголовок не является неотрицательным числом
+        """
+        content_length = int(self.headers.get('content-length', 0))
+        if content_length < 0:
+            msg = 'Negative content length: {0}'.format(content_length)
+            raise ValueError(msg)
+        return content_length
+
+    def keep_alive(self) -> bool:
+        """Клиент не просил закрыть соединение.
+
+        :return: bool
+        """
+        return self.headers.get('connection', '').lower() != 'close'
@@ -20,40 +20,469 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
+# flake8: noqa: WPS202
+
 import sys
+from typing import Final
 
+import httpx
 import sentry_sdk
 from loguru import logger
 from redis import asyncio as aioredis
 
+from app_types.cache_stats_report import CacheStatsReport
+from app_types.flushable import Flushable
+from app_types.queue_stats_report import QueueStatsReport
+from app_types.runable import Runable
+from app_types.sync_runable import SyncRunable
+from app_types.throttle_stats import ThrottleStats
+from app_types.throttle_stats_report import ThrottleStatsReport
 from db.connection import pgsql
+from integrations.http_client_app import HttpClientApp
+from integrations.tg.aimd_concurrency_limit import AimdConcurrencyLimit
 from integrations.tg.app_with_get_me import AppWithGetMe
+from integrations.tg.app_with_set_webhook import AppWithSetWebhook
+from integrations.tg.chat_lanes_pool import ChatLanesPool
+from integrations.tg.chat_lanes_webhook_answer import ChatLanesWebhookAnswer
 from integrations.tg.database_connected_app import DatabaseConnectedApp
+from integrations.tg.exception_logged_sendable import ExceptionLoggedSendable
+from integrations.tg.inline_webhook_answer import InlineWebhookAnswer
 from integrations.tg.polling_app import PollingApp
 from integrations.tg.polling_updates import PollingUpdatesIterator
+from integrations.tg.pooled_webhook_answer import PooledWebhookAnswer
+from integrations.tg.redis_chat_rate_limits import RedisChatRateLimits
 from integrations.tg.sendable_answer import SendableAnswer
-from integrations.tg.tg_answers import TgEmptyAnswer, TgMeasureAnswer
+from integrations.tg.task_throttle_stats import TaskThrottleStats
+from integrations.tg.tg_answers import TgAnswer, TgEmptyAnswer, TgMeasureAnswer
+from integrations.tg.tg_rate_limited_transport import TgRateLimitedTransport
+from integrations.tg.throttle_counter import ThrottleCounter
+from integrations.tg.token_bucket_rate import TokenBucketRate
 from integrations.tg.udpates_with_offset_url import UpdatesWithOffsetURL
+from integrations.tg.updates_pool import UpdatesPool
 from integrations.tg.updates_timeout import UpdatesTimeout
 from integrations.tg.updates_url import UpdatesURL
 from integrations.tg.upddates_long_pollinig_url import UpdatesLongPollingURL
+from integrations.tg.webhook_answer import WebhookAnswer
+from integrations.tg.webhook_app import WebhookApp
 from quranbot_answer import QuranbotAnswer
 from services.cli_app import CliApp
 from services.command_cli_app import CommandCliApp
 from services.fork_cli_app import ForkCliApp
+from services.json_path_cache import JsonPathCache
 from services.logged_answer import LoggedAnswer
+from services.periodic_stats_log import PeriodicStatsLog
+from services.stats_logged_app import StatsLoggedApp
 from settings import BASE_DIR, Settings
+from srv.ayats.ayats_search import AyatsSearch
+from srv.ayats.cached_ayats_search import CachedAyatsSearch
+from srv.ayats.corpus_loaded_app import CorpusLoadedApp
+from srv.ayats.pg_ayats_search import PgAyatsSearch
+from srv.ayats.pg_quran_corpus import PgQuranCorpus
+from srv.ayats.quran_corpus import QuranCorpus
+from srv.events.amqp_channels import AmqpChannels
 from srv.events.ayat_changed_event import RbmqAyatChangedEvent
+from srv.events.buffered_sink import BufferedSink
+from srv.events.cached_schema_validation import CachedSchemaValidation
 from srv.events.check_user_status import CheckUsersStatus
-from srv.events.event_fork import EventFork
+from srv.events.dead_letter_event import DeadLetterEvent
+from srv.events.disabled_schema_validation import DisabledSchemaValidation
+from srv.events.event_hook import EventHook
 from srv.events.event_hook_app import EventHookApp
+from srv.events.event_route import EventRoute
+from srv.events.event_routes import EventRoutes
+from srv.events.flushed_sink_app import FlushedSinkApp
+from srv.events.http_client_event_hook import HttpClientEventHook
+from srv.events.invalidating_event import InvalidatingEvent
+from srv.events.invalidation_bus import InvalidationBus
+from srv.events.invalidation_bus_app import InvalidationBusApp
+from srv.events.invalidation_bus_event_hook import InvalidationBusEventHook
 from srv.events.mailing_created import MailingCreatedEvent
 from srv.events.message_deleted import MessageDeleted
 from srv.events.morning_content_published import MorningContentPublishedEvent
 from srv.events.prayer_created_event import PrayerCreatedEvent
 from srv.events.prayers_mailing import PrayersMailingPublishedEvent
+from srv.events.queued_sink import QueuedSink
 from srv.events.rabbitmq_sink import RabbitmqSink
+from srv.events.rbmq_channel_pool import RbmqChannelPool
+from srv.events.rbmq_channels_app import RbmqChannelsApp
+from srv.events.rbmq_channels_event_hook import RbmqChannelsEventHook
+from srv.events.rbmq_event_ack import RbmqEventAck
 from srv.events.rbmq_event_hook import RbmqEventHook
+from srv.events.redis_invalidation_bus import RedisInvalidationBus
+from srv.events.schema_validation import SchemaValidation
+from srv.events.sink import Sink
+from srv.events.stats_logged_event_hook import StatsLoggedEventHook
+from srv.events.validated_event import ValidatedEvent
+
+AYATS_KEY_SPACE: Final = 'ayats'
+
+
+def _events_app(
+    settings: Settings,
+    invalidation_bus: InvalidationBus,
+    rbmq_channels: AmqpChannels,
+    updates_log_buffer: Flushable,
+    updates_log_sink: QueuedSink,
+    app: Runable,
+) -> Runable:
+    return InvalidationBusApp(
+        invalidation_bus,
+        RbmqChannelsApp(
+            rbmq_channels,
+            FlushedSinkApp(
+                updates_log_buffer,
+                FlushedSinkApp(
+                    updates_log_sink,
+                    StatsLoggedApp(
+                        PeriodicStatsLog(
+                            [QueueStatsReport('updates-log', updates_log_sink)],
+                            settings.STATS_LOG_INTERVAL,
+                            logger,
+                        ),
+                        app,
+                    ),
+                ),
+            ),
+        ),
+    )
+
+
+def _updates_app(
+    settings: Settings,
+    http_client: httpx.AsyncClient,
+    quran_corpus: QuranCorpus,
+    updates_pool: Flushable,
+    app: Runable,
+) -> Runable:
+    return HttpClientApp(
+        http_client,
+        DatabaseConnectedApp(
+            pgsql,
+            CorpusLoadedApp(
+                quran_corpus,
+                AppWithGetMe(
+                    FlushedSinkApp(updates_pool, app),
+                    settings.API_TOKEN,
+                    http_client,
+                    logger,
+                ),
+            ),
+        ),
+    )
+
+
+def _webhook_answer(
+    settings: Settings,
+    quranbot_answer: TgAnswer,
+    http_client: httpx.AsyncClient,
+    updates_log_sink: Sink,
+    updates_pool: UpdatesPool,
+) -> WebhookAnswer:
+    if settings.WEBHOOK_INLINE_REPLY:
+        return ChatLanesWebhookAnswer(
+            InlineWebhookAnswer(quranbot_answer, http_client, updates_log_sink, logger),
+            settings.POLLING_CONCURRENCY,
+        )
+    return PooledWebhookAnswer(updates_pool)
+
+
+def _tg_transport(settings: Settings, redis: aioredis.Redis, task_stats: ThrottleCounter) -> TgRateLimitedTransport:
+    return TgRateLimitedTransport(
+        httpx.AsyncHTTPTransport(
+            http2=settings.HTTP2,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        ),
+        RedisChatRateLimits(
+            redis,
+            TokenBucketRate(settings.TG_GLOBAL_RATE, int(settings.TG_GLOBAL_RATE)),
+            TokenBucketRate(settings.TG_CHAT_RATE, settings.TG_CHAT_BURST),
+            TokenBucketRate(settings.TG_GROUP_RATE, settings.TG_GROUP_BURST),
+        ),
+        settings.TG_FLOOD_RETRIES,
+        task_stats,
+        logger,
+    )
+
+
+def _rbmq_event_hook(
+    settings: Settings,
+    rbmq_channels: AmqpChannels,
+    validation: SchemaValidation,
+    tg_stats: ThrottleStats,
+    *routes: EventRoute,
+) -> EventHook:
+    json_paths = JsonPathCache(settings.JSON_PATH_CACHE_SIZE)
+    consumer_channels = RbmqChannelPool.settings_ctor(settings, len(settings.RABBITMQ_QUEUES_CONCURRENCY))
+    dead_letter = DeadLetterEvent(rbmq_channels, 'dead-letter-events', logger)
+    return StatsLoggedEventHook(
+        PeriodicStatsLog(
+            [
+                CacheStatsReport('jsonpath', json_paths),
+                ThrottleStatsReport('telegram', tg_stats),
+            ],
+            settings.STATS_LOG_INTERVAL,
+            logger,
+        ),
+        RbmqChannelsEventHook(
+            consumer_channels,
+            RbmqEventHook(
+                settings,
+                consumer_channels,
+                pgsql,
+                RbmqEventAck(
+                    json_paths,
+                    logger,
+                    ValidatedEvent(
+                        EventRoutes.routes_ctor(dead_letter, *routes),
+                        validation if settings.EVENTS_VALIDATION in {'consume', 'both'} else DisabledSchemaValidation(),
+                        dead_letter,
+                        logger,
+                    ),
+                ),
+                logger,
+            ),
+        ),
+    )
+
+
+def _ayats_search(settings: Settings, invalidation_bus: InvalidationBus) -> AyatsSearch:
+    ayats_search = CachedAyatsSearch(
+        PgAyatsSearch(pgsql),
+        settings.AYATS_SEARCH_CACHE_SIZE,
+        settings.AYATS_SEARCH_CACHE_TTL,
+    )
+    invalidation_bus.subscribe(AYATS_KEY_SPACE, ayats_search)
+    return ayats_search
+
+
+def _inbound_app(
+    settings: Settings,
+    http_client: httpx.AsyncClient,
+    quranbot_answer: TgAnswer,
+    updates_log_sink: Sink,
+    updates_pool: UpdatesPool,
+    webhook: bool,
+) -> Runable:
+    if webhook:
+        return AppWithSetWebhook(
+            WebhookApp(
+                settings.WEBHOOK_HOST,
+                settings.WEBHOOK_PORT,
+                settings.WEBHOOK_PATH,
+                settings.WEBHOOK_SECRET,
+                _webhook_answer(settings, quranbot_answer, http_client, updates_log_sink, updates_pool),
+                settings.WEBHOOK_READ_TIMEOUT,
+                logger,
+            ),
+            settings.API_TOKEN,
+            settings.WEBHOOK_URL,
+            settings.WEBHOOK_SECRET,
+            http_client,
+            logger,
+        )
+    return PollingApp(
+        PollingUpdatesIterator(
+            UpdatesLongPollingURL(
+                UpdatesWithOffsetURL(
+                    UpdatesURL(settings.API_TOKEN),
+                ),
+                UpdatesTimeout(),
+            ),
+            UpdatesTimeout(),
+            http_client,
+        ),
+        updates_pool,
+        logger,
+    )
+
+
+def _quranbot_updates_app(
+    settings: Settings,
+    redis: aioredis.Redis,
+    rabbitmq_sink: Sink,
+    invalidation_bus: InvalidationBus,
+    updates_log_sink: Sink,
+    webhook: bool,
+) -> Runable:
+    http_client = httpx.AsyncClient(
+        transport=_tg_transport(settings, redis, TaskThrottleStats()),
+        timeout=settings.HTTP_TIMEOUT,
+    )
+    quran_corpus = PgQuranCorpus(pgsql)
+    invalidation_bus.subscribe(AYATS_KEY_SPACE, quran_corpus)
+    quranbot_answer = TgMeasureAnswer(
+        QuranbotAnswer(
+            pgsql,
+            quran_corpus,
+            _ayats_search(settings, invalidation_bus),
+            redis,
+            http_client,
+            rabbitmq_sink,
+            settings,
+            logger,
+        ),
+        logger,
+    )
+    updates_pool = ChatLanesPool(
+        ExceptionLoggedSendable(
+            LoggedAnswer(
+                SendableAnswer(quranbot_answer, http_client, logger),
+                updates_log_sink,
+            ),
+            logger,
+        ),
+        settings.POLLING_CONCURRENCY,
+        settings.POLLING_SHUTDOWN_TIMEOUT,
+        logger,
+    )
+    return _updates_app(
+        settings,
+        http_client,
+        quran_corpus,
+        updates_pool,
+        _inbound_app(settings, http_client, quranbot_answer, updates_log_sink, updates_pool, webhook),
+    )
+
+
+def _quranbot_app(
+    settings: Settings,
+    redis: aioredis.Redis,
+    rbmq_channels: AmqpChannels,
+    rabbitmq_sink: RabbitmqSink,
+    webhook: bool,
+) -> SyncRunable:
+    updates_log_buffer = BufferedSink(
+        rabbitmq_sink,
+        settings.UPDATES_LOG_BATCH_SIZE,
+        settings.UPDATES_LOG_FLUSH_DELAY,
+        logger,
+    )
+    updates_log_sink = QueuedSink(
+        updates_log_buffer,
+        settings.UPDATES_LOG_QUEUE_SIZE,
+        settings.UPDATES_LOG_SHUTDOWN_TIMEOUT,
+        logger,
+    )
+    invalidation_bus = RedisInvalidationBus(redis, settings.INVALIDATION_RECONNECT_DELAY, logger)
+    return CliApp(_events_app(
+        settings,
+        invalidation_bus,
+        rbmq_channels,
+        updates_log_buffer,
+        updates_log_sink,
+        _quranbot_updates_app(settings, redis, rabbitmq_sink, invalidation_bus, updates_log_sink, webhook),
+    ))
+
+
+def _event_routes(
+    settings: Settings,
+    redis: aioredis.Redis,
+    http_client: httpx.AsyncClient,
+    tg_stats: ThrottleStats,
+    rabbitmq_sink: Sink,
+) -> list[EventRoute]:
+    tg_concurrency = AimdConcurrencyLimit(
+        settings.TG_CONCURRENCY_MIN,
+        settings.TG_CONCURRENCY_MAX,
+        settings.TG_CONCURRENCY_TARGET_LATENCY,
+        settings.TG_CONCURRENCY_INITIAL,
+    )
+    return [
+        EventRoute('Mailing.DailyAyats', 1, MorningContentPublishedEvent(
+            TgEmptyAnswer(settings.API_TOKEN),
+            http_client,
+            tg_stats,
+            tg_concurrency,
+            pgsql,
+            settings,
+            rabbitmq_sink,
+            logger,
+        )),
+        EventRoute('Mailing.DailyPrayers', 1, PrayersMailingPublishedEvent(
+            TgEmptyAnswer(settings.API_TOKEN),
+            http_client,
+            tg_stats,
+            tg_concurrency,
+            pgsql,
+            settings,
+            rabbitmq_sink,
+            logger,
+            redis,
+        )),
+        EventRoute('Mailing.Created', 1, MailingCreatedEvent(
+            TgEmptyAnswer(settings.API_TOKEN),
+            http_client,
+            tg_stats,
+            tg_concurrency,
+            pgsql,
+            rabbitmq_sink,
+            logger,
+            settings,
+        )),
+        EventRoute('User.CheckStatus', 1, CheckUsersStatus(
+            TgEmptyAnswer(settings.API_TOKEN),
+            http_client,
+            tg_stats,
+            tg_concurrency,
+            pgsql,
+            rabbitmq_sink,
+            logger,
+            settings.MAILING_BATCH_SIZE,
+        )),
+        EventRoute('Messages.Deleted', 2, MessageDeleted(
+            TgEmptyAnswer(settings.API_TOKEN),
+            http_client,
+            pgsql,
+            rabbitmq_sink,
+            logger,
+        )),
+        EventRoute('Prayers.Created', 2, PrayerCreatedEvent(pgsql)),
+    ]
+
+
+def _receive_events_app(
+    settings: Settings,
+    redis: aioredis.Redis,
+    rbmq_channels: AmqpChannels,
+    schema_validation: SchemaValidation,
+    rabbitmq_sink: Sink,
+) -> SyncRunable:
+    tg_task_stats = TaskThrottleStats()
+    tg_transport = _tg_transport(settings, redis, tg_task_stats)
+    http_client = httpx.AsyncClient(
+        transport=tg_transport,
+        timeout=settings.HTTP_TIMEOUT,
+    )
+    quran_corpus = PgQuranCorpus(pgsql)
+    invalidation_bus = RedisInvalidationBus(redis, settings.INVALIDATION_RECONNECT_DELAY, logger)
+    invalidation_bus.subscribe(AYATS_KEY_SPACE, quran_corpus)
+    return EventHookApp(
+        HttpClientEventHook(
+            http_client,
+            InvalidationBusEventHook(
+                invalidation_bus,
+                RbmqChannelsEventHook(
+                    rbmq_channels,
+                    _rbmq_event_hook(
+                        settings,
+                        rbmq_channels,
+                        schema_validation,
+                        tg_transport,
+                        EventRoute('Ayat.Changed', 1, InvalidatingEvent(
+                            RbmqAyatChangedEvent(pgsql, quran_corpus),
+                            invalidation_bus,
+                            AYATS_KEY_SPACE,
+                            '$.data.public_id',
+                        )),
+                        *_event_routes(settings, redis, http_client, tg_task_stats, rabbitmq_sink),
+                    ),
+                ),
+            ),
+        ),
+    )
 
 
 def main(sys_args: list[str]) -> None:
@@ -62,100 +491,31 @@ def main(sys_args: list[str]) -> None:
     :param sys_args: list[str]
     """
     settings = Settings(_env_file=BASE_DIR.parent / '.env')
-    rabbitmq_sink = RabbitmqSink(settings, logger)
+    rbmq_channels = RbmqChannelPool.settings_ctor(settings, settings.RABBITMQ_CHANNELS)
+    schema_validation = CachedSchemaValidation()
+    rabbitmq_sink = RabbitmqSink(
+        rbmq_channels,
+        schema_validation if settings.EVENTS_VALIDATION in {'publish', 'both'} else DisabledSchemaValidation(),
+        logger,
+    )
     redis = aioredis.from_url(str(settings.REDIS_DSN))
     if settings.SENTRY_DSN:
         sentry_sdk.init(
             dsn=settings.SENTRY_DSN,
             enable_tracing=True,
         )
-    quranbot_polling_app = CliApp(
-        DatabaseConnectedApp(
-            pgsql,
-            AppWithGetMe(
-                PollingApp(
-                    PollingUpdatesIterator(
-                        UpdatesLongPollingURL(
-                            UpdatesWithOffsetURL(
-                                UpdatesURL(settings.API_TOKEN),
-                            ),
-                            UpdatesTimeout(),
-                        ),
-                        UpdatesTimeout(),
-                    ),
-                    LoggedAnswer(
-                        SendableAnswer(
-                            TgMeasureAnswer(
-                                QuranbotAnswer(
-                                    pgsql,
-                                    redis,
-                                    rabbitmq_sink,
-                                    settings,
-                                    logger,
-                                ),
-                                logger,
-                            ),
-                            logger,
-                        ),
-                        rabbitmq_sink,
-                    ),
-                    logger,
-                ),
-                settings.API_TOKEN,
-                logger,
-            ),
-        ),
-    )
     ForkCliApp(
         CommandCliApp(
             'run_polling',
-            quranbot_polling_app,
+            _quranbot_app(settings, redis, rbmq_channels, rabbitmq_sink, webhook=False),
+        ),
+        CommandCliApp(
+            'run_webhook',
+            _quranbot_app(settings, redis, rbmq_channels, rabbitmq_sink, webhook=True),
         ),
         CommandCliApp(
             'receive_events',
-            EventHookApp(
-                RbmqEventHook(
-                    settings,
-                    pgsql,
-                    logger,
-                    EventFork('Ayat.Changed', 1, RbmqAyatChangedEvent(pgsql)),
-                    EventFork('Mailing.DailyAyats', 1, MorningContentPublishedEvent(
-                        TgEmptyAnswer(settings.API_TOKEN),
-                        pgsql,
-                        settings,
-                        rabbitmq_sink,
-                        logger,
-                    )),
-                    EventFork('Mailing.DailyPrayers', 1, PrayersMailingPublishedEvent(
-                        TgEmptyAnswer(settings.API_TOKEN),
-                        pgsql,
-                        settings,
-                        rabbitmq_sink,
-                        logger,
-                        redis,
-                    )),
-                    EventFork('Mailing.Created', 1, MailingCreatedEvent(
-                        TgEmptyAnswer(settings.API_TOKEN),
-                        pgsql,
-                        rabbitmq_sink,
-                        logger,
-                        settings,
-                    )),
-                    EventFork('User.CheckStatus', 1, CheckUsersStatus(
-                        TgEmptyAnswer(settings.API_TOKEN),
-                        pgsql,
-                        rabbitmq_sink,
-                        logger,
-                    )),
-                    EventFork('Messages.Deleted', 2, MessageDeleted(
-                        TgEmptyAnswer(settings.API_TOKEN),
-                        pgsql,
-                        rabbitmq_sink,
-                        logger,
-                    )),
-                    EventFork('Prayers.Created', 2, PrayerCreatedEvent(pgsql)),
-                ),
-            ),
+            _receive_events_app(settings, redis, rbmq_channels, schema_validation, rabbitmq_sink),
         ),
     ).run(sys_args)
 
@@ -42,26 +42,21 @@ from handlers.search_city_answer import SearchCityAnswer
 from handlers.skipped_prayers_answer import SkippedPrayersAnswer
 from handlers.status_answer import StatusAnswer
 from handlers.user_prayer_status_change_answer import UserPrayerStatusChangeAnswer
-from integrations.tg.tg_answers import (
-    TgAnswer,
-    TgAnswerFork,
-    TgAnswerToSender,
-    TgCallbackQueryRegexAnswer,
-    TgEmptyAnswer,
-    TgMessageAnswer,
-    TgMessageRegexAnswer,
-    TgTextAnswer,
-)
+from integrations.tg.tg_answers import TgAnswer, TgAnswerToSender, TgEmptyAnswer, TgMessageAnswer, TgTextAnswer
 from integrations.tg.tg_answers.message_answer_to_sender import TgHtmlMessageAnswerToSender
+from integrations.tg.tg_answers.tg_request import TgRequest
+from services.answers.answer_route import AnswerRoute
 from services.answers.change_state_answer import ChangeStateAnswer
+from services.answers.indexed_answer_fork import IndexedAnswerFork
 from services.answers.safe_fork import SafeFork
 from services.help_answer import HelpAnswer
-from services.state_answer import StepAnswer
 from settings import Settings
 from srv.admin_messages.pg_admin_message import PgAdminMessage
 from srv.ayats.ayat_by_id_answer import AyatByIdAnswer
+from srv.ayats.ayats_search import AyatsSearch
 from srv.ayats.change_favorite_ayat_answer import ChangeFavoriteAyatAnswer
 from srv.ayats.favorite_ayat_page import FavoriteAyatPage
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.events.sink import Sink
 from srv.prayers.inline_query_answer import InlineQueryAnswer
 from srv.prayers.invite_set_city_answer import InviteSetCityAnswer
@@ -76,7 +71,10 @@ class QuranbotAnswer(TgAnswer):
     def __init__(
         self,
         database: Database,
+        corpus: QuranCorpus,
+        search: AyatsSearch,
         redis: Redis,
+        http_client: httpx.AsyncClient,
         event_sink: Sink,
         settings: Settings,
         logger: LogSink,
@@ -84,24 +82,30 @@ class QuranbotAnswer(TgAnswer):
         """Конструктор класса.
 
         :param database: Database
+        :param corpus: QuranCorpus
+        :param search: AyatsSearch
         :param redis: Redis
+        :param http_client: httpx.AsyncClient
         :param event_sink: SinkInterface
         :param settings: Settings
         :param logger: LogSink
         """
         self._pgsql = database
+        self._corpus = corpus
+        self._search = search
         self._redis = redis
+        self._http_client = http_client
         self._event_sink = event_sink
         self._settings = settings
         self._logger = logger
         self._pre_build()
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await self._answer.build(update)
 
@@ -109,9 +113,10 @@ class QuranbotAnswer(TgAnswer):
         # TODO #802 Удалить или задокументировать необходимость приватного метода "_pre_build"
         empty_answer = TgEmptyAnswer(self._settings.API_TOKEN)
         self._answer = SafeFork(
-            TgAnswerFork(
+            IndexedAnswerFork.routes_ctor(
+                self._redis,
                 self._logger,
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     'Подкасты',
                     RandomPodcastAnswer(
                         self._settings.DEBUG,
@@ -121,7 +126,7 @@ class QuranbotAnswer(TgAnswer):
                         self._logger,
                     ),
                 ),
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     r'/podcast\d+',
                     ConcretePodcastAnswer(
                         self._settings.DEBUG,
@@ -131,7 +136,7 @@ class QuranbotAnswer(TgAnswer):
                         self._logger,
                     ),
                 ),
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     'Время намаза',
                     PrayerTimeAnswer.new_prayers_ctor(
                         self._pgsql,
@@ -142,27 +147,28 @@ class QuranbotAnswer(TgAnswer):
                         self._settings,
                     ),
                 ),
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     '/skipped_prayers',
                     SkippedPrayersAnswer(empty_answer, self._pgsql),
                 ),
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     'Избранное',
                     FavoriteAyatsAnswer(
-                        self._settings.DEBUG, self._pgsql, self._redis, empty_answer, self._logger,
+                        self._settings.DEBUG, self._pgsql, self._corpus, self._redis, empty_answer, self._logger,
                     ),
                 ),
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     r'\d+:\d+',
                     SearchAyatByNumbersAnswer(
                         self._settings.DEBUG,
                         empty_answer,
                         self._redis,
                         self._pgsql,
+                        self._corpus,
                         self._logger,
                     ),
                 ),
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     'Найти аят',
                     ChangeStateAnswer(
                         TgTextAnswer.str_ctor(TgHtmlMessageAnswerToSender(empty_answer), 'Введите слово для поиска:'),
@@ -171,7 +177,7 @@ class QuranbotAnswer(TgAnswer):
                         self._logger,
                     ),
                 ),
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     'Поменять город',
                     InviteSetCityAnswer(
                         TgTextAnswer.str_ctor(
@@ -182,17 +188,23 @@ class QuranbotAnswer(TgAnswer):
                         self._logger,
                     ),
                 ),
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     '/start',
                     FullStartAnswer(
-                        self._pgsql, empty_answer, self._event_sink, self._redis, self._settings, self._logger,
+                        self._pgsql,
+                        self._corpus,
+                        empty_answer,
+                        self._event_sink,
+                        self._redis,
+                        self._settings,
+                        self._logger,
                     ),
                 ),
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     '/status',
                     StatusAnswer(empty_answer, self._pgsql, self._redis),
                 ),
-                TgMessageRegexAnswer(
+                AnswerRoute.message_regex_ctor(
                     '/help',
                     HelpAnswer(
                         empty_answer,
@@ -201,23 +213,25 @@ class QuranbotAnswer(TgAnswer):
                         self._logger,
                     ),
                 ),
-                StepAnswer(
+                AnswerRoute.step_ctor(
                     UserStep.ayat_search.value,
-                    SearchAyatByKeywordAnswer(
-                        self._settings.DEBUG,
-                        empty_answer,
-                        self._redis,
-                        self._pgsql,
-                        self._logger,
+                    AnswerRoute.any_update_ctor(
+                        SearchAyatByKeywordAnswer(
+                            self._settings.DEBUG,
+                            empty_answer,
+                            self._redis,
+                            self._pgsql,
+                            self._corpus,
+                            self._search,
+                            self._logger,
+                        ),
                     ),
-                    self._redis,
-                    self._logger,
                 ),
-                TgCallbackQueryRegexAnswer(
+                AnswerRoute.callback_regex_ctor(
                     '(mark_readed|mark_not_readed)',
                     UserPrayerStatusChangeAnswer(empty_answer, self._pgsql, self._redis, self._logger, self._settings),
                 ),
-                TgCallbackQueryRegexAnswer(
+                AnswerRoute.callback_regex_ctor(
                     '(like|dislike)',
                     PodcastReactionChangeAnswer(
                         self._settings.DEBUG,
@@ -227,38 +241,53 @@ class QuranbotAnswer(TgAnswer):
                         self._logger,
                     ),
                 ),
-                TgCallbackQueryRegexAnswer(
+                AnswerRoute.callback_regex_ctor(
                     'getAyat',
-                    AyatByIdAnswer(self._settings.DEBUG, empty_answer, self._pgsql),
+                    AyatByIdAnswer(self._settings.DEBUG, empty_answer, self._pgsql, self._corpus),
                 ),
-                TgCallbackQueryRegexAnswer(
+                AnswerRoute.callback_regex_ctor(
                     'decr',
                     DecrementSkippedPrayerAnswer(empty_answer, self._pgsql),
                 ),
-                StepAnswer(
+                AnswerRoute.step_ctor(
                     UserStep.ayat_search.value,
-                    TgCallbackQueryRegexAnswer(
+                    AnswerRoute.callback_regex_ctor(
                         'getSAyat',
-                        PaginateBySearchAyat(empty_answer, self._redis, self._pgsql, self._settings, self._logger),
+                        PaginateBySearchAyat(
+                            empty_answer,
+                            self._redis,
+                            self._pgsql,
+                            self._corpus,
+                            self._search,
+                            self._settings,
+                            self._logger,
+                        ),
                     ),
-                    self._redis,
-                    self._logger,
                 ),
-                StepAnswer(
+                AnswerRoute.step_ctor(
                     UserStep.city_search.value,
-                    SearchCityAnswer(self._pgsql, empty_answer, self._settings.DEBUG, self._redis, self._logger),
-                    self._redis,
-                    self._logger,
+                    AnswerRoute.any_update_ctor(
+                        SearchCityAnswer(
+                            self._pgsql,
+                            empty_answer,
+                            self._http_client,
+                            self._settings.DEBUG,
+                            self._redis,
+                            self._logger,
+                        ),
+                    ),
                 ),
-                TgCallbackQueryRegexAnswer(
+                AnswerRoute.callback_regex_ctor(
                     'getFAyat',
-                    FavoriteAyatPage(self._settings.DEBUG, empty_answer, self._pgsql),
+                    FavoriteAyatPage(self._settings.DEBUG, empty_answer, self._pgsql, self._corpus),
                 ),
-                TgCallbackQueryRegexAnswer(
+                AnswerRoute.callback_regex_ctor(
                     '(addToFavor|removeFromFavor)',
-                    ChangeFavoriteAyatAnswer(self._pgsql, empty_answer, self._redis, self._logger),
+                    ChangeFavoriteAyatAnswer(
+                        self._pgsql, self._corpus, self._search, empty_answer, self._redis, self._logger,
+                    ),
                 ),
-                InlineQueryAnswer(empty_answer, self._pgsql),
+                AnswerRoute.inline_query_ctor(InlineQueryAnswer(empty_answer, self._pgsql)),
             ),
             TgAnswerToSender(
                 TgMessageAnswer(empty_answer),
@@ -29,15 +29,18 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from loguru import logger
 
 from settings import BASE_DIR, Settings
+from srv.events.cached_schema_validation import CachedSchemaValidation
 from srv.events.rabbitmq_sink import RabbitmqSink
+from srv.events.rbmq_channel_pool import RbmqChannelPool
 
 logging.basicConfig()
 logging.getLogger('apscheduler').setLevel(logging.DEBUG)
 settings = Settings(_env_file=BASE_DIR.parent / '.env')
+sink = RabbitmqSink(RbmqChannelPool.settings_ctor(settings, 1), CachedSchemaValidation(), logger)
 
 
 async def _morning_ayats_task() -> None:
-    await RabbitmqSink(settings, logger).send(
+    await sink.send(
         'quranbot.mailings',
         {},
         'Mailing.DailyAyats',
@@ -46,7 +49,7 @@ async def _morning_ayats_task() -> None:
 
 
 async def _daily_prayers_task() -> None:
-    await RabbitmqSink(settings, logger).send(
+    await sink.send(
         'quranbot.mailings',
         {},
         'Mailing.DailyPrayers',
@@ -55,7 +58,7 @@ async def _daily_prayers_task() -> None:
 
 
 async def _daily_check_user_status() -> None:
-    await RabbitmqSink(settings, logger).send(
+    await sink.send(
         'quranbot.users',
         {},
         'User.CheckStatus',
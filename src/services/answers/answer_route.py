@@ -0,0 +1,103 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import enum
+from typing import final
+
+import attrs
+
+from integrations.tg.tg_answers import TgAnswer
+
+
+@final
+class RouteKind(enum.Enum):
+    """Вид обновления, которое обрабатывает маршрут."""
+
+    message_text = 'message_text'
+    callback_query = 'callback_query'
+    inline_query = 'inline_query'
+    any_update = 'any_update'
+
+
+@final
+@attrs.define(frozen=True)
+class AnswerRoute:
+    """Описание ветки маршрутизации для `IndexedAnswerFork`.
+
+    Маршруты повторяют ветки `TgAnswerFork`:
+    message_regex_ctor - `TgMessageRegexAnswer`,
+    callback_regex_ctor - `TgCallbackQueryRegexAnswer`,
+    step_ctor - `StepAnswer` над другим маршрутом.
+    """
+
+    kind: RouteKind
+    answer: TgAnswer
+    pattern: str = ''
+    step: str = ''
+
+    @classmethod
+    def message_regex_ctor(cls, pattern: str, answer: TgAnswer) -> 'AnswerRoute':
+        """Маршрут по тексту сообщения.
+
+        :param pattern: str
+        :param answer: TgAnswer
+        :return: AnswerRoute
+        """
+        return cls(RouteKind.message_text, answer, pattern)
+
+    @classmethod
+    def callback_regex_ctor(cls, pattern: str, answer: TgAnswer) -> 'AnswerRoute':
+        """Маршрут по данным с кнопки.
+
+        :param pattern: str
+        :param answer: TgAnswer
+        :return: AnswerRoute
+        """
+        return cls(RouteKind.callback_query, answer, pattern)
+
+    @classmethod
+    def inline_query_ctor(cls, answer: TgAnswer) -> 'AnswerRoute':
+        """Маршрут для инлайн поиска.
+
+        :param answer: TgAnswer
+        :return: AnswerRoute
+        """
+        return cls(RouteKind.inline_query, answer)
+
+    @classmethod
+    def any_update_ctor(cls, answer: TgAnswer) -> 'AnswerRoute':
+        """Маршрут для любого обновления.
+
+        :param answer: TgAnswer
+        :return: AnswerRoute
+        """
+        return cls(RouteKind.any_update, answer)
+
+    @classmethod
+    def step_ctor(cls, step: str, route: 'AnswerRoute') -> 'AnswerRoute':
+        """Маршрут, доступный только в определенном состоянии пользователя.
+
+        :param step: str
+        :param route: AnswerRoute
+        :return: AnswerRoute
+        """
+        return attrs.evolve(route, step=step)
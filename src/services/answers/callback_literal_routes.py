@@ -0,0 +1,88 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import re
+from collections.abc import Container, Sequence
+from typing import Final, final, override
+
+import attrs
+from pyeo import elegant
+
+from services.answers.answer_route import AnswerRoute, RouteKind
+from services.answers.route_matches import RouteMatches
+
+LITERALS: Final = re.compile(r'^\(?(\w+(?:\|\w+)*)\)?$')
+WORDS: Final = re.compile(r'\w+')
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class CallbackLiteralRoutes(RouteMatches):
+    """Маршруты по данным с кнопки, отобранные по литералам шаблонов.
+
+    Регулярное выражение проверяется только у маршрутов, чей литерал
+    ("like" для шаблона "(like|dislike)") входит в данные кнопки.
+    Маршруты с шаблоном не из литералов хранятся с пустым литералом и проверяются всегда.
+    """
+
+    _literals: dict[int, list[str]]
+    _patterns: dict[int, re.Pattern]
+
+    @classmethod
+    def routes_ctor(cls, routes: Sequence[AnswerRoute]) -> RouteMatches:
+        """Конструктор из маршрутов.
+
+        :param routes: Sequence[AnswerRoute]
+        :return: RouteMatches
+        """
+        return cls(
+            {
+                idx: cls._pattern_literals(route.pattern)
+                for idx, route in enumerate(routes)
+                if route.kind == RouteKind.callback_query
+            },
+            {
+                idx: re.compile(route.pattern)
+                for idx, route in enumerate(routes)
+                if route.kind == RouteKind.callback_query
+            },
+        )
+
+    @override
+    def matched(self, update_value: str) -> Container[int]:
+        """Индексы подходящих маршрутов.
+
+        :param update_value: str - данные с кнопки
+        :return: Container[int]
+        """
+        return {
+            idx
+            for idx, literals in self._literals.items()
+            if any(literal in update_value for literal in literals)
+            and self._patterns[idx].search(update_value)
+        }
+
+    @classmethod
+    def _pattern_literals(cls, pattern: str) -> list[str]:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_pattern_literals"
+        return WORDS.findall(pattern) if LITERALS.match(pattern) else ['']
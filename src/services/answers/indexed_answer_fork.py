@@ -0,0 +1,96 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from contextlib import suppress
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+from redis.asyncio import Redis
+
+from app_types.logger import LogSink
+from app_types.update import Update
+from exceptions.internal_exceptions import NotProcessableUpdateError
+from integrations.tg.exceptions.update_parse_exceptions import (
+    CallbackQueryNotFoundError,
+    CoordinatesNotFoundError,
+    InlineQueryNotFoundError,
+    MessageIdNotFoundError,
+)
+from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
+from integrations.tg.tg_chat_id import TgChatId
+from services.answers.answer_route import AnswerRoute
+from services.answers.indexed_update_routes import IndexedUpdateRoutes
+from services.answers.update_routes import UpdateRoutes
+from srv.users.cached_user_state import CachedUserState
+from srv.users.redis_user_state import RedisUserState
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class IndexedAnswerFork(TgAnswer):
+    """Маршрутизация ответов по индексу, построенному при старте.
+
+    Результат совпадает с `TgAnswerFork` из тех же веток,
+    но проверяются только ветки, отобранные `UpdateRoutes` для обновления.
+    Состояние пользователя читается из redis не более одного раза на обновление.
+    """
+
+    _redis: Redis
+    _logger: LogSink
+    _routes: tuple[AnswerRoute, ...]
+    _update_routes: UpdateRoutes
+
+    @classmethod
+    def routes_ctor(cls, redis: Redis, logger: LogSink, *routes: AnswerRoute) -> TgAnswer:
+        """Конструктор с построением индекса.
+
+        :param redis: Redis
+        :param logger: LogSink
+        :param routes: AnswerRoute
+        :return: TgAnswer
+        """
+        return cls(redis, logger, routes, IndexedUpdateRoutes.routes_ctor(routes))
+
+    @override
+    async def build(self, update: Update) -> list[TgRequest]:
+        """Собрать ответ.
+
+        :param update: Update
+        :return: list[TgRequest]
+        :raises NotProcessableUpdateError: if not found matches
+        """
+        user_state = CachedUserState(RedisUserState(self._redis, TgChatId(update), self._logger))
+        for idx in self._update_routes.candidates(update.parsed()):
+            route = self._routes[idx]
+            if route.step and (await user_state.step()).value != route.step:
+                continue
+            with suppress(
+                CoordinatesNotFoundError, CallbackQueryNotFoundError, MessageIdNotFoundError, InlineQueryNotFoundError,
+            ):
+                origin_requests = await route.answer.build(update)
+                if origin_requests:
+                    self._logger.debug('Update processed by: {handler}', handler=route.answer)
+                    return origin_requests
+        raise NotProcessableUpdateError
@@ -0,0 +1,101 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import Container, Sequence
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from app_types.parsed_tg_update import ParsedTgUpdate
+from services.answers.answer_route import AnswerRoute, RouteKind
+from services.answers.callback_literal_routes import CallbackLiteralRoutes
+from services.answers.message_regex_routes import MessageRegexRoutes
+from services.answers.route_matches import RouteMatches
+from services.answers.update_routes import UpdateRoutes
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class IndexedUpdateRoutes(UpdateRoutes):
+    """Маршруты обновления по индексу, построенному при старте.
+
+    Маршруты заранее сгруппированы по виду обновления,
+    маршруты для любого обновления входят в каждую группу и проверяются всегда.
+    """
+
+    _by_kind: dict[RouteKind, tuple[int, ...]]
+    _any_update: frozenset[int]
+    _message_routes: RouteMatches
+    _callback_routes: RouteMatches
+
+    @classmethod
+    def routes_ctor(cls, routes: Sequence[AnswerRoute]) -> UpdateRoutes:
+        """Конструктор из маршрутов.
+
+        :param routes: Sequence[AnswerRoute]
+        :return: UpdateRoutes
+        """
+        return cls(
+            {
+                kind: tuple(
+                    idx
+                    for idx, route in enumerate(routes)
+                    if route.kind in {kind, RouteKind.any_update}
+                )
+                for kind in RouteKind
+            },
+            frozenset(
+                idx
+                for idx, route in enumerate(routes)
+                if route.kind == RouteKind.any_update
+            ),
+            MessageRegexRoutes.routes_ctor(routes),
+            CallbackLiteralRoutes.routes_ctor(routes),
+        )
+
+    @override
+    def candidates(self, parsed_update: ParsedTgUpdate) -> Sequence[int]:
+        """Индексы маршрутов в порядке проверки.
+
+        :param parsed_update: ParsedTgUpdate
+        :return: Sequence[int]
+        """
+        kind, matched = self._matched(parsed_update)
+        return [
+            idx
+            for idx in self._by_kind[kind]
+            if idx in matched or idx in self._any_update
+        ]
+
+    def _matched(self, parsed_update: ParsedTgUpdate) -> tuple[RouteKind, Container[int]]:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_matched"
+        if parsed_update.is_callback_query:
+            if parsed_update.callback_query_data is None:
+                return RouteKind.callback_query, ()
+            return RouteKind.callback_query, self._callback_routes.matched(parsed_update.callback_query_data)
+        if parsed_update.inline_query_id is not None:
+            return RouteKind.inline_query, self._by_kind[RouteKind.inline_query]
+        if parsed_update.message_text is None:
+            return RouteKind.any_update, ()
+        return RouteKind.message_text, self._message_routes.matched(parsed_update.message_text)
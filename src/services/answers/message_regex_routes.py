@@ -0,0 +1,73 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import re
+from collections.abc import Container, Sequence
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from services.answers.answer_route import AnswerRoute, RouteKind
+from services.answers.route_matches import RouteMatches
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class MessageRegexRoutes(RouteMatches):
+    """Маршруты по тексту сообщения, проверяемые одним регулярным выражением.
+
+    Шаблон каждого маршрута обернут в необязательный lookahead с именованной группой,
+    поэтому одно совпадение отмечает все маршруты, для которых сработал бы re.search.
+    """
+
+    _regex: re.Pattern
+
+    @classmethod
+    def routes_ctor(cls, routes: Sequence[AnswerRoute]) -> RouteMatches:
+        """Конструктор из маршрутов.
+
+        :param routes: Sequence[AnswerRoute]
+        :return: RouteMatches
+        """
+        return cls(re.compile(''.join(
+            r'(?:(?=[\s\S]*?(?P<route{0}>{1}))|)'.format(idx, route.pattern)
+            for idx, route in enumerate(routes)
+            if route.kind == RouteKind.message_text
+        )))
+
+    @override
+    def matched(self, update_value: str) -> Container[int]:
+        """Индексы подходящих маршрутов.
+
+        :param update_value: str - текст сообщения
+        :return: Container[int]
+        """
+        regex_result = self._regex.match(update_value)
+        if not regex_result:
+            return ()
+        return frozenset(
+            int(group_name.removeprefix('route'))
+            for group_name, group_value in regex_result.groupdict().items()
+            if group_value is not None
+        )
@@ -22,11 +22,11 @@
 
 from typing import final, override
 
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from services.debug_param import DebugParam
 
 
@@ -47,11 +47,11 @@ class AppendDebugInfoAnswer(TgAnswer):
         self._debug_params = debug_params
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         origin_requests = await self._origin.build(update)
         if not self._debug:
@@ -64,23 +64,16 @@ class AppendDebugInfoAnswer(TgAnswer):
             ],
         )
 
-    def _build_new_requests(self, origin_requests: list[httpx.Request], debug_params: list[str]) -> list[httpx.Request]:
+    def _build_new_requests(self, origin_requests: list[TgRequest], debug_params: list[str]) -> list[TgRequest]:
         # TODO #802 Удалить или задокументировать необходимость приватного метода "_build_new_requests"
         debug_str = '\n\n!----- DEBUG INFO -----!\n\n{0}\n\n!----- END DEBUG INFO -----!'.format(
             '\n'.join(debug_params),
         )
-        new_requests = []
-        for request in origin_requests:
-            if 'sendMessage' in str(request.url):
-                text = request.url.params['text']
-                new_requests.append(httpx.Request(
-                    method=request.method,
-                    url=request.url.copy_set_param(
-                        'text',
-                        '{0}{1}'.format(text, debug_str),
-                    ),
-                    headers=request.headers,
-                ))
-            else:
-                new_requests.append(request)
-        return new_requests
+        return [self._debugged_request(request, debug_str) for request in origin_requests]
+
+    def _debugged_request(self, request: TgRequest, debug_str: str) -> TgRequest:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_debugged_request"
+        if request.api_method() != 'sendMessage':
+            return request
+        text = request.fields()['text']
+        return request.with_fields({'text': '{0}{1}'.format(text, debug_str)})
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
@@ -31,6 +30,7 @@ from integrations.tg.tg_answers.answer_to_sender import TgAnswerToSender
 from integrations.tg.tg_answers.message_answer import TgMessageAnswer
 from integrations.tg.tg_answers.text_answer import TgTextAnswer
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.update_id import UpdateId
 
 
@@ -43,11 +43,11 @@ class DebugAnswer(TgAnswer):
     _origin: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :returns: list[httpx.Request]
+        :returns: list[TgRequest]
         """
         return await TgTextAnswer.str_ctor(
             TgAnswerToSender(
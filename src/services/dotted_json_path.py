@@ -0,0 +1,112 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import Final, final, override
+
+import attrs
+from pyeo import elegant
+
+from services.json_path_expression import JsonPathExpression
+
+_NOT_FOUND: Final = object()
+
+
+# pyeo forbids isinstance, but parsed json nodes are plain dict/list/scalar values
+# without an object protocol to dispatch on, so the node type is checked explicitly
+@final
+@attrs.define(frozen=True)
+@elegant
+class DottedJsonPath(JsonPathExpression):  # type: ignore [misc]
+    """Простой путь вида '$.a.b' или '$..a.b' без разбора jsonpath грамматики.
+
+    Для рекурсивного спуска порядок обхода совпадает с jsonpath_ng:
+    сначала проверяется текущий узел, затем дочерние в порядке ключей.
+    """
+
+    _keys: tuple[str, ...]
+    _recursive: bool
+
+    @override
+    def first_match(self, json: dict) -> object:
+        """Первое найденное значение.
+
+        :param json: dict
+        :return: object
+        :raises ValueError: если поиск не дал результатов
+        """
+        found = self._descendant(json) if self._recursive else self._by_keys(json)
+        if found is _NOT_FOUND:
+            raise ValueError
+        return found
+
+    @override
+    def matches(self, json: dict) -> list:
+        """Все найденные значения.
+
+        :param json: dict
+        :return: list
+        """
+        if self._recursive:
+            return self._descendants(json)
+        found = self._by_keys(json)
+        return [] if found is _NOT_FOUND else [found]
+
+    def _descendant(self, node: object) -> object:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_descendant"
+        found = self._by_keys(node)
+        if found is not _NOT_FOUND:
+            return found
+        if isinstance(node, dict):
+            children = list(node.values())
+        elif isinstance(node, list):
+            children = node
+        else:
+            return _NOT_FOUND
+        for child in children:
+            found = self._descendant(child)
+            if found is not _NOT_FOUND:
+                return found
+        return _NOT_FOUND
+
+    def _descendants(self, node: object) -> list:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_descendants"
+        found = self._by_keys(node)
+        own = [] if found is _NOT_FOUND else [found]
+        if isinstance(node, dict):
+            children = list(node.values())
+        elif isinstance(node, list):
+            children = node
+        else:
+            return own
+        return own + [
+            child_match
+            for child in children
+            for child_match in self._descendants(child)
+        ]
+
+    def _by_keys(self, node: object) -> object:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_by_keys"
+        for key in self._keys:
+            if not isinstance(node, dict) or key not in node:
+                return _NOT_FOUND
+            node = node[key]
+        return node
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 from redis.asyncio import Redis
 
@@ -31,6 +30,7 @@ from app_types.logger import LogSink
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer, TgTextAnswer
 from integrations.tg.tg_answers.message_answer_to_sender import TgHtmlMessageAnswerToSender
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from services.reset_state_answer import ResetStateAnswer
 from srv.admin_messages.admin_message import AdminMessage
@@ -50,11 +50,11 @@ class HelpAnswer(TgAnswer):
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await ResetStateAnswer(
             TgTextAnswer(
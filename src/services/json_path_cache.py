@@ -0,0 +1,100 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import re
+from collections import OrderedDict
+from typing import Final, final, override
+
+import jsonpath_ng
+from pyeo import elegant
+
+from app_types.cache_stats import CacheStats
+from services.dotted_json_path import DottedJsonPath
+from services.json_path_expression import JsonPathExpression
+from services.json_path_expressions import JsonPathExpressions
+from services.ng_json_path import NgJsonPath
+
+_DOTTED_PATH: Final = re.compile(r'^\$(\.\.?)([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)$')
+
+
+@final
+@elegant
+class JsonPathCache(JsonPathExpressions, CacheStats):
+    """Ограниченный LRU кэш скомпилированных jsonpath выражений.
+
+    Разбор jsonpath_ng строит PLY грамматику и занимает миллисекунды,
+    поэтому выражение компилируется один раз на процесс.
+    Простые пути вида '$.a.b' и '$..a.b' обходятся без jsonpath_ng.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Ctor.
+
+        :param max_size: int - максимальное кол-во выражений в кэше
+        """
+        self._max_size = max_size
+        self._expressions: OrderedDict[str, JsonPathExpression] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @override
+    def expression(self, json_path: str) -> JsonPathExpression:
+        """Скомпилированное выражение.
+
+        :param json_path: str
+        :return: JsonPathExpression
+        """
+        expression = self._expressions.get(json_path)
+        if expression is not None:
+            self._hits += 1
+            self._expressions.move_to_end(json_path)
+            return expression
+        self._misses += 1
+        expression = self._compiled(json_path)
+        self._expressions[json_path] = expression
+        if len(self._expressions) > self._max_size:
+            self._expressions.popitem(last=False)
+        return expression
+
+    @override
+    def hits(self) -> int:
+        """Кол-во попаданий в кэш.
+
+        :return: int
+        """
+        return self._hits
+
+    @override
+    def misses(self) -> int:
+        """Кол-во промахов кэша.
+
+        :return: int
+        """
+        return self._misses
+
+    def _compiled(self, json_path: str) -> JsonPathExpression:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_compiled"
+        dotted = _DOTTED_PATH.match(json_path)
+        if dotted:
+            keys = tuple(dotted.group(2).split('.'))
+            return DottedJsonPath(keys, dotted.group(1) == '..')
+        return NgJsonPath(jsonpath_ng.parse(json_path))
@@ -20,14 +20,14 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
-from typing import Generic, final, override
+from typing import Generic, cast, final, override
 
 import attrs
-import jsonpath_ng
 from pyeo import elegant
 
 from app_types.stringable import SupportsStr
 from services.json_path import ET_co, JsonPath
+from services.json_path_expressions import JsonPathExpressions
 
 
 @final
@@ -36,6 +36,9 @@ from services.json_path import ET_co, JsonPath
 class JsonPathValue(JsonPath, Generic[ET_co]):
     """Объект, получающий значение по jsonpath.
 
+    Выражения берутся из кэша скомпилированных выражений.
+    Если поиск не дал результатов, выражение выбрасывает ValueError.
+
     Пример поиска идентификатора чата:
 
     .. code-block:: python3
@@ -45,6 +48,7 @@ class JsonPathValue(JsonPath, Generic[ET_co]):
                 MatchManyJsonPath(
                     self._update.asdict(),
                     ('$..chat.id', '$..from.id'),
+                    json_paths,
                 ),
                 InternalBotError(),
             ).evaluate(),
@@ -53,15 +57,13 @@ class JsonPathValue(JsonPath, Generic[ET_co]):
 
     _json: dict
     _json_path: SupportsStr
+    _expressions: JsonPathExpressions
 
     @override
     def evaluate(self) -> ET_co:
         """Получить значение.
 
         :return: T
-        :raises ValueError: если поиск не дал результатов
         """
-        match = jsonpath_ng.parse(self._json_path).find(self._json)
-        if not match:
-            raise ValueError
-        return match[0].value
+        expression = self._expressions.expression(str(self._json_path))
+        return cast(ET_co, expression.first_match(self._json))
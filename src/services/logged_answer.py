@@ -49,19 +49,48 @@ MESSAGES_CREATED: Final = 'Messages.Created'
 @attrs.define(frozen=True)
 @elegant
 class LoggedAnswer(Sendable):
-    """Декоратор логирующий сообщения."""
+    """Декоратор логирующий сообщения.
+
+    Ответ пользователю отправляется до публикации событий лога,
+    поэтому задержки брокера не увеличивают время ответа.
+    """
 
     _origin: Sendable
     _event_sink: Sink
     _mailing_id: uuid.UUID | None = None
 
     @override
-    async def send(self, update: Update) -> list[dict]:  # noqa: WPS217, WPS231
+    async def send(self, update: Update) -> list[dict]:
         """Отправка.
 
         :param update: str
         :return: list[dict]
         """
+        try:
+            sent_answers = await self._origin.send(update)
+        finally:
+            await self._incoming(update)
+        await self._event_sink.send(
+            UPDATES_LOG,
+            {
+                MESSAGES: [
+                    {
+                        MESSAGE_JSON: ujson.dumps(answer['result']),
+                        IS_UNKNOWN: False,
+                        TRIGGER_MESSAGE_ID: self._trigger_message_id(update),
+                        TRIGGER_CALLBACK_ID: self._trigger_callback_id(update),
+                        MAILING_ID: str(self._mailing_id) if self._mailing_id else None,
+                    }
+                    for answer in sent_answers
+                ],
+            },
+            MESSAGES_CREATED,
+            1,
+        )
+        return sent_answers
+
+    async def _incoming(self, update: Update) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_incoming"
         if update.asdict().get(MESSAGE_LITERAL):
             await self._event_sink.send(
                 UPDATES_LOG,
@@ -87,60 +116,16 @@ class LoggedAnswer(Sendable):
                 'Button.Pushed',
                 1,
             )
-        sent_answers = await self._origin.send(update)
+
+    def _trigger_message_id(self, update: Update) -> int | None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_trigger_message_id"
         if update.asdict().get(MESSAGE_LITERAL):
-            await self._event_sink.send(
-                UPDATES_LOG,
-                {
-                    MESSAGES: [
-                        {
-                            MESSAGE_JSON: ujson.dumps(answer['result']),
-                            IS_UNKNOWN: False,
-                            TRIGGER_MESSAGE_ID: update.asdict()[MESSAGE_LITERAL]['message_id'],
-                            TRIGGER_CALLBACK_ID: None,
-                            MAILING_ID: str(self._mailing_id) if self._mailing_id else None,
-                        }
-                        for answer in sent_answers
-                    ],
-                },
-                MESSAGES_CREATED,
-                1,
-            )
-            return sent_answers
-        elif update.asdict().get(CALLBACK_QUERY):
-            await self._event_sink.send(
-                UPDATES_LOG,
-                {
-                    MESSAGES: [
-                        {
-                            MESSAGE_JSON: ujson.dumps(answer['result']),
-                            IS_UNKNOWN: False,
-                            TRIGGER_MESSAGE_ID: None,
-                            TRIGGER_CALLBACK_ID: update.asdict()[CALLBACK_QUERY]['id'],
-                            MAILING_ID: str(self._mailing_id) if self._mailing_id else None,
-                        }
-                        for answer in sent_answers
-                    ],
-                },
-                MESSAGES_CREATED,
-                1,
-            )
-        else:
-            await self._event_sink.send(
-                UPDATES_LOG,
-                {
-                    MESSAGES: [
-                        {
-                            MESSAGE_JSON: ujson.dumps(answer['result']),
-                            IS_UNKNOWN: False,
-                            TRIGGER_MESSAGE_ID: None,
-                            TRIGGER_CALLBACK_ID: None,
-                            MAILING_ID: str(self._mailing_id) if self._mailing_id else None,
-                        }
-                        for answer in sent_answers
-                    ],
-                },
-                MESSAGES_CREATED,
-                1,
-            )
-        return sent_answers
+            return update.asdict()[MESSAGE_LITERAL]['message_id']
+        return None
+
+    def _trigger_callback_id(self, update: Update) -> str | None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_trigger_callback_id"
+        update_dict = update.asdict()
+        if not update_dict.get(MESSAGE_LITERAL) and update_dict.get(CALLBACK_QUERY):
+            return update_dict[CALLBACK_QUERY]['id']
+        return None
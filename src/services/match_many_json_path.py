@@ -29,6 +29,7 @@ from pyeo import elegant
 
 from app_types.stringable import SupportsStr
 from services.json_path import ET_co, JsonPath
+from services.json_path_expressions import JsonPathExpressions
 from services.json_path_value import JsonPathValue
 
 
@@ -40,6 +41,7 @@ class MatchManyJsonPath(JsonPath, Generic[ET_co]):
 
     _json: dict
     _json_paths: Iterable[SupportsStr]
+    _expressions: JsonPathExpressions
 
     @override
     def evaluate(self) -> ET_co:
@@ -53,5 +55,6 @@ class MatchManyJsonPath(JsonPath, Generic[ET_co]):
                 return JsonPathValue(
                     self._json,
                     path,
+                    self._expressions,
                 ).evaluate()
         raise ValueError
@@ -0,0 +1,60 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+import jsonpath_ng
+from pyeo import elegant
+
+from services.json_path_expression import JsonPathExpression
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class NgJsonPath(JsonPathExpression):
+    """Выражение, скомпилированное jsonpath_ng."""
+
+    _expression: jsonpath_ng.JSONPath
+
+    @override
+    def first_match(self, json: dict) -> object:
+        """Первое найденное значение.
+
+        :param json: dict
+        :return: object
+        :raises ValueError: если поиск не дал результатов
+        """
+        match = self._expression.find(json)
+        if not match:
+            raise ValueError
+        return match[0].value
+
+    @override
+    def matches(self, json: dict) -> list:
+        """Все найденные значения.
+
+        :param json: dict
+        :return: list
+        """
+        return [node.value for node in self._expression.find(json)]
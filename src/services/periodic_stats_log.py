@@ -0,0 +1,56 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from collections.abc import Sequence
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from app_types.logger import LogSink
+from app_types.stats_log import StatsLog
+from app_types.stringable import SupportsStr
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class PeriodicStatsLog(StatsLog):
+    """Статистика, записываемая в лог раз в `interval` секунд."""
+
+    _reports: Sequence[SupportsStr]
+    _interval: float
+    _logger: LogSink
+
+    @override
+    def write(self) -> None:
+        """Записать текущую статистику."""
+        for report in self._reports:
+            self._logger.info(str(report))
+
+    @override
+    async def write_periodically(self) -> None:
+        """Записывать статистику через равные промежутки до отмены."""
+        while True:  # noqa: WPS457
+            await asyncio.sleep(self._interval)
+            self.write()
@@ -0,0 +1,60 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import Sequence
+from typing import final, override
+
+import attrs
+import ujson
+from pyeo import elegant
+
+from app_types.update import Update
+from integrations.tg.keyboard import Keyboard
+from srv.prayers.exist_user_prayers_dict import ExistUserPrayersDict
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class PrayersStatusKeyboard(Keyboard):
+    """Клавиатура времен намаза по уже выбранным статусам."""
+
+    _prayers: Sequence[ExistUserPrayersDict]
+
+    @override
+    async def generate(self, update: Update) -> str:
+        """Генерация.
+
+        :param update: Update
+        :return: str
+        """
+        return ujson.dumps({
+            'inline_keyboard': [[
+                {
+                    'text': '✅' if user_prayer['is_read'] else '❌',
+                    'callback_data': ('mark_not_readed({0})' if user_prayer['is_read'] else 'mark_readed({0})').format(
+                        user_prayer['prayer_at_user_id'],
+                    ),
+                }
+                for user_prayer in self._prayers
+            ]],
+        })
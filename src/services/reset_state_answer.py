@@ -23,11 +23,11 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.users.user_state import UserState
 from srv.users.user_step import UserStep
 
@@ -42,11 +42,11 @@ class ResetStateAnswer(TgAnswer):
     _user_state: UserState
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         requests = await self._origin.build(update)
         await self._user_state.change_step(UserStep.nothing)
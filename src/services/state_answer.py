@@ -23,13 +23,13 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 from redis.asyncio import Redis
 
 from app_types.logger import LogSink
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from srv.users.redis_user_state import RedisUserState
 
@@ -46,11 +46,11 @@ class StepAnswer(TgAnswer):
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         step = await RedisUserState(self._redis, TgChatId(update), self._logger).step()
         if step.value != self._step:
@@ -0,0 +1,56 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import contextlib
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from app_types.runable import Runable
+from app_types.stats_log import StatsLog
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class StatsLoggedApp(Runable):
+    """Декоратор, периодически пишущий статистику в лог, пока работает приложение.
+
+    После остановки приложения статистика пишется еще раз.
+    """
+
+    _stats_log: StatsLog
+    _app: Runable
+
+    @override
+    async def run(self) -> None:
+        """Запуск."""
+        writing = asyncio.create_task(self._stats_log.write_periodically())
+        try:
+            await self._app.run()
+        finally:
+            writing.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await writing
+            self._stats_log.write()
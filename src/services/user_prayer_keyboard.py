@@ -24,7 +24,6 @@ from contextlib import suppress
 from typing import final, override
 
 import attrs
-import ujson
 from databases import Database
 from pyeo import elegant
 
@@ -32,6 +31,7 @@ from app_types.update import Update
 from exceptions.internal_exceptions import PrayerAtUserAlreadyExistsError
 from integrations.tg.fk_chat_id import ChatId
 from services.answers.resized_keyboard import Keyboard
+from services.prayers_status_keyboard import PrayersStatusKeyboard
 from srv.prayers.pg_city_change_safe_user_prayers import PgCityChangeSafeUserPrayers
 from srv.prayers.pg_exist_user_prayers import PgExistUserPrayers
 from srv.prayers.pg_new_prayers_at_user import PgNewPrayersAtUser
@@ -55,6 +55,7 @@ class UserPrayersKeyboard(Keyboard):
         :param update: Update
         :return: str
         """
+        date = await self._date.parse(update)
         with suppress(PrayerAtUserAlreadyExistsError):
             await PgCityChangeSafeUserPrayers(
                 PgNewPrayersAtUser(
@@ -64,22 +65,8 @@ class UserPrayersKeyboard(Keyboard):
                 PgExistUserPrayers(
                     self._pgsql,
                     self._chat_id,
-                    await self._date.parse(update),
+                    date,
                 ),
-            ).create(await self._date.parse(update))
-        prayers = await PgExistUserPrayers(
-            self._pgsql,
-            self._chat_id,
-            await self._date.parse(update),
-        ).fetch()
-        return ujson.dumps({
-            'inline_keyboard': [[
-                {
-                    'text': '✅' if user_prayer['is_read'] else '❌',
-                    'callback_data': ('mark_not_readed({0})' if user_prayer['is_read'] else 'mark_readed({0})').format(
-                        user_prayer['prayer_at_user_id'],
-                    ),
-                }
-                for user_prayer in prayers
-            ]],
-        })
+            ).create(date)
+        prayers = await PgExistUserPrayers(self._pgsql, self._chat_id, date).fetch()
+        return await PrayersStatusKeyboard(prayers).generate(update)
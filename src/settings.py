@@ -21,7 +21,7 @@
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
 from pathlib import Path
-from typing import final
+from typing import Literal, final
 
 from pydantic import PostgresDsn, RedisDsn
 from pydantic_settings import BaseSettings
@@ -41,6 +41,23 @@ class Settings(BaseSettings):
     RABBITMQ_PASS: str
     RABBITMQ_HOST: str
     RABBITMQ_VHOST: str
+    RABBITMQ_CHANNELS: int = 8
+    EVENTS_VALIDATION: Literal['publish', 'consume', 'both'] = 'both'
+    RABBITMQ_QUEUES_CONCURRENCY: dict[str, int] = {  # noqa: RUF012
+        'quranbot.users': 1,
+        'quranbot.mailings': 1,
+        'quranbot.ayats': 4,
+        'quranbot.messages': 16,
+    }
+    UPDATES_LOG_BATCH_SIZE: int = 500
+    UPDATES_LOG_FLUSH_DELAY: float = 1
+    UPDATES_LOG_QUEUE_SIZE: int = 10000
+    UPDATES_LOG_SHUTDOWN_TIMEOUT: float = 5
+    STATS_LOG_INTERVAL: float = 60
+    INVALIDATION_RECONNECT_DELAY: float = 1
+    AYATS_SEARCH_CACHE_SIZE: int = 1000
+    AYATS_SEARCH_CACHE_TTL: float = 600
+    JSON_PATH_CACHE_SIZE: int = 256
     SENTRY_DSN: str
     ADMIN_CHAT_IDS: str
     TELEGRAM_CLIENT_ID: str = ''
@@ -49,6 +66,30 @@ class Settings(BaseSettings):
     DAILY_AYATS: bool = False
     DAILY_PRAYERS: bool = False
     RAMADAN_MODE: bool = False
+    POLLING_CONCURRENCY: int = 10
+    POLLING_SHUTDOWN_TIMEOUT: float = 5
+    HTTP2: bool = False
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_TIMEOUT: float = 10
+    WEBHOOK_HOST: str = '127.0.0.1'
+    WEBHOOK_PORT: int = 8010
+    WEBHOOK_PATH: str = '/'
+    WEBHOOK_URL: str = ''
+    WEBHOOK_SECRET: str = ''
+    WEBHOOK_READ_TIMEOUT: float = 10
+    WEBHOOK_INLINE_REPLY: bool = False
+    TG_GLOBAL_RATE: float = 30
+    TG_CHAT_RATE: float = 1
+    TG_CHAT_BURST: int = 3
+    TG_GROUP_RATE: float = 1 / 3  # 20 messages per minute
+    TG_GROUP_BURST: int = 1
+    TG_FLOOD_RETRIES: int = 3
+    TG_CONCURRENCY_MIN: int = 1
+    TG_CONCURRENCY_MAX: int = 100
+    TG_CONCURRENCY_INITIAL: int = 10
+    TG_CONCURRENCY_TARGET_LATENCY: float = 1
+    MAILING_BATCH_SIZE: int = 100
 
     def admin_chat_ids(self) -> list[int]:
         """Список идентификаторов админов.
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.supports_bool import SupportsBool
@@ -39,6 +38,7 @@ from integrations.tg.tg_answers import (
     TgTextAnswer,
 )
 from integrations.tg.tg_answers.message_answer_to_sender import TgHtmlMessageAnswerToSender
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.ayats.ayat import Ayat
 from srv.files.file_answer import FileAnswer
 from srv.files.file_id_answer import TelegramFileIdAnswer
@@ -56,11 +56,11 @@ class AyatAnswer(TgAnswer):
     _ayat_answer_keyboard: Keyboard
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await TgAnswerList(
             TgLinkPreviewOptions(
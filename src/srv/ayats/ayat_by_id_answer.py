@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 
@@ -32,8 +31,10 @@ from app_types.update import Update
 from integrations.tg.callback_query import CallbackQueryData
 from integrations.tg.tg_answers import TgAnswer, TgAnswerList, TgAnswerToSender, TgAudioAnswer, TgTextAnswer
 from integrations.tg.tg_answers.message_answer_to_sender import TgHtmlMessageAnswerToSender
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.ayats.ayat_by_id_message_answer import AyatByIdMessageAnswer
-from srv.ayats.pg_ayat import PgAyat
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
 from srv.files.file_answer import FileAnswer
 from srv.files.file_id_answer import TelegramFileIdAnswer
@@ -48,18 +49,21 @@ class AyatByIdAnswer(TgAnswer):
     _debug_mode: SupportsBool
     _empty_answer: TgAnswer
     _pgsql: Database
+    _corpus: QuranCorpus
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
-        result_ayat = TextLenSafeAyat(PgAyat.from_callback_query(CallbackQueryData(update), self._pgsql))
+        result_ayat = TextLenSafeAyat(
+            CorpusAyat.from_callback_query(CallbackQueryData(update), self._corpus, self._pgsql),
+        )
         return await TgAnswerList(
             AyatByIdMessageAnswer(
-                result_ayat, TgHtmlMessageAnswerToSender(self._empty_answer), self._pgsql,
+                result_ayat, TgHtmlMessageAnswerToSender(self._empty_answer), self._pgsql, self._corpus,
             ),
             FileAnswer(
                 self._debug_mode,
@@ -23,19 +23,20 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer, TgAnswerMarkup, TgTextAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from srv.ayats.ayat import Ayat
 from srv.ayats.ayat_callback_template_enum import AyatCallbackTemplateEnum
 from srv.ayats.ayat_favorite_keyboard_button import AyatFavoriteKeyboardButton
+from srv.ayats.corpus_neighbor_ayats import CorpusNeighborAyats
 from srv.ayats.favorites.ayat_is_favor import AyatIsFavor
 from srv.ayats.neighbor_ayat_keyboard import NeighborAyatKeyboard
-from srv.ayats.pg_neighbor_ayats import PgNeighborAyats
+from srv.ayats.quran_corpus import QuranCorpus
 
 
 @final
@@ -47,13 +48,14 @@ class AyatByIdMessageAnswer(TgAnswer):
     _result_ayat: Ayat
     _message_answer: TgAnswer
     _pgsql: Database
+    _corpus: QuranCorpus
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return await TgAnswerMarkup(
             TgTextAnswer(
@@ -62,7 +64,7 @@ class AyatByIdMessageAnswer(TgAnswer):
             ),
             AyatFavoriteKeyboardButton(
                 NeighborAyatKeyboard(
-                    PgNeighborAyats(self._pgsql, await self._result_ayat.identifier().ayat_id()),
+                    CorpusNeighborAyats(self._pgsql, self._corpus, await self._result_ayat.identifier().ayat_id()),
                     AyatCallbackTemplateEnum.get_ayat,
                 ),
                 AyatIsFavor(
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 
@@ -31,11 +30,13 @@ from app_types.supports_bool import SupportsBool
 from app_types.update import Update
 from integrations.tg.message_text import MessageText
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.ayats.ayat_answer import AyatAnswer
 from srv.ayats.ayat_answer_keyboard import AyatAnswerKeyboard
 from srv.ayats.ayat_callback_template_enum import AyatCallbackTemplateEnum
-from srv.ayats.pg_ayat import PgAyat
-from srv.ayats.pg_neighbor_ayats import PgNeighborAyats
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.corpus_neighbor_ayats import CorpusNeighborAyats
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
 
 
@@ -49,22 +50,23 @@ class AyatBySuraAyatNumAnswer(TgAnswer):
     _empty_answer: TgAnswer
     _file_answer: TgAnswer
     _pgsql: Database
+    _corpus: QuranCorpus
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
-        result_ayat = TextLenSafeAyat(PgAyat.by_sura_ayat_num(MessageText(update), self._pgsql))
+        result_ayat = TextLenSafeAyat(CorpusAyat.by_sura_ayat_num(MessageText(update), self._corpus, self._pgsql))
         return await AyatAnswer(
             self._debug_mode,
             self._empty_answer,
             result_ayat,
             AyatAnswerKeyboard(
                 result_ayat,
-                PgNeighborAyats(self._pgsql, await result_ayat.identifier().ayat_id()),
+                CorpusNeighborAyats(self._pgsql, self._corpus, await result_ayat.identifier().ayat_id()),
                 AyatCallbackTemplateEnum.get_ayat,
                 self._pgsql,
             ),
@@ -23,12 +23,12 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from exceptions.content_exceptions import AyatNotFoundError
 from integrations.tg.tg_answers import TgAnswer, TgTextAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -41,11 +41,11 @@ class AyatNotFoundSafeAnswer(TgAnswer):
     _error_answer: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :returns: list[httpx.Request]
+        :returns: list[TgRequest]
         """
         try:
             return await self._origin.build(update)
@@ -34,7 +34,11 @@ from srv.ayats.text_search_query import TextSearchQuery
 @final
 @attrs.define(frozen=True)
 class AyatTextSearchQuery(TextSearchQuery):
-    """Запрос поиска аята."""
+    """Запрос поиска аята.
+
+    Запрос хранится без лишних пробелов и служит ключом кэша результатов `AyatsSearch`,
+    поэтому пагинация по выдаче не повторяет поиск.
+    """
 
     _redis: Redis
     _chat_id: ChatId
@@ -49,8 +53,9 @@ class AyatTextSearchQuery(TextSearchQuery):
         :param query: str
         """
         key = self._key_template.format(int(self._chat_id))
-        self._logger.info('Try writing key: {0}, value: {1}'.format(key, query))
-        await self._redis.set(key, query)
+        normalized_query = ' '.join(query.split())
+        self._logger.info('Try writing key: {0}, value: {1}'.format(key, normalized_query))
+        await self._redis.set(key, normalized_query)
         self._logger.info('Key: {0} wrote'.format(
             self._key_template.format(int(self._chat_id)),
         ))
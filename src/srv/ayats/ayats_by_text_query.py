@@ -31,7 +31,9 @@ from app_types.fk_async_int import FkAsyncInt
 from app_types.listable import AsyncListable
 from app_types.stringable import SupportsStr
 from srv.ayats.ayat import Ayat
-from srv.ayats.pg_ayat import PgAyat
+from srv.ayats.ayats_search import AyatsSearch
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
 
 
@@ -39,10 +41,12 @@ from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
 @attrs.define(frozen=True)
 @elegant
 class AyatsByTextQuery(AsyncListable):
-    """Список аятов, найденных по текстовому запросу."""
+    """Список аятов, найденных по текстовому запросу, в порядке релевантности."""
 
     _query: SupportsStr
     _pgsql: Database
+    _corpus: QuranCorpus
+    _search: AyatsSearch
 
     @override
     async def to_list(self) -> Sequence[Ayat]:
@@ -50,21 +54,13 @@ class AyatsByTextQuery(AsyncListable):
 
         :return: list[QAyat]
         """
-        query = '\n'.join([
-            'SELECT a.ayat_id AS id',
-            'FROM ayats AS a',
-            'WHERE a.content ILIKE :search_query',
-            'ORDER BY a.ayat_id',
-        ])
-        rows = await self._pgsql.fetch_all(query, {
-            'search_query': '%{0}%'.format(self._query),
-        })
         return [
             TextLenSafeAyat(
-                PgAyat(
-                    FkAsyncInt(row['id']),
+                CorpusAyat(
+                    FkAsyncInt(ayat_id),
+                    self._corpus,
                     self._pgsql,
                 ),
             )
-            for row in rows
+            for ayat_id in (await self._search.found(str(self._query))).ids()
         ]
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 from redis.asyncio import Redis
 
@@ -31,6 +30,7 @@ from app_types.logger import LogSink
 from app_types.update import Update
 from integrations.tg.message_text import MessageText
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from srv.ayats.ayat_text_search_query import AyatTextSearchQuery
 
@@ -46,11 +46,11 @@ class CachedAyatSearchQueryAnswer(TgAnswer):
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         await AyatTextSearchQuery(
             self._redis,
@@ -0,0 +1,88 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import time
+from collections import OrderedDict
+from typing import final, override
+
+from pyeo import elegant
+
+from srv.ayats.ayats_search import AyatsSearch
+from srv.ayats.found_ayats import FoundAyats
+from srv.events.invalidated_cache import InvalidatedCache
+
+
+@final
+@elegant
+class CachedAyatsSearch(AyatsSearch, InvalidatedCache):
+    """Поиск аятов с кэшем результатов в памяти процесса.
+
+    Ключ кэша - запрос в нижнем регистре без лишних пробелов, он же передается в `origin`,
+    поэтому запросы с одним ключом всегда дают одинаковую выдачу.
+    Хранится не более `max_size` результатов не дольше `ttl` секунд, давно не использованные вытесняются.
+    Изменение любого аята может поменять выдачу по любому запросу, поэтому кэш сбрасывается целиком.
+    """
+
+    def __init__(self, origin: AyatsSearch, max_size: int, ttl: float) -> None:
+        """Ctor.
+
+        :param origin: AyatsSearch
+        :param max_size: int - максимальное кол-во запросов в кэше
+        :param ttl: float - время жизни результата в секундах
+        """
+        self._origin = origin
+        self._max_size = max_size
+        self._ttl = ttl
+        self._cache: OrderedDict[str, tuple[float, FoundAyats]] = OrderedDict()
+
+    @override
+    async def found(self, query: str) -> FoundAyats:
+        """Найденные аяты.
+
+        :param query: str
+        :return: FoundAyats
+        """
+        key = ' '.join(query.lower().split())
+        cached = self._cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._ttl:
+            self._cache.move_to_end(key)
+            return cached[1]
+        found_ayats = await self._origin.found(key)
+        self._cache[key] = (time.monotonic(), found_ayats)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+        return found_ayats
+
+    @override
+    async def invalidate(self, key: str) -> None:
+        """Аят изменен, сбросить все результаты.
+
+        :param key: str - публичный идентификатор аята
+        """
+        self._cache.clear()
+
+    @override
+    async def flush(self) -> None:
+        """Сбросить кэш."""
+        self._cache.clear()
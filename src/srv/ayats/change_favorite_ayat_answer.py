@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -42,6 +41,7 @@ from integrations.tg.tg_answers import (
     TgKeyboardEditAnswer,
     TgMessageIdAnswer,
 )
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from services.regular_expression import IntableRegularExpression
 from services.state_answer import StepAnswer
@@ -49,10 +49,12 @@ from srv.ayats.ayat_answer_keyboard import AyatAnswerKeyboard
 from srv.ayats.ayat_callback_template_enum import AyatCallbackTemplateEnum
 from srv.ayats.ayat_favorite_status import AyatFavoriteStatus
 from srv.ayats.ayat_text_search_query import AyatTextSearchQuery
+from srv.ayats.ayats_search import AyatsSearch
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.corpus_neighbor_ayats import CorpusNeighborAyats
 from srv.ayats.favorite_ayats_after_remove import FavoriteAyatsAfterRemove
 from srv.ayats.favorite_neighbor_ayats import FavoriteNeighborAyats
-from srv.ayats.pg_ayat import PgAyat
-from srv.ayats.pg_neighbor_ayats import PgNeighborAyats
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
 from srv.ayats.text_search_neighbor_ayats import TextSearchNeighborAyats
 from srv.users.user_step import UserStep
@@ -65,25 +67,28 @@ class ChangeFavoriteAyatAnswer(TgAnswer):
     """Ответ на запрос о смене аята в избранном."""
 
     _pgsql: Database
+    _corpus: QuranCorpus
+    _search: AyatsSearch
     _origin: TgAnswer
     _redis: Redis
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         status = AyatFavoriteStatus(str(CallbackQueryData(update)))
         result_ayat = TextLenSafeAyat(
-            PgAyat(
+            CorpusAyat(
                 FkAsyncInt(
                     IntableRegularExpression(
                         str(CallbackQueryData(update)),
                     ),
                 ),
+                self._corpus,
                 self._pgsql,
             ),
         )
@@ -115,7 +120,7 @@ class ChangeFavoriteAyatAnswer(TgAnswer):
                                 result_ayat,
                                 FavoriteNeighborAyats(
                                     status.ayat_id(),
-                                    FavoriteAyatsAfterRemove(chat_id, status.ayat_id(), self._pgsql),
+                                    FavoriteAyatsAfterRemove(chat_id, status.ayat_id(), self._pgsql, self._corpus),
                                 ),
                                 AyatCallbackTemplateEnum.get_favorite_ayat,
                                 self._pgsql,
@@ -138,6 +143,8 @@ class ChangeFavoriteAyatAnswer(TgAnswer):
                                 result_ayat,
                                 TextSearchNeighborAyats(
                                     self._pgsql,
+                                    self._corpus,
+                                    self._search,
                                     status.ayat_id(),
                                     AyatTextSearchQuery(self._redis, chat_id, self._logger),
                                 ),
@@ -158,8 +165,8 @@ class ChangeFavoriteAyatAnswer(TgAnswer):
                         TgKeyboardEditAnswer(TgAnswerToSender(self._origin)),
                         AyatAnswerKeyboard(
                             result_ayat,
-                            PgNeighborAyats(
-                                self._pgsql, await result_ayat.identifier().ayat_id(),
+                            CorpusNeighborAyats(
+                                self._pgsql, self._corpus, await result_ayat.identifier().ayat_id(),
                             ),
                             AyatCallbackTemplateEnum.get_ayat,
                             self._pgsql,
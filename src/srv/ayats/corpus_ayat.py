@@ -0,0 +1,154 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+from databases import Database
+from eljson.json import Json
+from pyeo import elegant
+
+from app_types.fk_async_int import FkAsyncInt
+from app_types.intable import AsyncInt
+from app_types.stringable import SupportsStr
+from services.regular_expression import IntableRegularExpression
+from srv.ayats.ayat import Ayat, AyatText
+from srv.ayats.ayat_id_by_public_id import AyatIdByPublicId
+from srv.ayats.ayat_id_by_sura_ayat_num import AyatIdBySuraAyatNum
+from srv.ayats.corpus_ayat_identifier import CorpusAyatIdentifier
+from srv.ayats.nums_search_query import NumsSearchQuery
+from srv.ayats.pg_ayat import PgAyat
+from srv.ayats.quran_corpus import QuranCorpus
+from srv.ayats.validated_search_query import ValidatedSearchQuery
+from srv.files.tg_file import TgFile
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class CorpusAyat(Ayat):  # noqa: WPS214. This class contain 4 secondary ctor and 4 method
+    """Аят из корпуса в памяти.
+
+    Текст, аудио и номера читаются из `QuranCorpus` без обращений к БД,
+    изменение записывается в БД и перечитывается в корпус.
+    """
+
+    _ayat_id: AsyncInt
+    _corpus: QuranCorpus
+    _pgsql: Database
+
+    @classmethod
+    def by_sura_ayat_num(cls, sura_ayat_num: SupportsStr, corpus: QuranCorpus, database: Database) -> Ayat:
+        """Конструктор для поиска по номеру суры, аята.
+
+        :param sura_ayat_num: Stringable
+        :param corpus: QuranCorpus
+        :param database: Database
+        :return: Ayat
+        """
+        return cls(
+            AyatIdBySuraAyatNum(
+                ValidatedSearchQuery(
+                    NumsSearchQuery(sura_ayat_num),
+                ),
+                database,
+            ),
+            corpus,
+            database,
+        )
+
+    @classmethod
+    def from_int(cls, ayat_id: int, corpus: QuranCorpus, database: Database) -> Ayat:
+        """Конструктор для числа.
+
+        :param ayat_id: int
+        :param corpus: QuranCorpus
+        :param database: Database
+        :return: Ayat
+        """
+        return cls(FkAsyncInt(ayat_id), corpus, database)
+
+    @classmethod
+    def from_callback_query(cls, callback_query: SupportsStr, corpus: QuranCorpus, database: Database) -> Ayat:
+        """Создать аят из данных нажатой inline кнопки.
+
+        :param callback_query: SupportsStr
+        :param corpus: QuranCorpus
+        :param database: Database
+        :return: Ayat
+        """
+        return cls(
+            FkAsyncInt(
+                int(IntableRegularExpression(callback_query)),
+            ),
+            corpus,
+            database,
+        )
+
+    @classmethod
+    def ayat_changed_event_ctor(cls, event_body: Json, corpus: QuranCorpus, pgsql: Database) -> Ayat:
+        """Конструктор для события изменения аята.
+
+        :param event_body: Json
+        :param corpus: QuranCorpus
+        :param pgsql: Database
+        :return: Ayat
+        """
+        return cls(
+            AyatIdByPublicId(event_body.path('$.data.public_id')[0], pgsql),
+            corpus,
+            pgsql,
+        )
+
+    @override
+    def identifier(self) -> CorpusAyatIdentifier:
+        """Идентификатор аята.
+
+        :return: CorpusAyatIdentifier
+        """
+        return CorpusAyatIdentifier(self._ayat_id, self._corpus)
+
+    @override
+    async def to_str(self) -> AyatText:
+        """Текст аята.
+
+        :return: str
+        """
+        return (await self._corpus.ayat(await self._ayat_id.to_int())).text()
+
+    @override
+    async def audio(self) -> TgFile:
+        """Получить аудио аята.
+
+        :return: TgFile
+        """
+        return (await self._corpus.ayat(await self._ayat_id.to_int())).audio()
+
+    @override
+    async def change(self, event_body: Json) -> None:
+        """Изменить содержимое аята.
+
+        :param event_body: Json
+        """
+        ayat_id = await self._ayat_id.to_int()
+        await PgAyat.from_int(ayat_id, self._pgsql).change(event_body)
+        await self._corpus.refresh(ayat_id)
@@ -20,7 +20,7 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
-from typing import Final, final, override
+from typing import final, override
 
 import attrs
 from databases import Database
@@ -28,20 +28,23 @@ from pyeo import elegant
 
 from exceptions.content_exceptions import AyatNotFoundError
 from srv.ayats.ayat import Ayat
+from srv.ayats.corpus_ayat import CorpusAyat
 from srv.ayats.neighbor_ayats import NeighborAyats
-from srv.ayats.pg_ayat import PgAyat
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
 
-_AYAT_ID_LITERAL: Final = 'ayat_id'
-
 
 @final
 @attrs.define(frozen=True)
 @elegant
-class PgNeighborAyats(NeighborAyats):
-    """Класс для работы с соседними аятами в хранилище."""
+class CorpusNeighborAyats(NeighborAyats):
+    """Соседние аяты по порядку в корпусе.
+
+    Соседи и номер страницы берутся из `QuranCorpus.window` без обращений к БД.
+    """
 
     _pgsql: Database
+    _corpus: QuranCorpus
     _ayat_id: int
 
     @override
@@ -51,15 +54,10 @@ class PgNeighborAyats(NeighborAyats):
         :return: AyatShort
         :raises AyatNotFoundError: if ayat not found
         """
-        query = '\n'.join([
-            'SELECT ayat_id',
-            'FROM ayats',
-            'WHERE ayat_id = :ayat_id',
-        ])
-        row = await self._pgsql.fetch_one(query, {_AYAT_ID_LITERAL: self._ayat_id - 1})
-        if not row:
+        left = (await self._corpus.window(self._ayat_id)).left
+        if left is None:
             raise AyatNotFoundError
-        return TextLenSafeAyat(PgAyat.from_int(row[_AYAT_ID_LITERAL], self._pgsql))
+        return TextLenSafeAyat(CorpusAyat.from_int(left, self._corpus, self._pgsql))
 
     @override
     async def right_neighbor(self) -> Ayat:
@@ -68,15 +66,10 @@ class PgNeighborAyats(NeighborAyats):
         :return: AyatShort
         :raises AyatNotFoundError: if ayat not found
         """
-        query = '\n'.join([
-            'SELECT ayats.ayat_id',
-            'FROM ayats',
-            'WHERE ayats.ayat_id = :ayat_id',
-        ])
-        row = await self._pgsql.fetch_one(query, {_AYAT_ID_LITERAL: self._ayat_id + 1})
-        if not row:
+        right = (await self._corpus.window(self._ayat_id)).right
+        if right is None:
             raise AyatNotFoundError
-        return TextLenSafeAyat(PgAyat.from_int(row[_AYAT_ID_LITERAL], self._pgsql))
+        return TextLenSafeAyat(CorpusAyat.from_int(right, self._corpus, self._pgsql))
 
     @override
     async def page(self) -> str:
@@ -84,9 +77,5 @@ class PgNeighborAyats(NeighborAyats):
 
         :return: str
         """
-        ayats_count = await self._pgsql.fetch_val('SELECT COUNT(*) FROM ayats')
-        actual_page_num = await self._pgsql.fetch_val(
-            'SELECT COUNT(*) FROM ayats WHERE ayat_id <= :ayat_id',
-            {_AYAT_ID_LITERAL: self._ayat_id},
-        )
-        return 'стр. {0}/{1}'.format(actual_page_num, ayats_count)
+        window = await self._corpus.window(self._ayat_id)
+        return 'стр. {0}/{1}'.format(window.position, window.total)
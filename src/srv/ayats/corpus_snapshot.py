@@ -0,0 +1,97 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+from typing import final
+
+import attrs
+from databases.interfaces import Record
+
+from exceptions.content_exceptions import AyatNotFoundError
+from srv.ayats.ayat_identifier import AyatId
+from srv.ayats.ayat_record import AyatRecord
+from srv.ayats.ayat_window import AyatWindow
+from srv.ayats.loaded_ayat_record import LoadedAyatRecord
+
+
+@final
+@attrs.frozen(slots=True)
+class CorpusSnapshot:
+    """Неизменяемый снимок корпуса: аяты по идентификатору и их порядок."""
+
+    records: Mapping[AyatId, AyatRecord]
+    order: tuple[AyatId, ...]
+
+    @classmethod
+    def records_ctor(cls, records: Mapping[AyatId, AyatRecord]) -> 'CorpusSnapshot':
+        """Конструктор по аятам, порядок вычисляется по идентификаторам.
+
+        :param records: Mapping[AyatId, AyatRecord]
+        :return: CorpusSnapshot
+        """
+        return cls(MappingProxyType(dict(records)), tuple(sorted(records)))
+
+    @classmethod
+    def rows_ctor(cls, rows: Iterable[Record]) -> 'CorpusSnapshot':
+        """Конструктор по строкам запроса корпуса.
+
+        :param rows: Iterable[Record]
+        :return: CorpusSnapshot
+        """
+        return cls.records_ctor({
+            row['ayat_id']: LoadedAyatRecord.row_ctor(row)
+            for row in rows
+        })
+
+    def ayat(self, ayat_id: AyatId) -> AyatRecord:
+        """Данные аята.
+
+        :param ayat_id: AyatId
+        :return: AyatRecord
+        :raises AyatNotFoundError: если аят не найден
+        """
+        try:
+            return self.records[ayat_id]
+        except KeyError as err:
+            msg = 'Аят с id={0} не найден'.format(ayat_id)
+            raise AyatNotFoundError(msg) from err
+
+    def window(self, ayat_id: AyatId) -> AyatWindow:
+        """Соседи аята и его позиция.
+
+        :param ayat_id: AyatId
+        :return: AyatWindow
+        :raises AyatNotFoundError: если аят не найден
+        """
+        idx = bisect_left(self.order, ayat_id)
+        if idx == len(self.order) or self.order[idx] != ayat_id:
+            msg = 'Аят с id={0} не найден'.format(ayat_id)
+            raise AyatNotFoundError(msg)
+        total = len(self.order)
+        return AyatWindow(
+            self.order[idx - 1] if idx else None,
+            self.order[idx + 1] if idx + 1 < total else None,
+            idx + 1,
+            total,
+        )
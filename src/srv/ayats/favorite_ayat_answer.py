@@ -23,13 +23,13 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 
 from app_types.supports_bool import SupportsBool
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from srv.ayats.ayat_answer import AyatAnswer
 from srv.ayats.ayat_answer_keyboard import AyatAnswerKeyboard
@@ -37,6 +37,7 @@ from srv.ayats.ayat_callback_template_enum import AyatCallbackTemplateEnum
 from srv.ayats.favorite_ayats import FavoriteAyats
 from srv.ayats.favorite_neighbor_ayats import FavoriteNeighborAyats
 from srv.ayats.favorites.user_favorite_ayats import UserFavoriteAyats
+from srv.ayats.quran_corpus import QuranCorpus
 
 
 @final
@@ -48,18 +49,20 @@ class FavoriteAyatAnswer(TgAnswer):
     _debug_mode: SupportsBool
     _empty_answer: TgAnswer
     _pgsql: Database
+    _corpus: QuranCorpus
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         result_ayat = (
             await FavoriteAyats(
                 TgChatId(update),
                 self._pgsql,
+                self._corpus,
             ).to_list()
         )[0]
         return await AyatAnswer(
@@ -69,7 +72,8 @@ class FavoriteAyatAnswer(TgAnswer):
             AyatAnswerKeyboard(
                 result_ayat,
                 FavoriteNeighborAyats(
-                    await result_ayat.identifier().ayat_id(), UserFavoriteAyats(self._pgsql, TgChatId(update)),
+                    await result_ayat.identifier().ayat_id(),
+                    UserFavoriteAyats(self._pgsql, self._corpus, TgChatId(update)),
                 ),
                 AyatCallbackTemplateEnum.get_favorite_ayat,
                 self._pgsql,
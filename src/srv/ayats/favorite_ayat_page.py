@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 
@@ -31,6 +30,7 @@ from app_types.supports_bool import SupportsBool
 from app_types.update import Update
 from integrations.tg.callback_query import CallbackQueryData
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from services.regular_expression import IntableRegularExpression
 from srv.ayats.ayat_answer import AyatAnswer
@@ -39,6 +39,7 @@ from srv.ayats.ayat_callback_template_enum import AyatCallbackTemplateEnum
 from srv.ayats.favorite_ayats import FavoriteAyats
 from srv.ayats.favorite_neighbor_ayats import FavoriteNeighborAyats
 from srv.ayats.favorites.user_favorite_ayats import UserFavoriteAyats
+from srv.ayats.quran_corpus import QuranCorpus
 
 
 @final
@@ -50,15 +51,16 @@ class FavoriteAyatPage(TgAnswer):
     _debug_mode: SupportsBool
     _empty_answer: TgAnswer
     _pgsql: Database
+    _corpus: QuranCorpus
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
-        favorite_ayats = await FavoriteAyats(TgChatId(update), self._pgsql).to_list()
+        favorite_ayats = await FavoriteAyats(TgChatId(update), self._pgsql, self._corpus).to_list()
         for ayat in favorite_ayats:
             expect_ayat_id = IntableRegularExpression(CallbackQueryData(update))
             if await ayat.identifier().ayat_id() == int(expect_ayat_id):
@@ -72,7 +74,7 @@ class FavoriteAyatPage(TgAnswer):
                 result_ayat,
                 FavoriteNeighborAyats(
                     await result_ayat.identifier().ayat_id(),
-                    UserFavoriteAyats(self._pgsql, TgChatId(update)),
+                    UserFavoriteAyats(self._pgsql, self._corpus, TgChatId(update)),
                 ),
                 AyatCallbackTemplateEnum.get_favorite_ayat,
                 self._pgsql,
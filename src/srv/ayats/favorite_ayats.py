@@ -30,7 +30,8 @@ from app_types.fk_async_int import FkAsyncInt
 from app_types.listable import AsyncListable
 from integrations.tg.fk_chat_id import ChatId
 from srv.ayats.ayat import Ayat
-from srv.ayats.pg_ayat import PgAyat
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
 
 
@@ -42,6 +43,7 @@ class FavoriteAyats(AsyncListable):
 
     _chat_id: ChatId
     _pgsql: Database
+    _corpus: QuranCorpus
 
     @override
     async def to_list(self) -> list[Ayat]:
@@ -58,6 +60,6 @@ class FavoriteAyats(AsyncListable):
         ])
         rows = await self._pgsql.fetch_all(query, {'chat_id': int(self._chat_id)})
         return [
-            TextLenSafeAyat(PgAyat(FkAsyncInt(row['ayat_id']), self._pgsql))
+            TextLenSafeAyat(CorpusAyat(FkAsyncInt(row['ayat_id']), self._corpus, self._pgsql))
             for row in rows
         ]
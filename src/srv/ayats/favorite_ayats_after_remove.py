@@ -31,7 +31,8 @@ from app_types.listable import AsyncListable
 from integrations.tg.fk_chat_id import ChatId
 from srv.ayats.ayat import Ayat
 from srv.ayats.ayat_identifier import AyatId
-from srv.ayats.pg_ayat import PgAyat
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
 
 
@@ -44,6 +45,7 @@ class FavoriteAyatsAfterRemove(AsyncListable):
     _chat_id: ChatId
     _ayat_id: AyatId
     _pgsql: Database
+    _corpus: QuranCorpus
 
     @override
     async def to_list(self) -> Sequence[Ayat]:
@@ -65,7 +67,11 @@ class FavoriteAyatsAfterRemove(AsyncListable):
         flag = True
         for row in rows:
             if row['ayat_id'] > self._ayat_id and flag:
-                ayats.append(TextLenSafeAyat(PgAyat.from_int(self._ayat_id, self._pgsql)))
+                ayats.append(self._ayat(self._ayat_id))
                 flag = False
-            ayats.append(TextLenSafeAyat(PgAyat.from_int(row['ayat_id'], self._pgsql)))
+            ayats.append(self._ayat(row['ayat_id']))
         return ayats
+
+    def _ayat(self, ayat_id: AyatId) -> Ayat:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_ayat"
+        return TextLenSafeAyat(CorpusAyat.from_int(ayat_id, self._corpus, self._pgsql))
@@ -29,7 +29,8 @@ from pyeo import elegant
 from app_types.listable import AsyncListable
 from integrations.tg.fk_chat_id import ChatId
 from srv.ayats.ayat import Ayat
-from srv.ayats.pg_ayat import PgAyat
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
 
 
@@ -40,13 +41,14 @@ class UserFavoriteAyats(AsyncListable[Ayat]):
     """Избранные аяты пользователя."""
 
     _pgsql: Database
+    _corpus: QuranCorpus
     _chat_id: ChatId
 
     @override
     async def to_list(self) -> list[Ayat]:
         """Списковое представление.
 
-        :return: list[PgAyat]
+        :return: list[Ayat]
         """
         query = '\n'.join([
             'SELECT a.ayat_id AS id',
@@ -58,5 +60,5 @@ class UserFavoriteAyats(AsyncListable[Ayat]):
         ])
         rows = await self._pgsql.fetch_all(query, {'chat_id': int(self._chat_id)})
         return [
-            TextLenSafeAyat(PgAyat.from_int(row['id'], self._pgsql)) for row in rows
+            TextLenSafeAyat(CorpusAyat.from_int(row['id'], self._corpus, self._pgsql)) for row in rows
         ]
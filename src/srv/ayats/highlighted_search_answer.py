@@ -23,11 +23,11 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.ayats.text_search_query import TextSearchQuery
 
 
@@ -41,30 +41,22 @@ class HighlightedSearchAnswer(TgAnswer):
     _search_query: TextSearchQuery
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
-        new_requests = []
         requests = await self._origin.build(update)
         search_query = await self._search_query.read()
-        for request in requests:
-            try:
-                text = request.url.params['text']
-            except KeyError:
-                new_requests.append(request)
-                continue
-            if search_query in text:
-                new_requests.append(httpx.Request(
-                    method=request.method,
-                    url=request.url.copy_set_param(
-                        'text',
-                        text.replace('+', ' ') .replace(search_query, '<b>{0}</b>'.format(search_query)),
-                    ),
-                    headers=request.headers,
-                ))
-            else:
-                new_requests.append(request)
-        return new_requests
+        return [
+            self._highlighted(request, search_query)
+            for request in requests
+        ]
+
+    def _highlighted(self, request: TgRequest, search_query: str) -> TgRequest:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_highlighted"
+        text = request.fields().get('text')
+        if text is None or search_query not in text:
+            return request
+        return request.with_fields({'text': text.replace(search_query, '<b>{0}</b>'.format(search_query))})
@@ -0,0 +1,107 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+from databases.interfaces import Record
+from pyeo import elegant
+
+from srv.ayats.ayat_link import AyatLink
+from srv.ayats.ayat_record import AyatRecord
+from srv.ayats.search_query import AyatNum, SuraId
+from srv.files.loaded_file import LoadedFile
+from srv.files.tg_file import TgFile
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class LoadedAyatRecord(AyatRecord):
+    """Данные аята, прочитанные из БД."""
+
+    _sura_num: SuraId
+    _sura_link: str
+    _ayat_num: AyatNum
+    _arab_text: str
+    _translation: str
+    _transliteration: str
+    _audio_tg_file_id: str
+    _audio_link: str
+
+    @classmethod
+    def row_ctor(cls, row: Record) -> AyatRecord:
+        """Конструктор по строке запроса корпуса.
+
+        :param row: Record
+        :return: AyatRecord
+        """
+        return cls(
+            row['sura_id'],
+            row['sura_link'],
+            row['ayat_number'],
+            row['arab_text'],
+            row['content'],
+            row['transliteration'],
+            row['telegram_file_id'],
+            row['file_link'],
+        )
+
+    @override
+    def sura_num(self) -> SuraId:
+        """Номер суры.
+
+        :return: SuraId
+        """
+        return self._sura_num
+
+    @override
+    def ayat_num(self) -> AyatNum:
+        """Номер аята.
+
+        :return: AyatNum
+        """
+        return self._ayat_num
+
+    @override
+    def text(self) -> str:
+        """Текст аята.
+
+        :return: str
+        """
+        template = '<a href="{link}">{sura}:{ayat})</a>\n{arab_text}\n\n{content}\n\n<i>{transliteration}</i>'
+        return template.format(
+            link=str(AyatLink(self._sura_link, self._sura_num, self._ayat_num)),
+            sura=self._sura_num,
+            ayat=self._ayat_num,
+            arab_text=self._arab_text,
+            content=self._translation,
+            transliteration=self._transliteration,
+        )
+
+    @override
+    def audio(self) -> TgFile:
+        """Аудио аята.
+
+        :return: TgFile
+        """
+        return LoadedFile(self._audio_tg_file_id, self._audio_link)
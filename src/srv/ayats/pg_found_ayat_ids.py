@@ -0,0 +1,68 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import re
+from typing import Final, final, override
+
+import attrs
+from databases import Database
+from pyeo import elegant
+
+from app_types.listable import AsyncListable
+from app_types.stringable import SupportsStr
+from srv.ayats.ayat_identifier import AyatId
+
+SEARCH_QUERY: Final = '\n'.join([
+    "WITH search AS (SELECT to_tsquery('russian', :tsquery) AS tsq)",
+    'SELECT a.ayat_id',
+    'FROM ayats AS a, search',
+    'WHERE a.content_tsv @@ search.tsq OR a.content ILIKE :like_query',
+    'ORDER BY ts_rank(a.content_tsv, search.tsq) DESC, a.ayat_id',
+])
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class PgFoundAyatIds(AsyncListable[AyatId]):
+    """Идентификаторы аятов, найденных по тексту перевода.
+
+    Каждое слово запроса ищется по префиксу с учетом морфологии (tsvector, russian),
+    совпадения по подстроке (pg_trgm) остаются в выдаче, чтобы не потерять найденное раньше.
+    Оба условия обслуживаются GIN индексами, результат отсортирован по релевантности.
+    """
+
+    _query: SupportsStr
+    _pgsql: Database
+
+    @override
+    async def to_list(self) -> list[AyatId]:
+        """Список.
+
+        :return: list[AyatId]
+        """
+        words = re.findall(r'\w+', str(self._query).lower())
+        rows = await self._pgsql.fetch_all(SEARCH_QUERY, {
+            'tsquery': ' & '.join('{0}:*'.format(word) for word in words),
+            'like_query': '%{0}%'.format(self._query),
+        })
+        return [row['ayat_id'] for row in rows]
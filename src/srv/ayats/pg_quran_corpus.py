@@ -0,0 +1,165 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from collections import deque
+from functools import partial
+from typing import Final, final, override
+
+import attrs
+from databases import Database
+from pyeo import elegant
+
+from srv.ayats.ayat_identifier import AyatId
+from srv.ayats.ayat_record import AyatRecord
+from srv.ayats.ayat_window import AyatWindow
+from srv.ayats.corpus_snapshot import CorpusSnapshot
+from srv.ayats.loaded_ayat_record import LoadedAyatRecord
+from srv.ayats.quran_corpus import QuranCorpus
+from srv.events.invalidated_cache import InvalidatedCache
+
+CORPUS_QUERY: Final = '\n'.join([
+    'SELECT',
+    '    a.ayat_id,',
+    '    a.sura_id,',
+    '    s.link AS sura_link,',
+    '    a.ayat_number,',
+    '    a.arab_text,',
+    '    a.content,',
+    '    a.transliteration,',
+    '    f.telegram_file_id,',
+    '    f.link AS file_link',
+    'FROM ayats AS a',
+    'INNER JOIN suras AS s ON a.sura_id = s.sura_id',
+    'INNER JOIN files AS f ON a.audio_id = f.file_id',
+])
+
+
+@final
+@attrs.define(slots=True)
+@elegant
+class PgQuranCorpus(QuranCorpus, InvalidatedCache):
+    """Корпус аятов из postgres.
+
+    Все аяты (~6 тыс. строк) читаются одним запросом при запуске приложения (`load`)
+    и дальше отдаются из памяти без обращений к БД.
+    Если корпус не загружен (например, после неудачного сброса), он загружается при первом обращении.
+    Снимок неизменяемый: изменение аята собирает новый снимок и подменяет ссылку на него,
+    поэтому читатели видят либо старую, либо новую версию аята целиком.
+    Вместе с аятами в снимке хранится их порядок, по нему соседи и номер страницы
+    вычисляются без запросов.
+    Изменения из других процессов приходят через `InvalidationBus` по публичному идентификатору аята.
+    """
+
+    _pgsql: Database
+    _snapshot: deque[CorpusSnapshot] = attrs.field(factory=partial(deque, maxlen=1))
+    _lock: asyncio.Lock = attrs.field(factory=asyncio.Lock)
+
+    @override
+    async def load(self) -> None:
+        """Загрузить корпус."""
+        await self._loaded()
+
+    @override
+    async def ayat(self, ayat_id: AyatId) -> AyatRecord:
+        """Данные аята.
+
+        :param ayat_id: AyatId
+        :return: AyatRecord
+        """
+        return (await self._loaded()).ayat(ayat_id)
+
+    @override
+    async def window(self, ayat_id: AyatId) -> AyatWindow:
+        """Соседи аята и его позиция в корпусе.
+
+        :param ayat_id: AyatId
+        :return: AyatWindow
+        """
+        return (await self._loaded()).window(ayat_id)
+
+    @override
+    async def refresh(self, ayat_id: AyatId) -> None:
+        """Перечитать аят из хранилища.
+
+        :param ayat_id: AyatId
+        """
+        async with self._lock:
+            if not self._snapshot:
+                return
+            row = await self._pgsql.fetch_one(
+                '{0}\nWHERE a.ayat_id = :ayat_id'.format(CORPUS_QUERY),
+                {'ayat_id': ayat_id},
+            )
+            changed = dict(self._snapshot[0].records)
+            if row:
+                changed[ayat_id] = LoadedAyatRecord.row_ctor(row)
+            else:
+                changed.pop(ayat_id, None)
+            self._snapshot.append(CorpusSnapshot.records_ctor(changed))
+
+    @override
+    async def invalidate(self, key: str) -> None:
+        """Перечитать аят, измененный в другом процессе.
+
+        :param key: str - публичный идентификатор аята
+        """
+        async with self._lock:
+            if not self._snapshot:
+                return
+            row = await self._pgsql.fetch_one(
+                '{0}\nWHERE a.public_id = :public_id'.format(CORPUS_QUERY),
+                {'public_id': key},
+            )
+            if not row:
+                self._snapshot.clear()
+                return
+            self._snapshot.append(CorpusSnapshot.records_ctor({
+                **self._snapshot[0].records,
+                row['ayat_id']: LoadedAyatRecord.row_ctor(row),
+            }))
+
+    @override
+    async def flush(self) -> None:
+        """Перечитать загруженный корпус целиком.
+
+        Если перечитать не удалось, корпус сбрасывается и загрузится при следующем обращении.
+
+        :raises Exception: если перечитать корпус не удалось
+        """
+        async with self._lock:
+            if not self._snapshot:
+                return
+            try:
+                self._snapshot.append(CorpusSnapshot.rows_ctor(await self._pgsql.fetch_all(CORPUS_QUERY)))
+            except Exception:
+                self._snapshot.clear()
+                raise
+
+    async def _loaded(self) -> CorpusSnapshot:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_loaded"
+        if self._snapshot:
+            return self._snapshot[0]
+        async with self._lock:
+            if not self._snapshot:
+                self._snapshot.append(CorpusSnapshot.rows_ctor(await self._pgsql.fetch_all(CORPUS_QUERY)))
+            return self._snapshot[0]
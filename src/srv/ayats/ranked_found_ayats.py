@@ -0,0 +1,91 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import count
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from exceptions.content_exceptions import AyatNotFoundError
+from srv.ayats.ayat_identifier import AyatId
+from srv.ayats.ayat_window import AyatWindow
+from srv.ayats.found_ayats import FoundAyats
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class RankedFoundAyats(FoundAyats):
+    """Неизменяемый результат поиска аятов.
+
+    `ids` упорядочены по релевантности, поэтому для поиска позиции аята
+    рядом хранятся отсортированные идентификаторы и их позиции в выдаче.
+    """
+
+    _ids: tuple[AyatId, ...]
+    _sorted_ids: tuple[AyatId, ...]
+    _positions: tuple[int, ...]
+
+    @classmethod
+    def ids_ctor(cls, ids: Sequence[AyatId]) -> FoundAyats:
+        """Конструктор по идентификаторам в порядке выдачи.
+
+        :param ids: Sequence[AyatId]
+        :return: FoundAyats
+        """
+        return cls(
+            tuple(ids),
+            tuple(sorted(ids)),
+            tuple(position for _, position in sorted(zip(ids, count()))),
+        )
+
+    @override
+    def ids(self) -> Sequence[AyatId]:
+        """Идентификаторы аятов в порядке выдачи.
+
+        :return: Sequence[AyatId]
+        """
+        return self._ids
+
+    @override
+    def window(self, ayat_id: AyatId) -> AyatWindow:
+        """Соседи аята и его позиция в выдаче.
+
+        :param ayat_id: AyatId
+        :return: AyatWindow
+        :raises AyatNotFoundError: если аят не входит в выдачу
+        """
+        idx = bisect_left(self._sorted_ids, ayat_id)
+        if idx == len(self._sorted_ids) or self._sorted_ids[idx] != ayat_id:
+            msg = 'Аят с id={0} не найден'.format(ayat_id)
+            raise AyatNotFoundError(msg)
+        position = self._positions[idx]
+        total = len(self._ids)
+        return AyatWindow(
+            self._ids[position - 1] if position else None,
+            self._ids[position + 1] if position + 1 < total else None,
+            position + 1,
+            total,
+        )
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
@@ -34,12 +33,15 @@ from app_types.update import Update
 from exceptions.content_exceptions import AyatNotFoundError
 from integrations.tg.message_text import MessageText
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from srv.ayats.ayat_answer import AyatAnswer
 from srv.ayats.ayat_answer_keyboard import AyatAnswerKeyboard
 from srv.ayats.ayat_callback_template_enum import AyatCallbackTemplateEnum
 from srv.ayats.ayat_text_search_query import AyatTextSearchQuery
 from srv.ayats.ayats_by_text_query import AyatsByTextQuery
+from srv.ayats.ayats_search import AyatsSearch
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.text_search_neighbor_ayats import TextSearchNeighborAyats
 
 
@@ -53,14 +55,16 @@ class SearchAyatByTextAnswer(TgAnswer):
     _empty_answer: TgAnswer
     _redis: Redis
     _pgsql: Database
+    _corpus: QuranCorpus
+    _search: AyatsSearch
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         :raises AyatNotFoundError: if ayat not found
         """
         try:
@@ -68,6 +72,8 @@ class SearchAyatByTextAnswer(TgAnswer):
                 await AyatsByTextQuery(
                     str(MessageText(update)),
                     self._pgsql,
+                    self._corpus,
+                    self._search,
                 ).to_list()
             )[0]
         except IndexError as err:
@@ -80,6 +86,8 @@ class SearchAyatByTextAnswer(TgAnswer):
                 result_ayat,
                 TextSearchNeighborAyats(
                     self._pgsql,
+                    self._corpus,
+                    self._search,
                     await result_ayat.identifier().ayat_id(),
                     AyatTextSearchQuery(self._redis, TgChatId(update), self._logger),
                 ),
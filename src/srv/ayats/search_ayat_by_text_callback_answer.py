@@ -23,27 +23,28 @@
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 from redis.asyncio import Redis
 
-from app_types.fk_string import FkString
 from app_types.logger import LogSink
 from app_types.supports_bool import SupportsBool
 from app_types.update import Update
-from exceptions.content_exceptions import AyatNotFoundError
 from integrations.tg.callback_query import CallbackQueryData
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from services.regular_expression import IntableRegularExpression
 from srv.ayats.ayat_answer import AyatAnswer
 from srv.ayats.ayat_answer_keyboard import AyatAnswerKeyboard
 from srv.ayats.ayat_callback_template_enum import AyatCallbackTemplateEnum
 from srv.ayats.ayat_text_search_query import AyatTextSearchQuery
-from srv.ayats.ayats_by_text_query import AyatsByTextQuery
+from srv.ayats.ayats_search import AyatsSearch
 from srv.ayats.cached_text_search_query import CachedTextSearchQuery
-from srv.ayats.text_search_neighbor_ayats import TextSearchNeighborAyats
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.quran_corpus import QuranCorpus
+from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
+from srv.ayats.window_neighbor_ayats import WindowNeighborAyats
 
 
 @final
@@ -56,50 +57,28 @@ class SearchAyatByTextCallbackAnswer(TgAnswer):
     _empty_answer: TgAnswer
     _redis: Redis
     _pgsql: Database
+    _corpus: QuranCorpus
+    _search: AyatsSearch
     _logger: LogSink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
-        :raises AyatNotFoundError: if ayat not found
+        :return: list[TgRequest]
         """
         target_ayat_id = int(IntableRegularExpression(str(CallbackQueryData(update))))
-        ayats = await AyatsByTextQuery(
-            FkString(
-                await AyatTextSearchQuery(
-                    self._redis,
-                    TgChatId(update),
-                    self._logger,
-                ).read(),
-            ),
-            self._pgsql,
-        ).to_list()
-        for ayat in ayats:
-            if await ayat.identifier().ayat_id() == target_ayat_id:
-                result_ayat = ayat
-                break
-        else:
-            raise AyatNotFoundError
+        query = CachedTextSearchQuery(AyatTextSearchQuery(self._redis, TgChatId(update), self._logger))
+        window = (await self._search.found(await query.read())).window(target_ayat_id)
+        result_ayat = TextLenSafeAyat(CorpusAyat.from_int(target_ayat_id, self._corpus, self._pgsql))
         return await AyatAnswer(
             self._debug_mode,
             self._empty_answer,
             result_ayat,
             AyatAnswerKeyboard(
                 result_ayat,
-                TextSearchNeighborAyats(
-                    self._pgsql,
-                    await result_ayat.identifier().ayat_id(),
-                    CachedTextSearchQuery(
-                        AyatTextSearchQuery(
-                            self._redis,
-                            TgChatId(update),
-                            self._logger,
-                        ),
-                    ),
-                ),
+                WindowNeighborAyats(self._pgsql, self._corpus, window),
                 AyatCallbackTemplateEnum.get_search_ayat,
                 self._pgsql,
             ),
@@ -20,7 +20,7 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
-from typing import Final, final, override
+from typing import final, override
 
 import attrs
 from databases import Database
@@ -28,29 +28,29 @@ from pyeo import elegant
 
 from exceptions.content_exceptions import AyatNotFoundError
 from srv.ayats.ayat import Ayat
+from srv.ayats.ayat_window import AyatWindow
+from srv.ayats.ayats_search import AyatsSearch
+from srv.ayats.corpus_ayat import CorpusAyat
 from srv.ayats.neighbor_ayats import NeighborAyats
-from srv.ayats.pg_ayat import PgAyat
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
 from srv.ayats.text_search_query import TextSearchQuery
 
-_AYAT_ID_LITERAL: Final = 'ayat_id'
-
 
 @final
 @attrs.define(frozen=True)
 @elegant
 class TextSearchNeighborAyats(NeighborAyats):
-    """Класс для работы с сосденими аятами, при текстовом поиске."""
+    """Класс для работы с сосденими аятами, при текстовом поиске.
+
+    Соседи и номер страницы берутся из результата `AyatsSearch`.
+    """
 
     _pgsql: Database
+    _corpus: QuranCorpus
+    _search: AyatsSearch
     _ayat_id: int
     _query: TextSearchQuery
-    _search_sql_query = '\n'.join([
-        'SELECT ayats.ayat_id',
-        'FROM ayats',
-        'WHERE ayats.content ILIKE :search_query',
-        'ORDER BY ayats.ayat_id',
-    ])
 
     @override
     async def left_neighbor(self) -> Ayat:
@@ -59,14 +59,10 @@ class TextSearchNeighborAyats(NeighborAyats):
         :return: AyatShort
         :raises AyatNotFoundError: if ayat not found
         """
-        search_query = '%{0}%'.format(await self._query.read())
-        rows = await self._pgsql.fetch_all(self._search_sql_query, {'search_query': search_query})
-        for idx, row in enumerate(rows[1:], start=1):
-            if row[_AYAT_ID_LITERAL] == self._ayat_id:
-                return TextLenSafeAyat(
-                    PgAyat.from_int(rows[idx - 1][_AYAT_ID_LITERAL], self._pgsql),
-                )
-        raise AyatNotFoundError
+        left = (await self._window()).left
+        if left is None:
+            raise AyatNotFoundError
+        return TextLenSafeAyat(CorpusAyat.from_int(left, self._corpus, self._pgsql))
 
     @override
     async def right_neighbor(self) -> Ayat:
@@ -75,14 +71,10 @@ class TextSearchNeighborAyats(NeighborAyats):
         :return: AyatShort
         :raises AyatNotFoundError: if ayat not found
         """
-        search_query = '%{0}%'.format(await self._query.read())
-        rows = await self._pgsql.fetch_all(self._search_sql_query, {'search_query': search_query})
-        for idx, row in enumerate(rows[:-1]):
-            if row[_AYAT_ID_LITERAL] == self._ayat_id:
-                return TextLenSafeAyat(
-                    PgAyat.from_int(rows[idx + 1][_AYAT_ID_LITERAL], self._pgsql),
-                )
-        raise AyatNotFoundError
+        right = (await self._window()).right
+        if right is None:
+            raise AyatNotFoundError
+        return TextLenSafeAyat(CorpusAyat.from_int(right, self._corpus, self._pgsql))
 
     @override
     async def page(self) -> str:
@@ -90,12 +82,10 @@ class TextSearchNeighborAyats(NeighborAyats):
 
         :return: str
         """
-        actual_page_num = 0
-        rows = await self._pgsql.fetch_all(
-            self._search_sql_query,
-            {'search_query': '%{0}%'.format(await self._query.read())},
-        )
-        for idx, row in enumerate(rows, start=1):
-            if row[_AYAT_ID_LITERAL] == self._ayat_id:
-                actual_page_num = idx
-        return 'стр. {0}/{1}'.format(actual_page_num, len(rows))
+        window = await self._window()
+        return 'стр. {0}/{1}'.format(window.position, window.total)
+
+    async def _window(self) -> AyatWindow:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_window"
+        found = await self._search.found(await self._query.read())
+        return found.window(self._ayat_id)
@@ -0,0 +1,79 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+from databases import Database
+from pyeo import elegant
+
+from exceptions.content_exceptions import AyatNotFoundError
+from srv.ayats.ayat import Ayat
+from srv.ayats.ayat_window import AyatWindow
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.neighbor_ayats import NeighborAyats
+from srv.ayats.quran_corpus import QuranCorpus
+from srv.ayats.text_len_shorten_ayat import TextLenSafeAyat
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class WindowNeighborAyats(NeighborAyats):
+    """Соседние аяты из уже полученного окна.
+
+    Используется, когда окно аята уже вычислено, чтобы не искать его повторно.
+    """
+
+    _pgsql: Database
+    _corpus: QuranCorpus
+    _window: AyatWindow
+
+    @override
+    async def left_neighbor(self) -> Ayat:
+        """Получить левый аят.
+
+        :return: AyatShort
+        :raises AyatNotFoundError: if ayat not found
+        """
+        if self._window.left is None:
+            raise AyatNotFoundError
+        return TextLenSafeAyat(CorpusAyat.from_int(self._window.left, self._corpus, self._pgsql))
+
+    @override
+    async def right_neighbor(self) -> Ayat:
+        """Получить правый аят.
+
+        :return: AyatShort
+        :raises AyatNotFoundError: if ayat not found
+        """
+        if self._window.right is None:
+            raise AyatNotFoundError
+        return TextLenSafeAyat(CorpusAyat.from_int(self._window.right, self._corpus, self._pgsql))
+
+    @override
+    async def page(self) -> str:
+        """Информация о странице.
+
+        :return: str
+        """
+        return 'стр. {0}/{1}'.format(self._window.position, self._window.total)
@@ -27,7 +27,8 @@ from databases import Database
 from eljson.json import Json
 from pyeo import elegant
 
-from srv.ayats.pg_ayat import PgAyat
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.events.recieved_event import ReceivedEvent
 
 JsonPathQuery: TypeAlias = str
@@ -41,6 +42,7 @@ class RbmqAyatChangedEvent(AyatChangedEvent):
     """Событие изменения аята из rabbitmq."""
 
     _pgsql: Database
+    _corpus: QuranCorpus
 
     @override
     async def process(self, json_doc: Json) -> None:
@@ -48,5 +50,4 @@ class RbmqAyatChangedEvent(AyatChangedEvent):
 
         :param json_doc: Json
         """
-        pg_ayat = PgAyat.ayat_changed_event_ctor(json_doc, self._pgsql)
-        await pg_ayat.change(json_doc)
+        await CorpusAyat.ayat_changed_event_ctor(json_doc, self._corpus, self._pgsql).change(json_doc)
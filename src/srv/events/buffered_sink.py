@@ -0,0 +1,124 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from collections.abc import Sequence
+from itertools import batched, chain
+from typing import Final, final, override
+
+from pyeo import elegant
+
+from app_types.flushable import Flushable
+from app_types.logger import LogSink
+from srv.events.batch_sink import BatchSink
+from srv.events.sink import Sink
+
+MESSAGES: Final = 'messages'
+
+
+@final
+@elegant
+class BufferedSink(Sink, Flushable):
+    """Буферизующий декоратор для отправки событий.
+
+    События копятся в памяти и отправляются пачкой, когда в буфере накопилось `max_size` записей
+    или с момента первой записи прошло `max_delay` секунд.
+    События вида {"messages": [...]} (Messages.Created) склеиваются в одно событие на `max_size` сообщений.
+    При переполнении буфера отправитель ждет сброса, поэтому память ограничена.
+    """
+
+    def __init__(self, origin: BatchSink, max_size: int, max_delay: float, logger: LogSink) -> None:
+        """Ctor.
+
+        :param origin: BatchSink
+        :param max_size: int - кол-во записей, при котором буфер сбрасывается
+        :param max_delay: float - максимальное время нахождения записи в буфере
+        :param logger: LogSink
+        """
+        self._origin = origin
+        self._max_size = max_size
+        self._max_delay = max_delay
+        self._logger = logger
+        self._buffer: dict[tuple[str, str, int], list[dict]] = {}
+        self._size = 0
+        self._timer: asyncio.Task | None = None
+
+    @override
+    async def send(self, queue_name: str, event_data: dict, event_name: str, version: int) -> None:
+        """Отправить событие.
+
+        :param queue_name: str
+        :param event_data: dict
+        :param event_name: str
+        :param version: int
+        """
+        self._buffer.setdefault((queue_name, event_name, version), []).append(event_data)
+        self._size += self._records_count(event_data)
+        if self._size >= self._max_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._delayed_flush())
+
+    @override
+    async def flush(self) -> None:
+        """Сбросить буфер."""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        buffer = self._buffer
+        self._buffer = {}
+        self._size = 0
+        for (queue_name, event_name, version), events_data in buffer.items():
+            try:
+                await self._origin.send_batch(
+                    queue_name,
+                    self._merged(events_data),
+                    event_name,
+                    version,
+                )
+            except Exception:  # pylint: disable=broad-exception-caught
+                self._logger.exception('Fail on flush {0} events {1}'.format(len(events_data), event_name))
+
+    async def _delayed_flush(self) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_delayed_flush"
+        await asyncio.sleep(self._max_delay)
+        await self.flush()
+
+    def _records_count(self, event_data: dict) -> int:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_records_count"
+        if self._is_messages(event_data):
+            return max(len(event_data[MESSAGES]), 1)
+        return 1
+
+    def _is_messages(self, event_data: dict) -> bool:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_is_messages"
+        return event_data.keys() == {MESSAGES}
+
+    def _merged(self, events_data: Sequence[dict]) -> list[dict]:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_merged"
+        messages = list(chain.from_iterable(
+            event_data[MESSAGES] for event_data in events_data if self._is_messages(event_data)
+        ))
+        return [
+            *[event_data for event_data in events_data if not self._is_messages(event_data)],
+            *[{MESSAGES: list(chunk)} for chunk in batched(messages, self._max_size)],
+        ]
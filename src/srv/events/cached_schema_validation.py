@@ -0,0 +1,88 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import re
+from importlib.resources import files
+from typing import final, override
+
+import jsonschema
+import ujson
+from jsonschema.protocols import Validator
+from pyeo import elegant
+
+from srv.events.schema_validation import SchemaValidation
+
+
+@final
+@elegant
+class CachedSchemaValidation(SchemaValidation):
+    """Проверка события по схеме из quranbot_schema_registry.
+
+    Ошибки совпадают с `quranbot_schema_registry.validate_schema`,
+    но файл схемы читается и компилируется один раз на (имя, версия) события.
+    Публичного API для загрузки схем в реестре нет, поэтому файл схемы берется из ресурсов пакета
+    по тому же пути, что и в `validate_schema`. Совпадение закреплено тестом по всем схемам реестра,
+    а версия реестра - точным пином в pyproject.toml.
+    """
+
+    def __init__(self) -> None:
+        """Ctor."""
+        self._validators: dict[tuple[str, int], Validator | None] = {}
+
+    @override
+    def validate(self, event: dict, event_name: str, version: int) -> None:
+        """Проверить событие.
+
+        :param event: dict
+        :param event_name: str
+        :param version: int
+        :raises TypeError: if schema not found or event invalid
+        """
+        key = (event_name, version)
+        if key not in self._validators:
+            self._validators[key] = self._validator(event_name, version)
+        validator = self._validators[key]
+        if validator is None:
+            msg = 'Schema file for event {0} version: {1} not found'.format(event_name, version)
+            raise TypeError(msg)
+        error = jsonschema.exceptions.best_match(validator.iter_errors(event))
+        if error is not None:
+            msg = 'Schema: {0}.v{1}. Error: {2}'.format(event_name, version, str(error))
+            raise TypeError(msg)
+
+    def _validator(self, event_name: str, version: int) -> Validator | None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_validator"
+        schema_path = files('quranbot_schema_registry').joinpath(
+            'schemas',
+            *(
+                '_'.join(word.lower() for word in re.findall('[A-Z][a-z0-9]*', name_part))
+                for name_part in event_name.split('.')
+            ),
+            '{0}.json'.format(version),
+        )
+        try:
+            schema = ujson.loads(schema_path.read_text())
+        except FileNotFoundError:
+            return None
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        return validator_cls(schema)
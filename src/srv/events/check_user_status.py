@@ -20,17 +20,20 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
+from collections.abc import Sequence
 from typing import final, override
 
 import attrs
+import httpx
 from databases import Database
 from eljson.json import Json
 from pyeo import elegant
 
 from app_types.fk_update import FkUpdate
-from app_types.listable import AsyncListable
 from app_types.logger import LogSink
+from app_types.throttle_stats import ThrottleStats
 from integrations.tg.bulk_sendable_answer import BulkSendableAnswer
+from integrations.tg.concurrency_limit import ConcurrencyLimit
 from integrations.tg.tg_answers import TgAnswer, TgChatIdAnswer
 from integrations.tg.tg_answers.chat_action import TgChatAction
 from integrations.tg.typing_action import TypingAction
@@ -47,12 +50,21 @@ from srv.users.user import User
 @attrs.define(frozen=True)
 @elegant
 class CheckUsersStatus(ReceivedEvent):
-    """Статусы пользователей."""
+    """Статусы пользователей.
+
+    Пользователи читаются потоком и проверяются пачками по `batch_size`,
+    поэтому память не зависит от кол-ва пользователей, а отправка начинается с первой пачки.
+    Лимит одновременных запросов к телеграму передается снаружи и общий для всех пачек и запусков.
+    """
 
     _empty_answer: TgAnswer
+    _http_client: httpx.AsyncClient
+    _throttle_stats: ThrottleStats
+    _limit: ConcurrencyLimit
     _pgsql: Database
     _events_sink: Sink
     _logger: LogSink
+    _batch_size: int
 
     @override
     async def process(self, json_doc: Json) -> None:
@@ -60,11 +72,32 @@ class CheckUsersStatus(ReceivedEvent):
 
         :param json_doc: Json
         """
-        users = PgActiveUsers(self._pgsql)
+        batch: list[User] = []
+        async for user in PgActiveUsers(self._pgsql, self._batch_size).stream():
+            batch.append(user)
+            if len(batch) == self._batch_size:
+                await self._checked(batch)
+                batch = []
+        if batch:
+            await self._checked(batch)
+
+    async def _checked(self, users: Sequence[User]) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_checked"
         zipped_user_responses = zip(
-            await users.to_list(),
+            users,
             await BulkSendableAnswer(
-                await self._answers(users),
+                [
+                    TypingAction(
+                        TgChatIdAnswer(
+                            TgChatAction(self._empty_answer),
+                            await user.chat_id(),
+                        ),
+                    )
+                    for user in users
+                ],
+                self._http_client,
+                self._limit,
+                self._throttle_stats,
                 self._logger,
             ).send(FkUpdate.empty_ctor()),
             strict=True,
@@ -82,15 +115,3 @@ class CheckUsersStatus(ReceivedEvent):
             PgUsers(self._pgsql, deactivated_user_chat_ids),
             self._events_sink,
         ).update(to=False)
-
-    async def _answers(self, users: AsyncListable[User]) -> list[TgAnswer]:
-        # TODO #802 Удалить или задокументировать необходимость приватного метода "_answers"
-        return [
-            TypingAction(
-                TgChatIdAnswer(
-                    TgChatAction(self._empty_answer),
-                    await user.chat_id(),
-                ),
-            )
-            for user in await users.to_list()
-        ]
@@ -0,0 +1,57 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+from eljson.exceptions import NodeNotFoundError
+from eljson.json import Json
+from pyeo import elegant
+
+from services.json_path_expressions import JsonPathExpressions
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class CompiledPathsJson(Json):
+    """Json документ, переиспользующий разобранные jsonpath выражения.
+
+    Поведение совпадает с `JsonDoc`, но выражения берутся из общего для процесса кэша,
+    а не разбираются на каждый вызов.
+    """
+
+    _json: dict
+    _expressions: JsonPathExpressions
+
+    @override
+    def path(self, query: str) -> list:
+        """Значения по jsonpath.
+
+        :param query: str
+        :return: list
+        :raises NodeNotFoundError: if path not found
+        """
+        found = self._expressions.expression(query).matches(self._json)
+        if not found:
+            raise NodeNotFoundError
+        return found
@@ -0,0 +1,86 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import aio_pika
+import ujson
+from eljson.json import Json
+from pyeo import elegant
+
+from app_types.events_count import EventsCount
+from app_types.logger import LogSink
+from srv.events.amqp_channels import AmqpChannels
+from srv.events.recieved_event import ReceivedEvent
+
+
+@final
+@elegant
+class DeadLetterEvent(ReceivedEvent, EventsCount):
+    """Событие без обработчика или не прошедшее проверку схемы.
+
+    Событие считается и публикуется без изменений в очередь `queue_name` для разбора.
+    Очередь объявляется (durable) перед публикацией: сообщение в default exchange без очереди
+    брокер молча отбрасывает.
+    """
+
+    def __init__(self, channels: AmqpChannels, queue_name: str, logger: LogSink) -> None:
+        """Ctor.
+
+        :param channels: AmqpChannels
+        :param queue_name: str
+        :param logger: LogSink
+        """
+        self._channels = channels
+        self._queue_name = queue_name
+        self._logger = logger
+        self._count = 0
+
+    @override
+    async def process(self, json_doc: Json) -> None:
+        """Обработать событие.
+
+        :param json_doc: Json
+        """
+        self._count += 1
+        self._logger.error('Event {0} v{1} moved to dead letter queue, total dead letter events: {2}'.format(
+            json_doc.path('$.event_name')[0],
+            json_doc.path('$.event_version')[0],
+            self._count,
+        ))
+        async with self._channels.channel() as channel:
+            await channel.declare_queue(self._queue_name, durable=True)
+            await channel.default_exchange.publish(
+                aio_pika.Message(
+                    body=ujson.dumps(json_doc.path('$')[0]).encode('utf-8'),
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                ),
+                routing_key=self._queue_name,
+            )
+
+    @override
+    def count(self) -> int:
+        """Кол-во событий, отправленных на разбор.
+
+        :return: int
+        """
+        return self._count
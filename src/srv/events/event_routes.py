@@ -0,0 +1,84 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import Mapping
+from typing import TypeAlias, final, override
+
+import attrs
+from eljson.json import Json
+from pyeo import elegant
+
+from srv.events.event_route import EventRoute, RouteKey
+from srv.events.recieved_event import ReceivedEvent
+
+RoutesTable: TypeAlias = Mapping[RouteKey, tuple[ReceivedEvent, ...]]
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class EventRoutes(ReceivedEvent):
+    """Маршрутизация событий по таблице (имя, версия), построенной при старте.
+
+    Результат совпадает с перебором `EventFork` из тех же маршрутов,
+    но имя и версия события читаются один раз.
+    События без обработчика передаются в `dead_letter`.
+    """
+
+    _routes: RoutesTable
+    _dead_letter: ReceivedEvent
+
+    @classmethod
+    def routes_ctor(cls, dead_letter: ReceivedEvent, *routes: EventRoute) -> ReceivedEvent:
+        """Конструктор с построением таблицы.
+
+        :param dead_letter: ReceivedEvent
+        :param routes: EventRoute
+        :return: ReceivedEvent
+        """
+        return cls(cls._table(routes), dead_letter)
+
+    @override
+    async def process(self, json_doc: Json) -> None:
+        """Обработать событие.
+
+        :param json_doc: Json
+        """
+        event_name = json_doc.path('$.event_name')[0]
+        events = self._routes.get((event_name, json_doc.path('$.event_version')[0]))
+        if not events:
+            await self._dead_letter.process(json_doc)
+            return
+        for event in events:
+            await event.process(json_doc)
+
+    @classmethod
+    def _table(cls, routes: tuple[EventRoute, ...]) -> RoutesTable:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_table"
+        return {
+            key: tuple(
+                route.event
+                for route in routes
+                if route.key() == key
+            )
+            for key in dict.fromkeys(route.key() for route in routes)
+        }
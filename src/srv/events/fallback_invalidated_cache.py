@@ -0,0 +1,63 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from app_types.logger import LogSink
+from srv.events.invalidated_cache import InvalidatedCache
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class FallbackInvalidatedCache(InvalidatedCache):
+    """Кэш, который при ошибке сброса ключа сбрасывается целиком.
+
+    Ошибки сброса логируются и не пробрасываются, чтобы один кэш не останавливал сброс остальных.
+    """
+
+    _origin: InvalidatedCache
+    _key_space: str
+    _logger: LogSink
+
+    @override
+    async def invalidate(self, key: str) -> None:
+        """Сбросить один ключ.
+
+        :param key: str
+        """
+        try:
+            await self._origin.invalidate(key)
+        except Exception:  # noqa: BLE001 pylint: disable=broad-exception-caught
+            self._logger.exception('Fail on invalidate {0}, flush cache'.format(self._key_space))
+            await self.flush()
+
+    @override
+    async def flush(self) -> None:
+        """Сбросить кэш целиком."""
+        try:
+            await self._origin.flush()
+        except Exception:  # noqa: BLE001 pylint: disable=broad-exception-caught
+            self._logger.exception('Fail on flush {0}'.format(self._key_space))
@@ -0,0 +1,49 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import Protocol
+
+from pyeo import elegant
+
+from srv.events.invalidated_cache import InvalidatedCache
+
+
+@elegant
+class InvalidationBus(Protocol):
+    """Канал сброса кэшей между процессами."""
+
+    async def publish(self, key_space: str, key: str) -> None:
+        """Сообщить об изменении ключа.
+
+        :param key_space: str - пространство ключей, например "ayats"
+        :param key: str
+        """
+
+    def subscribe(self, key_space: str, cache: InvalidatedCache) -> None:
+        """Подписать кэш на изменения пространства ключей.
+
+        :param key_space: str
+        :param cache: InvalidatedCache
+        """
+
+    async def listen(self) -> None:
+        """Получать сообщения об изменениях до отмены."""
@@ -24,25 +24,24 @@ import uuid
 from typing import final, override
 
 import attrs
+import httpx
 from databases import Database
 from eljson.json import Json
 from pyeo import elegant
 
-from app_types.fk_async_listable import FkAsyncListable
-from app_types.fk_update import FkUpdate
 from app_types.logger import LogSink
-from exceptions.internal_exceptions import TelegramIntegrationsError, UnreacheableError
-from integrations.tg.sendable_answer import SendableAnswer
-from integrations.tg.tg_answers import TgAnswer, TgChatIdAnswer, TgHtmlParseAnswer, TgTextAnswer
-from integrations.tg.tg_answers.message_answer import TgMessageAnswer
-from services.logged_answer import LoggedAnswer
+from app_types.throttle_stats import ThrottleStats
+from exceptions.internal_exceptions import UnreacheableError
+from integrations.tg.concurrency_limit import ConcurrencyLimit
+from integrations.tg.tg_answers import TgAnswer
 from settings import Settings
 from srv.events.recieved_event import ReceivedEvent
 from srv.events.sink import Sink
-from srv.users.fk_user import FkUser
-from srv.users.pg_updated_users_status import PgUpdatedUsersStatus
-from srv.users.updated_users_status_event import UpdatedUsersStatusEvent
-from srv.users.user import User
+from srv.mailings.batched_mailing_journal import BatchedMailingJournal
+from srv.mailings.concurrent_mailing import ConcurrentMailing
+from srv.mailings.pg_mailing_checkpoint import PgMailingCheckpoint
+from srv.mailings.pg_mailing_messages import PgMailingMessages
+from srv.mailings.text_row_answer import TextRowAnswer
 
 
 @final
@@ -52,6 +51,9 @@ class MailingCreatedEvent(ReceivedEvent):
     """Обработка события об утренней рассылки с аятми."""
 
     _empty_answer: TgAnswer
+    _http_client: httpx.AsyncClient
+    _throttle_stats: ThrottleStats
+    _limit: ConcurrencyLimit
     _pgsql: Database
     _events_sink: Sink
     _log_sink: LogSink
@@ -65,66 +67,33 @@ class MailingCreatedEvent(ReceivedEvent):
         :raises UnreacheableError: unreacheable state
         """
         if json_doc.path('$.data.group')[0] == 'all':
-            chat_ids = [
-                row['chat_id']
-                for row in await self._pgsql.fetch_all('\n'.join([
-                    'SELECT chat_id',
-                    'FROM users',
-                    "WHERE is_active = 't'",
-                ]))
-            ]
+            query = "SELECT chat_id FROM users WHERE is_active = 't'"
         elif json_doc.path('$.data.group')[0] == 'admins':
-            chat_ids = self._settings.admin_chat_ids()
+            query = 'SELECT UNNEST(ARRAY[{0}]::bigint[]) AS chat_id'.format(
+                ','.join(str(chat_id) for chat_id in self._settings.admin_chat_ids()),
+            )
         else:
             raise UnreacheableError
-        unsubscribed_users: list[User] = []
-        zipped_ans_chat_ids = zip(
-            [
-                TgHtmlParseAnswer(
-                    TgTextAnswer.str_ctor(
-                        TgChatIdAnswer(
-                            TgMessageAnswer(self._empty_answer),
-                            chat_id,
-                        ),
-                        json_doc.path('$.data.text')[0],
-                    ),
-                )
-                for chat_id in chat_ids
-            ],
-            chat_ids,
-            strict=True,
-        )
-        for answer, chat_id in zipped_ans_chat_ids:
-            await self._iteration(answer, chat_id, unsubscribed_users, json_doc.path('$.data.mailing_id')[0])
-        await UpdatedUsersStatusEvent(
-            PgUpdatedUsersStatus(self._pgsql, FkAsyncListable(unsubscribed_users)),
-            FkAsyncListable(unsubscribed_users),
-            self._events_sink,
-        ).update(to=False)
-
-    async def _iteration(
-        self,
-        answer: TgAnswer,
-        chat_id: int,
-        unsubscribed_users: list[User],
-        mailing_id: uuid.UUID,
-    ) -> None:
-        # TODO #802 Удалить или задокументировать необходимость приватного метода "_iteration"
-        try:
-            await LoggedAnswer(
-                SendableAnswer(
-                    answer,
-                    self._log_sink,
-                ),
+        await ConcurrentMailing(
+            'Рассылка {0}'.format(json_doc.path('$.data.mailing_id')[0]),
+            PgMailingMessages(
+                self._pgsql,
+                query,
+                TextRowAnswer(self._empty_answer, json_doc.path('$.data.text')[0]),
+                self._settings.MAILING_BATCH_SIZE,
+            ),
+            BatchedMailingJournal(
+                self._pgsql,
                 self._events_sink,
-                mailing_id,
-            ).send(FkUpdate.empty_ctor())
-        except TelegramIntegrationsError as err:
-            error_messages = [
-                'chat not found',
-                'bot was blocked by the user',
-                'user is deactivated',
-            ]
-            for error_message in error_messages:
-                if error_message in str(err):
-                    unsubscribed_users.append(FkUser(chat_id, 0, is_active=False))  # noqa: PERF401
+                uuid.UUID(str(json_doc.path('$.data.mailing_id')[0])),
+                self._settings.MAILING_BATCH_SIZE,
+            ),
+            PgMailingCheckpoint(self._pgsql, str(json_doc.path('$.event_id')[0])),
+            self._empty_answer,
+            self._http_client,
+            self._throttle_stats,
+            self._settings.admin_chat_ids(),
+            self._limit,
+            self._settings.MAILING_BATCH_SIZE,
+            self._log_sink,
+        ).send()
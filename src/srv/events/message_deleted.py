@@ -23,6 +23,7 @@
 from typing import final, override
 
 import attrs
+import httpx
 from databases import Database
 from eljson.json import Json
 from pyeo import elegant
@@ -42,6 +43,7 @@ class MessageDeleted(ReceivedEvent):
     """Удаление сообщения."""
 
     _empty_answer: TgAnswer
+    _http_client: httpx.AsyncClient
     _pgsql: Database
     _events_sink: Sink
     _logger: LogSink
@@ -60,5 +62,6 @@ class MessageDeleted(ReceivedEvent):
                 ),
                 json_doc.path('$.data.message_id')[0],
             ),
+            self._http_client,
             self._logger,
         ).send(FkUpdate.empty_ctor())
@@ -21,32 +21,26 @@
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
 import uuid
-from collections.abc import Iterator
 from typing import final, override
 
 import attrs
+import httpx
 from databases import Database
-from databases.interfaces import Record
 from eljson.json import Json
-from jinja2 import Template
 from pyeo import elegant
 
-from app_types.fk_async_listable import FkAsyncListable
-from app_types.fk_update import FkUpdate
 from app_types.logger import LogSink
-from exceptions.internal_exceptions import TelegramIntegrationsError
-from integrations.tg.sendable_answer import SendableAnswer
-from integrations.tg.tg_answers import TgAnswer, TgChatIdAnswer, TgHtmlParseAnswer, TgTextAnswer
-from integrations.tg.tg_answers.link_preview_options import TgLinkPreviewOptions
-from integrations.tg.tg_answers.message_answer import TgMessageAnswer
-from services.logged_answer import LoggedAnswer
+from app_types.throttle_stats import ThrottleStats
+from integrations.tg.concurrency_limit import ConcurrencyLimit
+from integrations.tg.tg_answers import TgAnswer
 from settings import Settings
 from srv.events.recieved_event import ReceivedEvent
 from srv.events.sink import Sink
-from srv.users.fk_user import FkUser
-from srv.users.pg_updated_users_status import PgUpdatedUsersStatus
-from srv.users.updated_users_status_event import UpdatedUsersStatusEvent
-from srv.users.user import User
+from srv.mailings.batched_mailing_journal import BatchedMailingJournal
+from srv.mailings.concurrent_mailing import ConcurrentMailing
+from srv.mailings.day_cohort_mailing_messages import DayCohortMailingMessages
+from srv.mailings.day_incremented_checkpoint import DayIncrementedCheckpoint
+from srv.mailings.pg_mailing_checkpoint import PgMailingCheckpoint
 
 
 @final
@@ -56,6 +50,9 @@ class MorningContentPublishedEvent(ReceivedEvent):
     """Обработка события об утренней рассылки с аятми."""
 
     _empty_answer: TgAnswer
+    _http_client: httpx.AsyncClient
+    _throttle_stats: ThrottleStats
+    _limit: ConcurrencyLimit
     _pgsql: Database
     _settings: Settings
     _events_sink: Sink
@@ -67,102 +64,34 @@ class MorningContentPublishedEvent(ReceivedEvent):
 
         :param json_doc: Json
         """
-        rows = await self._pgsql.fetch_all('\n'.join([
-            'SELECT',
-            '    u.chat_id,',
-            "    STRING_AGG(a.sura_id::character varying, ',') as sura_ids,",
-            "    STRING_AGG(a.ayat_number, '|' ORDER BY a.ayat_id) as ayat_nums,",
-            '    STRING_AGG(',
-            '        a.content,',
-            "        '|sep|'",
-            '        ORDER BY a.ayat_id',
-            '    ) AS content,',
-            "    STRING_AGG(s.link, '|sep|' ORDER BY a.ayat_id) AS sura_link",
-            'FROM public.ayats AS a',
-            'JOIN public.users AS u ON a.day = u.day',
-            'JOIN suras AS s ON a.sura_id = s.sura_id',
-            "WHERE u.is_active = 't' {0}".format(
-                'AND u.chat_id IN ({0})'.format(
-                    ','.join([str(chat_id) for chat_id in self._settings.ADMIN_CHAT_IDS]),
-                )
-                if self._settings.DAILY_AYATS == 'off' else '',
-            ),
-            'GROUP BY u.chat_id',
-            'ORDER BY u.chat_id',
-        ]))
-        unsubscribed_users: list[User] = []
-        for answer, chat_id in self._zipped_ans_chat_ids(rows):
-            await self._iteration(answer, chat_id, unsubscribed_users)
-        await UpdatedUsersStatusEvent(
-            PgUpdatedUsersStatus(self._pgsql, FkAsyncListable(unsubscribed_users)),
-            FkAsyncListable(unsubscribed_users),
-            self._events_sink,
-        ).update(to=False)
-        await self._pgsql.execute('\n'.join([
-            'UPDATE users',
-            'SET day = day + 1',
-            "WHERE is_active = 't' AND chat_id IN ({0})".format(','.join([str(row['chat_id']) for row in rows])),
-        ]))
-
-    def _zipped_ans_chat_ids(self, rows: list[Record]) -> Iterator[tuple[TgAnswer, int]]:
-        # TODO #802 Удалить или задокументировать необходимость приватного метода "_zipped_ans_chat_ids"
-        return zip(
-            [
-                TgLinkPreviewOptions(
-                    TgHtmlParseAnswer(
-                        TgTextAnswer.str_ctor(
-                            TgChatIdAnswer(
-                                TgMessageAnswer(self._empty_answer),
-                                row['chat_id'],
-                            ),
-                            Template(''.join([
-                                '{% for ayat in ayats %}',
-                                '<b>{{ ayat.sura_id }}:{{ ayat.ayat_number }})</b> {{ ayat.content }}\n',
-                                '{% endfor %}',
-                                '\nhttps://umma.ru{{ sura_link }}',
-                            ])).render({
-                                'ayats': [
-                                    {
-                                        'sura_id': sura_id,
-                                        'ayat_number': ayat_num,
-                                        'content': ayat_content,
-                                    }
-                                    for sura_id, ayat_num, ayat_content in zip(
-                                        row['sura_ids'].split(','),
-                                        row['ayat_nums'].split('|'),
-                                        row['content'].split('|sep|'),
-                                        strict=True,
-                                    )
-                                ],
-                                'sura_link': row['sura_link'].split('|sep|')[0],
-                            }),
-                        ),
+        await ConcurrentMailing(
+            'Утренние аяты',
+            DayCohortMailingMessages(
+                self._pgsql,
+                '\n'.join([
+                    'SELECT u.chat_id, u.day',
+                    'FROM public.users AS u',
+                    "WHERE u.is_active = 't'",
+                    'AND EXISTS (SELECT 1 FROM public.ayats AS a WHERE a.day = u.day) {0}'.format(  # noqa: S608
+                        'AND u.chat_id IN ({0})'.format(
+                            ','.join([str(chat_id) for chat_id in self._settings.ADMIN_CHAT_IDS]),
+                        )
+                        if self._settings.DAILY_AYATS == 'off' else '',
                     ),
-                    disabled=True,
-                )
-                for row in rows
-            ],
-            [row['chat_id'] for row in rows],
-            strict=True,
-        )
-
-    async def _iteration(self, answer: TgAnswer, chat_id: int, unsubscribed_users: list[User]) -> None:
-        # TODO #802 Удалить или обосновать необходимость метода `MorningContentPublishedEvent._iteration`
-        try:
-            await LoggedAnswer(
-                SendableAnswer(
-                    answer,
-                    self._log_sink,
-                ),
-                self._events_sink,
-                uuid.uuid4(),
-            ).send(FkUpdate.empty_ctor())
-        except TelegramIntegrationsError as err:
-            error_messages = [
-                'chat not found',
-                'bot was blocked by the user',
-                'user is deactivated',
-            ]
-            for error_message in error_messages:
-                if error_message in str(err):
-                    unsubscribed_users.append(FkUser(chat_id, 0, is_active=False))  # noqa: PERF401
+                ]),
+                self._empty_answer,
+                self._settings.MAILING_BATCH_SIZE,
+            ),
+            BatchedMailingJournal(self._pgsql, self._events_sink, uuid.uuid4(), self._settings.MAILING_BATCH_SIZE),
+            DayIncrementedCheckpoint(
+                PgMailingCheckpoint(self._pgsql, str(json_doc.path('$.event_id')[0])),
+                self._pgsql,
+            ),
+            self._empty_answer,
+            self._http_client,
+            self._throttle_stats,
+            self._settings.admin_chat_ids(),
+            self._limit,
+            self._settings.MAILING_BATCH_SIZE,
+            self._log_sink,
+        ).send()
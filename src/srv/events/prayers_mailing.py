@@ -23,45 +23,27 @@
 import datetime
 import uuid
 from operator import add
-from typing import Final, final, override
+from typing import final, override
 
 import attrs
+import httpx
 import pytz
-import ujson
 from databases import Database
 from eljson.json import Json
 from pyeo import elegant
 from redis.asyncio import Redis
 
-from app_types.fk_async_listable import FkAsyncListable
-from app_types.fk_update import FkUpdate
 from app_types.logger import LogSink
-from exceptions.internal_exceptions import TelegramIntegrationsError
-from integrations.tg.sendable_answer import SendableAnswer
-from integrations.tg.tg_answers import (
-    TgAnswer,
-    TgAnswerMarkup,
-    TgChatIdAnswer,
-    TgHtmlParseAnswer,
-    TgMessageAnswer,
-    TgTextAnswer,
-)
-from integrations.tg.tg_chat_id import TgChatId
-from services.logged_answer import LoggedAnswer
-from services.user_prayer_keyboard import UserPrayersKeyboard
+from app_types.throttle_stats import ThrottleStats
+from integrations.tg.concurrency_limit import ConcurrencyLimit
+from integrations.tg.tg_answers import TgAnswer
 from settings import Settings
 from srv.events.recieved_event import ReceivedEvent
 from srv.events.sink import Sink
-from srv.prayers.fk_prayer_date import FkPrayerDate
-from srv.prayers.prayers_text import PrayersText
-from srv.prayers.ramadan_prayer_text import RamadanPrayerText
-from srv.prayers.user_city_id import UserCityId
-from srv.users.fk_user import FkUser
-from srv.users.pg_updated_users_status import PgUpdatedUsersStatus
-from srv.users.updated_users_status_event import UpdatedUsersStatusEvent
-from srv.users.user import User
-
-CHAT_ID: Final = 'chat_id'
+from srv.mailings.batched_mailing_journal import BatchedMailingJournal
+from srv.mailings.city_prayers_mailing_messages import CityPrayersMailingMessages
+from srv.mailings.concurrent_mailing import ConcurrentMailing
+from srv.mailings.pg_mailing_checkpoint import PgMailingCheckpoint
 
 
 @final
@@ -71,6 +53,9 @@ class PrayersMailingPublishedEvent(ReceivedEvent):
     """Обработка события о рассылке времени намаза на следующий день."""
 
     _empty_answer: TgAnswer
+    _http_client: httpx.AsyncClient
+    _throttle_stats: ThrottleStats
+    _limit: ConcurrencyLimit
     _pgsql: Database
     _settings: Settings
     _events_sink: Sink
@@ -83,76 +68,35 @@ class PrayersMailingPublishedEvent(ReceivedEvent):
 
         :param json_doc: Json
         """
-        active_users = await self._pgsql.fetch_all('\n'.join([
-            'SELECT u.chat_id',
-            'FROM users AS u',
-            "WHERE u.is_active = 't' {0}".format(
-                'AND u.chat_id IN ({0})'.format(
-                    ','.join([str(chat_id) for chat_id in self._settings.ADMIN_CHAT_IDS]),
-                )
-                if self._settings.DAILY_PRAYERS == 'off' else '',
-            ),
-            'ORDER BY u.chat_id',
-        ]))
-        unsubscribed_users: list[User] = []
-        date = FkPrayerDate(
-            add(
-                datetime.datetime.now(tz=pytz.timezone('Europe/Moscow')),
-                datetime.timedelta(days=1),
-            ).date(),
-        )
-        for active_user in active_users:
-            await self._iteration(
-                TgHtmlParseAnswer(
-                    TgAnswerMarkup(
-                        TgChatIdAnswer(
-                            TgTextAnswer(
-                                TgMessageAnswer(self._empty_answer),
-                                RamadanPrayerText(
-                                    PrayersText(
-                                        self._pgsql,
-                                        date,
-                                        UserCityId(self._pgsql, active_user[CHAT_ID]),
-                                        FkUpdate.empty_ctor(),
-                                    ),
-                                    self._settings.RAMADAN_MODE,
-                                ),
-                            ),
-                            active_user[CHAT_ID],
-                        ),
-                        UserPrayersKeyboard(
-                            self._pgsql,
-                            date,
-                            TgChatId(FkUpdate(ujson.dumps({'chat': {'id': active_user[CHAT_ID]}}))),
-                        ),
+        await ConcurrentMailing(
+            'Время намаза',
+            CityPrayersMailingMessages(
+                self._pgsql,
+                '\n'.join([
+                    'SELECT u.chat_id',
+                    'FROM users AS u',
+                    "WHERE u.is_active = 't' {0}".format(
+                        'AND u.chat_id IN ({0})'.format(
+                            ','.join([str(chat_id) for chat_id in self._settings.ADMIN_CHAT_IDS]),
+                        )
+                        if self._settings.DAILY_PRAYERS == 'off' else '',
                     ),
-                ),
-                active_user[CHAT_ID],
-                unsubscribed_users,
-            )
-        await UpdatedUsersStatusEvent(
-            PgUpdatedUsersStatus(self._pgsql, FkAsyncListable(unsubscribed_users)),
-            FkAsyncListable(unsubscribed_users),
-            self._events_sink,
-        ).update(to=False)
-
-    async def _iteration(self, answer: TgAnswer, chat_id: int, unsubscribed_users: list[User]) -> None:
-        # TODO #802 Удалить или обосновать необходимость метода `PrayersMailingPublishedEvent._iteration`
-        try:
-            await LoggedAnswer(
-                SendableAnswer(
-                    answer,
-                    self._log_sink,
-                ),
-                self._events_sink,
-                uuid.uuid4(),
-            ).send(FkUpdate.empty_ctor())
-        except TelegramIntegrationsError as err:
-            error_messages = [
-                'chat not found',
-                'bot was blocked by the user',
-                'user is deactivated',
-            ]
-            for error_message in error_messages:
-                if error_message in str(err):
-                    unsubscribed_users.append(FkUser(chat_id, 0, is_active=False))  # noqa: PERF401
+                ]),
+                add(
+                    datetime.datetime.now(tz=pytz.timezone('Europe/Moscow')),
+                    datetime.timedelta(days=1),
+                ).date(),
+                self._settings.RAMADAN_MODE,
+                self._empty_answer,
+                self._settings.MAILING_BATCH_SIZE,
+            ),
+            BatchedMailingJournal(self._pgsql, self._events_sink, uuid.uuid4(), self._settings.MAILING_BATCH_SIZE),
+            PgMailingCheckpoint(self._pgsql, str(json_doc.path('$.event_id')[0])),
+            self._empty_answer,
+            self._http_client,
+            self._throttle_stats,
+            self._settings.admin_chat_ids(),
+            self._limit,
+            self._settings.MAILING_BATCH_SIZE,
+            self._log_sink,
+        ).send()
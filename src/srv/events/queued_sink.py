@@ -0,0 +1,119 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from contextlib import suppress
+from typing import final, override
+
+from pyeo import elegant
+
+from app_types.flushable import Flushable
+from app_types.logger import LogSink
+from app_types.queue_stats import QueueStats
+from srv.events.sink import Sink
+
+
+@final
+@elegant
+class QueuedSink(Sink, Flushable, QueueStats):
+    """Отправка событий через очередь в памяти процесса.
+
+    `send` только кладет событие в очередь, публикацией занимается фоновая задача.
+    Если очередь переполнена (брокер недоступен или медленно отвечает), событие отбрасывается,
+    а обработка обновлений не останавливается.
+    """
+
+    def __init__(self, origin: Sink, max_size: int, shutdown_timeout: float, logger: LogSink) -> None:
+        """Ctor.
+
+        :param origin: Sink
+        :param max_size: int - максимальная длина очереди
+        :param shutdown_timeout: float - сколько секунд ждать отправки событий при остановке
+        :param logger: LogSink
+        """
+        self._origin = origin
+        self._shutdown_timeout = shutdown_timeout
+        self._logger = logger
+        self._queue: asyncio.Queue[tuple[str, dict, str, int]] = asyncio.Queue(max_size)
+        self._dropped = 0
+        self._worker: asyncio.Task | None = None
+
+    @override
+    async def send(self, queue_name: str, event_data: dict, event_name: str, version: int) -> None:
+        """Отправить событие.
+
+        :param queue_name: str
+        :param event_data: dict
+        :param event_name: str
+        :param version: int
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        try:
+            self._queue.put_nowait((queue_name, event_data, event_name, version))
+        except asyncio.QueueFull:
+            self._dropped += 1
+            self._logger.error('Events queue is full, {0} dropped. Total dropped: {1}'.format(
+                event_name, self._dropped,
+            ))
+
+    @override
+    async def flush(self) -> None:
+        """Дождаться отправки событий из очереди."""
+        if self._worker is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), self._shutdown_timeout)
+        except TimeoutError:
+            self._logger.error('Events queue not drained, {0} events lost'.format(self._queue.qsize()))
+        worker = self._worker
+        self._worker = None
+        worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await worker
+
+    @override
+    def depth(self) -> int:
+        """Кол-во элементов в очереди.
+
+        :return: int
+        """
+        return self._queue.qsize()
+
+    @override
+    def dropped(self) -> int:
+        """Кол-во элементов, отброшенных из-за переполнения очереди.
+
+        :return: int
+        """
+        return self._dropped
+
+    async def _drain(self) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_drain"
+        while True:  # noqa: WPS457
+            queue_name, event_data, event_name, version = await self._queue.get()
+            try:
+                await self._origin.send(queue_name, event_data, event_name, version)
+            except Exception:  # pylint: disable=broad-exception-caught
+                self._logger.exception('Fail on send event {0}'.format(event_name))
+            finally:
+                self._queue.task_done()
@@ -20,29 +20,37 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
+import asyncio
 import time
 import uuid
+from collections.abc import Sequence
 from typing import final, override
 
 import aio_pika
 import attrs
 import ujson
-from loguru import logger
 from pyeo import elegant
-from quranbot_schema_registry import validate_schema
 
 from app_types.logger import LogSink
-from settings import Settings
+from srv.events.amqp_channels import AmqpChannels
+from srv.events.batch_sink import BatchSink
+from srv.events.schema_validation import SchemaValidation
 from srv.events.sink import Sink
 
 
 @final
 @attrs.define(frozen=True)
 @elegant
-class RabbitmqSink(Sink):
-    """События в rabbitmq."""
+class RabbitmqSink(Sink, BatchSink):
+    """События в rabbitmq.
 
-    _settings: Settings
+    Публикует через пул каналов с подтверждениями, соединение живет столько же, сколько процесс.
+    Пачка событий публикуется в одном канале без ожидания подтверждения каждого сообщения,
+    подтверждения ожидаются разом.
+    """
+
+    _channels: AmqpChannels
+    _validation: SchemaValidation
     _logger: LogSink
 
     @override
@@ -54,7 +62,46 @@ class RabbitmqSink(Sink):
         :param event_name: str
         :param version: int
         """
-        event = {
+        await self.send_batch(queue_name, [event_data], event_name, version)
+
+    @override
+    async def send_batch(self, queue_name: str, events_data: Sequence[dict], event_name: str, version: int) -> None:
+        """Отправить пачку однотипных событий.
+
+        :param queue_name: str
+        :param events_data: Sequence[dict]
+        :param event_name: str
+        :param version: int
+        """
+        bodies = []
+        for event_data in events_data:
+            event = self._event(event_data, event_name)
+            body_json = ujson.dumps(event)
+            try:
+                self._validation.validate(event, event_name, version)
+            except TypeError as err:
+                self._logger.error('Schema of event: {0} invalid. {1}'.format(
+                    body_json, str(err),
+                ))
+                continue
+            self._logger.info('Try to publish event: {0}'.format(body_json))
+            bodies.append(body_json)
+        if not bodies:
+            return
+        async with self._channels.channel() as channel:
+            await asyncio.gather(*[
+                channel.default_exchange.publish(
+                    aio_pika.Message(body=body_json.encode('utf-8')),
+                    routing_key=queue_name,
+                )
+                for body_json in bodies
+            ])
+        for body_json in bodies:  # noqa: WPS440
+            self._logger.info('Event: {0} published'.format(body_json))
+
+    def _event(self, event_data: dict, event_name: str) -> dict:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_event"
+        return {
             'event_id': str(uuid.uuid4()),
             'event_version': 1,
             'event_name': event_name,
@@ -62,31 +109,3 @@ class RabbitmqSink(Sink):
             'producer': 'quranbot',
             'data': event_data,
         }
-        body_json = ujson.dumps(event)
-        try:
-            validate_schema(
-                body_json,
-                event_name,
-                version,
-            )
-        except TypeError as err:
-            logger.error('Schema of event: {0} invalid. {1}'.format(
-                body_json, str(err),
-            ))
-            return
-        connection = await aio_pika.connect_robust(
-            'amqp://{0}:{1}@{2}:5672/{3}'.format(
-                self._settings.RABBITMQ_USER,
-                self._settings.RABBITMQ_PASS,
-                self._settings.RABBITMQ_HOST,
-                self._settings.RABBITMQ_VHOST,
-            ),
-        )
-        self._logger.info('Try to publish event: {0}'.format(body_json))
-        async with connection:
-            channel = await connection.channel()
-            await channel.default_exchange.publish(
-                aio_pika.Message(body=body_json.encode('utf-8')),
-                routing_key=queue_name,
-            )
-        self._logger.info('Event: {0} published'.format(body_json))
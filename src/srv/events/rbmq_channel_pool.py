@@ -0,0 +1,108 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import final, override
+
+import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from pyeo import elegant
+
+from settings import Settings
+from srv.events.amqp_channels import AmqpChannels
+
+
+@final
+@elegant
+class RbmqChannelPool(AmqpChannels):
+    """Пул каналов поверх одного долгоживущего соединения с RabbitMQ.
+
+    Соединение открывается при первом запросе канала и переподключается автоматически (connect_robust).
+    Каналы открываются с подтверждениями публикации, закрытые брокером каналы в пул не возвращаются.
+    """
+
+    def __init__(self, url: str, max_channels: int) -> None:
+        """Ctor.
+
+        :param url: str - amqp dsn
+        :param max_channels: int - максимальное кол-во открытых каналов
+        """
+        self._url = url
+        self._slots = asyncio.Semaphore(max_channels)
+        self._lock = asyncio.Lock()
+        self._connection: AbstractRobustConnection | None = None
+        self._idle: list[AbstractChannel] = []
+
+    @classmethod
+    def settings_ctor(cls, settings: Settings, max_channels: int) -> AmqpChannels:
+        """Конструктор по настройкам.
+
+        :param settings: Settings
+        :param max_channels: int
+        :return: AmqpChannels
+        """
+        return cls(
+            'amqp://{0}:{1}@{2}:5672/{3}'.format(
+                settings.RABBITMQ_USER,
+                settings.RABBITMQ_PASS,
+                settings.RABBITMQ_HOST,
+                settings.RABBITMQ_VHOST,
+            ),
+            max_channels,
+        )
+
+    @override
+    @asynccontextmanager
+    async def channel(self) -> AsyncIterator[AbstractChannel]:
+        """Занять канал.
+
+        :yield: AbstractChannel
+        """
+        async with self._slots:
+            channel = await self._idle_or_new()
+            try:
+                yield channel
+            finally:
+                if not channel.is_closed:
+                    self._idle.append(channel)
+
+    @override
+    async def close(self) -> None:
+        """Закрыть соединение."""
+        async with self._lock:
+            self._idle.clear()
+            if self._connection is not None:
+                await self._connection.close()
+                self._connection = None
+
+    async def _idle_or_new(self) -> AbstractChannel:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_idle_or_new"
+        while self._idle:
+            channel = self._idle.pop()
+            if not channel.is_closed:
+                return channel
+        async with self._lock:
+            if self._connection is None:
+                self._connection = await aio_pika.connect_robust(self._url)
+            return await self._connection.channel(publisher_confirms=True)
@@ -0,0 +1,102 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import aio_pika
+import ujson
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage
+from pyeo import elegant
+
+from app_types.logger import LogSink
+from services.json_path_expressions import JsonPathExpressions
+from srv.events.compiled_paths_json import CompiledPathsJson
+from srv.events.message_ack import MessageAck
+from srv.events.recieved_event import ReceivedEvent
+
+
+@final
+@elegant
+class RbmqEventAck(MessageAck):
+    """Обработка события из RabbitMQ.
+
+    Сообщение подтверждается после обработки.
+    Событие, обработка которого упала, публикуется в очередь failed-events,
+    если опубликовать не удалось - сообщение возвращается в очередь.
+    """
+
+    def __init__(
+        self,
+        json_paths: JsonPathExpressions,
+        logger: LogSink,
+        *events: ReceivedEvent,
+    ) -> None:
+        """Ctor.
+
+        :param json_paths: JsonPathExpressions - кэш jsonpath выражений для тела события
+        :param logger: LogSink,
+        :param events: ReceivedEvent,
+        """
+        self._json_paths = json_paths
+        self._logger = logger
+        self._events = events
+
+    @override
+    async def ack(self, message: AbstractIncomingMessage, chnl: AbstractChannel) -> None:
+        """Обработать и подтвердить сообщение.
+
+        :param message: AbstractIncomingMessage
+        :param chnl: AbstractChannel - канал, из которого получено сообщение
+        """
+        if not message.body:
+            await message.ack()
+            return
+        try:
+            await self._inner_handler(message)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Catching all exceptions because app entry.
+            self._logger.exception('Fail on process event')
+            await self._moved_to_failed(message, chnl)
+            return
+        await message.ack()
+
+    async def _moved_to_failed(self, message: AbstractIncomingMessage, chnl: AbstractChannel) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_moved_to_failed"
+        try:
+            await chnl.default_exchange.publish(
+                aio_pika.Message(body=message.body),
+                routing_key='failed-events',
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._logger.exception('Fail on publish failed event, return it to queue')
+            await message.nack(requeue=True)
+            return
+        await message.ack()
+
+    async def _inner_handler(self, message: AbstractIncomingMessage) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_inner_handler"
+        decoded_body = message.body.decode('utf-8')
+        self._logger.info('Taked event {0}'.format(decoded_body))
+        body_json = CompiledPathsJson(ujson.loads(decoded_body), self._json_paths)
+        for event in self._events:
+            await event.process(body_json)
+        self._logger.info('Event {0} processed'.format(body_json.path('$.event_id')[0]))
@@ -23,98 +23,79 @@
 import asyncio
 from typing import final, override
 
-import aio_pika
-import ujson
-from aiormq.abc import DeliveredMessage
+import attrs
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractQueue
 from databases import Database
-from eljson.json_doc import JsonDoc
 from pyeo import elegant
-from quranbot_schema_registry import validate_schema
 
 from app_types.logger import LogSink
 from settings import Settings
+from srv.events.amqp_channels import AmqpChannels
 from srv.events.event_hook import EventHook
-from srv.events.recieved_event import ReceivedEvent
+from srv.events.message_ack import MessageAck
 
 
 @final
+@attrs.define(frozen=True)
 @elegant
 class RbmqEventHook(EventHook):
-    """Обработчик событий из RabbitMQ."""
+    """Обработчик событий из RabbitMQ.
 
-    def __init__(
-        self,
-        settings: Settings,
-        pgsql: Database,
-        logger: LogSink,
-        *events: ReceivedEvent,
-    ) -> None:
-        """Ctor.
+    На каждую очередь из настройки RABBITMQ_QUEUES_CONCURRENCY занимается отдельный канал с подпиской,
+    поэтому пул каналов должен вмещать все очереди.
+    Prefetch канала и кол-во одновременно обрабатываемых событий равны лимиту очереди,
+    поэтому долгие рассылки не блокируют обработку событий из других очередей.
+    Ошибка обработки одного сообщения логируется и не останавливает подписки.
+    """
 
-        :param settings: Settings,
-        :param pgsql: Database,
-        :param logger: LogSink,
-        :param events: ReceivedEvent,
-        """
-        self._settings = settings
-        self._pgsql = pgsql
-        self._logger = logger
-        self._events = events
+    _settings: Settings
+    _channels: AmqpChannels
+    _pgsql: Database
+    _ack: MessageAck
+    _logger: LogSink
 
     @override
-    async def catch(self) -> None:  # noqa: WPS217
+    async def catch(self) -> None:
         """Запуск обработки."""
         await self._pgsql.connect()
-        connection = await aio_pika.connect_robust(
-            'amqp://{0}:{1}@{2}:5672/{3}'.format(
-                self._settings.RABBITMQ_USER,
-                self._settings.RABBITMQ_PASS,
-                self._settings.RABBITMQ_HOST,
-                self._settings.RABBITMQ_VHOST,
-            ),
-        )
-        self._logger.info('Connected to rabbitmq')
-        async with connection:
-            chnl = await connection.channel()
-            channel = await chnl.get_underlay_channel()
+        async with asyncio.TaskGroup() as task_group:
+            for queue_name, concurrency in self._settings.RABBITMQ_QUEUES_CONCURRENCY.items():
+                task_group.create_task(self._consume(queue_name, concurrency))
             self._logger.info('Wait events...')
-            while True:  # noqa: WPS457
-                await asyncio.sleep(0.1)
-                for queue_name in ('quranbot.users', 'quranbot.mailings', 'quranbot.ayats', 'quranbot.messages'):
-                    msg: DeliveredMessage = await channel.basic_get(queue_name)
-                    await self._event_handler(msg, chnl)
 
-    async def _event_handler(self, message: DeliveredMessage, chnl: aio_pika.abc.AbstractChannel) -> None:
-        # TODO #802 Удалить или задокументировать необходимость приватного метода "_event_handler"
-        if not message.body:
-            return
-        try:
-            await self._inner_handler(message)
-        except Exception:  # pylint: disable=broad-exception-caught
-            # Catching all exceptions because app entry.
-            self._logger.exception('Fail on process event')
-            await chnl.default_exchange.publish(
-                aio_pika.Message(body=message.body),
-                routing_key='failed-events',
-            )
-        await message.channel.basic_ack(message.delivery.delivery_tag)  # type: ignore [union-attr, arg-type]
+    async def _consume(self, queue_name: str, concurrency: int) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_consume"
+        async with self._channels.channel() as channel:
+            await channel.set_qos(prefetch_count=concurrency)
+            queue = await channel.get_queue(queue_name)
+            self._logger.info('Connected to rabbitmq queue {0}'.format(queue_name))
+            async with asyncio.TaskGroup() as task_group:
+                await self._dispatch(queue, channel, task_group, asyncio.Semaphore(concurrency))
+
+    async def _dispatch(
+        self,
+        queue: AbstractQueue,
+        chnl: AbstractChannel,
+        task_group: asyncio.TaskGroup,
+        slots: asyncio.Semaphore,
+    ) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_dispatch"
+        async with queue.iterator() as messages:
+            async for message in messages:
+                await slots.acquire()
+                task_group.create_task(self._event_handler(message, chnl, slots))
 
-    async def _inner_handler(self, message: DeliveredMessage) -> None:
-        # TODO #802 Удалить или задокументировать необходимость приватного метода "_inner_handler"
-        decoded_body = message.body.decode('utf-8')
-        self._logger.info('Taked event {0}'.format(decoded_body))
-        body_json = JsonDoc.from_string(decoded_body)  # type: ignore [no-untyped-call]
+    async def _event_handler(
+        self,
+        message: AbstractIncomingMessage,
+        chnl: AbstractChannel,
+        slots: asyncio.Semaphore,
+    ) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_event_handler"
         try:
-            validate_schema(
-                ujson.loads(decoded_body),
-                body_json.path('$.event_name')[0],
-                body_json.path('$.event_version')[0],
-            )
-        except TypeError as err:
-            self._logger.error('Schema of event: {0} invalid. {1}'.format(
-                body_json.path('$.event_id')[0], str(err),
-            ))
-            return
-        for event in self._events:
-            await event.process(body_json)
-        self._logger.info('Event {0} processed'.format(body_json.path('$.event_id')[0]))
+            await self._ack.ack(message, chnl)
+        except Exception:  # noqa: BLE001 pylint: disable=broad-exception-caught
+            # Failed ack/nack of one message (e.g. channel closed on reconnect) must not stop the consumers
+            self._logger.exception('Fail on ack event')
+        finally:
+            slots.release()
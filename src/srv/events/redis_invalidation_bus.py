@@ -0,0 +1,110 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from collections import defaultdict
+from typing import Final, final, override
+
+from pyeo import elegant
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app_types.logger import LogSink
+from srv.events.fallback_invalidated_cache import FallbackInvalidatedCache
+from srv.events.invalidated_cache import InvalidatedCache
+from srv.events.invalidation_bus import InvalidationBus
+
+CHANNEL_PREFIX: Final = 'quranbot:invalidation:'
+
+
+@final
+@elegant
+class RedisInvalidationBus(InvalidationBus):
+    """Канал сброса кэшей через redis pub/sub.
+
+    Pub/sub не хранит сообщения: все, что опубликовано, пока процесс не подписан
+    (старт, обрыв соединения), теряется. Поэтому после каждой (пере)подписки
+    все подписанные кэши сбрасываются целиком.
+    Любая ошибка чтения канала, а не только ошибки соединения, логируется и ведет к переподписке.
+    """
+
+    def __init__(self, redis: Redis, reconnect_delay: float, logger: LogSink) -> None:
+        """Ctor.
+
+        :param redis: Redis
+        :param reconnect_delay: float - пауза перед переподключением в секундах
+        :param logger: LogSink
+        """
+        self._redis = redis
+        self._reconnect_delay = reconnect_delay
+        self._logger = logger
+        self._caches: defaultdict[str, list[InvalidatedCache]] = defaultdict(list)
+
+    @override
+    async def publish(self, key_space: str, key: str) -> None:
+        """Сообщить об изменении ключа.
+
+        :param key_space: str - пространство ключей, например "ayats"
+        :param key: str
+        """
+        await self._redis.publish('{0}{1}'.format(CHANNEL_PREFIX, key_space), key)
+
+    @override
+    def subscribe(self, key_space: str, cache: InvalidatedCache) -> None:
+        """Подписать кэш на изменения пространства ключей.
+
+        :param key_space: str
+        :param cache: InvalidatedCache
+        """
+        self._caches[key_space].append(FallbackInvalidatedCache(cache, key_space, self._logger))
+
+    @override
+    async def listen(self) -> None:
+        """Получать сообщения об изменениях до отмены."""
+        while True:  # noqa: WPS457
+            try:
+                await self._listened()
+            except (RedisError, OSError):
+                self._logger.exception('Invalidation channel lost, reconnect in {0}s'.format(self._reconnect_delay))
+                await asyncio.sleep(self._reconnect_delay)
+            except Exception:  # noqa: BLE001 pylint: disable=broad-exception-caught
+                # Unexpected message or decode error must not leave the process without invalidation
+                self._logger.exception('Fail on invalidation channel, reconnect in {0}s'.format(self._reconnect_delay))
+                await asyncio.sleep(self._reconnect_delay)
+
+    async def _listened(self) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_listened"
+        async with self._redis.pubsub() as pubsub:
+            await pubsub.psubscribe('{0}*'.format(CHANNEL_PREFIX))
+            await self._flushed()
+            async for message in pubsub.listen():
+                if message['type'] != 'pmessage':
+                    continue
+                key_space = message['channel'].decode().removeprefix(CHANNEL_PREFIX)
+                for cache in self._caches.get(key_space, []):
+                    await cache.invalidate(message['data'].decode())
+
+    async def _flushed(self) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_flushed"
+        for caches in self._caches.values():
+            for cache in caches:
+                await cache.flush()
@@ -0,0 +1,65 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+from eljson.json import Json
+from pyeo import elegant
+
+from app_types.logger import LogSink
+from srv.events.recieved_event import ReceivedEvent
+from srv.events.schema_validation import SchemaValidation
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class ValidatedEvent(ReceivedEvent):
+    """Декоратор, проверяющий событие по схеме перед обработкой.
+
+    Событие, не прошедшее проверку, в т.ч. событие без схемы,
+    передается в `invalid` вместо обработки.
+    """
+
+    _origin: ReceivedEvent
+    _validation: SchemaValidation
+    _invalid: ReceivedEvent
+    _logger: LogSink
+
+    @override
+    async def process(self, json_doc: Json) -> None:
+        """Обработка события.
+
+        :param json_doc: Json
+        """
+        event_name = json_doc.path('$.event_name')[0]
+        event_version = json_doc.path('$.event_version')[0]
+        try:
+            self._validation.validate(json_doc.path('$')[0], event_name, event_version)
+        except TypeError as err:
+            self._logger.error('Schema of event: {0} invalid. {1}'.format(
+                json_doc.path('$.event_id')[0], str(err),
+            ))
+            await self._invalid.process(json_doc)
+            return
+        await self._origin.process(json_doc)
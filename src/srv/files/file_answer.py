@@ -23,12 +23,12 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.supports_bool import SupportsBool
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.files.tg_file_id_not_filled_safe_answer import TgFileIdNotFilledSafeAnswer
 
 
@@ -43,11 +43,11 @@ class FileAnswer(TgAnswer):
     _file_link_answer: TgAnswer
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Отправка.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         if self._debug_mode:
             return await self._file_link_answer.build(update)
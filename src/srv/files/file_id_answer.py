@@ -23,12 +23,11 @@
 from typing import final, override
 
 import attrs
-import httpx
-from furl import furl
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.files.tg_file import TgFile
 
 
@@ -42,16 +41,13 @@ class TelegramFileIdAnswer(TgAnswer):
     _tg_file: TgFile
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Отправка.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         return [
-            httpx.Request(
-                request.method,
-                furl(request.url).add({'audio': await self._tg_file.tg_file_id()}).url,
-            )
+            request.with_fields({'audio': await self._tg_file.tg_file_id()})
             for request in await self._origin.build(update)
         ]
@@ -0,0 +1,120 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import uuid
+from typing import final, override
+
+import attrs
+import ujson
+from databases import Database
+from pyeo import elegant
+
+from app_types.fk_async_listable import FkAsyncListable
+from services.logged_answer import (
+    IS_UNKNOWN,
+    MAILING_ID,
+    MESSAGE_JSON,
+    MESSAGES,
+    MESSAGES_CREATED,
+    TRIGGER_CALLBACK_ID,
+    TRIGGER_MESSAGE_ID,
+    UPDATES_LOG,
+)
+from srv.events.sink import Sink
+from srv.mailings.mailing_journal import MailingJournal
+from srv.users.fk_user import FkUser
+from srv.users.pg_updated_users_status import PgUpdatedUsersStatus
+from srv.users.updated_users_status_event import UpdatedUsersStatusEvent
+from srv.users.user import User
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class BatchedMailingJournal(MailingJournal):
+    """Журнал рассылки, записывающий пачками.
+
+    Отправленные сообщения публикуются одним событием Messages.Created на `batch_size` сообщений,
+    отписавшиеся пользователи деактивируются одним запросом на `batch_size` пользователей.
+    """
+
+    _pgsql: Database
+    _events_sink: Sink
+    _mailing_id: uuid.UUID
+    _batch_size: int
+    _messages: list[dict] = attrs.field(factory=list)
+    _unsubscribed: list[User] = attrs.field(factory=list)
+
+    @override
+    async def sent(self, responses: list[dict]) -> None:
+        """Запомнить отправленные сообщения.
+
+        :param responses: list[dict]
+        """
+        self._messages.extend(
+            {
+                MESSAGE_JSON: ujson.dumps(response['result']),
+                IS_UNKNOWN: False,
+                TRIGGER_MESSAGE_ID: None,
+                TRIGGER_CALLBACK_ID: None,
+                MAILING_ID: str(self._mailing_id),
+            }
+            for response in responses
+        )
+        if len(self._messages) >= self._batch_size:
+            await self._flush_messages()
+
+    @override
+    async def unsubscribed(self, chat_id: int) -> None:
+        """Запомнить отписавшегося пользователя.
+
+        :param chat_id: int
+        """
+        self._unsubscribed.append(FkUser(chat_id, 0, is_active=False))
+        if len(self._unsubscribed) >= self._batch_size:
+            await self._flush_unsubscribed()
+
+    @override
+    async def flush(self) -> None:
+        """Записать накопленное."""
+        await self._flush_messages()
+        await self._flush_unsubscribed()
+
+    async def _flush_messages(self) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_flush_messages"
+        if not self._messages:
+            return
+        messages = self._messages.copy()
+        self._messages.clear()
+        await self._events_sink.send(UPDATES_LOG, {MESSAGES: messages}, MESSAGES_CREATED, 1)
+
+    async def _flush_unsubscribed(self) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_flush_unsubscribed"
+        if not self._unsubscribed:
+            return
+        users = FkAsyncListable(self._unsubscribed.copy())
+        self._unsubscribed.clear()
+        await UpdatedUsersStatusEvent(
+            PgUpdatedUsersStatus(self._pgsql, users),
+            users,
+            self._events_sink,
+        ).update(to=False)
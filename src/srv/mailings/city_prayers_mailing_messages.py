@@ -0,0 +1,187 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import datetime
+import uuid
+from collections.abc import AsyncIterator
+from itertools import groupby
+from operator import itemgetter
+from typing import final, override
+
+import attrs
+from databases import Database
+from pyeo import elegant
+
+from integrations.tg.tg_answers.tg_answer import TgAnswer
+from srv.mailings.mailing_messages import MailingMessages
+from srv.mailings.pg_mailing_messages import PgMailingMessages
+from srv.mailings.pg_prayers_row_answer import PgPrayersRowAnswer
+from srv.mailings.prayers_row_answer import PrayersRowAnswer
+from srv.prayers.exist_user_prayers_dict import ExistUserPrayersDict
+from srv.prayers.prayers_rows_text import PrayersRowsText
+from srv.prayers.ramadan_prayer_text import RamadanPrayerText
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class CityPrayersMailingMessages(MailingMessages):
+    """Сообщения рассылки времени намаза, подготовленные пачкой.
+
+    Перед началом потока:
+    - одним запросом создаются записи prayers_at_user для всех получателей, у которых их еще нет
+    - текст собирается один раз на город
+    - статусы намазов для клавиатур читаются одним запросом
+    Получатели без города или без времен намаза на дату в рассылку не попадают.
+    Получатели, сменившие город или подписавшиеся во время рассылки, получают сообщение, собранное при отправке.
+    Запрос получателей должен возвращать колонку chat_id.
+    """
+
+    _pgsql: Database
+    _recipients_query: str
+    _date: datetime.date
+    _ramadan_mode: bool
+    _empty_answer: TgAnswer
+    _page_size: int
+
+    @override
+    async def count(self, after: int) -> int:
+        """Кол-во получателей.
+
+        :param after: int - идентификатор чата, после которого считать получателей
+        :return: int
+        """
+        return await self._recipients({}, {}).count(after)
+
+    @override
+    async def iterate(self, after: int) -> AsyncIterator[tuple[int, TgAnswer]]:
+        """Поток пар идентификатор чата - ответ.
+
+        :param after: int - идентификатор чата, после которого начинать поток
+        :yield: tuple[int, TgAnswer]
+        """
+        await self._pgsql.execute(
+            '\n'.join([
+                'WITH targets AS (',
+                '    SELECT t.chat_id, t.city_id, GEN_RANDOM_UUID()::character varying AS prayer_group_id',
+                '    FROM ({0}) AS t'.format(self._targets_query()),  # noqa: S608 query is not user input
+                '    WHERE (',
+                '        SELECT COUNT(*)',
+                '        FROM prayers_at_user AS pau',
+                '        INNER JOIN prayers AS p ON pau.prayer_id = p.prayer_id',
+                "        WHERE p.day = :date AND pau.user_id = t.chat_id AND p.name <> 'sunrise'",
+                '    ) <> 5',
+                '), prayer_groups AS (',
+                '    INSERT INTO prayers_at_user_groups SELECT prayer_group_id FROM targets',
+                ')',
+                'INSERT INTO prayers_at_user (user_id, prayer_id, is_read, prayer_group_id)',
+                'SELECT t.chat_id, p.prayer_id, false, t.prayer_group_id',
+                'FROM targets AS t',
+                'INNER JOIN prayers AS p ON p.city_id = t.city_id',
+                "WHERE p.day = :date AND p.name <> 'sunrise'",
+                'ORDER BY',
+                '    t.chat_id,',
+                "    ARRAY_POSITION(ARRAY['fajr', 'dhuhr', 'asr', 'maghrib', 'isha''a']::text[], p.name::text)",
+                'ON CONFLICT (user_id, prayer_id) DO NOTHING',
+            ]),
+            {'date': self._date},
+        )
+        recipients = self._recipients(await self._texts(), await self._keyboards())
+        async for chat_id, answer in recipients.iterate(after):
+            yield chat_id, answer
+
+    def _recipients(
+        self,
+        texts: dict[uuid.UUID, str],
+        keyboards: dict[tuple[int, uuid.UUID], list[ExistUserPrayersDict]],
+    ) -> MailingMessages:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_recipients"
+        return PgMailingMessages(
+            self._pgsql,
+            self._targets_query(),
+            PrayersRowAnswer(
+                self._empty_answer,
+                texts,
+                keyboards,
+                PgPrayersRowAnswer(self._empty_answer, self._pgsql, self._date, self._ramadan_mode),
+            ),
+            self._page_size,
+        )
+
+    def _targets_query(self) -> str:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_targets_query"
+        return '\n'.join([
+            'SELECT u.chat_id, u.city_id',
+            'FROM ({0}) AS recipients'.format(self._recipients_query),  # noqa: S608 query is not user input
+            'INNER JOIN users AS u ON u.chat_id = recipients.chat_id',
+            'WHERE (',
+            '    SELECT COUNT(*)',
+            '    FROM prayers AS p',
+            "    WHERE p.city_id = u.city_id AND p.day = '{0}'::date".format(self._date.isoformat()),
+            ') >= 6',
+        ])
+
+    async def _texts(self) -> dict[uuid.UUID, str]:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_texts"
+        rows = await self._pgsql.fetch_all(
+            '\n'.join([
+                'SELECT c.city_id, c.name AS city_name, p.day, p.time, p.name',
+                'FROM prayers AS p',
+                'INNER JOIN cities AS c ON p.city_id = c.city_id',
+                'WHERE p.day = :date AND c.city_id IN (SELECT t.city_id FROM ({0}) AS t)'.format(  # noqa: S608
+                    self._targets_query(),
+                ),
+                'ORDER BY',
+                '    c.city_id,',
+                '    ARRAY_POSITION(',
+                "        ARRAY['fajr', 'sunrise', 'dhuhr', 'asr', 'maghrib', 'isha''a']::text[],",
+                '        p.name::text',
+                '    )',
+            ]),
+            {'date': self._date},
+        )
+        return {
+            city_id: await RamadanPrayerText(PrayersRowsText(list(city_rows)), self._ramadan_mode).to_str()
+            for city_id, city_rows in groupby(rows, key=itemgetter('city_id'))
+        }
+
+    async def _keyboards(self) -> dict[tuple[int, uuid.UUID], list[ExistUserPrayersDict]]:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_keyboards"
+        rows = await self._pgsql.fetch_all(
+            '\n'.join([
+                'SELECT pau.user_id, p.city_id, pau.prayer_at_user_id, pau.is_read',
+                'FROM prayers_at_user AS pau',
+                'INNER JOIN prayers AS p ON pau.prayer_id = p.prayer_id',
+                "WHERE p.day = :date AND p.name <> 'sunrise' AND pau.user_id IN (SELECT t.chat_id FROM ({0}) AS t)".format(  # noqa: S608, E501
+                    self._targets_query(),
+                ),
+                'ORDER BY pau.user_id, p.city_id, pau.prayer_at_user_id',
+            ]),
+            {'date': self._date},
+        )
+        return {
+            user_city: [
+                {'prayer_at_user_id': row['prayer_at_user_id'], 'is_read': row['is_read']}
+                for row in user_rows
+            ]
+            for user_city, user_rows in groupby(rows, key=itemgetter('user_id', 'city_id'))
+        }
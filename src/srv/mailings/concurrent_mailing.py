@@ -0,0 +1,177 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from collections.abc import Iterator, Sequence
+from typing import Final, final, override
+
+import attrs
+import httpx
+import ujson
+from pyeo import elegant
+
+from app_types.fk_update import FkUpdate
+from app_types.logger import LogSink
+from app_types.throttle_stats import ThrottleStats
+from exceptions.internal_exceptions import TelegramIntegrationsError
+from integrations.tg.concurrency_limit import ConcurrencyLimit
+from integrations.tg.limit_recorded_sendable import LimitRecordedSendable
+from integrations.tg.sendable_answer import SendableAnswer
+from integrations.tg.tg_answers import TgAnswer, TgChatIdAnswer, TgMessageAnswer, TgTextAnswer
+from srv.mailings.logged_mailing_progress import LoggedMailingProgress
+from srv.mailings.mailing import Mailing
+from srv.mailings.mailing_checkpoint import MailingCheckpoint
+from srv.mailings.mailing_journal import MailingJournal
+from srv.mailings.mailing_messages import MailingMessages
+from srv.mailings.mailing_progress import MailingProgress
+from srv.mailings.timed_mailing_progress import TimedMailingProgress
+
+UNSUBSCRIBE_REASONS: Final = ('chat not found', 'bot was blocked by the user', 'user is deactivated')
+REPORT_EVERY: Final = 1000
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class ConcurrentMailing(Mailing):
+    """Рассылка с ограниченным кол-вом одновременных отправок.
+
+    Получатели читаются пачками по `batch_size` в порядке chat_id,
+    пачку разбирают одновременные отправки, их кол-во задает адаптивный `limit`:
+    уменьшение лимита останавливает лишние отправки сразу, рост учитывается со следующей пачки.
+    После пачки сохраняется точка, с которой рассылка продолжится после перезапуска, затем записывается журнал.
+    Ошибка журнала пишется в лог и не останавливает рассылку.
+    Лимиты API телеграма соблюдает транспорт HTTP клиента.
+    Прогресс пишется в лог каждые REPORT_EVERY получателей, итоговый отчет - в лог и чаты администраторов.
+    `throttle_stats` считает запросы текущей задачи (TaskThrottleStats),
+    поэтому в отчет попадают ожидания лимитов и повторы только отправок этой рассылки.
+    """
+
+    _name: str
+    _messages: MailingMessages
+    _journal: MailingJournal
+    _checkpoint: MailingCheckpoint
+    _empty_answer: TgAnswer
+    _http_client: httpx.AsyncClient
+    _throttle_stats: ThrottleStats
+    _admin_chat_ids: Sequence[int]
+    _limit: ConcurrencyLimit
+    _batch_size: int
+    _logger: LogSink
+
+    @override
+    async def send(self) -> None:
+        """Отправка."""
+        after = await self._checkpoint.last_chat_id()
+        total = await self._messages.count(after)
+        self._logger.info('Mailing "{0}" started after chat {1}, recipients: {2}'.format(self._name, after, total))
+        progress = LoggedMailingProgress(TimedMailingProgress(total), self._name, REPORT_EVERY, self._logger)
+        batch: list[tuple[int, TgAnswer]] = []
+        async for message in self._messages.iterate(after):
+            batch.append(message)
+            if len(batch) == self._batch_size:
+                await self._send_batch(batch, progress)
+                batch = []
+        await self._send_batch(batch, progress)
+        await self._report('\n'.join([
+            'Рассылка "{0}" завершена'.format(self._name),
+            progress.report(),
+        ]))
+
+    async def _send_batch(self, batch: list[tuple[int, TgAnswer]], progress: MailingProgress) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_send_batch"
+        messages = iter(batch)
+        workers = min(max(self._limit.current(), 1), len(batch))
+        async with asyncio.TaskGroup() as task_group:
+            for idx in range(workers):
+                task_group.create_task(self._worker(idx, messages, progress))
+        # The checkpoint goes first: a journal failure must not make a restart send the batch again
+        await self._checkpoint.save([chat_id for chat_id, _ in batch])
+        try:
+            await self._journal.flush()
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._logger.exception('Fail flush mailing "{0}" journal'.format(self._name))
+
+    async def _worker(self, idx: int, messages: Iterator[tuple[int, TgAnswer]], progress: MailingProgress) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_worker"
+        # The worker task has its own copy of the throttle counters, the delta belongs to its sends only
+        throttled = self._throttle_stats.throttled()
+        waited = self._throttle_stats.waited()
+        retried = self._throttle_stats.retried()
+        # Workers beyond a decreased limit stop before taking the next recipient
+        while idx < max(self._limit.current(), 1):
+            message = next(messages, None)
+            if message is None:
+                break
+            try:
+                await self._send_one(*message, progress)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Journal failure for one recipient must not stop the whole mailing
+                self._logger.exception('Fail journal mailing message to {0}'.format(message[0]))
+        progress.limited(
+            self._throttle_stats.throttled() - throttled,
+            self._throttle_stats.waited() - waited,
+            self._throttle_stats.retried() - retried,
+        )
+
+    async def _send_one(self, chat_id: int, answer: TgAnswer, progress: MailingProgress) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_send_one"
+        try:
+            responses = await LimitRecordedSendable(
+                SendableAnswer(answer, self._http_client, self._logger),
+                self._limit,
+                self._throttle_stats,
+            ).send(FkUpdate.empty_ctor())
+        except TelegramIntegrationsError as err:
+            reason = self._reason(str(err))
+            if any(unsubscribe_reason in reason for unsubscribe_reason in UNSUBSCRIBE_REASONS):
+                progress.unsubscribed()
+                await self._journal.unsubscribed(chat_id)
+            else:
+                progress.failed(reason)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            # One broken recipient must not stop the whole mailing
+            self._logger.exception('Fail send mailing message to {0}'.format(chat_id))
+            progress.failed(type(err).__name__)
+        else:
+            progress.sent()
+            await self._journal.sent(responses)
+
+    async def _report(self, report: str) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_report"
+        self._logger.info(report)
+        for chat_id in self._admin_chat_ids:
+            try:
+                await SendableAnswer(
+                    TgTextAnswer.str_ctor(TgChatIdAnswer(TgMessageAnswer(self._empty_answer), chat_id), report),
+                    self._http_client,
+                    self._logger,
+                ).send(FkUpdate.empty_ctor())
+            except (TelegramIntegrationsError, httpx.HTTPError):
+                self._logger.exception('Fail send mailing report to admin {0}'.format(chat_id))
+
+    def _reason(self, error_text: str) -> str:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_reason"
+        try:
+            return str(ujson.loads(error_text)['description'])
+        except (ValueError, KeyError, TypeError):
+            return error_text
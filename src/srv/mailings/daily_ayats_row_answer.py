@@ -0,0 +1,70 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import Mapping
+from typing import final, override
+
+import attrs
+from databases.interfaces import Record
+from pyeo import elegant
+
+from integrations.tg.tg_answers import TgAnswer, TgChatIdAnswer, TgHtmlParseAnswer, TgTextAnswer
+from integrations.tg.tg_answers.link_preview_options import TgLinkPreviewOptions
+from integrations.tg.tg_answers.message_answer import TgMessageAnswer
+from srv.mailings.row_answer import RowAnswer
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class DailyAyatsRowAnswer(RowAnswer):
+    """Сообщение утренней рассылки аятов.
+
+    Текст берется из заранее отрисованных текстов по дню пользователя, строка должна содержать колонку day.
+    Получатели, чьего дня нет среди текстов (день сменился уже во время рассылки), передаются в `missing`.
+    """
+
+    _empty_answer: TgAnswer
+    _texts: Mapping[int, str]
+    _missing: RowAnswer
+
+    @override
+    def answer(self, row: Record) -> TgAnswer:
+        """Ответ.
+
+        :param row: Record
+        :return: TgAnswer
+        """
+        if row['day'] not in self._texts:
+            return self._missing.answer(row)
+        return TgLinkPreviewOptions(
+            TgHtmlParseAnswer(
+                TgTextAnswer.str_ctor(
+                    TgChatIdAnswer(
+                        TgMessageAnswer(self._empty_answer),
+                        row['chat_id'],
+                    ),
+                    self._texts[row['day']],
+                ),
+            ),
+            disabled=True,
+        )
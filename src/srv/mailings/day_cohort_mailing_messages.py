@@ -0,0 +1,109 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import AsyncIterator, Sequence
+from itertools import groupby
+from operator import itemgetter
+from typing import final, override
+
+import attrs
+from databases import Database
+from databases.interfaces import Record
+from pyeo import elegant
+
+from integrations.tg.tg_answers.tg_answer import TgAnswer
+from srv.mailings.daily_ayats_row_answer import DailyAyatsRowAnswer
+from srv.mailings.mailing_messages import MailingMessages
+from srv.mailings.pg_daily_ayats_row_answer import PgDailyAyatsRowAnswer
+from srv.mailings.pg_day_ayats_text import DAILY_AYATS_TEMPLATE
+from srv.mailings.pg_mailing_messages import PgMailingMessages
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class DayCohortMailingMessages(MailingMessages):
+    """Сообщения утренней рассылки, сгруппированные по дню пользователя.
+
+    У всех пользователей с одинаковым днем одинаковый текст,
+    поэтому тексты собираются и отрисовываются один раз на день перед началом потока,
+    а для получателя остается только выбрать текст по его дню.
+    Дни, появившиеся у получателей во время рассылки, отрисовываются при отправке и дополняют тексты.
+    Запрос получателей должен возвращать колонки chat_id и day.
+    """
+
+    _pgsql: Database
+    _recipients_query: str
+    _empty_answer: TgAnswer
+    _page_size: int
+
+    @override
+    async def count(self, after: int) -> int:
+        """Кол-во получателей.
+
+        :param after: int - идентификатор чата, после которого считать получателей
+        :return: int
+        """
+        return await self._recipients({}).count(after)
+
+    @override
+    async def iterate(self, after: int) -> AsyncIterator[tuple[int, TgAnswer]]:
+        """Поток пар идентификатор чата - ответ.
+
+        :param after: int - идентификатор чата, после которого начинать поток
+        :yield: tuple[int, TgAnswer]
+        """
+        rows = await self._pgsql.fetch_all('\n'.join([
+            'SELECT a.day, a.sura_id, a.ayat_number, a.content, s.link',
+            'FROM public.ayats AS a',
+            'JOIN public.suras AS s ON a.sura_id = s.sura_id',
+            'WHERE a.day IN (SELECT DISTINCT recipients.day FROM ({0}) AS recipients)'.format(  # noqa: S608
+                self._recipients_query,
+            ),
+            'ORDER BY a.day, a.ayat_id',
+        ]))
+        async for chat_id, answer in self._recipients(self._day_texts(rows)).iterate(after):
+            yield chat_id, answer
+
+    def _recipients(self, texts: dict[int, str]) -> MailingMessages:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_recipients"
+        return PgMailingMessages(
+            self._pgsql,
+            self._recipients_query,
+            DailyAyatsRowAnswer(
+                self._empty_answer,
+                texts,
+                PgDailyAyatsRowAnswer(self._empty_answer, self._pgsql, texts),
+            ),
+            self._page_size,
+        )
+
+    def _day_texts(self, rows: Sequence[Record]) -> dict[int, str]:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_day_texts"
+        texts = {}
+        for day, day_rows in groupby(rows, key=itemgetter('day')):
+            ayats = list(day_rows)
+            texts[day] = DAILY_AYATS_TEMPLATE.render({
+                'ayats': ayats,
+                'sura_link': ayats[0]['link'],
+            })
+        return texts
@@ -0,0 +1,68 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import Sequence
+from typing import final, override
+
+import attrs
+from databases import Database
+from pyeo import elegant
+
+from srv.mailings.mailing_checkpoint import MailingCheckpoint
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class DayIncrementedCheckpoint(MailingCheckpoint):
+    """Точка сохранения, переводящая получателей на следующий день утренней рассылки.
+
+    День увеличивается в одной транзакции с сохранением точки,
+    поэтому после перезапуска пачка не будет увеличена повторно.
+    """
+
+    _origin: MailingCheckpoint
+    _pgsql: Database
+
+    @override
+    async def last_chat_id(self) -> int:
+        """Последний обработанный идентификатор чата.
+
+        :return: int
+        """
+        return await self._origin.last_chat_id()
+
+    @override
+    async def save(self, chat_ids: Sequence[int]) -> None:
+        """Сохранить обработанную пачку получателей.
+
+        :param chat_ids: Sequence[int]
+        """
+        if not chat_ids:
+            return
+        async with self._pgsql.transaction():
+            await self._pgsql.execute('\n'.join([
+                'UPDATE users',
+                'SET day = day + 1',
+                "WHERE is_active = 't' AND chat_id IN ({0})".format(','.join(str(chat_id) for chat_id in chat_ids)),
+            ]))
+            await self._origin.save(chat_ids)
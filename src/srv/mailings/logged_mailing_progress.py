@@ -0,0 +1,97 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import attrs
+from pyeo import elegant
+
+from app_types.logger import LogSink
+from srv.mailings.mailing_progress import MailingProgress
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class LoggedMailingProgress(MailingProgress):
+    """Прогресс рассылки, который пишется в лог каждые `every` обработанных получателей.
+
+    Проверка идет сразу после изменения счетчика, без await между ними,
+    поэтому параллельные отправки не пропускают ни одну отметку.
+    """
+
+    _origin: MailingProgress
+    _name: str
+    _every: int
+    _logger: LogSink
+
+    @override
+    def sent(self) -> None:
+        """Сообщение доставлено."""
+        self._origin.sent()
+        self._logged()
+
+    @override
+    def unsubscribed(self) -> None:
+        """Получатель отписался."""
+        self._origin.unsubscribed()
+        self._logged()
+
+    @override
+    def failed(self, reason: str) -> None:
+        """Ошибка отправки.
+
+        :param reason: str
+        """
+        self._origin.failed(reason)
+        self._logged()
+
+    @override
+    def limited(self, throttled: int, waited: float, retried: int) -> None:
+        """Отправка ждала лимитов телеграма.
+
+        :param throttled: int - кол-во запросов, ожидавших разрешения
+        :param waited: float - время ожидания в секундах
+        :param retried: int - кол-во повторов после ответа 429
+        """
+        self._origin.limited(throttled, waited, retried)
+
+    @override
+    def processed(self) -> int:
+        """Кол-во обработанных получателей.
+
+        :return: int
+        """
+        return self._origin.processed()
+
+    @override
+    def report(self) -> str:
+        """Текстовый отчет.
+
+        :return: str
+        """
+        return self._origin.report()
+
+    def _logged(self) -> None:
+        # TODO #802 Удалить или задокументировать необходимость приватного метода "_logged"
+        if self._origin.processed() % self._every == 0:
+            self._logger.info('Mailing "{0}" progress:\n{1}'.format(self._name, self._origin.report()))
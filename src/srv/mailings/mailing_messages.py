@@ -0,0 +1,45 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import AsyncIterator
+from typing import Protocol
+
+from pyeo import elegant
+
+from integrations.tg.tg_answers.tg_answer import TgAnswer
+
+
+@elegant
+class MailingMessages(Protocol):
+    """Сообщения рассылки, упорядоченные по идентификатору чата."""
+
+    async def count(self, after: int) -> int:
+        """Кол-во получателей.
+
+        :param after: int - идентификатор чата, после которого считать получателей
+        """
+
+    def iterate(self, after: int) -> AsyncIterator[tuple[int, TgAnswer]]:
+        """Поток пар идентификатор чата - ответ.
+
+        :param after: int - идентификатор чата, после которого начинать поток
+        """
@@ -0,0 +1,56 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import Protocol
+
+from pyeo import elegant
+
+
+@elegant
+class MailingProgress(Protocol):
+    """Прогресс рассылки."""
+
+    def sent(self) -> None:
+        """Сообщение доставлено."""
+
+    def unsubscribed(self) -> None:
+        """Получатель отписался."""
+
+    def failed(self, reason: str) -> None:
+        """Ошибка отправки.
+
+        :param reason: str
+        """
+
+    def limited(self, throttled: int, waited: float, retried: int) -> None:
+        """Отправка ждала лимитов телеграма.
+
+        :param throttled: int - кол-во запросов, ожидавших разрешения
+        :param waited: float - время ожидания в секундах
+        :param retried: int - кол-во повторов после ответа 429
+        """
+
+    def processed(self) -> int:
+        """Кол-во обработанных получателей."""
+
+    def report(self) -> str:
+        """Текстовый отчет."""
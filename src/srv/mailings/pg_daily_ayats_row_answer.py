@@ -0,0 +1,70 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import MutableMapping
+from typing import final, override
+
+import attrs
+from databases import Database
+from databases.interfaces import Record
+from pyeo import elegant
+
+from integrations.tg.tg_answers import TgAnswer, TgChatIdAnswer, TgHtmlParseAnswer, TgTextAnswer
+from integrations.tg.tg_answers.link_preview_options import TgLinkPreviewOptions
+from integrations.tg.tg_answers.message_answer import TgMessageAnswer
+from srv.mailings.pg_day_ayats_text import PgDayAyatsText
+from srv.mailings.row_answer import RowAnswer
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class PgDailyAyatsRowAnswer(RowAnswer):
+    """Сообщение утренней рассылки аятов с текстом, отрисованным при отправке.
+
+    Нужно для получателей, чей день не попал в заранее отрисованные тексты,
+    например пользователь сменил день уже после начала рассылки.
+    """
+
+    _empty_answer: TgAnswer
+    _pgsql: Database
+    _texts: MutableMapping[int, str]
+
+    @override
+    def answer(self, row: Record) -> TgAnswer:
+        """Ответ.
+
+        :param row: Record
+        :return: TgAnswer
+        """
+        return TgLinkPreviewOptions(
+            TgHtmlParseAnswer(
+                TgTextAnswer(
+                    TgChatIdAnswer(
+                        TgMessageAnswer(self._empty_answer),
+                        row['chat_id'],
+                    ),
+                    PgDayAyatsText(self._pgsql, row['day'], self._texts),
+                ),
+            ),
+            disabled=True,
+        )
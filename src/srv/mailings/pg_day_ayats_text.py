@@ -0,0 +1,83 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import MutableMapping
+from typing import Final, final, override
+
+import attrs
+from databases import Database
+from jinja2 import Template
+from pyeo import elegant
+
+from app_types.async_supports_str import AsyncSupportsStr
+from exceptions.base_exception import InternalBotError
+
+DAILY_AYATS_TEMPLATE: Final = Template(''.join([
+    '{% for ayat in ayats %}',
+    '<b>{{ ayat.sura_id }}:{{ ayat.ayat_number }})</b> {{ ayat.content }}\n',
+    '{% endfor %}',
+    '\nhttps://umma.ru{{ sura_link }}',
+]))
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class PgDayAyatsText(AsyncSupportsStr):
+    """Текст утренней рассылки для дня, отрисованный по запросу.
+
+    Отрисованный текст сохраняется в общий для рассылки словарь текстов,
+    поэтому следующие получатели с этим днем его не запрашивают.
+    """
+
+    _pgsql: Database
+    _day: int
+    _texts: MutableMapping[int, str]
+
+    @override
+    async def to_str(self) -> str:
+        """Строковое представление.
+
+        :return: str
+        :raises InternalBotError: для дня нет аятов
+        """
+        cached = self._texts.get(self._day)
+        if cached is not None:
+            return cached
+        rows = await self._pgsql.fetch_all(
+            '\n'.join([
+                'SELECT a.sura_id, a.ayat_number, a.content, s.link',
+                'FROM public.ayats AS a',
+                'JOIN public.suras AS s ON a.sura_id = s.sura_id',
+                'WHERE a.day = :day',
+                'ORDER BY a.ayat_id',
+            ]),
+            {'day': self._day},
+        )
+        if not rows:
+            msg = 'Ayats for day {0} not found'.format(self._day)
+            raise InternalBotError(msg)
+        self._texts[self._day] = DAILY_AYATS_TEMPLATE.render({
+            'ayats': rows,
+            'sura_link': rows[0]['link'],
+        })
+        return self._texts[self._day]
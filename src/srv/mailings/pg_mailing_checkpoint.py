@@ -0,0 +1,77 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import Sequence
+from typing import final, override
+
+import attrs
+from databases import Database
+from pyeo import elegant
+
+from srv.mailings.mailing_checkpoint import MailingCheckpoint
+from srv.users.min_chat_id import MIN_CHAT_ID
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class PgMailingCheckpoint(MailingCheckpoint):
+    """Точка сохранения рассылки в postgres.
+
+    Запись не удаляется после окончания рассылки,
+    поэтому повторно доставленное событие не приведет к повторной отправке.
+    """
+
+    _pgsql: Database
+    _run_id: str
+
+    @override
+    async def last_chat_id(self) -> int:
+        """Последний обработанный идентификатор чата.
+
+        :return: int
+        """
+        last_chat_id = await self._pgsql.fetch_val(
+            'SELECT last_chat_id FROM mailing_checkpoints WHERE run_id = :run_id',
+            {'run_id': self._run_id},
+        )
+        return MIN_CHAT_ID if last_chat_id is None else last_chat_id
+
+    @override
+    async def save(self, chat_ids: Sequence[int]) -> None:
+        """Сохранить обработанную пачку получателей.
+
+        :param chat_ids: Sequence[int]
+        """
+        if not chat_ids:
+            return
+        await self._pgsql.execute(
+            '\n'.join([
+                'INSERT INTO mailing_checkpoints (run_id, last_chat_id)',
+                'VALUES (:run_id, :last_chat_id)',
+                'ON CONFLICT (run_id) DO UPDATE',
+                'SET',
+                '    last_chat_id = GREATEST(mailing_checkpoints.last_chat_id, EXCLUDED.last_chat_id),',
+                '    updated_at = now()',
+            ]),
+            {'run_id': self._run_id, 'last_chat_id': max(chat_ids)},
+        )
@@ -0,0 +1,85 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import AsyncIterator
+from typing import cast, final, override
+
+import attrs
+from databases import Database
+from databases.interfaces import Record
+from pyeo import elegant
+
+from integrations.tg.tg_answers.tg_answer import TgAnswer
+from srv.mailings.mailing_messages import MailingMessages
+from srv.mailings.row_answer import RowAnswer
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class PgMailingMessages(MailingMessages):
+    """Сообщения рассылки по выборке из postgres.
+
+    Строки читаются страницами по `page_size` с пагинацией по chat_id,
+    поэтому выборка не загружается в память целиком и соединение не держится всю рассылку.
+    Запрос должен возвращать колонку chat_id.
+    """
+
+    _pgsql: Database
+    _query: str
+    _row_answer: RowAnswer
+    _page_size: int
+
+    @override
+    async def count(self, after: int) -> int:
+        """Кол-во получателей.
+
+        :param after: int - идентификатор чата, после которого считать получателей
+        :return: int
+        """
+        return await self._pgsql.fetch_val(
+            'SELECT COUNT(*) FROM ({0}) AS recipients WHERE chat_id > :after'.format(self._query),  # noqa: S608
+            {'after': after},
+        )
+
+    @override
+    async def iterate(self, after: int) -> AsyncIterator[tuple[int, TgAnswer]]:
+        """Поток пар идентификатор чата - ответ.
+
+        :param after: int - идентификатор чата, после которого начинать поток
+        :yield: tuple[int, TgAnswer]
+        """
+        while True:  # noqa: WPS457
+            rows = await self._pgsql.fetch_all(
+                '\n'.join([
+                    'SELECT * FROM ({0}) AS recipients'.format(self._query),  # noqa: S608 query is not user input
+                    'WHERE chat_id > :after',
+                    'ORDER BY chat_id',
+                    'LIMIT :limit',
+                ]),
+                {'after': after, 'limit': self._page_size},
+            )
+            for row in rows:
+                yield row['chat_id'], self._row_answer.answer(cast(Record, row))
+            if len(rows) < self._page_size:
+                return
+            after = rows[-1]['chat_id']
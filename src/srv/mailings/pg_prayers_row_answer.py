@@ -0,0 +1,90 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import datetime
+from typing import final, override
+
+import attrs
+from databases import Database
+from databases.interfaces import Record
+from pyeo import elegant
+
+from app_types.fk_update import FkUpdate
+from integrations.tg.fk_chat_id import FkChatId
+from integrations.tg.tg_answers import (
+    TgAnswer,
+    TgAnswerMarkup,
+    TgChatIdAnswer,
+    TgHtmlParseAnswer,
+    TgMessageAnswer,
+    TgTextAnswer,
+)
+from services.user_prayer_keyboard import UserPrayersKeyboard
+from srv.mailings.row_answer import RowAnswer
+from srv.prayers.fk_prayer_date import FkPrayerDate
+from srv.prayers.prayers_text import PrayersText
+from srv.prayers.ramadan_prayer_text import RamadanPrayerText
+from srv.prayers.user_city_id import UserCityId
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class PgPrayersRowAnswer(RowAnswer):
+    """Сообщение рассылки времени намаза, собранное при отправке.
+
+    Текст и клавиатура запрашиваются для одного получателя, записи prayers_at_user создаются при необходимости.
+    Нужно для получателей, сменивших город или подписавшихся уже после начала рассылки.
+    """
+
+    _empty_answer: TgAnswer
+    _pgsql: Database
+    _date: datetime.date
+    _ramadan_mode: bool
+
+    @override
+    def answer(self, row: Record) -> TgAnswer:
+        """Ответ.
+
+        :param row: Record
+        :return: TgAnswer
+        """
+        return TgHtmlParseAnswer(
+            TgAnswerMarkup(
+                TgChatIdAnswer(
+                    TgTextAnswer(
+                        TgMessageAnswer(self._empty_answer),
+                        RamadanPrayerText(
+                            PrayersText(
+                                self._pgsql,
+                                FkPrayerDate(self._date),
+                                UserCityId(self._pgsql, FkChatId(row['chat_id'])),
+                                FkUpdate.empty_ctor(),
+                            ),
+                            self._ramadan_mode,
+                        ),
+                    ),
+                    row['chat_id'],
+                ),
+                UserPrayersKeyboard(self._pgsql, FkPrayerDate(self._date), FkChatId(row['chat_id'])),
+            ),
+        )
@@ -0,0 +1,82 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import uuid
+from collections.abc import Mapping, Sequence
+from typing import final, override
+
+import attrs
+from databases.interfaces import Record
+from pyeo import elegant
+
+from integrations.tg.tg_answers import (
+    TgAnswer,
+    TgAnswerMarkup,
+    TgChatIdAnswer,
+    TgHtmlParseAnswer,
+    TgMessageAnswer,
+    TgTextAnswer,
+)
+from services.prayers_status_keyboard import PrayersStatusKeyboard
+from srv.mailings.row_answer import RowAnswer
+from srv.prayers.exist_user_prayers_dict import ExistUserPrayersDict
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class PrayersRowAnswer(RowAnswer):
+    """Сообщение рассылки времени намаза.
+
+    Текст и клавиатура берутся из заранее собранных по городу и по пользователю с городом,
+    строка должна содержать колонки chat_id и city_id.
+    Получатели, для чьих города или чата заготовок нет (сменили город или подписались во время рассылки),
+    передаются в `missing`.
+    """
+
+    _empty_answer: TgAnswer
+    _texts: Mapping[uuid.UUID, str]
+    _keyboards: Mapping[tuple[int, uuid.UUID], Sequence[ExistUserPrayersDict]]
+    _missing: RowAnswer
+
+    @override
+    def answer(self, row: Record) -> TgAnswer:
+        """Ответ.
+
+        :param row: Record
+        :return: TgAnswer
+        """
+        city_id = row['city_id']
+        if city_id not in self._texts or (row['chat_id'], city_id) not in self._keyboards:
+            return self._missing.answer(row)
+        return TgHtmlParseAnswer(
+            TgAnswerMarkup(
+                TgChatIdAnswer(
+                    TgTextAnswer.str_ctor(
+                        TgMessageAnswer(self._empty_answer),
+                        self._texts[city_id],
+                    ),
+                    row['chat_id'],
+                ),
+                PrayersStatusKeyboard(self._keyboards[row['chat_id'], city_id]),
+            ),
+        )
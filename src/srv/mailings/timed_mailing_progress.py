@@ -0,0 +1,114 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import datetime
+import time
+from collections import Counter
+from itertools import starmap
+from typing import Final, final, override
+
+import attrs
+from pyeo import elegant
+
+from srv.mailings.mailing_progress import MailingProgress
+
+MIN_ELAPSED: Final = 1e-6
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class TimedMailingProgress(MailingProgress):
+    """Прогресс рассылки со скоростью и оценкой времени окончания.
+
+    Счетчики хранятся в `counts` (sent, unsubscribed, throttled, retried), причины ошибок - в `errors`.
+    """
+
+    _total: int
+    _started: float = attrs.field(factory=time.monotonic)
+    _counts: Counter[str] = attrs.field(factory=Counter)
+    _errors: Counter[str] = attrs.field(factory=Counter)
+    _waited: list[float] = attrs.field(factory=list)
+
+    @override
+    def sent(self) -> None:
+        """Сообщение доставлено."""
+        self._counts['sent'] += 1
+
+    @override
+    def unsubscribed(self) -> None:
+        """Получатель отписался."""
+        self._counts['unsubscribed'] += 1
+
+    @override
+    def failed(self, reason: str) -> None:
+        """Ошибка отправки.
+
+        :param reason: str
+        """
+        self._errors[reason] += 1
+
+    @override
+    def limited(self, throttled: int, waited: float, retried: int) -> None:
+        """Отправка ждала лимитов телеграма.
+
+        :param throttled: int - кол-во запросов, ожидавших разрешения
+        :param waited: float - время ожидания в секундах
+        :param retried: int - кол-во повторов после ответа 429
+        """
+        self._counts.update(throttled=throttled, retried=retried)
+        self._waited.append(waited)
+
+    @override
+    def processed(self) -> int:
+        """Кол-во обработанных получателей.
+
+        :return: int
+        """
+        handled = self._counts['sent'] + self._counts['unsubscribed']
+        return handled + self._errors.total()
+
+    @override
+    def report(self) -> str:
+        """Текстовый отчет.
+
+        :return: str
+        """
+        processed = self.processed()
+        elapsed = max(time.monotonic() - self._started, MIN_ELAPSED)
+        throughput = processed / elapsed
+        eta = (self._total - processed) / throughput if throughput else 0
+        return '\n'.join([
+            'Обработано: {0}/{1}'.format(processed, self._total),
+            'Доставлено: {0}, отписались: {1}, ошибок: {2}'.format(
+                self._counts['sent'], self._counts['unsubscribed'], self._errors.total(),
+            ),
+            'Скорость: {0:.1f} сообщ./сек'.format(throughput),
+            'Прошло: {0}, осталось: {1}'.format(
+                datetime.timedelta(seconds=round(elapsed)),
+                datetime.timedelta(seconds=round(max(eta, 0))),
+            ),
+            'Ожидали лимитов телеграма: {0} ({1:.1f} сек.), повторов после 429: {2}'.format(
+                self._counts['throttled'], sum(self._waited), self._counts['retried'],
+            ),
+            *starmap('{0}: {1}'.format, self._errors.most_common()),
+        ])
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 from redis.asyncio import Redis
 
@@ -35,6 +34,7 @@ from integrations.tg.tg_answers.message_answer import TgMessageAnswer
 from integrations.tg.tg_answers.skipable_answer import SkipableAnswer
 from integrations.tg.tg_answers.text_answer import TgTextAnswer
 from integrations.tg.tg_answers.tg_answer import TgAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from services.reset_state_answer import ResetStateAnswer
 from srv.podcasts.podcast import Podcast
@@ -56,11 +56,11 @@ class PodcastAnswer(TgAnswer):
     _show_podcast_id: bool
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Трансформация в ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         chat_id = TgChatId(update)
         return await ResetStateAnswer(
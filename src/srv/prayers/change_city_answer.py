@@ -23,11 +23,11 @@
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer, TgTextAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.prayers.city import City
 from srv.prayers.updated_user_city import UpdatedUserCity
 
@@ -43,11 +43,11 @@ class ChangeCityAnswer(TgAnswer):
     _city: City
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         await self._user_city.update()
         return await TgTextAnswer.str_ctor(
@@ -23,7 +23,6 @@
 from typing import final, override
 
 import attrs
-import httpx
 import ujson
 from databases import Database
 from pyeo import elegant
@@ -34,7 +33,7 @@ from integrations.tg.exceptions.update_parse_exceptions import InlineQueryNotFou
 from integrations.tg.inline_query import InlineQuery
 from integrations.tg.inline_query_id import InlineQueryId
 from integrations.tg.tg_answers import TgAnswer
-from services.debug_answer import DebugAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.prayers.city_names import CityNames
 
 
@@ -48,39 +47,30 @@ class InlineQueryAnswer(TgAnswer):
     _pgsql: Database
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         :raises NotProcessableUpdateError: if update hasn't inline query
         """
         try:
             inline_query_data = str(InlineQuery(update))
         except InlineQueryNotFoundError as err:
             raise NotProcessableUpdateError from err
-        origin_requests = await DebugAnswer(self._origin).build(update)
         city_names = await CityNames(self._pgsql, inline_query_data).to_list()
         return [
-            httpx.Request(
-                origin_requests[0].method,
-                (
-                    origin_requests[0]
-                    .url
-                    .join('answerInlineQuery')
-                    .copy_add_param('inline_query_id', int(InlineQueryId(update)))
-                    .copy_add_param(
-                        'results',
-                        ujson.dumps([
-                            {
-                                'id': str(idx),
-                                'type': 'article',
-                                'title': city_name,
-                                'input_message_content': {'message_text': city_name},
-                            }
-                            for idx, city_name in enumerate(city_names)
-                        ]),
-                    )
-                ),
-            ),
+            request.with_api_method('answerInlineQuery').with_fields({
+                'inline_query_id': str(int(InlineQueryId(update))),
+                'results': ujson.dumps([
+                    {
+                        'id': str(idx),
+                        'type': 'article',
+                        'title': city_name,
+                        'input_message_content': {'message_text': city_name},
+                    }
+                    for idx, city_name in enumerate(city_names)
+                ]),
+            })
+            for request in await self._origin.build(update)
         ]
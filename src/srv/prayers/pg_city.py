@@ -24,6 +24,7 @@ import uuid
 from typing import final, override
 
 import attrs
+import httpx
 from databases import Database
 from pyeo import elegant
 
@@ -55,14 +56,15 @@ class PgCity(City):
         return cls(CityIdByName(FkAsyncStr(city_name), pgsql), pgsql)
 
     @classmethod
-    def location_ctor(cls, location: Coordinates, pgsql: Database) -> City:
+    def location_ctor(cls, location: Coordinates, http_client: httpx.AsyncClient, pgsql: Database) -> City:
         """Конструктор для координат города.
 
         :param location: Coordinates
+        :param http_client: httpx.AsyncClient
         :param pgsql: Database
         :return: City
         """
-        return cls(CityIdByName(NominatimCityName(location), pgsql), pgsql)
+        return cls(CityIdByName(NominatimCityName(location, http_client), pgsql), pgsql)
 
     @override
     async def city_id(self) -> uuid.UUID:
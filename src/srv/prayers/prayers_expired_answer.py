@@ -24,7 +24,6 @@ from collections.abc import Sequence
 from typing import final, override
 
 import attrs
-import httpx
 from pyeo import elegant
 
 from app_types.update import Update
@@ -37,6 +36,7 @@ from integrations.tg.tg_answers import (
     TgMessageAnswer,
     TgTextAnswer,
 )
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 @final
@@ -50,11 +50,11 @@ class PrayersExpiredAnswer(TgAnswer):
     _admin_chat_ids: Sequence[int]
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Сборка ответа.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         try:
             return await self._origin.build(update)
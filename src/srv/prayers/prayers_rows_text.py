@@ -0,0 +1,71 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import Sequence
+from typing import Final, final, override
+
+import attrs
+from databases.interfaces import Record
+from pyeo import elegant
+
+from app_types.async_supports_str import AsyncSupportsStr
+
+TIME_LITERAL: Final = 'time'
+
+
+@final
+@attrs.define(frozen=True)
+@elegant
+class PrayersRowsText(AsyncSupportsStr):
+    """Текст сообщения с намазами по строкам выборки.
+
+    Строки должны содержать city_name, day, time и быть упорядочены от утреннего намаза к ночному.
+    """
+
+    _rows: Sequence[Record]
+
+    @override
+    async def to_str(self) -> str:
+        """Строковое представление.
+
+        :return: str
+        """
+        template = '\n'.join([
+            'Время намаза для г. {city_name} ({date})\n',
+            'Иртәнге: {fajr_prayer_time}',
+            'Восход: {sunrise_prayer_time}',
+            'Өйлә: {dhuhr_prayer_time}',
+            'Икенде: {asr_prayer_time}',
+            'Ахшам: {magrib_prayer_time}',
+            'Ястү: {ishaa_prayer_time}',
+        ])
+        time_format = '%H:%M'
+        return template.format(
+            city_name=self._rows[0]['city_name'],
+            date=self._rows[0]['day'].strftime('%d.%m.%Y'),
+            fajr_prayer_time=self._rows[0][TIME_LITERAL].strftime(time_format),
+            sunrise_prayer_time=self._rows[1][TIME_LITERAL].strftime(time_format),
+            dhuhr_prayer_time=self._rows[2][TIME_LITERAL].strftime(time_format),
+            asr_prayer_time=self._rows[3][TIME_LITERAL].strftime(time_format),
+            magrib_prayer_time=self._rows[4][TIME_LITERAL].strftime(time_format),
+            ishaa_prayer_time=self._rows[5][TIME_LITERAL].strftime(time_format),
+        )
@@ -20,7 +20,7 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
-from typing import Final, final, override
+from typing import final, override
 
 import attrs
 from databases import Database
@@ -31,8 +31,7 @@ from app_types.update import Update
 from exceptions.prayer_exceptions import PrayersNotFoundError
 from integrations.city_name_by_id import CityNameById
 from srv.prayers.prayer_date import PrayerDate
-
-TIME_LITERAL: Final = 'time'
+from srv.prayers.prayers_rows_text import PrayersRowsText
 
 
 @final
@@ -65,32 +64,14 @@ class PrayersText(AsyncSupportsStr):
             'ORDER BY',
             "    ARRAY_POSITION(ARRAY['fajr', 'sunrise', 'dhuhr', 'asr', 'maghrib', 'isha''a']::text[], p.name::text)",
         ])
+        date = await self._date.parse(self._update)
         rows = await self._pgsql.fetch_all(query, {
-            'date': await self._date.parse(self._update),
+            'date': date,
             'city_id': await self._city_id.to_str(),
         })
         if not rows:
             raise PrayersNotFoundError(
                 await CityNameById(self._pgsql, self._city_id).to_str(),
-                await self._date.parse(self._update),
+                date,
             )
-        template = '\n'.join([
-            'Время намаза для г. {city_name} ({date})\n',
-            'Иртәнге: {fajr_prayer_time}',
-            'Восход: {sunrise_prayer_time}',
-            'Өйлә: {dhuhr_prayer_time}',
-            'Икенде: {asr_prayer_time}',
-            'Ахшам: {magrib_prayer_time}',
-            'Ястү: {ishaa_prayer_time}',
-        ])
-        time_format = '%H:%M'
-        return template.format(
-            city_name=rows[0]['city_name'],
-            date=rows[0]['day'].strftime('%d.%m.%Y'),
-            fajr_prayer_time=rows[0][TIME_LITERAL].strftime(time_format),
-            sunrise_prayer_time=rows[1][TIME_LITERAL].strftime(time_format),
-            dhuhr_prayer_time=rows[2][TIME_LITERAL].strftime(time_format),
-            asr_prayer_time=rows[3][TIME_LITERAL].strftime(time_format),
-            magrib_prayer_time=rows[4][TIME_LITERAL].strftime(time_format),
-            ishaa_prayer_time=rows[5][TIME_LITERAL].strftime(time_format),
-        )
+        return await PrayersRowsText(rows).to_str()
@@ -24,7 +24,6 @@ from collections.abc import Sequence
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 
@@ -33,8 +32,10 @@ from app_types.fk_async_int import FkAsyncInt
 from app_types.update import Update
 from integrations.tg.message_text import MessageText
 from integrations.tg.tg_answers import TgAnswer, TgAnswerList, TgAnswerToSender, TgChatIdAnswer, TgTextAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.admin_messages.admin_message import AdminMessage
-from srv.ayats.pg_ayat import PgAyat
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.quran_corpus import QuranCorpus
 from srv.start.new_user import NewUser
 from srv.start.referrer_chat_id import ReferrerChatId
 from srv.start.referrer_id_or_none import ReferrerIdOrNone
@@ -50,14 +51,15 @@ class StartAnswer(TgAnswer):
     _admin_message: AdminMessage
     _new_tg_user: NewUser
     _pgsql: Database
+    _corpus: QuranCorpus
     _admin_chat_ids: Sequence[int]
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         """
         referrer_chat_id: AsyncIntOrNone = ReferrerIdOrNone(
             ReferrerChatId(
@@ -66,7 +68,7 @@ class StartAnswer(TgAnswer):
             ),
         )
         start_message = self._admin_message
-        ayat_message = PgAyat(FkAsyncInt(1), self._pgsql)
+        ayat_message = CorpusAyat(FkAsyncInt(1), self._corpus, self._pgsql)
         await self._new_tg_user.create(referrer_chat_id)
         referrer_chat_id_calculated = await referrer_chat_id.to_int()
         if referrer_chat_id_calculated:
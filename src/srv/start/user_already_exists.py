@@ -24,13 +24,13 @@ from contextlib import suppress
 from typing import final, override
 
 import attrs
-import httpx
 from databases import Database
 from pyeo import elegant
 
 from app_types.update import Update
 from exceptions.user import UserAlreadyActiveError, UserAlreadyExistsError
 from integrations.tg.tg_answers import TgAnswer, TgTextAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from integrations.tg.tg_chat_id import TgChatId
 from integrations.tg.tg_datetime import TgDateTime
 from srv.events.sink import Sink
@@ -52,11 +52,11 @@ class UserAlreadyExistsAnswer(TgAnswer):
     _event_sink: Sink
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         """Собрать ответ.
 
         :param update: Update
-        :return: list[httpx.Request]
+        :return: list[TgRequest]
         :raises UserAlreadyActiveError: if user already active
         """
         with suppress(UserAlreadyExistsError):
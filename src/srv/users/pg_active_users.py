@@ -20,14 +20,17 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
+from collections.abc import AsyncIterator
 from typing import final, override
 
 import attrs
 from databases import Database
 from pyeo import elegant
 
+from app_types.async_streamable import AsyncStreamable
 from app_types.listable import AsyncListable
 from srv.users.fk_valid_chat_id import FkValidChatId
+from srv.users.min_chat_id import MIN_CHAT_ID
 from srv.users.pg_user import PgUser
 from srv.users.user import User
 
@@ -35,10 +38,15 @@ from srv.users.user import User
 @final
 @attrs.define(frozen=True)
 @elegant
-class PgActiveUsers(AsyncListable):
-    """Активные пользователи."""
+class PgActiveUsers(AsyncListable, AsyncStreamable):
+    """Активные пользователи.
+
+    Поток читается страницами по `page_size` с пагинацией по chat_id,
+    поэтому соединение не держится между страницами и изменения уже прочитанных пользователей не мешают чтению.
+    """
 
     _pgsql: Database
+    _page_size: int = 1000
 
     @override
     async def to_list(self) -> list[User]:
@@ -56,3 +64,27 @@ class PgActiveUsers(AsyncListable):
             PgUser(FkValidChatId.int_ctor(row['chat_id']), self._pgsql)
             for row in rows
         ]
+
+    @override
+    async def stream(self) -> AsyncIterator[User]:
+        """Поток пользователей, упорядоченный по chat_id.
+
+        :yield: User
+        """
+        after = MIN_CHAT_ID
+        while True:  # noqa: WPS457
+            rows = await self._pgsql.fetch_all(
+                '\n'.join([
+                    'SELECT chat_id',
+                    'FROM users',
+                    "WHERE is_active = 't' AND chat_id > :after",
+                    'ORDER BY chat_id',
+                    'LIMIT :limit',
+                ]),
+                {'after': after, 'limit': self._page_size},
+            )
+            for row in rows:
+                yield PgUser(FkValidChatId.int_ctor(row['chat_id']), self._pgsql)
+            if len(rows) < self._page_size:
+                return
+            after = rows[-1]['chat_id']
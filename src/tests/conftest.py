@@ -21,7 +21,6 @@
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
 import asyncio
-import urllib
 from pathlib import Path
 
 import httpx
@@ -34,15 +33,6 @@ from settings import BASE_DIR, Settings
 
 
 # flake8: noqa: WPS202
-@pytest.fixture()
-def unquote():
-    def _unquote(url):  # noqa: WPS430
-        return urllib.parse.unquote(
-            str(url),
-        ).replace('+', ' ')
-    return _unquote
-
-
 @pytest.fixture(scope='session')
 def event_loop_policy():
     return asyncio.get_event_loop_policy()
@@ -80,6 +70,12 @@ def inline_query_update_factory():
     return _inline_query_update_factory
 
 
+@pytest.fixture()
+async def http_client():
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
 @pytest.fixture()
 def fk_logger():
     return FkLogSink()
@@ -22,6 +22,7 @@
 
 from typing import final, override
 
+from app_types.parsed_tg_update import ParsedTgUpdate
 from app_types.update import Update
 from integrations.tg.cached_tg_update import CachedTgUpdate
 
@@ -32,6 +33,7 @@ class SeUpdate(Update):
     def __init__(self) -> None:
         self._str_call_count = 0
         self._asdict_call_count = 0
+        self._parsed_call_count = 0
 
     @override
     def __str__(self) -> str:
@@ -47,6 +49,13 @@ class SeUpdate(Update):
             return {'key': 'value'}
         raise Exception  # noqa: TRY002, WPS454
 
+    @override
+    def parsed(self) -> ParsedTgUpdate:
+        if self._parsed_call_count == 0:
+            self._parsed_call_count += 1
+            return ParsedTgUpdate(update_id=1)
+        raise Exception  # noqa: TRY002, WPS454
+
 
 def test():
     update = CachedTgUpdate(SeUpdate())
@@ -55,3 +64,10 @@ def test():
     assert str(update) == 'value'
     assert update.asdict() == {'key': 'value'}
     assert update.asdict() == {'key': 'value'}
+
+
+def test_parsed():
+    update = CachedTgUpdate(SeUpdate())
+
+    assert update.parsed().update_id == 1
+    assert update.parsed().update_id == 1
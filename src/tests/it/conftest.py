@@ -66,6 +66,7 @@ async def pgsql(_migrate):
         'suras',
         'files',
         'admin_messages',
+        'mailing_checkpoints',
     )
     for table in tables:
         await database.execute('DELETE FROM {0}'.format(table))  # noqa: S608
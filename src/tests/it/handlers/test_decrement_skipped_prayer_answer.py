@@ -34,8 +34,8 @@ async def test(callback_update_factory, pgsql):
         FkUpdate(callback_update_factory(chat_id=358610865, callback_data='decr(fajr)')),
     )
 
-    assert got[0].url.path == '/editMessageText'
-    assert got[0].url.params['text'] == '\n'.join([
+    assert got[0].api_method() == 'editMessageText'
+    assert got[0].fields()['text'] == '\n'.join([
         'Кол-во непрочитанных намазов:\n',
         'Иртәнге: 19',
         'Өйлә: 19',
@@ -50,7 +50,7 @@ async def test(callback_update_factory, pgsql):
             "WHERE pau.user_id = 358610865 AND pau.is_read = 't'",
         ]),
     ) == 63
-    assert ujson.loads(got[0].url.params['reply_markup']) == {
+    assert ujson.loads(got[0].fields()['reply_markup']) == {
         'inline_keyboard': [
             [{'callback_data': 'decr(fajr)', 'text': 'Иртәнге: (-1)'}],
             [{'callback_data': 'decr(dhuhr)', 'text': 'Өйлә: (-1)'}],
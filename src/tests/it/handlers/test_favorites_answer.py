@@ -26,14 +26,16 @@ from app_types.fk_log_sink import FkLogSink
 from app_types.fk_update import FkUpdate
 from handlers.favorites_answer import FavoriteAyatsAnswer
 from integrations.tg.tg_answers.fk_answer import FkAnswer
+from srv.ayats.pg_quran_corpus import PgQuranCorpus
 
 
 async def test_favorite_ayats_answer(pgsql, fake_redis):
     debug = False
-    got = await FavoriteAyatsAnswer(debug, pgsql, fake_redis, FkAnswer(), FkLogSink()).build(
+    answer = FavoriteAyatsAnswer(debug, pgsql, PgQuranCorpus(pgsql), fake_redis, FkAnswer(), FkLogSink())
+    got = await answer.build(
         FkUpdate(ujson.dumps({
             'chat': {'id': 74359},
         })),
     )
 
-    assert got[0].url.params['text'] == 'Вы еще не добавляли аятов в избранное'
+    assert got[0].fields()['text'] == 'Вы еще не добавляли аятов в избранное'
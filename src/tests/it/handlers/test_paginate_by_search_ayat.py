@@ -26,6 +26,8 @@ from app_types.fk_log_sink import FkLogSink
 from app_types.fk_update import FkUpdate
 from handlers.paginate_by_search_ayat import PaginateBySearchAyat
 from integrations.tg.tg_answers.fk_answer import FkAnswer
+from srv.ayats.pg_ayats_search import PgAyatsSearch
+from srv.ayats.pg_quran_corpus import PgQuranCorpus
 
 
 async def test(fake_redis, pgsql, settings_ctor):
@@ -33,6 +35,8 @@ async def test(fake_redis, pgsql, settings_ctor):
         FkAnswer(),
         fake_redis,
         pgsql,
+        PgQuranCorpus(pgsql),
+        PgAyatsSearch(pgsql),
         settings_ctor(),
         FkLogSink(),
     ).build(FkUpdate(ujson.dumps({
@@ -42,4 +46,4 @@ async def test(fake_redis, pgsql, settings_ctor):
         },
     })))
 
-    assert got[0].url.params['text'] == 'Пожалуйста, введите запрос для поиска:'
+    assert got[0].fields()['text'] == 'Пожалуйста, введите запрос для поиска:'
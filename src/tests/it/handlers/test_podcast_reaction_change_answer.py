@@ -105,9 +105,9 @@ async def test_without_message_text(pgsql, fake_redis):
         })),
     )
 
-    assert got[0].url.path == '/sendMessage'
-    assert got[0].url.params['text'] == '/podcast5'
-    assert got[1].url.params['reply_markup'] == ujson.dumps({
+    assert got[0].api_method() == 'sendMessage'
+    assert got[0].fields()['text'] == '/podcast5'
+    assert got[1].fields()['reply_markup'] == ujson.dumps({
         'inline_keyboard': [[
             {'text': '👍 1', 'callback_data': 'like(5)'}, {'text': '👎 0', 'callback_data': 'dislike(5)'},
         ]],
@@ -133,8 +133,8 @@ async def test_without_message_with_audio(pgsql, fake_redis):
         })),
     )
 
-    assert got[0].url.path == '/editMessageReplyMarkup'
-    assert got[0].url.params['reply_markup'] == ujson.dumps({
+    assert got[0].api_method() == 'editMessageReplyMarkup'
+    assert got[0].fields()['reply_markup'] == ujson.dumps({
         'inline_keyboard': [[
             {'text': '👍 1', 'callback_data': 'like(5)'}, {'text': '👎 0', 'callback_data': 'dislike(5)'},
         ]],
@@ -163,7 +163,7 @@ async def test(pgsql, fake_redis, reaction, podcast_id, button1, button2):
     ))
 
     assert len(got) == 1
-    assert ujson.loads(got[0].url.params['reply_markup']) == {
+    assert ujson.loads(got[0].fields()['reply_markup']) == {
         'inline_keyboard': [[
             {'callback_data': 'like({0})'.format(podcast_id), 'text': button1},
             {'callback_data': 'dislike({0})'.format(podcast_id), 'text': button2},
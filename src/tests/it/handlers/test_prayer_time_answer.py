@@ -56,7 +56,7 @@ async def test(pgsql, fake_redis, settings_ctor, message_update_factory, time_ma
         settings_ctor(ramadan_mode=True),
     ).build(FkUpdate(message_update_factory('Время намаза', 905)))
 
-    assert got[0].url.params['text'] == '\n'.join([
+    assert got[0].fields()['text'] == '\n'.join([
         'Время намаза для г. Kazan (19.12.2023)\n',
         'Иртәнге: 05:43 <i>- Конец сухура</i>',
         'Восход: 08:02',
@@ -29,22 +29,24 @@ from handlers.search_city_answer import SearchCityAnswer
 from integrations.tg.tg_answers.fk_answer import FkAnswer
 
 
-async def test_message(pgsql, fake_redis):
+async def test_message(pgsql, http_client, fake_redis):
     debug = False
-    got = await SearchCityAnswer(pgsql, FkAnswer(), debug, fake_redis, FkLogSink()).build(
+    answer = SearchCityAnswer(pgsql, FkAnswer(), http_client, debug, fake_redis, FkLogSink())
+    got = await answer.build(
         FkUpdate(ujson.dumps({
             'message': {'text': 'Kazan'},
             'chat': {'id': 384957},
         })),
     )
 
-    assert got[0].url.params['text'] == 'Этот город не поддерживается'
+    assert got[0].fields()['text'] == 'Этот город не поддерживается'
 
 
 @pytest.mark.usefixtures('_mock_nominatim')
-async def test_location(pgsql, fake_redis):
+async def test_location(pgsql, http_client, fake_redis):
     debug = False
-    got = await SearchCityAnswer(pgsql, FkAnswer(), debug, fake_redis, FkLogSink()).build(
+    answer = SearchCityAnswer(pgsql, FkAnswer(), http_client, debug, fake_redis, FkLogSink())
+    got = await answer.build(
         FkUpdate(ujson.dumps({
             'chat': {'id': 34847935},
             'latitude': 55.7887,
@@ -52,4 +54,4 @@ async def test_location(pgsql, fake_redis):
         })),
     )
 
-    assert got[0].url.params['text'] == 'Этот город не поддерживается'
+    assert got[0].fields()['text'] == 'Этот город не поддерживается'
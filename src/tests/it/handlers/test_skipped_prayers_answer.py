@@ -36,7 +36,7 @@ async def test(message_update_factory, pgsql):
         ),
     )
 
-    assert got[0].url.params['text'] == '\n'.join([
+    assert got[0].fields()['text'] == '\n'.join([
         'Кол-во непрочитанных намазов:\n',
         'Иртәнге: 20',
         'Өйлә: 19',
@@ -51,7 +51,7 @@ async def test(message_update_factory, pgsql):
             'WHERE pau.user_id = 358610865',
         ]),
     ) == 160
-    assert ujson.loads(got[0].url.params['reply_markup']) == {
+    assert ujson.loads(got[0].fields()['reply_markup']) == {
         'inline_keyboard': [
             [{'callback_data': 'decr(fajr)', 'text': 'Иртәнге: (-1)'}],
             [{'callback_data': 'decr(dhuhr)', 'text': 'Өйлә: (-1)'}],
@@ -69,7 +69,7 @@ async def test_empty_prayers_at_user(pgsql, message_update_factory):
         ),
     )
 
-    assert got[0].url.params['text'] == '\n'.join([
+    assert got[0].fields()['text'] == '\n'.join([
         'Кол-во непрочитанных намазов:\n',
         'Иртәнге: 0',
         'Өйлә: 0',
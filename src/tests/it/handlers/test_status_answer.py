@@ -29,7 +29,7 @@ async def test(pgsql, fake_redis):
     got = await StatusAnswer(FkAnswer(), pgsql, fake_redis).build(
         FkUpdate('{"chat":{"id":1}}'),
     )
-    answer_text = got[0].url.params['text']
+    answer_text = got[0].fields()['text']
 
     assert 'DB' in answer_text
     assert 'Redis' in answer_text
@@ -63,7 +63,7 @@ async def test_new_prayer_times(pgsql, fake_redis, time_machine, settings_ctor):
         })),
     )
 
-    assert ujson.loads(got[0].url.params.get('reply_markup')) == {
+    assert ujson.loads(got[0].fields()['reply_markup']) == {
         'inline_keyboard': [
             [
                 {'callback_data': 'mark_readed(1)', 'text': '❌'},
@@ -74,7 +74,7 @@ async def test_new_prayer_times(pgsql, fake_redis, time_machine, settings_ctor):
             ],
         ],
     }
-    assert got[0].url.path == '/sendMessage'
+    assert got[0].api_method() == 'sendMessage'
 
 
 @pytest.mark.usefixtures('_generated_prayers')
@@ -101,7 +101,7 @@ async def test_today(pgsql, fake_redis, time_machine, settings_ctor):
         })),
     )
 
-    assert ujson.loads(got[0].url.params.get('reply_markup')) == {
+    assert ujson.loads(got[0].fields()['reply_markup']) == {
         'inline_keyboard': [
             [
                 {'callback_data': 'mark_readed(1)', 'text': '❌'},
@@ -112,7 +112,7 @@ async def test_today(pgsql, fake_redis, time_machine, settings_ctor):
             ],
         ],
     }
-    assert got[0].url.path == '/editMessageReplyMarkup'
+    assert got[0].api_method() == 'editMessageReplyMarkup'
 
 
 @pytest.mark.usefixtures('_generated_prayers')
@@ -158,8 +158,8 @@ async def test_without_message_text(pgsql, fake_redis, settings_ctor):
         })),
     )
 
-    assert got[0].url.path == '/sendMessage'
-    assert got[0].url.params['text'] == '\n'.join([
+    assert got[0].api_method() == 'sendMessage'
+    assert got[0].fields()['text'] == '\n'.join([
         'Время намаза для г. Kazan (19.12.2023)\n',
         'Иртәнге: 05:43',
         'Восход: 08:02',
@@ -168,7 +168,7 @@ async def test_without_message_text(pgsql, fake_redis, settings_ctor):
         'Ахшам: 15:07',
         'Ястү: 17:04',
     ])
-    assert ujson.loads(got[0].url.params['reply_markup']) == {
+    assert ujson.loads(got[0].fields()['reply_markup']) == {
         'inline_keyboard': [
             [
                 {'callback_data': 'mark_readed(1)', 'text': '❌'},
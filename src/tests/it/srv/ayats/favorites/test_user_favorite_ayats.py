@@ -23,6 +23,7 @@
 import pytest
 
 from srv.ayats.favorites.user_favorite_ayats import UserFavoriteAyats
+from srv.ayats.pg_quran_corpus import PgQuranCorpus
 
 
 @pytest.fixture()
@@ -42,6 +43,6 @@ async def _favorite_ayats(db_ayat, pgsql):
 
 @pytest.mark.usefixtures('_favorite_ayats')
 async def test_user_favorite_ayats(pgsql):
-    got = await UserFavoriteAyats(pgsql, 49573).to_list()
+    got = await UserFavoriteAyats(pgsql, PgQuranCorpus(pgsql), 49573).to_list()
 
     assert [await ayat.identifier().ayat_id() for ayat in got] == [1]
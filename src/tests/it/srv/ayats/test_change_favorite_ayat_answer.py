@@ -27,6 +27,8 @@ from app_types.fk_log_sink import FkLogSink
 from app_types.fk_update import FkUpdate
 from integrations.tg.tg_answers.fk_answer import FkAnswer
 from srv.ayats.change_favorite_ayat_answer import ChangeFavoriteAyatAnswer
+from srv.ayats.pg_ayats_search import PgAyatsSearch
+from srv.ayats.pg_quran_corpus import PgQuranCorpus
 
 
 @pytest.fixture()
@@ -37,7 +39,7 @@ async def _user(pgsql):
 @pytest.mark.usefixtures('db_ayat', '_user')
 async def test_add(pgsql, fake_redis):
     got = await ChangeFavoriteAyatAnswer(
-        pgsql, FkAnswer(), fake_redis, FkLogSink(),
+        pgsql, PgQuranCorpus(pgsql), PgAyatsSearch(pgsql), FkAnswer(), fake_redis, FkLogSink(),
     ).build(FkUpdate(
         ujson.dumps({
             'callback_query': {'data': 'addToFavor(1)'},
@@ -46,7 +48,7 @@ async def test_add(pgsql, fake_redis):
         }),
     ))
 
-    assert ujson.loads(got[0].url.params['reply_markup']) == {
+    assert ujson.loads(got[0].fields()['reply_markup']) == {
         'inline_keyboard': [
             [{'callback_data': 'fake', 'text': 'стр. 1/1'}],
             [{'callback_data': 'removeFromFavor(1)', 'text': 'Удалить из избранного'}],
@@ -57,7 +59,7 @@ async def test_add(pgsql, fake_redis):
 @pytest.mark.usefixtures('db_ayat', '_user')
 async def test_remove(pgsql, fake_redis):
     got = await ChangeFavoriteAyatAnswer(
-        pgsql, FkAnswer(), fake_redis, FkLogSink(),
+        pgsql, PgQuranCorpus(pgsql), PgAyatsSearch(pgsql), FkAnswer(), fake_redis, FkLogSink(),
     ).build(FkUpdate(
         ujson.dumps({
             'callback_query': {'data': 'removeFromFavor(1)'},
@@ -66,7 +68,7 @@ async def test_remove(pgsql, fake_redis):
         }),
     ))
 
-    assert ujson.loads(got[0].url.params['reply_markup']) == {
+    assert ujson.loads(got[0].fields()['reply_markup']) == {
         'inline_keyboard': [
             [{'callback_data': 'fake', 'text': 'стр. 1/1'}],
             [{'callback_data': 'addToFavor(1)', 'text': 'Добавить в избранное'}],
@@ -0,0 +1,146 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import datetime
+
+import pytest
+import pytz
+from eljson.json_doc import JsonDoc
+
+from srv.ayats.corpus_ayat import CorpusAyat
+from srv.ayats.pg_quran_corpus import PgQuranCorpus
+
+
+@pytest.fixture()
+async def _db_ayat(pgsql):
+    created_at = datetime.datetime.now(tz=pytz.timezone('Europe/Moscow'))
+    await pgsql.execute_many(
+        '\n'.join([
+            'INSERT INTO files (file_id, telegram_file_id, link, created_at)',
+            'VALUES (:file_id, :telegram_file_id, :link, :created_at)',
+        ]),
+        [
+            {
+                'file_id': '82db206b-34ed-4ae0-ac83-1f0c56dfde90',
+                'telegram_file_id': 'aoiejf298jr9p23u8qr3',
+                'link': 'https://link-to-file.domain',
+                'created_at': created_at,
+            },
+            {
+                'file_id': '99cce289-cfa0-4f92-8c3b-84aac82814ba',
+                'telegram_file_id': 'wpeoif2309jf09j',
+                'link': 'https://link-to-other-file.domain',
+                'created_at': created_at,
+            },
+        ],
+    )
+    await pgsql.execute(
+        "INSERT INTO suras (sura_id, link) VALUES (1, 'https://link-to-sura.domain')",
+    )
+    await pgsql.execute(
+        '\n'.join([
+            'INSERT INTO ayats',
+            '(ayat_id, sura_id, public_id, day, audio_id, ayat_number, content, arab_text, transliteration)',
+            'VALUES',
+            '(:ayat_id, :sura_id, :public_id, :day, :audio_id, :ayat_number, :content, :arab_text, :transliteration)',
+        ]),
+        {
+            'ayat_id': 1,
+            'sura_id': 1,
+            'public_id': '3067bdc4-8dc0-456b-aa68-e38122b5f2f8',
+            'day': 1,
+            'audio_id': '82db206b-34ed-4ae0-ac83-1f0c56dfde90',
+            'ayat_number': '1-7',
+            'content': 'Ayat content',
+            'arab_text': 'Arab text',
+            'transliteration': 'Transliteration',
+        },
+    )
+
+
+@pytest.mark.usefixtures('_db_ayat')
+async def test_str(pgsql):
+    got = await CorpusAyat.from_int(1, PgQuranCorpus(pgsql), pgsql).to_str()
+
+    assert got == '\n'.join([
+        '<a href="https://umma.ruhttps://link-to-sura.domain#1-1">1:1-7)</a>',
+        'Arab text\n',
+        'Ayat content\n',
+        '<i>Transliteration</i>',
+    ])
+
+
+@pytest.fixture()
+async def loaded_corpus(pgsql, _db_ayat):
+    corpus = PgQuranCorpus(pgsql)
+    await corpus.ayat(1)
+    await pgsql.execute('DELETE FROM ayats')
+    return corpus
+
+
+async def test_without_db_after_load(pgsql, loaded_corpus):
+    ayat = CorpusAyat.from_int(1, loaded_corpus, pgsql)
+
+    assert await ayat.identifier().sura_num() == 1
+    assert await ayat.identifier().ayat_num() == '1-7'
+    assert await (await ayat.audio()).tg_file_id() == 'aoiejf298jr9p23u8qr3'
+
+
+@pytest.mark.usefixtures('_db_ayat')
+async def test_change(pgsql):
+    corpus = PgQuranCorpus(pgsql)
+    await corpus.ayat(1)
+    event = {
+        'event_id': 'some_id',
+        'event_version': 1,
+        'event_name': 'event_name',
+        'event_time': '392409283',
+        'producer': 'some producer',
+        'data': {
+            'public_id': '3067bdc4-8dc0-456b-aa68-e38122b5f2f8',
+            'day': 2,
+            'audio_id': '99cce289-cfa0-4f92-8c3b-84aac82814ba',
+            'ayat_number': '1-3',
+            'content': 'Updated content',
+            'arab_text': 'Updated arab text',
+            'transliteration': 'Updated arab transliteration',
+        },
+    }
+    ayat = CorpusAyat.ayat_changed_event_ctor(JsonDoc(event), corpus, pgsql)
+    await ayat.change(JsonDoc(event))
+
+    got = await corpus.ayat(1)
+
+    assert got.ayat_num() == '1-3'
+    assert 'Updated content' in got.text()
+    assert await got.audio().tg_file_id() == 'wpeoif2309jf09j'
+
+
+@pytest.mark.usefixtures('_db_ayat')
+async def test_flush_reload(pgsql):
+    corpus = PgQuranCorpus(pgsql)
+    await corpus.load()
+    await pgsql.execute("UPDATE ayats SET ayat_number = '1-3'")
+    await corpus.flush()
+    await pgsql.execute('DELETE FROM ayats')
+
+    assert (await corpus.ayat(1)).ayat_num() == '1-3'
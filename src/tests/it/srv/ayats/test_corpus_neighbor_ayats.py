@@ -26,9 +26,13 @@ import pytest
 import pytz
 
 from exceptions.content_exceptions import AyatNotFoundError
+from srv.ayats.ayat_window import AyatWindow
+from srv.ayats.corpus_neighbor_ayats import CorpusNeighborAyats
 from srv.ayats.fk_text_search_query import FkTextSearchQuery
-from srv.ayats.pg_neighbor_ayats import PgNeighborAyats
+from srv.ayats.pg_ayats_search import PgAyatsSearch
+from srv.ayats.pg_quran_corpus import PgQuranCorpus
 from srv.ayats.text_search_neighbor_ayats import TextSearchNeighborAyats
+from srv.ayats.window_neighbor_ayats import WindowNeighborAyats
 
 
 @pytest.fixture()
@@ -96,7 +100,7 @@ async def _db_ayat(pgsql):
 
 @pytest.mark.usefixtures('_db_ayat')
 async def test_first(pgsql):
-    neighbor = PgNeighborAyats(pgsql, 1)
+    neighbor = CorpusNeighborAyats(pgsql, PgQuranCorpus(pgsql), 1)
 
     with pytest.raises(AyatNotFoundError):
         await neighbor.left_neighbor()
@@ -106,7 +110,7 @@ async def test_first(pgsql):
 
 @pytest.mark.usefixtures('_db_ayat')
 async def test_last(pgsql):
-    neighbor = PgNeighborAyats(pgsql, 3)
+    neighbor = CorpusNeighborAyats(pgsql, PgQuranCorpus(pgsql), 3)
 
     with pytest.raises(AyatNotFoundError):
         await neighbor.right_neighbor()
@@ -116,7 +120,9 @@ async def test_last(pgsql):
 
 @pytest.mark.usefixtures('_db_ayat')
 async def test_search_first(pgsql):
-    neighbor = TextSearchNeighborAyats(pgsql, 1, FkTextSearchQuery('Content'))
+    neighbor = TextSearchNeighborAyats(
+        pgsql, PgQuranCorpus(pgsql), PgAyatsSearch(pgsql), 1, FkTextSearchQuery('Content'),
+    )
 
     with pytest.raises(AyatNotFoundError):
         await neighbor.left_neighbor()
@@ -126,9 +132,29 @@ async def test_search_first(pgsql):
 
 @pytest.mark.usefixtures('_db_ayat')
 async def test_search_last(pgsql):
-    neighbor = TextSearchNeighborAyats(pgsql, 3, FkTextSearchQuery('Content'))
+    neighbor = TextSearchNeighborAyats(
+        pgsql, PgQuranCorpus(pgsql), PgAyatsSearch(pgsql), 3, FkTextSearchQuery('Content'),
+    )
 
     with pytest.raises(AyatNotFoundError):
         await neighbor.right_neighbor()
     assert await (await neighbor.left_neighbor()).identifier().ayat_id() == 2
     assert await neighbor.page() == 'стр. 3/3'
+
+
+@pytest.mark.usefixtures('_db_ayat')
+async def test_window_middle(pgsql):
+    neighbor = WindowNeighborAyats(pgsql, PgQuranCorpus(pgsql), AyatWindow(1, 3, 2, 3))
+
+    assert await (await neighbor.left_neighbor()).identifier().ayat_id() == 1
+    assert await (await neighbor.right_neighbor()).identifier().ayat_id() == 3
+    assert await neighbor.page() == 'стр. 2/3'
+
+
+async def test_window_edges(pgsql):
+    neighbor = WindowNeighborAyats(pgsql, PgQuranCorpus(pgsql), AyatWindow(None, None, 1, 1))
+
+    with pytest.raises(AyatNotFoundError):
+        await neighbor.left_neighbor()
+    with pytest.raises(AyatNotFoundError):
+        await neighbor.right_neighbor()
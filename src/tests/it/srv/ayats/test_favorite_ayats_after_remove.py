@@ -26,6 +26,7 @@ import pytest
 import pytz
 
 from srv.ayats.favorite_ayats_after_remove import FavoriteAyatsAfterRemove
+from srv.ayats.pg_quran_corpus import PgQuranCorpus
 
 
 @pytest.fixture()
@@ -101,6 +102,6 @@ async def _db_ayat(pgsql):
 
 @pytest.mark.usefixtures('_db_ayat')
 async def test(pgsql):
-    got = await FavoriteAyatsAfterRemove(1, 1, pgsql).to_list()
+    got = await FavoriteAyatsAfterRemove(1, 1, pgsql, PgQuranCorpus(pgsql)).to_list()
 
     assert len(got) == 4
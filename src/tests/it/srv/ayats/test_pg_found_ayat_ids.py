@@ -0,0 +1,67 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import datetime
+
+import pytest
+import pytz
+
+from srv.ayats.pg_found_ayat_ids import PgFoundAyatIds
+
+
+@pytest.fixture()
+async def _db_ayats(pgsql):
+    await pgsql.execute(
+        'INSERT INTO files (file_id, created_at) VALUES (:file_id, :created_at)',
+        {
+            'file_id': '82db206b-34ed-4ae0-ac83-1f0c56dfde90',
+            'created_at': datetime.datetime.now(tz=pytz.timezone('Europe/Moscow')),
+        },
+    )
+    await pgsql.execute("INSERT INTO suras (sura_id, link) VALUES (1, 'https://link-to-sura.domain')")
+    await pgsql.execute_many(
+        '\n'.join([
+            'INSERT INTO ayats',
+            '(ayat_id, sura_id, public_id, day, audio_id, ayat_number, content, arab_text, transliteration)',
+            'VALUES',
+            "(:ayat_id, 1, :public_id, 1, '82db206b-34ed-4ae0-ac83-1f0c56dfde90', :ayat_id, :content, '', '')",
+        ]),
+        [
+            {'ayat_id': 1, 'public_id': '3067bdc4-8dc0-456b-aa68-e38122b5f2f8', 'content': 'Хвала Аллаху'},
+            {'ayat_id': 2, 'public_id': '5d3d2a5f-5a86-4bd7-b0d0-1dd5f8c1b3c8', 'content': 'Милостивый, Милосердный'},
+            {'ayat_id': 3, 'public_id': '9e2a0a0c-5b54-4f5f-a3a6-2b6b7a1a3c1e', 'content': 'Милостив и милостивым'},
+        ],
+    )
+
+
+@pytest.mark.usefixtures('_db_ayats')
+@pytest.mark.parametrize(('query', 'expected'), [
+    ('Милостивого', [3, 2]),
+    ('милосерд', [2]),
+    ('лостив', [2, 3]),
+    ('хвала аллах', [1]),
+    ('Пророк', []),
+])
+async def test(pgsql, query, expected):
+    got = await PgFoundAyatIds(query, pgsql).to_list()
+
+    assert got == expected
@@ -29,24 +29,28 @@ from exceptions.content_exceptions import AyatNotFoundError
 from integrations.tg.fk_chat_id import FkChatId
 from integrations.tg.tg_answers.fk_answer import FkAnswer
 from srv.ayats.ayat_text_search_query import AyatTextSearchQuery
+from srv.ayats.pg_ayats_search import PgAyatsSearch
+from srv.ayats.pg_quran_corpus import PgQuranCorpus
 from srv.ayats.search_ayat_by_text_callback_answer import SearchAyatByTextCallbackAnswer
 
 
 @pytest.fixture()
 def search_answer(pgsql, fake_redis):
     debug = True
-    return SearchAyatByTextCallbackAnswer(debug, FkAnswer(), fake_redis, pgsql, FkLogSink())
+    return SearchAyatByTextCallbackAnswer(
+        debug, FkAnswer(), fake_redis, pgsql, PgQuranCorpus(pgsql), PgAyatsSearch(pgsql), FkLogSink(),
+    )
 
 
 @pytest.mark.usefixtures('db_ayat')
-async def test(fake_redis, unquote, search_answer):
+async def test(fake_redis, search_answer):
     await AyatTextSearchQuery(fake_redis, FkChatId(1758), FkLogSink()).write('Content')
     got = await search_answer.build(FkUpdate('{"callback_query": {"data": "1"}, "chat": {"id": 1758}}'))
 
-    assert got[0].url.path == '/sendMessage'
-    assert dict(got[0].url.params) == {
+    assert got[0].api_method() == 'sendMessage'
+    assert got[0].fields() == {
         'parse_mode': 'html',
-        'chat_id': '1758',
+        'chat_id': 1758,
         'text': '\n'.join([
             '<a href="https://umma.ru/link-to-sura#1-1">1:1-7)</a>',
             'Arab text\n',
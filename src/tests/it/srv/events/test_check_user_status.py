@@ -26,10 +26,14 @@ import ujson
 from eljson.json_doc import JsonDoc
 
 from app_types.fk_log_sink import FkLogSink
+from app_types.fk_throttle_stats import FkThrottleStats
+from integrations.tg.aimd_concurrency_limit import AimdConcurrencyLimit
 from integrations.tg.tg_answers.fk_answer import FkAnswer
 from srv.events.check_user_status import CheckUsersStatus
 from srv.events.fk_sink import FkSink
 
+SEND_CHAT_ACTION = 'https://some.domain/sendChatAction'
+
 
 @pytest.fixture()
 def _mock_actives(respx_mock):
@@ -38,9 +42,9 @@ def _mock_actives(respx_mock):
             200, text=ujson.dumps({'ok': True, 'result': True}),
         ),
     }
-    respx_mock.get('https://some.domain/sendChatAction?chat_id=1&action=typing').mock(**rv)
-    respx_mock.get('https://some.domain/sendChatAction?chat_id=2&action=typing').mock(**rv)
-    respx_mock.get('https://some.domain/sendChatAction?chat_id=3&action=typing').mock(**rv)
+    for chat_id in (1, 2, 3):
+        typing = {'chat_id': chat_id, 'action': 'typing'}
+        respx_mock.post(SEND_CHAT_ACTION, json=typing).mock(**rv)
 
 
 @pytest.fixture()
@@ -50,9 +54,10 @@ def _mock_unsubscribed(respx_mock):
             400, text='{"ok":false,"error_code":400,"description":"Bad Request: chat not found"}',
         ),
     }
-    respx_mock.get('https://some.domain/sendChatAction?chat_id=1&action=typing').mock(**rv)
-    respx_mock.get('https://some.domain/sendChatAction?chat_id=2&action=typing').mock(**rv)
-    respx_mock.get('https://some.domain/sendChatAction?chat_id=3&action=typing').mock(
+    for chat_id in (1, 2):
+        typing = {'chat_id': chat_id, 'action': 'typing'}
+        respx_mock.post(SEND_CHAT_ACTION, json=typing).mock(**rv)
+    respx_mock.post(SEND_CHAT_ACTION, json={'chat_id': 3, 'action': 'typing'}).mock(
         return_value=httpx.Response(200, text=ujson.dumps({'ok': True, 'result': True})),
     )
 
@@ -67,9 +72,16 @@ async def _users(pgsql):
 
 
 @pytest.mark.usefixtures('_users', '_mock_actives')
-async def test_user_status(pgsql):
+async def test_user_status(pgsql, http_client):
     await CheckUsersStatus(
-        FkAnswer(), pgsql, FkSink(), FkLogSink(),
+        FkAnswer(),
+        http_client,
+        FkThrottleStats(),
+        AimdConcurrencyLimit(1, 100, 1, 10),
+        pgsql,
+        FkSink(),
+        FkLogSink(),
+        2,
     ).process(JsonDoc({}))
 
     assert [
@@ -79,9 +91,16 @@ async def test_user_status(pgsql):
 
 
 @pytest.mark.usefixtures('_users', '_mock_unsubscribed')
-async def test_unsubscribed(pgsql):
+async def test_unsubscribed(pgsql, http_client):
     await CheckUsersStatus(
-        FkAnswer(), pgsql, FkSink(), FkLogSink(),
+        FkAnswer(),
+        http_client,
+        FkThrottleStats(),
+        AimdConcurrencyLimit(1, 100, 1, 10),
+        pgsql,
+        FkSink(),
+        FkLogSink(),
+        2,
     ).process(JsonDoc({}))
 
     assert [
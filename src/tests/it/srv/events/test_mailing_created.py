@@ -27,6 +27,8 @@ import pytest
 from eljson.json_doc import JsonDoc
 
 from app_types.fk_log_sink import FkLogSink
+from app_types.fk_throttle_stats import FkThrottleStats
+from integrations.tg.aimd_concurrency_limit import AimdConcurrencyLimit
 from integrations.tg.tg_answers import TgEmptyAnswer
 from srv.events.fk_sink import FkSink
 from srv.events.mailing_created import MailingCreatedEvent
@@ -34,7 +36,10 @@ from srv.events.mailing_created import MailingCreatedEvent
 
 @pytest.fixture()
 def _mock_http(respx_mock):
-    respx_mock.get('https://api.telegram.org/bottoken/sendMessage?chat_id=483457&text=Hello&parse_mode=html').mock(
+    respx_mock.post(
+        'https://api.telegram.org/bottoken/sendMessage',
+        json={'chat_id': 483457, 'text': 'Hello', 'parse_mode': 'html'},
+    ).mock(
         return_value=httpx.Response(
             json={
                 'ok': True,
@@ -62,6 +67,13 @@ def _mock_http(respx_mock):
     )
 
 
+@pytest.fixture()
+def _mock_admin_report(respx_mock):
+    respx_mock.post('https://api.telegram.org/bottoken/sendMessage', json__chat_id=93754).mock(
+        return_value=httpx.Response(200, json={'ok': True, 'result': {}}),
+    )
+
+
 @pytest.fixture()
 async def _users(pgsql):
     await pgsql.execute_many(
@@ -74,16 +86,19 @@ async def _users(pgsql):
     )
 
 
-@pytest.mark.usefixtures('_mock_http', '_users')
-async def test(pgsql, settings_ctor):
+@pytest.mark.usefixtures('_mock_http', '_mock_admin_report', '_users')
+async def test(pgsql, http_client, settings_ctor):
     await MailingCreatedEvent(
         TgEmptyAnswer('token'),
+        http_client,
+        FkThrottleStats(),
+        AimdConcurrencyLimit(1, 100, 1, 10),
         pgsql,
         FkSink(),
         FkLogSink(),
-        settings_ctor(admin_chat_ids='93754').ADMIN_CHAT_IDS,
+        settings_ctor(admin_chat_ids='93754'),
     ).process(
-        JsonDoc({'data': {
+        JsonDoc({'event_id': str(uuid.uuid4()), 'data': {
             'mailing_id': str(uuid.uuid4()),
             'text': 'Hello',
             'group': 'all',
@@ -32,7 +32,10 @@ from srv.events.message_deleted import MessageDeleted
 
 @pytest.fixture()
 def _mock_http(respx_mock):
-    respx_mock.get('https://api.telegram.org/bottoken/deleteMessage?chat_id=37945&message_id=893457').mock(
+    respx_mock.post(
+        'https://api.telegram.org/bottoken/deleteMessage',
+        json={'chat_id': 37945, 'message_id': 893457},
+    ).mock(
         return_value=httpx.Response(
             text='{"ok":true}',
             status_code=200,
@@ -41,9 +44,10 @@ def _mock_http(respx_mock):
 
 
 @pytest.mark.usefixtures('_mock_http')
-async def test(pgsql):
+async def test(pgsql, http_client):
     await MessageDeleted(
         TgEmptyAnswer('token'),
+        http_client,
         pgsql,
         FkSink(),
         FkLogSink(),
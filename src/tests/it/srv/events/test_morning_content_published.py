@@ -21,19 +21,24 @@
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
 import datetime
+import uuid
 
 import httpx
 import pytest
 import pytz
 import ujson
 from eljson.json_doc import JsonDoc
-from furl import furl
 from loguru import logger
 
+from app_types.fk_throttle_stats import FkThrottleStats
+from integrations.tg.aimd_concurrency_limit import AimdConcurrencyLimit
 from integrations.tg.tg_answers import TgEmptyAnswer
+from srv.events.cached_schema_validation import CachedSchemaValidation
 from srv.events.morning_content_published import MorningContentPublishedEvent
 from srv.events.rabbitmq_sink import RabbitmqSink
+from srv.events.rbmq_channel_pool import RbmqChannelPool
 from srv.users.pg_user import PgUser
+from srv.users.user import User
 
 
 @pytest.fixture()
@@ -43,29 +48,29 @@ def _mock_http(respx_mock):
             200, text=ujson.dumps({'ok': True, 'result': True}),
         ),
     }
-    url = furl('https://api.telegram.org/botfakeToken/sendMessage').add({
+    respx_mock.post('https://api.telegram.org/botfakeToken/sendMessage', json={
         'text': '<b>1:1)</b> First ayat content\n<b>1:2)</b> Second ayat content\n\nhttps://umma.ru/sura-1',
-        'chat_id': '358610865',
+        'chat_id': 358610865,
         'parse_mode': 'html',
         'link_preview_options': '{"is_disabled":true}',
-    })
-    respx_mock.get(str(url)).mock(
+    }).mock(
         return_value=httpx.Response(
             text='{"ok":false,"error_code":403,"description":"Forbidden: bot was blocked by the user"}',
             status_code=400,
         ),
     )
     chat_content = {
-        '24391797': '<b>1:1)</b> First ayat content\n<b>1:2)</b> Second ayat content\n\nhttps://umma.ru/sura-1',
-        '206497847': '<b>2:1-4)</b> Third ayat content\n\nhttps://umma.ru/sura-2',
+        24391797: '<b>1:1)</b> First ayat content\n<b>1:2)</b> Second ayat content\n\nhttps://umma.ru/sura-1',
+        206497847: '<b>2:1-4)</b> Third ayat content\n\nhttps://umma.ru/sura-2',
     }
     for chat_id, text in chat_content.items():
-        respx_mock.get(str(furl('https://api.telegram.org/botfakeToken/sendMessage').add({
+        respx_mock.post('https://api.telegram.org/botfakeToken/sendMessage', json={
             'text': text,
             'chat_id': chat_id,
             'parse_mode': 'html',
             'link_preview_options': '{"is_disabled":true}',
-        }))).mock(**rv)
+        }).mock(**rv)
+    respx_mock.post('https://api.telegram.org/botfakeToken/sendMessage', json__chat_id=1).mock(**rv)
 
 
 @pytest.fixture()
@@ -141,8 +146,15 @@ async def users(pgsql):
     ]
 
 
+async def _users_state(users: list[User]) -> list[tuple[int, bool, int]]:
+    return [
+        (await user.chat_id(), await user.is_active(), await user.day())
+        for user in users
+    ]
+
+
 @pytest.mark.usefixtures('_ayats', '_mock_http')
-async def test(pgsql, users, settings_ctor):
+async def test(pgsql, http_client, users, settings_ctor):
     settings = settings_ctor(  # noqa: S106. Not secure issue
         rabbitmq_host='localhost',
         rabbitmq_user='guest',
@@ -152,18 +164,56 @@ async def test(pgsql, users, settings_ctor):
     )
     await MorningContentPublishedEvent(
         TgEmptyAnswer('fakeToken'),
+        http_client,
+        FkThrottleStats(),
+        AimdConcurrencyLimit(1, 100, 1, 10),
         pgsql,
         settings,
-        RabbitmqSink(settings, logger),
+        RabbitmqSink(RbmqChannelPool.settings_ctor(settings, 1), CachedSchemaValidation(), logger),
         logger,
-    ).process(JsonDoc({}))
+    ).process(JsonDoc({'event_id': str(uuid.uuid4())}))
 
-    assert [
-        (await user.chat_id(), await user.is_active(), await user.day())
-        for user in users
-    ] == [
+    assert await _users_state(users) == [
         (358610865, False, 2),
         (206497847, True, 4),
         (827078672, False, 5),
         (24391797, True, 3),
     ]
+
+
+@pytest.mark.respx(assert_all_called=False)
+@pytest.mark.usefixtures('_ayats', '_mock_http')
+async def test_resume_from_checkpoint(pgsql, http_client, users, settings_ctor):
+    event_id = str(uuid.uuid4())
+    await pgsql.execute(
+        'INSERT INTO mailing_checkpoints (run_id, last_chat_id) VALUES (:run_id, 206497847)',
+        {'run_id': event_id},
+    )
+    settings = settings_ctor(  # noqa: S106. Not secure issue
+        rabbitmq_host='localhost',
+        rabbitmq_user='guest',
+        rabbitmq_pass='guest',  # noqa: S106. Not secure issue
+        rabbitmq_vhost='',
+        daily_ayats='on',
+    )
+    await MorningContentPublishedEvent(
+        TgEmptyAnswer('fakeToken'),
+        http_client,
+        FkThrottleStats(),
+        AimdConcurrencyLimit(1, 100, 1, 10),
+        pgsql,
+        settings,
+        RabbitmqSink(RbmqChannelPool.settings_ctor(settings, 1), CachedSchemaValidation(), logger),
+        logger,
+    ).process(JsonDoc({'event_id': event_id}))
+
+    assert await _users_state(users) == [
+        (358610865, False, 2),
+        (206497847, True, 3),
+        (827078672, False, 5),
+        (24391797, True, 2),
+    ]
+    assert await pgsql.fetch_val(
+        'SELECT last_chat_id FROM mailing_checkpoints WHERE run_id = :run_id',
+        {'run_id': event_id},
+    ) == 358610865
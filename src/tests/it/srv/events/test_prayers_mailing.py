@@ -21,17 +21,21 @@
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
 import datetime
+import uuid
 
 import httpx
 import pytest
 import ujson
 from eljson.json_doc import JsonDoc
-from furl import furl
 from loguru import logger
 
+from app_types.fk_throttle_stats import FkThrottleStats
+from integrations.tg.aimd_concurrency_limit import AimdConcurrencyLimit
 from integrations.tg.tg_answers import TgEmptyAnswer
+from srv.events.cached_schema_validation import CachedSchemaValidation
 from srv.events.prayers_mailing import PrayersMailingPublishedEvent
 from srv.events.rabbitmq_sink import RabbitmqSink
+from srv.events.rbmq_channel_pool import RbmqChannelPool
 from srv.users.pg_user import PgUser
 
 
@@ -43,7 +47,7 @@ def mock_http_routes(respx_mock):
         ),
     }
     chat_content = {
-        '358610865': '\n'.join([
+        358610865: '\n'.join([
             'Время намаза для г. Kazan (07.03.2024)\n',
             'Иртәнге: 04:30',
             'Восход: 05:30',
@@ -54,7 +58,7 @@ def mock_http_routes(respx_mock):
         ]),
     }
     return [
-        respx_mock.get(str(furl('https://api.telegram.org/botfakeToken/sendMessage').add({
+        respx_mock.post('https://api.telegram.org/botfakeToken/sendMessage', json={
             'text': text,
             'chat_id': chat_id,
             'reply_markup': ujson.dumps({
@@ -67,8 +71,10 @@ def mock_http_routes(respx_mock):
                 ]],
             }),
             'parse_mode': 'html',
-        }))).mock(**rv)
+        }).mock(**rv)
         for chat_id, text in chat_content.items()
+    ] + [
+        respx_mock.post('https://api.telegram.org/botfakeToken/sendMessage', json__chat_id=358610865).mock(**rv),
     ]
 
 
@@ -79,7 +85,7 @@ def mock_http_ramadan_mode(respx_mock):
             200, text=ujson.dumps({'ok': True, 'result': True}),
         ),
     }
-    return respx_mock.get(str(furl('https://api.telegram.org/botfakeToken/sendMessage').add({
+    route = respx_mock.post('https://api.telegram.org/botfakeToken/sendMessage', json={
         'text': '\n'.join([
             'Время намаза для г. Kazan (07.03.2024)\n',
             'Иртәнге: 04:30 <i>- Конец сухура</i>',
@@ -89,7 +95,7 @@ def mock_http_ramadan_mode(respx_mock):
             'Ахшам: 08:30 <i>- Ифтар</i>',
             'Ястү: 09:30',
         ]),
-        'chat_id': '358610865',
+        'chat_id': 358610865,
         'reply_markup': ujson.dumps({
             'inline_keyboard': [[
                 {'text': '\u274c', 'callback_data': 'mark_readed(1)'},
@@ -100,7 +106,9 @@ def mock_http_ramadan_mode(respx_mock):
             ]],
         }),
         'parse_mode': 'html',
-    }))).mock(**rv)
+    }).mock(**rv)
+    respx_mock.post('https://api.telegram.org/botfakeToken/sendMessage', json__chat_id=358610865).mock(**rv)
+    return route
 
 
 @pytest.fixture()
@@ -175,7 +183,7 @@ async def users(pgsql):
 
 
 @pytest.mark.usefixtures('users')
-async def test(pgsql, fake_redis, time_machine, settings_ctor, mock_http_routes):
+async def test(pgsql, http_client, fake_redis, time_machine, settings_ctor, mock_http_routes):
     time_machine.move_to('2024-03-06')
     settings = settings_ctor(  # noqa: S106. Not secure issue
         rabbitmq_host='localhost',
@@ -188,18 +196,21 @@ async def test(pgsql, fake_redis, time_machine, settings_ctor, mock_http_routes)
     )
     await PrayersMailingPublishedEvent(
         TgEmptyAnswer('fakeToken'),
+        http_client,
+        FkThrottleStats(),
+        AimdConcurrencyLimit(1, 100, 1, 10),
         pgsql,
         settings,
-        RabbitmqSink(settings, logger),
+        RabbitmqSink(RbmqChannelPool.settings_ctor(settings, 1), CachedSchemaValidation(), logger),
         logger,
         fake_redis,
-    ).process(JsonDoc({}))
+    ).process(JsonDoc({'event_id': str(uuid.uuid4())}))
 
     assert all(route.called for route in mock_http_routes)
 
 
 @pytest.mark.usefixtures('users')
-async def test_ramadan_mode(pgsql, fake_redis, time_machine, settings_ctor, mock_http_ramadan_mode):
+async def test_ramadan_mode(pgsql, http_client, fake_redis, time_machine, settings_ctor, mock_http_ramadan_mode):
     time_machine.move_to('2024-03-06')
     settings = settings_ctor(  # noqa: S106. Not secure issue
         rabbitmq_host='localhost',
@@ -212,11 +223,14 @@ async def test_ramadan_mode(pgsql, fake_redis, time_machine, settings_ctor, mock
     )
     await PrayersMailingPublishedEvent(
         TgEmptyAnswer('fakeToken'),
+        http_client,
+        FkThrottleStats(),
+        AimdConcurrencyLimit(1, 100, 1, 10),
         pgsql,
         settings,
-        RabbitmqSink(settings, logger),
+        RabbitmqSink(RbmqChannelPool.settings_ctor(settings, 1), CachedSchemaValidation(), logger),
         logger,
         fake_redis,
-    ).process(JsonDoc({}))
+    ).process(JsonDoc({'event_id': str(uuid.uuid4())}))
 
     assert mock_http_ramadan_mode.called
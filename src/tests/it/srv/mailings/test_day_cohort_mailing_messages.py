@@ -0,0 +1,90 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import datetime
+
+import pytest
+import pytz
+import ujson
+
+from app_types.fk_update import FkUpdate
+from integrations.tg.tg_answers import TgAnswer, TgEmptyAnswer
+from srv.mailings.day_cohort_mailing_messages import DayCohortMailingMessages
+
+
+@pytest.fixture()
+async def _ayats(pgsql):
+    await pgsql.execute(
+        'INSERT INTO files (file_id, created_at) VALUES (:file_id, :created_at)',
+        {
+            'file_id': '7fc47c04-2271-4ef0-9e47-ba08f499932b',
+            'created_at': datetime.datetime(2020, 1, 1, tzinfo=pytz.timezone('Europe/Moscow')),
+        },
+    )
+    await pgsql.execute_many(
+        'INSERT INTO suras (sura_id, link) VALUES (:sura_id, :link)',
+        [{'sura_id': 1, 'link': '/sura-1'}, {'sura_id': 2, 'link': '/sura-2'}],
+    )
+    common = {
+        'public_id': '',
+        'audio_id': '7fc47c04-2271-4ef0-9e47-ba08f499932b',
+        'arab_text': '',
+        'transliteration': '',
+    }
+    await pgsql.execute_many(
+        '\n'.join([
+            'INSERT INTO ayats',
+            '(ayat_id, public_id, sura_id, audio_id, ayat_number, content, arab_text, transliteration, day)',
+            'VALUES',
+            '(:ayat_id, :public_id, :sura_id, :audio_id, :ayat_number, :content, :arab_text, :transliteration, :day)',
+        ]),
+        [
+            {'ayat_id': 1, 'sura_id': 1, 'ayat_number': '1', 'content': 'First ayat content', 'day': 2} | common,
+            {'ayat_id': 2, 'sura_id': 2, 'ayat_number': '1-4', 'content': 'Second ayat content', 'day': 3} | common,
+        ],
+    )
+    await pgsql.execute_many(
+        'INSERT INTO users (chat_id, is_active, day) VALUES (:chat_id, :is_active, :day)',
+        [
+            {'chat_id': 1, 'is_active': True, 'day': 2},
+            {'chat_id': 2, 'is_active': True, 'day': 2},
+        ],
+    )
+
+
+async def _text(answer: TgAnswer) -> str:
+    requests = await answer.build(FkUpdate.empty_ctor())
+    return ujson.loads(requests[0].httpx_request().content)['text']
+
+
+@pytest.mark.usefixtures('_ayats')
+async def test_day_changed_during_mailing(pgsql):
+    got = []
+    messages = DayCohortMailingMessages(pgsql, 'SELECT chat_id, day FROM users', TgEmptyAnswer('fakeToken'), 1)
+    async for chat_id, answer in messages.iterate(0):
+        await pgsql.execute('UPDATE users SET day = 3 WHERE chat_id = 2')
+        got.append((chat_id, await _text(answer)))
+
+    assert got == [
+        (1, '<b>1:1)</b> First ayat content\n\nhttps://umma.ru/sura-1'),
+        (2, '<b>2:1-4)</b> Second ayat content\n\nhttps://umma.ru/sura-2'),
+    ]
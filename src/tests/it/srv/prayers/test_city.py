@@ -58,8 +58,8 @@ async def test_pg_city(pgsql):
 
 
 @pytest.mark.usefixtures('_db_city', '_mock_nominatim')
-async def test_ctors(pgsql):
+async def test_ctors(pgsql, http_client):
     city_by_name = PgCity.name_ctor('Казань', pgsql)
-    city_by_location = PgCity.location_ctor(FkCoordinates(55.7887, 49.1221), pgsql)
+    city_by_location = PgCity.location_ctor(FkCoordinates(55.7887, 49.1221), http_client, pgsql)
 
     assert str(await city_by_name.city_id()) == str(await city_by_location.city_id())
@@ -50,7 +50,8 @@ async def test(pgsql):
         })),
     )
 
-    assert ujson.loads(got[0].url.params['results']) == [
+    assert got[0].fields()['inline_query_id'] == '1'
+    assert ujson.loads(got[0].fields()['results']) == [
         {
             'id': '0',
             'type': 'article',
@@ -0,0 +1,40 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from srv.users.pg_active_users import PgActiveUsers
+
+
+@pytest.fixture()
+async def _users(pgsql):
+    await pgsql.execute_many('INSERT INTO users (chat_id, is_active) VALUES (:chat_id, :is_active)', [
+        {'chat_id': chat_id, 'is_active': chat_id != 3}
+        for chat_id in (5, 1, 3, 4, 2)
+    ])
+
+
+@pytest.mark.usefixtures('_users')
+async def test_stream(pgsql):
+    got = [await user.chat_id() async for user in PgActiveUsers(pgsql, 2).stream()]
+
+    assert got == [1, 2, 4, 5]
@@ -22,12 +22,12 @@
 
 import pytest
 import ujson
-from furl import furl
 
 from app_types.fk_log_sink import FkLogSink
 from app_types.fk_update import FkUpdate
 from handlers.full_start_answer import FullStartAnswer
 from integrations.tg.tg_answers.fk_answer import FkAnswer
+from srv.ayats.pg_quran_corpus import PgQuranCorpus
 from srv.events.fk_sink import FkSink
 
 
@@ -46,121 +46,111 @@ async def _admin_message(pgsql):
 
 
 @pytest.mark.usefixtures('db_ayat', '_admin_message')
-async def test(pgsql, fake_redis, unquote, settings_ctor):
+async def test(pgsql, fake_redis, settings_ctor):
     got = await FullStartAnswer(
-        pgsql, FkAnswer(), FkSink(), fake_redis, settings_ctor(), FkLogSink(),
+        pgsql, PgQuranCorpus(pgsql), FkAnswer(), FkSink(), fake_redis, settings_ctor(), FkLogSink(),
     ).build(FkUpdate('{"message":{"text":"/start"},"chat":{"id":321},"date":0}'))
 
     assert len(got) == 3
-    assert unquote(got[0].url) == unquote(
-        furl('https://some.domain/sendMessage')
-        .add({
-            'parse_mode': 'html',
-            'text': 'start admin message',
-            'chat_id': 321,
-            'reply_markup': ujson.dumps({
-                'keyboard': [
-                    ['🎧 Подкасты'],
-                    ['🕋 Время намаза', '🏘️ Поменять город'],
-                    ['🌟 Избранное', '🔍 Найти аят'],
-                ],
-                'resize_keyboard': True,
-            }),
+    assert got[0].api_method() == 'sendMessage'
+    assert got[0].fields() == {
+        'parse_mode': 'html',
+        'text': 'start admin message',
+        'chat_id': 321,
+        'reply_markup': ujson.dumps({
+            'keyboard': [
+                ['🎧 Подкасты'],
+                ['🕋 Время намаза', '🏘️ Поменять город'],
+                ['🌟 Избранное', '🔍 Найти аят'],
+            ],
+            'resize_keyboard': True,
         }),
-    )
-    assert unquote(got[1].url) == unquote(
-        furl('https://some.domain/sendMessage')
-        .add({
-            'parse_mode': 'html',
-            'text': '\n'.join([
-                '<a href="https://umma.ru/link-to-sura#1-1">1:1-7)</a>',
-                'Arab text\n',
-                'Content\n',
-                '<i>Transliteration</i>',
-            ]),
-            'chat_id': 321,
-            'reply_markup': ujson.dumps({
-                'keyboard': [
-                    ['🎧 Подкасты'],
-                    ['🕋 Время намаза', '🏘️ Поменять город'],
-                    ['🌟 Избранное', '🔍 Найти аят'],
-                ],
-                'resize_keyboard': True,
-            }),
+    }
+    assert got[1].api_method() == 'sendMessage'
+    assert got[1].fields() == {
+        'parse_mode': 'html',
+        'text': '\n'.join([
+            '<a href="https://umma.ru/link-to-sura#1-1">1:1-7)</a>',
+            'Arab text\n',
+            'Content\n',
+            '<i>Transliteration</i>',
+        ]),
+        'chat_id': 321,
+        'reply_markup': ujson.dumps({
+            'keyboard': [
+                ['🎧 Подкасты'],
+                ['🕋 Время намаза', '🏘️ Поменять город'],
+                ['🌟 Избранное', '🔍 Найти аят'],
+            ],
+            'resize_keyboard': True,
         }),
-    )
+    }
 
 
 @pytest.mark.usefixtures('db_ayat', '_existed_user', '_admin_message')
-async def test_exists_user(pgsql, fake_redis, unquote, settings_ctor):
+async def test_exists_user(pgsql, fake_redis, settings_ctor):
     got = await FullStartAnswer(
-        pgsql, FkAnswer(), FkSink(), fake_redis, settings_ctor(), FkLogSink(),
+        pgsql, PgQuranCorpus(pgsql), FkAnswer(), FkSink(), fake_redis, settings_ctor(), FkLogSink(),
     ).build(FkUpdate('{"message":{"text":"/start"},"chat":{"id":321},"date":0}'))
 
     assert len(got) == 1
-    assert unquote(got[0].url) == unquote(
-        furl('https://some.domain/sendMessage')
-        .add({
-            'chat_id': 321,
-            'text': 'Вы уже зарегистрированы!',
-            'reply_markup': ujson.dumps({
-                'keyboard': [
-                    ['🎧 Подкасты'],
-                    ['🕋 Время намаза', '🏘️ Поменять город'],
-                    ['🌟 Избранное', '🔍 Найти аят'],
-                ],
-                'resize_keyboard': True,
-            }),
+    assert got[0].api_method() == 'sendMessage'
+    assert got[0].fields() == {
+        'chat_id': 321,
+        'text': 'Вы уже зарегистрированы!',
+        'reply_markup': ujson.dumps({
+            'keyboard': [
+                ['🎧 Подкасты'],
+                ['🕋 Время намаза', '🏘️ Поменять город'],
+                ['🌟 Избранное', '🔍 Найти аят'],
+            ],
+            'resize_keyboard': True,
         }),
-    )
+    }
 
 
 @pytest.mark.usefixtures('db_ayat', '_existed_user', '_admin_message')
-async def test_with_referrer(pgsql, fake_redis, unquote, settings_ctor):
+async def test_with_referrer(pgsql, fake_redis, settings_ctor):
     got = await FullStartAnswer(
-        pgsql, FkAnswer(), FkSink(), fake_redis, settings_ctor(), FkLogSink(),
+        pgsql, PgQuranCorpus(pgsql), FkAnswer(), FkSink(), fake_redis, settings_ctor(), FkLogSink(),
     ).build(FkUpdate('{"message":{"text":"/start 1"},"chat":{"id":1},"date":1670581213}'))
 
     assert len(got) == 4
-    assert unquote(got[0].url) == unquote(
-        furl('https://some.domain/sendMessage')
-        .add({
-            'parse_mode': 'html',
-            'text': 'start admin message',
-            'chat_id': 1,
-            'reply_markup': ujson.dumps({
-                'keyboard': [
-                    ['🎧 Подкасты'],
-                    ['🕋 Время намаза', '🏘️ Поменять город'],
-                    ['🌟 Избранное', '🔍 Найти аят'],
-                ],
-                'resize_keyboard': True,
-            }),
+    assert got[0].api_method() == 'sendMessage'
+    assert got[0].fields() == {
+        'parse_mode': 'html',
+        'text': 'start admin message',
+        'chat_id': 1,
+        'reply_markup': ujson.dumps({
+            'keyboard': [
+                ['🎧 Подкасты'],
+                ['🕋 Время намаза', '🏘️ Поменять город'],
+                ['🌟 Избранное', '🔍 Найти аят'],
+            ],
+            'resize_keyboard': True,
         }),
-    )
-    assert unquote(got[2].url) == unquote(
-        furl('https://some.domain/sendMessage')
-        .add({
-            'parse_mode': 'html',
-            'text': 'По вашей реферальной ссылке произошла регистрация',
-            'chat_id': 321,
-            'reply_markup': ujson.dumps({
-                'keyboard': [
-                    ['🎧 Подкасты'],
-                    ['🕋 Время намаза', '🏘️ Поменять город'],
-                    ['🌟 Избранное', '🔍 Найти аят'],
-                ],
-                'resize_keyboard': True,
-            }),
+    }
+    assert got[2].api_method() == 'sendMessage'
+    assert got[2].fields() == {
+        'parse_mode': 'html',
+        'text': 'По вашей реферальной ссылке произошла регистрация',
+        'chat_id': 321,
+        'reply_markup': ujson.dumps({
+            'keyboard': [
+                ['🎧 Подкасты'],
+                ['🕋 Время намаза', '🏘️ Поменять город'],
+                ['🌟 Избранное', '🔍 Найти аят'],
+            ],
+            'resize_keyboard': True,
         }),
-    )
+    }
 
 
 @pytest.mark.usefixtures('db_ayat', '_existed_user', '_admin_message')
 @pytest.mark.parametrize('referrer_id', [85, 3001])
 async def test_fake_referrer(pgsql, fake_redis, referrer_id, settings_ctor):
     got = await FullStartAnswer(
-        pgsql, FkAnswer(), FkSink(), fake_redis, settings_ctor(), FkLogSink(),
+        pgsql, PgQuranCorpus(pgsql), FkAnswer(), FkSink(), fake_redis, settings_ctor(), FkLogSink(),
     ).build(FkUpdate(ujson.dumps({
         'message': {'text': '/start {0}'.format(referrer_id)},
         'chat': {'id': 1},
@@ -0,0 +1,49 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import httpx
+
+from app_types.runable import Runable
+from integrations.http_client_app import HttpClientApp
+
+
+@final
+class FkApp(Runable):
+
+    def __init__(self, http_client: httpx.AsyncClient) -> None:
+        self.client_closed_on_run = True
+        self._http_client = http_client
+
+    @override
+    async def run(self) -> None:
+        self.client_closed_on_run = self._http_client.is_closed
+
+
+async def test():
+    http_client = httpx.AsyncClient()
+    app = FkApp(http_client)
+    await HttpClientApp(http_client, app).run()
+
+    assert not app.client_closed_on_run
+    assert http_client.is_closed
@@ -27,7 +27,7 @@ from integrations.tg.fk_coordinates import FkCoordinates
 
 
 @pytest.mark.usefixtures('_mock_nominatim')
-async def test():
-    got = await NominatimCityName(FkCoordinates(55.7887, 49.1221)).to_str()
+async def test(http_client):
+    got = await NominatimCityName(FkCoordinates(55.7887, 49.1221), http_client).to_str()
 
     assert got == 'Казань'
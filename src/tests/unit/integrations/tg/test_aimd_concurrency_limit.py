@@ -0,0 +1,83 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from integrations.tg.aimd_concurrency_limit import AimdConcurrencyLimit
+
+
+def test_increase():
+    limit = AimdConcurrencyLimit(1, 100, 1, 1)
+
+    limit.record(0.1, ok=True, throttled=False)
+    limit.record(0.1, ok=True, throttled=False)
+    limit.record(0.1, ok=True, throttled=False)
+
+    assert limit.current() == 2
+
+
+def test_slow_response_keep_limit():
+    limit = AimdConcurrencyLimit(1, 100, 1, 10)
+
+    limit.record(2, ok=True, throttled=False)
+
+    assert limit.current() == 10
+
+
+def test_throttled_keep_limit():
+    limit = AimdConcurrencyLimit(1, 100, 1, 1)
+
+    limit.record(0.1, ok=True, throttled=True)
+
+    assert limit.current() == 1
+
+
+def test_decrease():
+    limit = AimdConcurrencyLimit(1, 100, 1, 10)
+
+    limit.record(0.1, ok=False, throttled=False)
+
+    assert limit.current() == 5
+
+
+def test_decrease_once_per_window():
+    limit = AimdConcurrencyLimit(1, 100, 1, 10)
+
+    limit.record(0.1, ok=False, throttled=False)
+    limit.record(0.1, ok=False, throttled=False)
+
+    assert limit.current() == 5
+
+
+def test_min():
+    limit = AimdConcurrencyLimit(4, 5, 0, 5)
+
+    limit.record(0.1, ok=False, throttled=False)
+    limit.record(0.1, ok=False, throttled=False)
+
+    assert limit.current() == 4
+
+
+def test_max():
+    limit = AimdConcurrencyLimit(1, 5, 1, 5)
+
+    limit.record(0.1, ok=True, throttled=False)
+
+    assert limit.current() == 5
@@ -0,0 +1,133 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+
+import httpx
+import pytest
+import ujson
+
+from app_types.fk_log_sink import FkLogSink
+from app_types.fk_throttle_stats import FkThrottleStats
+from app_types.fk_update import FkUpdate
+from exceptions.internal_exceptions import TelegramIntegrationsError
+from integrations.tg.aimd_concurrency_limit import AimdConcurrencyLimit
+from integrations.tg.bulk_sendable_answer import BulkSendableAnswer
+from integrations.tg.redis_chat_rate_limits import RedisChatRateLimits
+from integrations.tg.task_throttle_stats import TaskThrottleStats
+from integrations.tg.tg_answers import TgChatIdAnswer
+from integrations.tg.tg_answers.fk_answer import FkAnswer
+from integrations.tg.tg_rate_limited_transport import TgRateLimitedTransport
+from integrations.tg.token_bucket_rate import TokenBucketRate
+
+RATE = TokenBucketRate(1000, 1)
+
+
+@pytest.fixture()
+def _mock_tg(respx_mock):
+    async def _response(request):  # noqa: WPS430
+        chat_id = ujson.loads(request.content)['chat_id']
+        await asyncio.sleep((10 - chat_id) * 0.005)
+        return httpx.Response(200, text=ujson.dumps({'ok': True, 'result': chat_id}))
+    respx_mock.post(url__startswith='https://some.domain').mock(side_effect=_response)
+
+
+@pytest.mark.usefixtures('_mock_tg')
+async def test_order(http_client):
+    got = await BulkSendableAnswer(
+        [TgChatIdAnswer(FkAnswer(), chat_id) for chat_id in range(10)],
+        http_client,
+        AimdConcurrencyLimit(1, 100, 1, 3),
+        FkThrottleStats(),
+        FkLogSink(),
+    ).send(FkUpdate.empty_ctor())
+
+    assert list(range(10)) == [response['result'] for response in got]
+
+
+async def test_too_many_requests(http_client, respx_mock):
+    respx_mock.post(url__startswith='https://some.domain').mock(
+        return_value=httpx.Response(429, text='{"ok":false,"error_code":429,"description":"Too Many Requests"}'),
+    )
+    limit = AimdConcurrencyLimit(1, 100, 1, 10)
+
+    with pytest.raises(TelegramIntegrationsError):
+        await BulkSendableAnswer(
+            [TgChatIdAnswer(FkAnswer(), 1)],
+            http_client,
+            limit,
+            FkThrottleStats(),
+            FkLogSink(),
+        ).send(FkUpdate.empty_ctor())
+
+    assert limit.current() == 5
+
+
+async def test_error_not_cancel_batch(http_client, respx_mock):
+    sent: list[int] = []
+
+    async def _response(request):  # noqa: WPS430
+        chat_id = ujson.loads(request.content)['chat_id']
+        if chat_id == 0:
+            return httpx.Response(400, text='{"ok":false,"error_code":400,"description":"Bad Request"}')
+        await asyncio.sleep(0.01)
+        sent.append(chat_id)
+        return httpx.Response(200, text=ujson.dumps({'ok': True, 'result': chat_id}))
+    respx_mock.post(url__startswith='https://some.domain').mock(side_effect=_response)
+
+    with pytest.raises(TelegramIntegrationsError):
+        await BulkSendableAnswer(
+            [TgChatIdAnswer(FkAnswer(), chat_id) for chat_id in range(5)],
+            http_client,
+            AimdConcurrencyLimit(1, 100, 1, 5),
+            FkThrottleStats(),
+            FkLogSink(),
+        ).send(FkUpdate.empty_ctor())
+
+    assert sorted(sent) == [1, 2, 3, 4]
+
+
+def _flood_wait_transport(fake_redis, task_stats: TaskThrottleStats) -> httpx.AsyncBaseTransport:
+    responses = iter([
+        httpx.Response(429, text='{"ok":false,"error_code":429,"parameters":{"retry_after":0}}'),
+        httpx.Response(200, text='{"ok":true,"result":1}'),
+    ])
+    return TgRateLimitedTransport(
+        httpx.MockTransport(lambda _: next(responses)),
+        RedisChatRateLimits(fake_redis, RATE, RATE, RATE),
+        3,
+        task_stats,
+        FkLogSink(),
+    )
+
+
+async def test_transport_retry_decrease_limit(fake_redis):
+    task_stats = TaskThrottleStats()
+    limit = AimdConcurrencyLimit(1, 100, 1, 10)
+
+    async with httpx.AsyncClient(transport=_flood_wait_transport(fake_redis, task_stats)) as client:
+        got = await BulkSendableAnswer(
+            [TgChatIdAnswer(FkAnswer(), 1)], client, limit, task_stats, FkLogSink(),
+        ).send(FkUpdate.empty_ctor())
+
+    assert [response['result'] for response in got] == [1]
+    assert limit.current() == 5
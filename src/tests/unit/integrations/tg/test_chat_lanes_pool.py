@@ -0,0 +1,173 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+# flake8: noqa: WPS202
+
+import asyncio
+from typing import final, override
+
+from app_types.fk_log_sink import FkLogSink
+from app_types.update import Update
+from integrations.tg.chat_lanes_pool import ChatLanesPool
+from integrations.tg.exception_logged_sendable import ExceptionLoggedSendable
+from integrations.tg.sendable import Sendable
+from integrations.tg.tg_chat_id import TgChatId
+from integrations.tg.update import TgUpdate
+
+
+@final
+class SlowSendable(Sendable):
+
+    def __init__(self, release: asyncio.Event) -> None:
+        self.processed: list[tuple[int, int]] = []
+        self.in_progress = 0
+        self.max_in_progress = 0
+        self._release = release
+
+    @override
+    async def send(self, update: Update) -> list[dict]:
+        self.in_progress += 1
+        self.max_in_progress = max(self.max_in_progress, self.in_progress)
+        await self._release.wait()
+        update_id = update.asdict()['update_id']
+        self.processed.append((int(TgChatId(update)), update_id))
+        self.in_progress -= 1
+        return []
+
+
+@final
+class FailedSendable(Sendable):
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @override
+    async def send(self, update: Update) -> list[dict]:
+        self.calls += 1
+        raise ValueError
+
+
+def _update(chat_id: int, update_id: int) -> Update:
+    return TgUpdate({'update_id': update_id, 'message': {'chat': {'id': chat_id}}})
+
+
+def _chat_updates(sendable: SlowSendable, chat_id: int) -> list[int]:
+    return [processed[1] for processed in sendable.processed if processed[0] == chat_id]
+
+
+async def _idle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_order_in_chat():
+    release = asyncio.Event()
+    sendable = SlowSendable(release)
+    updates_pool = ChatLanesPool(sendable, 10, 1, FkLogSink())
+    for update_id, chat_id in enumerate((1, 2, 1, 3, 1, 2)):
+        await updates_pool.dispatch(_update(chat_id, update_id))
+    await _idle()
+    release.set()
+    await _idle()
+
+    assert sendable.max_in_progress == 3
+    assert _chat_updates(sendable, 1) == [0, 2, 4]
+    assert _chat_updates(sendable, 2) == [1, 5]
+
+
+async def test_backpressure():
+    release = asyncio.Event()
+    sendable = SlowSendable(release)
+    updates_pool = ChatLanesPool(sendable, 2, 1, FkLogSink())
+    await updates_pool.dispatch(_update(1, 1))
+    await updates_pool.dispatch(_update(2, 2))
+    blocked = asyncio.create_task(updates_pool.dispatch(_update(3, 3)))
+    await _idle()
+
+    assert not blocked.done()
+
+    release.set()
+    await asyncio.wait_for(blocked, timeout=1)
+    await _idle()
+
+    assert len(sendable.processed) == 3
+
+
+async def test_failed_update_not_stop_lane():
+    sendable = FailedSendable()
+    logger = FkLogSink()
+    updates_pool = ChatLanesPool(ExceptionLoggedSendable(sendable, logger), 1, 1, logger)
+    await updates_pool.dispatch(_update(1, 1))
+    await asyncio.wait_for(updates_pool.dispatch(_update(1, 2)), timeout=1)
+    await _idle()
+
+    assert sendable.calls == 2
+    assert logger.stack == ['ERROR Fail on process update', 'ERROR Fail on process update']
+
+
+async def test_failed_update_release_slots():
+    sendable = FailedSendable()
+    updates_pool = ChatLanesPool(sendable, 1, 1, FkLogSink())
+    await updates_pool.dispatch(_update(1, 1))
+    await asyncio.wait_for(updates_pool.dispatch(_update(2, 2)), timeout=1)
+    await updates_pool.flush()
+
+    assert sendable.calls == 2
+
+
+async def test_without_chat():
+    sendable = FailedSendable()
+    updates_pool = ChatLanesPool(sendable, 2, 1, FkLogSink())
+    await updates_pool.dispatch(TgUpdate({'update_id': 1}))
+    await updates_pool.dispatch(TgUpdate({'update_id': 2}))
+    await _idle()
+
+    assert sendable.calls == 2
+
+
+async def test_flush():
+    release = asyncio.Event()
+    sendable = SlowSendable(release)
+    updates_pool = ChatLanesPool(sendable, 10, 1, FkLogSink())
+    await updates_pool.dispatch(_update(1, 1))
+    await updates_pool.dispatch(_update(1, 2))
+    await _idle()
+    release.set()
+    await updates_pool.flush()
+
+    assert sendable.processed == [(1, 1), (1, 2)]
+
+
+async def test_flush_timeout_release_slots():
+    sendable = SlowSendable(asyncio.Event())
+    logger = FkLogSink()
+    updates_pool = ChatLanesPool(sendable, 2, 0.01, logger)
+    await updates_pool.dispatch(_update(1, 1))
+    await updates_pool.dispatch(_update(1, 2))
+    await updates_pool.flush()
+
+    assert logger.stack == ['ERROR Lane chat:1 cancelled, 2 updates lost']
+    await asyncio.wait_for(
+        asyncio.gather(updates_pool.dispatch(_update(2, 3)), updates_pool.dispatch(_update(3, 4))),
+        timeout=1,
+    )
+    await updates_pool.flush()
@@ -0,0 +1,101 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from collections.abc import Iterable
+from typing import final, override
+
+from app_types.update import Update
+from integrations.tg.chat_lanes_webhook_answer import ChatLanesWebhookAnswer
+from integrations.tg.tg_chat_id import TgChatId
+from integrations.tg.update import TgUpdate
+from integrations.tg.webhook_answer import WebhookAnswer
+
+
+@final
+class SlowWebhookAnswer(WebhookAnswer):
+
+    def __init__(self, release: asyncio.Event) -> None:
+        self.processed: list[tuple[int, int]] = []
+        self.in_progress = 0
+        self.max_in_progress = 0
+        self._release = release
+
+    @override
+    async def reply(self, update: Update) -> str:
+        self.in_progress += 1
+        self.max_in_progress = max(self.max_in_progress, self.in_progress)
+        await self._release.wait()
+        update_id = update.asdict()['update_id']
+        self.processed.append((int(TgChatId(update)), update_id))
+        self.in_progress -= 1
+        return str(update_id)
+
+
+def _update(chat_id: int, update_id: int) -> Update:
+    return TgUpdate({'update_id': update_id, 'message': {'chat': {'id': chat_id}}})
+
+
+def _replies(answer: WebhookAnswer, chat_ids: Iterable[int]) -> list[asyncio.Task[str]]:
+    return [
+        asyncio.create_task(answer.reply(_update(chat_id, update_id)))
+        for update_id, chat_id in enumerate(chat_ids)
+    ]
+
+
+def _chat_updates(origin: SlowWebhookAnswer, chat_id: int) -> list[int]:
+    return [processed[1] for processed in origin.processed if processed[0] == chat_id]
+
+
+async def _idle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_order_in_chat():
+    release = asyncio.Event()
+    origin = SlowWebhookAnswer(release)
+    answer = ChatLanesWebhookAnswer(origin, 10)
+    replies = _replies(answer, (1, 2, 1, 3, 1, 2))
+    await _idle()
+    release.set()
+    got = await asyncio.gather(*replies)
+
+    assert got == ['0', '1', '2', '3', '4', '5']
+    assert origin.max_in_progress == 3
+    assert _chat_updates(origin, 1) == [0, 2, 4]
+    assert _chat_updates(origin, 2) == [1, 5]
+
+
+async def test_concurrency():
+    release = asyncio.Event()
+    origin = SlowWebhookAnswer(release)
+    answer = ChatLanesWebhookAnswer(origin, 2)
+    replies = _replies(answer, range(5))
+    await _idle()
+
+    assert origin.max_in_progress == 2
+
+    release.set()
+    await asyncio.gather(*replies)
+
+    assert len(origin.processed) == 5
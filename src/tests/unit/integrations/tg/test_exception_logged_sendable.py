@@ -0,0 +1,63 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+from app_types.fk_log_sink import FkLogSink
+from app_types.update import Update
+from integrations.tg.exception_logged_sendable import ExceptionLoggedSendable
+from integrations.tg.sendable import Sendable
+from integrations.tg.update import TgUpdate
+
+UPDATE = TgUpdate({'update_id': 1})
+
+
+@final
+class FailedSendable(Sendable):
+
+    @override
+    async def send(self, update: Update) -> list[dict]:
+        raise ValueError
+
+
+@final
+class FkSendable(Sendable):
+
+    @override
+    async def send(self, update: Update) -> list[dict]:
+        return [{'ok': True}]
+
+
+async def test():
+    logger = FkLogSink()
+    got = await ExceptionLoggedSendable(FailedSendable(), logger).send(UPDATE)
+
+    assert got == []
+    assert logger.stack == ['ERROR Fail on process update']
+
+
+async def test_success():
+    logger = FkLogSink()
+    got = await ExceptionLoggedSendable(FkSendable(), logger).send(UPDATE)
+
+    assert got == [{'ok': True}]
+    assert not logger.stack
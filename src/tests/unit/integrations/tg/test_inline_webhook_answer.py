@@ -0,0 +1,58 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import httpx
+import ujson
+
+from app_types.fk_log_sink import FkLogSink
+from app_types.fk_update import FkUpdate
+from integrations.tg.inline_webhook_answer import InlineWebhookAnswer
+from integrations.tg.tg_answers import TgAnswerList, TgChatIdAnswer, TgMessageAnswer, TgTextAnswer
+from integrations.tg.tg_answers.fk_answer import FkAnswer
+from srv.events.fk_sink import FkSink
+
+
+async def test(http_client):
+    got = await InlineWebhookAnswer(
+        TgTextAnswer.str_ctor(
+            TgChatIdAnswer(TgMessageAnswer(FkAnswer('https://api.telegram.org/botToken/')), 1),
+            'Привет',
+        ),
+        http_client,
+        FkSink(),
+        FkLogSink(),
+    ).reply(FkUpdate.empty_ctor())
+
+    assert ujson.loads(got) == {'method': 'sendMessage', 'chat_id': 1, 'text': 'Привет'}
+
+
+async def test_many_requests(http_client, respx_mock):
+    respx_mock.post('https://some.domain').mock(return_value=httpx.Response(200, text='{"ok":true,"result":{}}'))
+    got = await InlineWebhookAnswer(
+        TgAnswerList(FkAnswer(), FkAnswer()),
+        http_client,
+        FkSink(),
+        FkLogSink(),
+    ).reply(FkUpdate.empty_ctor())
+
+    assert not got
+    assert respx_mock.calls.call_count == 2
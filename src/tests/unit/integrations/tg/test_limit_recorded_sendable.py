@@ -0,0 +1,73 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import httpx
+import pytest
+
+from app_types.fk_throttle_stats import FkThrottleStats
+from app_types.fk_update import FkUpdate
+from app_types.update import Update
+from exceptions.internal_exceptions import TelegramIntegrationsError
+from integrations.tg.aimd_concurrency_limit import AimdConcurrencyLimit
+from integrations.tg.fk_sendable import FkSendable
+from integrations.tg.limit_recorded_sendable import LimitRecordedSendable
+from integrations.tg.sendable import Sendable
+
+
+@final
+class ErrorSendable(Sendable):
+
+    def __init__(self, error: Exception) -> None:
+        self._error = error
+
+    @override
+    async def send(self, update: Update) -> list[dict]:
+        raise self._error
+
+
+async def test_ok():
+    limit = AimdConcurrencyLimit(1, 100, 1, 10)
+    sendable = LimitRecordedSendable(FkSendable([{'ok': True}]), limit, FkThrottleStats())
+
+    got = await sendable.send(FkUpdate.empty_ctor())
+
+    assert got == [{'ok': True}]
+    assert limit.current() == 10
+
+
+@pytest.mark.parametrize(('error', 'expected'), [
+    (TelegramIntegrationsError('{"ok":false,"error_code":429,"description":"Too Many Requests"}'), 5),
+    (TelegramIntegrationsError('{"ok": false, "error_code": 429}'), 5),
+    (TelegramIntegrationsError('{"ok":false,"error_code":400,"description":"error_code 429"}'), 10),
+    (TelegramIntegrationsError('Bad Gateway'), 10),
+    (httpx.ReadTimeout('timeout'), 5),
+])
+async def test_error(error, expected):
+    limit = AimdConcurrencyLimit(1, 100, 1, 10)
+    sendable = LimitRecordedSendable(ErrorSendable(error), limit, FkThrottleStats())
+
+    with pytest.raises(type(error)):
+        await sendable.send(FkUpdate.empty_ctor())
+
+    assert limit.current() == expected
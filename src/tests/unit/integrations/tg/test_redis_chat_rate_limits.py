@@ -0,0 +1,57 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from integrations.tg.redis_chat_rate_limits import RedisChatRateLimits
+from integrations.tg.token_bucket_rate import TokenBucketRate
+
+FAST_RATE = TokenBucketRate(1000, 1)
+CHAT_RATE = TokenBucketRate(10, 1)
+GROUP_RATE = TokenBucketRate(1 / 3, 1)
+
+
+async def test_chats_separated(fake_redis):
+    limits = RedisChatRateLimits(fake_redis, FAST_RATE, CHAT_RATE, GROUP_RATE)
+
+    await limits.limit(1).acquire()
+    other_chat_wait = await limits.limit(2).acquire()
+    same_chat_wait = await limits.limit(1).acquire()
+
+    assert other_chat_wait == pytest.approx(0.001, abs=0.001)
+    assert same_chat_wait == pytest.approx(0.1, abs=0.02)
+
+
+async def test_group_limit(fake_redis):
+    await RedisChatRateLimits(fake_redis, FAST_RATE, CHAT_RATE, GROUP_RATE).limit(-100).acquire()
+
+    assert 2900 < await fake_redis.pttl('tg:rate:chat:-100') <= 3001
+
+
+@pytest.mark.parametrize('chat_id', [None, 1])
+async def test_global_limit(fake_redis, chat_id):
+    limits = RedisChatRateLimits(fake_redis, CHAT_RATE, FAST_RATE, FAST_RATE)
+
+    await limits.limit(2).acquire()
+    got = await limits.limit(chat_id).acquire()
+
+    assert got == pytest.approx(0.1, abs=0.02)
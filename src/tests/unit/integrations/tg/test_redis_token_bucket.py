@@ -0,0 +1,120 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+# flake8: noqa: WPS202
+
+import asyncio
+
+import pytest
+
+from integrations.tg.redis_token_bucket import RedisTokenBucket
+from integrations.tg.token_bucket_rate import TokenBucketRate
+
+
+async def test_burst(fake_redis):
+    bucket = RedisTokenBucket(fake_redis, {'tg:rate:global': TokenBucketRate(1, 3)})
+
+    got = [await bucket.acquire() for _ in range(3)]
+
+    assert got == [0, 0, 0]
+
+
+async def test_rate(fake_redis):
+    bucket = RedisTokenBucket(fake_redis, {'tg:rate:global': TokenBucketRate(100, 1)})
+
+    got = [await bucket.acquire() for _ in range(3)]
+
+    assert got[0] == 0
+    assert got[1] == pytest.approx(0.01, abs=0.005)
+    assert got[2] == pytest.approx(0.01, abs=0.005)
+
+
+async def test_shared_between_processes(fake_redis):
+    await RedisTokenBucket(fake_redis, {'tg:rate:global': TokenBucketRate(100, 1)}).acquire()
+
+    got = await RedisTokenBucket(fake_redis, {'tg:rate:global': TokenBucketRate(100, 1)}).acquire()
+
+    assert got == pytest.approx(0.01, abs=0.005)
+
+
+async def test_pause(fake_redis):
+    bucket = RedisTokenBucket(fake_redis, {'tg:rate:chat:1': TokenBucketRate(100, 5)})
+    await bucket.pause(0.05)
+
+    got = await bucket.acquire()
+
+    assert got == pytest.approx(0.05, abs=0.01)
+
+
+async def test_pause_delays_waiting(fake_redis):
+    bucket = RedisTokenBucket(fake_redis, {'tg:rate:chat:1': TokenBucketRate(20, 1)})
+    await bucket.acquire()
+    waiting = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0.01)
+    await bucket.pause(0.2)
+
+    got = await waiting
+
+    assert got == pytest.approx(0.2, abs=0.03)
+
+
+async def test_key_expire(fake_redis):
+    await RedisTokenBucket(fake_redis, {'tg:rate:chat:1': TokenBucketRate(10, 1)}).acquire()
+
+    assert 0 < await fake_redis.pttl('tg:rate:chat:1') <= 101
+
+
+async def test_all_buckets(fake_redis):
+    await RedisTokenBucket(fake_redis, {'tg:rate:global': TokenBucketRate(100, 1)}).acquire()
+    bucket = RedisTokenBucket(fake_redis, {
+        'tg:rate:chat:1': TokenBucketRate(1, 1),
+        'tg:rate:global': TokenBucketRate(100, 1),
+    })
+
+    got = await bucket.acquire()
+
+    assert got == pytest.approx(0.01, abs=0.005)
+
+
+async def test_denied_bucket_not_charged(fake_redis):
+    await RedisTokenBucket(fake_redis, {'tg:rate:global': TokenBucketRate(1, 1)}).acquire()
+    bucket = RedisTokenBucket(fake_redis, {
+        'tg:rate:chat:1': TokenBucketRate(1, 1),
+        'tg:rate:global': TokenBucketRate(1, 1),
+    })
+    acquiring = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0.01)
+    acquiring.cancel()
+
+    assert not await fake_redis.exists('tg:rate:chat:1')
+
+
+async def test_pause_first_bucket(fake_redis):
+    bucket = RedisTokenBucket(fake_redis, {
+        'tg:rate:chat:1': TokenBucketRate(100, 1),
+        'tg:rate:global': TokenBucketRate(100, 1),
+    })
+    await bucket.pause(0.05)
+
+    got = await RedisTokenBucket(fake_redis, {'tg:rate:global': TokenBucketRate(100, 1)}).acquire()
+
+    assert got == 0
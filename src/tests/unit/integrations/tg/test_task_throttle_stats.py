@@ -0,0 +1,58 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+
+from integrations.tg.task_throttle_stats import TaskThrottleStats
+
+
+def test_count():
+    stats = TaskThrottleStats()
+    stats.throttle(0.5)
+    stats.throttle(0.25)
+    stats.retry()
+
+    assert stats.throttled() == 2
+    assert stats.waited() == 0.75
+    assert stats.retried() == 1
+
+
+async def test_tasks_isolated():
+    stats = TaskThrottleStats()
+    throttled = asyncio.Event()
+
+    async def _throttled() -> None:  # noqa: WPS430
+        await asyncio.sleep(0)
+        stats.throttle(1)
+        stats.retry()
+        throttled.set()
+
+    async def _waiting() -> tuple[int, int]:  # noqa: WPS430
+        await throttled.wait()
+        return stats.throttled(), stats.retried()
+
+    async with asyncio.TaskGroup() as task_group:
+        task_group.create_task(_throttled())
+        waiting = task_group.create_task(_waiting())
+
+    assert waiting.result() == (0, 0)
+    assert (stats.throttled(), stats.retried()) == (0, 0)
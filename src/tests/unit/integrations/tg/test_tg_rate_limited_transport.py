@@ -0,0 +1,188 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+# flake8: noqa: WPS202
+
+from typing import final, override
+
+import httpx
+import pytest
+import ujson
+
+from app_types.fk_log_sink import FkLogSink
+from integrations.tg.chat_rate_limits import ChatRateLimits
+from integrations.tg.rate_limit import RateLimit
+from integrations.tg.redis_chat_rate_limits import RedisChatRateLimits
+from integrations.tg.task_throttle_stats import TaskThrottleStats
+from integrations.tg.tg_answers.tg_api_request import TgApiRequest
+from integrations.tg.tg_rate_limited_transport import TgRateLimitedTransport
+from integrations.tg.token_bucket_rate import TokenBucketRate
+
+
+@final
+class FkRateLimit(RateLimit):
+
+    def __init__(self, wait: float) -> None:
+        self._wait = wait
+        self.pauses: list[float] = []
+        self.acquired = 0
+
+    @override
+    async def acquire(self) -> float:
+        self.acquired += 1
+        return self._wait
+
+    @override
+    async def pause(self, seconds: float) -> None:
+        self.pauses.append(seconds)
+
+
+@final
+class FkChatRateLimits(ChatRateLimits):
+
+    def __init__(self, limit: RateLimit) -> None:
+        self._limit = limit
+        self.chat_ids: list[int | None] = []
+
+    @override
+    def limit(self, chat_id: int | None) -> RateLimit:
+        self.chat_ids.append(chat_id)
+        return self._limit
+
+
+def _send_message(chat_id: int) -> httpx.Request:
+    return TgApiRequest('https://some.domain/').with_api_method('sendMessage').with_fields({
+        'chat_id': chat_id, 'text': 'hello',
+    }).httpx_request()
+
+
+def _flood_response(retry_after: int) -> httpx.Response:
+    return httpx.Response(429, text=ujson.dumps({
+        'ok': False,
+        'error_code': 429,
+        'description': 'Too Many Requests: retry after {0}'.format(retry_after),
+        'parameters': {'retry_after': retry_after},
+    }))
+
+
+async def test_retry_after():
+    responses = iter([_flood_response(5), httpx.Response(200, text='{"ok":true}')])
+    chat_limit = FkRateLimit(0)
+    transport = TgRateLimitedTransport(
+        httpx.MockTransport(lambda _: next(responses)),
+        FkChatRateLimits(chat_limit),
+        3,
+        TaskThrottleStats(),
+        FkLogSink(),
+    )
+
+    got = await transport.handle_async_request(_send_message(1))
+
+    assert got.status_code == 200
+    assert chat_limit.pauses == [5]
+    assert chat_limit.acquired == 2
+    assert transport.retried() == 1
+
+
+async def test_retries_exceeded():
+    transport = TgRateLimitedTransport(
+        httpx.MockTransport(lambda _: _flood_response(1)),
+        FkChatRateLimits(FkRateLimit(0)),
+        2,
+        TaskThrottleStats(),
+        FkLogSink(),
+    )
+
+    got = await transport.handle_async_request(_send_message(1))
+
+    assert got.status_code == 429
+    assert transport.retried() == 2
+
+
+async def test_throttle_stats():
+    chat_limits = FkChatRateLimits(FkRateLimit(0.75))
+    transport = TgRateLimitedTransport(
+        httpx.MockTransport(lambda _: httpx.Response(200, text='{"ok":true}')),
+        chat_limits,
+        3,
+        TaskThrottleStats(),
+        FkLogSink(),
+    )
+
+    await transport.handle_async_request(_send_message(-100))
+    await transport.handle_async_request(_send_message(2))
+
+    assert chat_limits.chat_ids == [-100, 2]
+    assert transport.throttled() == 2
+    assert transport.waited() == pytest.approx(1.5)
+
+
+async def test_limited_without_chat():
+    chat_limits = FkChatRateLimits(FkRateLimit(0))
+    transport = TgRateLimitedTransport(
+        httpx.MockTransport(lambda _: httpx.Response(200, text='{"ok":true}')),
+        chat_limits,
+        3,
+        TaskThrottleStats(),
+        FkLogSink(),
+    )
+    inline_query_answer = TgApiRequest('https://some.domain/').with_api_method('answerInlineQuery').with_fields({
+        'inline_query_id': '1',
+        'results': '[]',
+    })
+
+    await transport.handle_async_request(httpx.Request('GET', 'https://some.domain/getUpdates'))
+    await transport.handle_async_request(inline_query_answer.httpx_request())
+
+    assert chat_limits.chat_ids == [None, None]
+
+
+async def test_shared_client(fake_redis):
+    rate = TokenBucketRate(1, 1)
+    transport = TgRateLimitedTransport(
+        httpx.MockTransport(lambda _: httpx.Response(200, text='{"ok":true}')),
+        RedisChatRateLimits(fake_redis, rate, rate, rate),
+        3,
+        TaskThrottleStats(),
+        FkLogSink(),
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        got = await client.send(_send_message(1))
+
+    assert got.json() == {'ok': True}
+    assert await fake_redis.exists('tg:rate:chat:1', 'tg:rate:global') == 2
+
+
+async def test_task_stats():
+    task_stats = TaskThrottleStats()
+    responses = iter([_flood_response(0), httpx.Response(200, text='{"ok":true}')])
+    transport = TgRateLimitedTransport(
+        httpx.MockTransport(lambda _: next(responses)),
+        FkChatRateLimits(FkRateLimit(0.5)),
+        3,
+        task_stats,
+        FkLogSink(),
+    )
+
+    await transport.handle_async_request(_send_message(1))
+
+    assert (task_stats.throttled(), task_stats.waited(), task_stats.retried()) == (2, 1, 1)
@@ -0,0 +1,190 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+# flake8: noqa: WPS202
+
+import asyncio
+import socket
+from typing import final, override
+
+import pytest
+
+from app_types.fk_log_sink import FkLogSink
+from app_types.update import Update
+from exceptions.base_exception import InternalBotError
+from integrations.tg.webhook_answer import WebhookAnswer
+from integrations.tg.webhook_app import WebhookApp
+
+
+@final
+class FkWebhookAnswer(WebhookAnswer):
+
+    def __init__(self) -> None:
+        self.updates: list[dict] = []
+
+    @override
+    async def reply(self, update: Update) -> str:
+        self.updates.append(update.asdict())
+        return '{"method":"sendMessage"}'
+
+
+@pytest.fixture()
+def port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture()
+async def webhook_answer(port):
+    answer = FkWebhookAnswer()
+    app = WebhookApp('127.0.0.1', port, '/webhook', 'secret', answer, 0.1, FkLogSink())
+    task = asyncio.create_task(app.run())
+    for _ in range(100):
+        try:
+            _, writer = await asyncio.open_connection('127.0.0.1', port)
+        except OSError:
+            await asyncio.sleep(0.01)
+            continue
+        writer.close()
+        break
+    yield answer
+    task.cancel()
+
+
+async def test(port, webhook_answer, http_client):
+    response = await http_client.post(
+        'http://127.0.0.1:{0}/webhook'.format(port),
+        json={'update_id': 1},
+        headers={'X-Telegram-Bot-Api-Secret-Token': 'secret'},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {'method': 'sendMessage'}
+    assert webhook_answer.updates == [{'update_id': 1}]
+
+
+async def test_keep_alive(port, webhook_answer, http_client):
+    for update_id in range(3):
+        await http_client.post(
+            'http://127.0.0.1:{0}/webhook'.format(port),
+            json={'update_id': update_id},
+            headers={'X-Telegram-Bot-Api-Secret-Token': 'secret'},
+        )
+
+    assert webhook_answer.updates == [{'update_id': 0}, {'update_id': 1}, {'update_id': 2}]
+
+
+@pytest.mark.parametrize('headers', [
+    {},
+    {'X-Telegram-Bot-Api-Secret-Token': 'invalid'},
+])
+async def test_invalid_secret(port, webhook_answer, http_client, headers):
+    response = await http_client.post(
+        'http://127.0.0.1:{0}/webhook'.format(port),
+        json={'update_id': 1},
+        headers=headers,
+    )
+
+    assert response.status_code == 401
+    assert webhook_answer.updates == []
+
+
+async def test_get(port, webhook_answer, http_client):
+    response = await http_client.get('http://127.0.0.1:{0}/webhook'.format(port))
+
+    assert response.status_code == 405
+
+
+@pytest.mark.parametrize('path', ['/', '/other', '/webhook/other'])
+async def test_unknown_path(port, webhook_answer, http_client, path):
+    response = await http_client.post(
+        'http://127.0.0.1:{0}{1}'.format(port, path),
+        json={'update_id': 1},
+        headers={'X-Telegram-Bot-Api-Secret-Token': 'secret'},
+    )
+
+    assert response.status_code == 404
+    assert webhook_answer.updates == []
+
+
+async def test_query_string(port, webhook_answer, http_client):
+    response = await http_client.post(
+        'http://127.0.0.1:{0}/webhook?param=1'.format(port),
+        json={'update_id': 1},
+        headers={'X-Telegram-Bot-Api-Secret-Token': 'secret'},
+    )
+
+    assert response.status_code == 200
+
+
+async def test_empty_secret(port):
+    with pytest.raises(InternalBotError):
+        await WebhookApp('127.0.0.1', port, '/webhook', '', FkWebhookAnswer(), 0.1, FkLogSink()).run()
+
+
+async def test_idle_connection_closed(port, webhook_answer):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b'POST /webhook HTTP/1.1\r\n')
+    await writer.drain()
+
+    assert await asyncio.wait_for(reader.read(), timeout=1) == b''
+    assert webhook_answer.updates == []
+
+    writer.close()
+
+
+async def test_negative_content_length(port, webhook_answer):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b'POST /webhook HTTP/1.1\r\nX-Telegram-Bot-Api-Secret-Token: secret\r\nContent-Length: -1\r\n\r\n{}')
+    await writer.drain()
+
+    assert (await asyncio.wait_for(reader.read(), timeout=1)).startswith(b'HTTP/1.1 400')
+    assert webhook_answer.updates == []
+
+    writer.close()
+
+
+async def test_body_not_read_without_secret(port, webhook_answer):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b'POST /webhook HTTP/1.1\r\nContent-Length: 1048576\r\n\r\n')
+    await writer.drain()
+
+    assert (await asyncio.wait_for(reader.read(), timeout=1)).startswith(b'HTTP/1.1 401')
+
+    writer.close()
+
+
+TOO_MANY_HEADERS = ''.join('X-Header-{0}: 1\r\n'.format(idx) for idx in range(200)).encode()
+TOO_LONG_HEADER = 'X-Header: {0}\r\n'.format('a' * 70000).encode()
+
+
+@pytest.mark.parametrize('raw_headers', [TOO_MANY_HEADERS, TOO_LONG_HEADER], ids=['too_many', 'too_long'])
+async def test_headers_too_large(port, webhook_answer, raw_headers):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b''.join([b'POST /webhook HTTP/1.1\r\n', raw_headers, b'\r\n']))
+    await writer.drain()
+
+    assert (await asyncio.wait_for(reader.read(), timeout=1)).startswith(b'HTTP/1.1 431')
+    assert webhook_answer.updates == []
+
+    writer.close()
@@ -35,7 +35,7 @@ async def test():
         FkAnswer(),
     ).build(FkUpdate.empty_ctor())
 
-    assert got[0].url == 'https://some.domain'
+    assert got[0].httpx_request().url == 'https://some.domain'
     assert len(got) == 1
 
 
@@ -32,4 +32,4 @@ async def test():
     ).build(FkUpdate.empty_ctor())
 
     assert len(got) == 2
-    assert [request.url for request in got] == ['https://some.domain', 'https://some.domain']
+    assert [request.httpx_request().url for request in got] == ['https://some.domain', 'https://some.domain']
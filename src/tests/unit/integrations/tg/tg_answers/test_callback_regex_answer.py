@@ -30,7 +30,7 @@ async def test():
         FkUpdate('{"callback_query":{"data":"target"}}'),
     )
 
-    assert got[0].url == 'https://some.domain'
+    assert got[0].httpx_request().url == 'https://some.domain'
 
 
 async def test_without_callback():
@@ -28,4 +28,4 @@ from integrations.tg.tg_answers.fk_answer import FkAnswer
 async def test():
     got = await TgChatAction(FkAnswer()).build(FkUpdate.empty_ctor())
 
-    assert got[0].url == 'https://some.domain/sendChatAction'
+    assert got[0].api_method() == 'sendChatAction'
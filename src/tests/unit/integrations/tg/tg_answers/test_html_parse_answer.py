@@ -28,4 +28,4 @@ from integrations.tg.tg_answers.fk_answer import FkAnswer
 async def test():
     got = await TgHtmlParseAnswer(FkAnswer()).build(FkUpdate.empty_ctor())
 
-    assert got[0].url == 'https://some.domain?parse_mode=html'
+    assert got[0].fields() == {'parse_mode': 'html'}
@@ -28,4 +28,4 @@ from integrations.tg.tg_answers.fk_answer import FkAnswer
 async def test():
     got = await TgKeyboardEditAnswer(FkAnswer()).build(FkUpdate.empty_ctor())
 
-    assert got[0].url == 'https://some.domain/editMessageReplyMarkup'
+    assert got[0].api_method() == 'editMessageReplyMarkup'
@@ -30,7 +30,7 @@ async def test():
         '{"latitude": 0, "longitude": 0}',
     ))
 
-    assert got[0].url == 'https://some.domain'
+    assert got[0].httpx_request().url == 'https://some.domain'
 
 
 async def test_not_match():
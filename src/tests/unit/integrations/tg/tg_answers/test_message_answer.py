@@ -28,4 +28,4 @@ from integrations.tg.tg_answers.fk_answer import FkAnswer
 async def test():
     got = await TgMessageAnswer(FkAnswer()).build(FkUpdate.empty_ctor())
 
-    assert got[0].url == 'https://some.domain/sendMessage'
+    assert got[0].httpx_request().url == 'https://some.domain/sendMessage'
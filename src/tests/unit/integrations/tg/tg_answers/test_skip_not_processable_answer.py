@@ -22,19 +22,18 @@
 
 from typing import override
 
-import httpx
-
 from app_types.fk_update import FkUpdate
 from app_types.update import Update
 from exceptions.internal_exceptions import NotProcessableUpdateError
 from integrations.tg.tg_answers import TgAnswer
 from integrations.tg.tg_answers.skip_not_processable import TgSkipNotProcessable
+from integrations.tg.tg_answers.tg_request import TgRequest
 
 
 class _NotProcessableAnswer(TgAnswer):
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         raise NotProcessableUpdateError
 
 
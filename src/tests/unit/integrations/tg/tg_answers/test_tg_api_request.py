@@ -0,0 +1,71 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import ujson
+
+from integrations.tg.tg_answers.tg_api_request import TgApiRequest
+
+
+def test():
+    got = (
+        TgApiRequest('https://api.telegram.org/botToken/')
+        .with_api_method('sendMessage')
+        .with_fields({'chat_id': 1, 'text': 'Ассаляму алейкум & hello'})
+        .httpx_request()
+    )
+
+    assert got.method == 'POST'
+    assert str(got.url) == 'https://api.telegram.org/botToken/sendMessage'
+    assert got.headers['Content-Type'] == 'application/json'
+    assert ujson.loads(got.content) == {'chat_id': 1, 'text': 'Ассаляму алейкум & hello'}
+    assert got.extensions['tg_chat_id'] == 1
+
+
+def test_fields_merged():
+    origin = TgApiRequest('https://some.domain').with_fields({'chat_id': 1})
+    got = origin.with_fields({'text': 'hello'})
+
+    assert got.fields() == {'chat_id': 1, 'text': 'hello'}
+
+
+def test_last_layer_wins():
+    origin = TgApiRequest('https://some.domain').with_fields({'text': 'hello'})
+    got = origin.with_fields({'text': 'world'})
+
+    assert got.fields() == {'text': 'world'}
+
+
+def test_without_method():
+    got = TgApiRequest('https://some.domain').httpx_request()
+
+    assert str(got.url) == 'https://some.domain'
+    assert not got.url.query
+    assert 'tg_chat_id' not in got.extensions
+
+
+def test_immutable():
+    origin = TgApiRequest('https://some.domain').with_fields({'chat_id': 1})
+    origin.with_api_method('sendMessage').with_fields({'text': 'hello'})
+    origin.fields()['text'] = 'hello'
+
+    assert not origin.api_method()
+    assert origin.fields() == {'chat_id': 1}
@@ -39,7 +39,7 @@ async def test():
         debug_mode=True,
     ).build(FkUpdate('{"update_id": 1}'))
 
-    assert got[0].url.params['text'] == '\n\n'.join([
+    assert got[0].fields()['text'] == '\n\n'.join([
         'text',
         '!----- DEBUG INFO -----!',
         'Update id: 1',
@@ -0,0 +1,47 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from integrations.tg.tg_answers.fk_answer import FkAnswer
+from services.answers.answer_route import AnswerRoute, RouteKind
+from services.answers.callback_literal_routes import CallbackLiteralRoutes
+
+
+@pytest.mark.parametrize(('callback_data', 'expected'), [
+    ('like(1)', {0}),
+    ('dislike(1)', {0}),
+    ('page(3)', {1}),
+    ('page(like)', {0}),
+    ('getAyat(1)', set()),
+])
+def test(callback_data, expected):
+    routes = CallbackLiteralRoutes.routes_ctor([
+        AnswerRoute(RouteKind.callback_query, FkAnswer(), '(like|dislike)'),
+        AnswerRoute(RouteKind.callback_query, FkAnswer(), r'page\(\d+\)'),
+        AnswerRoute(RouteKind.message_text, FkAnswer(), 'getAyat'),
+    ])
+
+    matched = routes.matched(callback_data)
+    got = {idx for idx in range(3) if idx in matched}
+
+    assert got == expected
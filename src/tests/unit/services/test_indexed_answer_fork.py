@@ -0,0 +1,222 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+# flake8: noqa: WPS202
+
+import itertools
+from typing import final, override
+
+import pytest
+import ujson
+
+from app_types.fk_log_sink import FkLogSink
+from app_types.update import Update
+from exceptions.internal_exceptions import NotProcessableUpdateError
+from integrations.tg.exceptions.update_parse_exceptions import InlineQueryNotFoundError
+from integrations.tg.inline_query import InlineQuery
+from integrations.tg.tg_answers import TgAnswer, TgAnswerFork, TgCallbackQueryRegexAnswer, TgMessageRegexAnswer
+from integrations.tg.tg_answers.fk_answer import FkAnswer
+from integrations.tg.tg_answers.tg_api_request import TgApiRequest
+from integrations.tg.tg_answers.tg_request import TgRequest
+from integrations.tg.update import TgUpdate
+from services.answers.answer_route import AnswerRoute, RouteKind
+from services.answers.indexed_answer_fork import IndexedAnswerFork
+from services.state_answer import StepAnswer
+from settings import BASE_DIR
+
+
+@final
+class EmptyAnswer(TgAnswer):
+
+    @override
+    async def build(self, update: Update) -> list[TgRequest]:
+        return []
+
+
+@final
+class FkInlineQueryAnswer(TgAnswer):
+
+    @override
+    async def build(self, update: Update) -> list[TgRequest]:
+        try:
+            str(InlineQuery(update))
+        except InlineQueryNotFoundError as err:
+            raise NotProcessableUpdateError from err
+        return [TgApiRequest('https://some.domain/inline')]
+
+
+# Повторяет порядок и выражения веток QuranbotAnswer
+ROUTES = (
+    (RouteKind.message_text, 'Подкасты', ''),
+    (RouteKind.message_text, r'/podcast\d+', ''),
+    (RouteKind.message_text, 'Время намаза', ''),
+    (RouteKind.message_text, '/skipped_prayers', ''),
+    (RouteKind.message_text, 'Избранное', ''),
+    (RouteKind.message_text, r'\d+:\d+', ''),
+    (RouteKind.message_text, 'Найти аят', ''),
+    (RouteKind.message_text, 'Поменять город', ''),
+    (RouteKind.message_text, '/start', ''),
+    (RouteKind.message_text, '/status', ''),
+    (RouteKind.message_text, '/help', ''),
+    (RouteKind.any_update, '', 'ayat_search'),
+    (RouteKind.callback_query, '(mark_readed|mark_not_readed)', ''),
+    (RouteKind.callback_query, '(like|dislike)', ''),
+    (RouteKind.callback_query, 'getAyat', ''),
+    (RouteKind.callback_query, 'decr', ''),
+    (RouteKind.callback_query, 'getSAyat', 'ayat_search'),
+    (RouteKind.any_update, '', 'city_search'),
+    (RouteKind.callback_query, 'getFAyat', ''),
+    (RouteKind.callback_query, '(addToFavor|removeFromFavor)', ''),
+    (RouteKind.callback_query, r'page\(\d+\)', ''),
+    (RouteKind.inline_query, '', ''),
+)
+EMPTY_ROUTES = frozenset((r'\d+:\d+', 'getAyat'))
+
+
+def _answer(idx: int, route: tuple[RouteKind, str, str]) -> TgAnswer:
+    if route[0] == RouteKind.inline_query:
+        return FkInlineQueryAnswer()
+    if route[1] in EMPTY_ROUTES:
+        return EmptyAnswer()
+    return FkAnswer('https://some.domain/{0}'.format(idx))
+
+
+def _old_branch(idx, route, redis) -> TgAnswer:
+    kind, pattern, step = route
+    branch = _answer(idx, route)
+    if kind == RouteKind.message_text:
+        branch = TgMessageRegexAnswer(pattern, branch)
+    elif kind == RouteKind.callback_query:
+        branch = TgCallbackQueryRegexAnswer(pattern, branch)
+    if step:
+        return StepAnswer(step, branch, redis, FkLogSink())
+    return branch
+
+
+def _route(idx, route) -> AnswerRoute:
+    kind, pattern, step = route
+    answer_route = AnswerRoute(kind, _answer(idx, route), pattern)
+    if step:
+        return AnswerRoute.step_ctor(step, answer_route)
+    return answer_route
+
+
+async def _answer_url(answer: TgAnswer, update: Update) -> str:
+    try:
+        return str((await answer.build(update))[0].httpx_request().url)
+    except NotProcessableUpdateError:
+        return 'not processable'
+
+
+def _message(text: str) -> dict:
+    message = {'message_id': 1, 'chat': {'id': 1}, 'date': 1, 'text': text}
+    return {'update_id': 1, 'message': message}
+
+
+def _callback(callback_data: str) -> dict:
+    return {
+        'update_id': 1,
+        'callback_query': {
+            'id': '1',
+            'from': {'id': 1},
+            'message': {'message_id': 1, 'chat': {'id': 1}, 'date': 1, 'text': 'Подкасты'},
+            'data': callback_data,
+        },
+    }
+
+
+MESSAGE_TEXTS = (
+    'Подкасты',
+    '/podcast12',
+    '/podcast',
+    'Время намаза',
+    '/skipped_prayers',
+    'Избранное',
+    '2:255',
+    'Найти аят',
+    'Найти аят 2:255',
+    'Поменять город',
+    '/start',
+    '/start 123',
+    '/status',
+    '/help',
+    'Казань',
+    'многострочный\nтекст /help',
+    '',
+)
+CALLBACK_DATAS = (
+    'mark_readed(1)',
+    'mark_not_readed(2)',
+    'like(1)',
+    'dislike(1)',
+    'getAyat(1)',
+    'decr(fajr)',
+    'getSAyat(1)',
+    'getFAyat(1)',
+    'addToFavor(1)',
+    'removeFromFavor(1)',
+    'page(3)',
+    'unknown(1)',
+    'page(like)',
+    'x(getAyat)',
+    'getAyat',
+)
+INLINE_QUERY = {'id': '1', 'from': {'id': 1}, 'query': 'Каз', 'offset': ''}
+EDITED_MESSAGE = {'message_id': 1, 'chat': {'id': 1}, 'date': 1, 'text': '/start'}
+UPDATES = (
+    *[_message(text) for text in MESSAGE_TEXTS],
+    *[_callback(callback_data) for callback_data in CALLBACK_DATAS],
+    {'update_id': 1, 'inline_query': INLINE_QUERY},
+    ujson.loads((BASE_DIR / 'tests' / 'fixtures' / 'coordinates.json').read_text()),
+    {'update_id': 1, 'edited_message': EDITED_MESSAGE},
+)
+
+
+@pytest.mark.parametrize('step', ['', 'nothing', 'ayat_search', 'city_search'])
+@pytest.mark.parametrize('update_dict', UPDATES)
+async def test_same_as_fork(fake_redis, step, update_dict):
+    if step:
+        await fake_redis.set('1:step', step)
+        await fake_redis.set('358610865:step', step)
+    update = TgUpdate(update_dict)
+    old_branches = [_old_branch(idx, route, fake_redis) for idx, route in enumerate(ROUTES)]
+    routes = itertools.starmap(_route, enumerate(ROUTES))
+    fork = TgAnswerFork(FkLogSink(), *old_branches)
+    indexed_fork = IndexedAnswerFork.routes_ctor(fake_redis, FkLogSink(), *routes)
+
+    assert await _answer_url(indexed_fork, update) == await _answer_url(fork, update)
+
+
+async def test_one_state_query(fake_redis):
+    await fake_redis.set('1:step', 'city_search')
+    logger = FkLogSink()
+
+    got = await IndexedAnswerFork.routes_ctor(
+        fake_redis,
+        logger,
+        AnswerRoute.step_ctor('ayat_search', AnswerRoute.any_update_ctor(FkAnswer())),
+        AnswerRoute.step_ctor('nothing', AnswerRoute.any_update_ctor(FkAnswer())),
+        AnswerRoute.step_ctor('city_search', AnswerRoute.any_update_ctor(FkAnswer('https://some.domain/city'))),
+    ).build(TgUpdate(_message('Казань')))
+
+    assert str(got[0].httpx_request().url) == 'https://some.domain/city'
+    assert logger.stack.count('INFO User state: city_search') == 1
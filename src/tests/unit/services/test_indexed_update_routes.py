@@ -0,0 +1,48 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from app_types.parsed_tg_update import ParsedTgUpdate
+from integrations.tg.tg_answers.fk_answer import FkAnswer
+from services.answers.answer_route import AnswerRoute, RouteKind
+from services.answers.indexed_update_routes import IndexedUpdateRoutes
+
+ROUTES = (
+    AnswerRoute(RouteKind.message_text, FkAnswer(), '/start'),
+    AnswerRoute(RouteKind.any_update, FkAnswer(), ''),
+    AnswerRoute(RouteKind.callback_query, FkAnswer(), '(like|dislike)'),
+    AnswerRoute(RouteKind.inline_query, FkAnswer(), ''),
+    AnswerRoute(RouteKind.message_text, FkAnswer(), 'help'),
+)
+
+
+@pytest.mark.parametrize(('parsed_update', 'expected'), [
+    (ParsedTgUpdate(message_text='/start /help'), [0, 1, 4]),
+    (ParsedTgUpdate(message_text='Казань'), [1]),
+    (ParsedTgUpdate(callback_query_data='like(1)', is_callback_query=True), [1, 2]),
+    (ParsedTgUpdate(is_callback_query=True), [1]),
+    (ParsedTgUpdate(inline_query_id='1'), [1, 3]),
+    (ParsedTgUpdate(), [1]),
+])
+def test(parsed_update, expected):
+    assert list(IndexedUpdateRoutes.routes_ctor(ROUTES).candidates(parsed_update)) == expected
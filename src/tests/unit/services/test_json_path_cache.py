@@ -0,0 +1,122 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import jsonpath_ng
+import pytest
+
+from services.dotted_json_path import DottedJsonPath
+from services.json_path_cache import JsonPathCache
+from services.json_path_value import JsonPathValue
+from services.match_many_json_path import MatchManyJsonPath
+from services.ng_json_path import NgJsonPath
+
+
+@pytest.fixture()
+def document() -> dict:
+    return {
+        'update_id': 1,
+        'callback_query': {
+            'from': {'id': 2},
+            'message': {'chat': {'id': 3}, 'text': 'inner', 'entities': [{'text': 'entity'}]},
+            'data': 'like(1)',
+        },
+        'message': {'text': 'outer', 'caption': None},
+    }
+
+
+@pytest.mark.parametrize('json_path', [
+    '$.update_id',
+    '$.message.text',
+    '$.message.caption',
+    '$..message.text',
+    '$..text',
+    '$..chat.id',
+    '$..from.id',
+    '$..callback_query.data',
+    '$..[latitude]',
+    '$.not_exists',
+    '$..not.exists',
+])
+def test_same_as_jsonpath_ng(document, json_path):
+    match = jsonpath_ng.parse(json_path).find(document)
+    json_path_value: JsonPathValue[object] = JsonPathValue(document, json_path, JsonPathCache(max_size=10))
+
+    if match:
+        assert json_path_value.evaluate() == match[0].value
+    else:
+        with pytest.raises(ValueError):  # noqa: PT011
+            json_path_value.evaluate()
+
+
+@pytest.mark.parametrize(('json_path', 'expected'), [
+    ('$.message.text', DottedJsonPath),
+    ('$..chat.id', DottedJsonPath),
+    ('$..[latitude]', NgJsonPath),
+    ('$.entities[0].text', NgJsonPath),
+])
+def test_fast_path(json_path, expected):
+    assert isinstance(JsonPathCache(max_size=10).expression(json_path), expected)
+
+
+def test_hits_and_misses():
+    cache = JsonPathCache(max_size=10)
+
+    first = cache.expression('$..chat.id')
+    second = cache.expression('$..chat.id')
+    cache.expression('$..from.id')
+
+    assert first is second
+    assert cache.hits() == 1
+    assert cache.misses() == 2
+
+
+def test_bounded():
+    cache = JsonPathCache(max_size=2)
+
+    cache.expression('$.a')
+    cache.expression('$.b')
+    cache.expression('$.a')
+    cache.expression('$.c')
+    cache.expression('$.a')
+    cache.expression('$.b')
+
+    assert cache.hits() == 2
+    assert cache.misses() == 4
+
+
+def test_match_many(document):
+    got: int = MatchManyJsonPath(document, ('$..not.exists', '$..from.id'), JsonPathCache(max_size=10)).evaluate()
+
+    assert got == 2
+
+
+@pytest.mark.parametrize('json_path', [
+    '$.message.text',
+    '$..text',
+    '$..chat.id',
+    '$..not.exists',
+    '$..[latitude]',
+])
+def test_matches_same_as_jsonpath_ng(document, json_path):
+    got = JsonPathCache(max_size=10).expression(json_path).matches(document)
+
+    assert got == [node.value for node in jsonpath_ng.parse(json_path).find(document)]
@@ -20,10 +20,42 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
+from typing import final, override
+
+import ujson
+
 from app_types.fk_update import FkUpdate
+from app_types.update import Update
 from integrations.tg.fk_sendable import FkSendable
+from integrations.tg.sendable import Sendable
 from services.logged_answer import LoggedAnswer
 from srv.events.fk_sink import FkSink
+from srv.events.sink import Sink
+
+
+@final
+class JournalSendable(Sendable):
+
+    def __init__(self, journal: list[str]) -> None:
+        self._journal = journal
+
+    @override
+    async def send(self, update: Update) -> list[dict]:
+        self._journal.append('reply')
+        return [{'ok': True, 'result': {'message_id': 2}}]
+
+
+@final
+class JournalSink(Sink):
+
+    def __init__(self, journal: list[str]) -> None:
+        self._journal = journal
+        self.events: list[dict] = []
+
+    @override
+    async def send(self, queue_name: str, event_data: dict, event_name: str, version: int) -> None:
+        self._journal.append(event_name)
+        self.events.append(event_data)
 
 
 async def test():
@@ -33,3 +65,16 @@ async def test():
     ).send(FkUpdate.empty_ctor())
 
     assert got == []
+
+
+async def test_reply_before_log() -> None:
+    journal: list[str] = []
+    sink = JournalSink(journal)
+    await LoggedAnswer(
+        JournalSendable(journal),
+        sink,
+    ).send(FkUpdate(ujson.dumps({'message': {'message_id': 1, 'text': 'hello'}})))
+    messages = sink.events[1]['messages']
+
+    assert journal == ['reply', 'Messages.Created', 'Messages.Created']
+    assert messages[0]['trigger_message_id'] == 1
@@ -0,0 +1,47 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from integrations.tg.tg_answers.fk_answer import FkAnswer
+from services.answers.answer_route import AnswerRoute, RouteKind
+from services.answers.message_regex_routes import MessageRegexRoutes
+
+
+@pytest.mark.parametrize(('message_text', 'expected'), [
+    ('/start', {0}),
+    ('Найти аят 2:255', {1, 2}),
+    ('многострочный\nтекст 2:255', {2}),
+    ('Казань', set()),
+])
+def test(message_text, expected):
+    routes = MessageRegexRoutes.routes_ctor([
+        AnswerRoute(RouteKind.message_text, FkAnswer(), '/start'),
+        AnswerRoute(RouteKind.message_text, FkAnswer(), 'Найти аят'),
+        AnswerRoute(RouteKind.message_text, FkAnswer(), r'\d+:\d+'),
+        AnswerRoute(RouteKind.callback_query, FkAnswer(), 'start'),
+    ])
+
+    matched = routes.matched(message_text)
+    got = {idx for idx in range(4) if idx in matched}
+
+    assert got == expected
@@ -0,0 +1,48 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import contextlib
+
+from app_types.fk_log_sink import FkLogSink
+from services.periodic_stats_log import PeriodicStatsLog
+
+
+def test_write():
+    logger = FkLogSink()
+    PeriodicStatsLog(['Queue updates-log: depth 0, dropped 0', 'Cache jsonpath: 1 hits, 2 misses'], 60, logger).write()
+
+    assert logger.stack == ['INFO Queue updates-log: depth 0, dropped 0', 'INFO Cache jsonpath: 1 hits, 2 misses']
+
+
+async def test_write_periodically():
+    logger = FkLogSink()
+    writing = asyncio.create_task(
+        PeriodicStatsLog(['Cache jsonpath: 1 hits, 2 misses'], 0.01, logger).write_periodically(),
+    )
+    await asyncio.sleep(0.05)
+    writing.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await writing
+
+    assert len(logger.stack) > 1
+    assert set(logger.stack) == {'INFO Cache jsonpath: 1 hits, 2 misses'}
@@ -0,0 +1,49 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+from app_types.fk_log_sink import FkLogSink
+from app_types.runable import Runable
+from services.periodic_stats_log import PeriodicStatsLog
+from services.stats_logged_app import StatsLoggedApp
+
+
+@final
+class FkApp(Runable):
+
+    def __init__(self, logger: FkLogSink) -> None:
+        self._logger = logger
+
+    @override
+    async def run(self) -> None:
+        self._logger.info('App run')
+
+
+async def test():
+    logger = FkLogSink()
+    await StatsLoggedApp(
+        PeriodicStatsLog(['Queue updates-log: depth 0, dropped 0'], 60, logger),
+        FkApp(logger),
+    ).run()
+
+    assert logger.stack == ['INFO App run', 'INFO Queue updates-log: depth 0, dropped 0']
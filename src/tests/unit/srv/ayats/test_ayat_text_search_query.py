@@ -42,3 +42,9 @@ async def test_write(fake_redis):
     await AyatTextSearchQuery(fake_redis, 84395, FkLogSink()).write('query')
 
     assert await fake_redis.get('84395:ayat_search_query') == b'query'
+
+
+async def test_write_normalized(fake_redis):
+    await AyatTextSearchQuery(fake_redis, 84395, FkLogSink()).write('  Милостивый \n Милосердный ')
+
+    assert await fake_redis.get('84395:ayat_search_query') == 'Милостивый Милосердный'.encode()
@@ -0,0 +1,84 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import pytest
+
+from srv.ayats.ayats_search import AyatsSearch
+from srv.ayats.cached_ayats_search import CachedAyatsSearch
+from srv.ayats.found_ayats import FoundAyats
+from srv.ayats.ranked_found_ayats import RankedFoundAyats
+
+
+@final
+class JournalAyatsSearch(AyatsSearch):
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    @override
+    async def found(self, query: str) -> FoundAyats:
+        self.queries.append(query)
+        return RankedFoundAyats.ids_ctor([len(self.queries)])
+
+
+@pytest.fixture()
+def origin():
+    return JournalAyatsSearch()
+
+
+async def test_cached(origin):
+    search = CachedAyatsSearch(origin, 10, 60)
+
+    first = await search.found('Милостивый  милосердный')
+    second = await search.found(' милостивый Милосердный')
+
+    assert first == second
+    assert origin.queries == ['милостивый милосердный']
+
+
+async def test_expired(origin):
+    search = CachedAyatsSearch(origin, 10, 0)
+    await search.found('query')
+    await search.found('query')
+
+    assert origin.queries == ['query', 'query']
+
+
+async def test_evict_least_recently_used(origin):
+    search = CachedAyatsSearch(origin, 2, 60)
+    for query in ('first', 'second', 'first', 'third', 'first', 'second'):
+        await search.found(query)
+
+    assert origin.queries == ['first', 'second', 'third', 'second']
+
+
+async def test_invalidate(origin):
+    search = CachedAyatsSearch(origin, 10, 60)
+    await search.found('query')
+    await search.invalidate('233f6d8a-1b7d-4a0e-a7ff-6c0dd6ef0ba9')
+    await search.found('query')
+    await search.flush()
+    await search.found('query')
+
+    assert origin.queries == ['query', 'query', 'query']
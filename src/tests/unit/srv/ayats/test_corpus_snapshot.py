@@ -0,0 +1,57 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from exceptions.content_exceptions import AyatNotFoundError
+from srv.ayats.ayat_window import AyatWindow
+from srv.ayats.corpus_snapshot import CorpusSnapshot
+from srv.ayats.loaded_ayat_record import LoadedAyatRecord
+
+
+@pytest.fixture()
+def snapshot():
+    return CorpusSnapshot.records_ctor({
+        ayat_id: LoadedAyatRecord(1, '/link', str(ayat_id), '', '', '', '', '')
+        for ayat_id in (3, 1, 2, 5)
+    })
+
+
+@pytest.mark.parametrize(('ayat_id', 'expected'), [
+    (1, AyatWindow(None, 2, 1, 4)),
+    (2, AyatWindow(1, 3, 2, 4)),
+    (3, AyatWindow(2, 5, 3, 4)),
+    (5, AyatWindow(3, None, 4, 4)),
+])
+def test_window(snapshot, ayat_id, expected):
+    assert snapshot.window(ayat_id) == expected
+
+
+@pytest.mark.parametrize('ayat_id', [0, 4, 6])
+def test_window_not_found(snapshot, ayat_id):
+    with pytest.raises(AyatNotFoundError):
+        snapshot.window(ayat_id)
+
+
+def test_ayat_not_found(snapshot):
+    with pytest.raises(AyatNotFoundError):
+        snapshot.ayat(4)
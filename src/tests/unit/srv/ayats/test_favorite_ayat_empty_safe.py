@@ -22,19 +22,18 @@
 
 from typing import override
 
-import httpx
-
 from app_types.fk_update import FkUpdate
 from app_types.update import Update
 from integrations.tg.tg_answers import TgAnswer
 from integrations.tg.tg_answers.fk_answer import FkAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.ayats.favorite_ayat_empty_safe import FavoriteAyatEmptySafeAnswer
 
 
 class IndexErrorAnswer(TgAnswer):
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         raise IndexError
 
 
@@ -44,7 +43,7 @@ async def test():
         FkAnswer('http://error-way.com'),
     ).build(FkUpdate.empty_ctor())
 
-    assert str(got[0].url) == 'http://right-way.com'
+    assert str(got[0].httpx_request().url) == 'http://right-way.com'
 
 
 async def test_error():
@@ -53,4 +52,4 @@ async def test_error():
         FkAnswer(),
     ).build(FkUpdate.empty_ctor())
 
-    assert str(got[0].url) == 'https://some.domain'
+    assert str(got[0].httpx_request().url) == 'https://some.domain'
@@ -20,9 +20,8 @@
 # OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
 # OR OTHER DEALINGS IN THE SOFTWARE.
 
-import urllib
-
 from app_types.fk_update import FkUpdate
+from integrations.tg.tg_answers import TgTextAnswer
 from integrations.tg.tg_answers.fk_answer import FkAnswer
 from srv.ayats.fk_text_search_query import FkTextSearchQuery
 from srv.ayats.highlighted_search_answer import HighlightedSearchAnswer
@@ -30,14 +29,12 @@ from srv.ayats.highlighted_search_answer import HighlightedSearchAnswer
 
 async def test():
     got = await HighlightedSearchAnswer(
-        FkAnswer('https://some.domain?text=How to write tests in python?'),
+        TgTextAnswer.str_ctor(FkAnswer(), 'How to write tests in python?'),
         FkTextSearchQuery('How to write tests'),
     ).build(FkUpdate.empty_ctor())
 
     assert len(got) == 1
-    assert urllib.parse.unquote(
-        str(got[0].url),
-    ) == 'https://some.domain?text=<b>How to write tests</b> in python?'
+    assert got[0].fields() == {'text': '<b>How to write tests</b> in python?'}
 
 
 async def test_key_error():
@@ -47,17 +44,13 @@ async def test_key_error():
     ).build(FkUpdate.empty_ctor())
 
     assert len(got) == 1
-    assert urllib.parse.unquote(
-        str(got[0].url),
-    ) == 'https://some.domain'
+    assert not got[0].fields()
 
 
 async def test_other_text():
     got = await HighlightedSearchAnswer(
-        FkAnswer('https://some.domain?text=How to write documentation'), FkTextSearchQuery('How to write tests'),
+        TgTextAnswer.str_ctor(FkAnswer(), 'How to write documentation'), FkTextSearchQuery('How to write tests'),
     ).build(FkUpdate.empty_ctor())
 
     assert len(got) == 1
-    assert urllib.parse.unquote(
-        str(got[0].url),
-    ) == 'https://some.domain?text=How to write documentation'
+    assert got[0].fields() == {'text': 'How to write documentation'}
@@ -0,0 +1,53 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from exceptions.content_exceptions import AyatNotFoundError
+from srv.ayats.ayat_window import AyatWindow
+from srv.ayats.ranked_found_ayats import RankedFoundAyats
+
+
+@pytest.fixture()
+def found_ayats():
+    return RankedFoundAyats.ids_ctor([7, 2, 10, 4])
+
+
+@pytest.mark.parametrize(('ayat_id', 'expected'), [
+    (7, AyatWindow(None, 2, 1, 4)),
+    (2, AyatWindow(7, 10, 2, 4)),
+    (10, AyatWindow(2, 4, 3, 4)),
+    (4, AyatWindow(10, None, 4, 4)),
+])
+def test_window(found_ayats, ayat_id, expected):
+    assert found_ayats.window(ayat_id) == expected
+
+
+@pytest.mark.parametrize('ayat_id', [1, 5, 11])
+def test_window_not_found(found_ayats, ayat_id):
+    with pytest.raises(AyatNotFoundError):
+        found_ayats.window(ayat_id)
+
+
+def test_empty():
+    with pytest.raises(AyatNotFoundError):
+        RankedFoundAyats.ids_ctor([]).window(1)
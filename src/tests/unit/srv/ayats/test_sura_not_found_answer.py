@@ -46,7 +46,7 @@ async def test_normal_flow():
         FkAnswer('https://error.flow'),
     ).build(FkUpdate.empty_ctor())
 
-    assert got[0].url == 'https://normal.flow'
+    assert got[0].httpx_request().url == 'https://normal.flow'
 
 
 async def test_error_flow():
@@ -55,4 +55,4 @@ async def test_error_flow():
         FkAnswer('https://error.flow'),
     ).build(FkUpdate.empty_ctor())
 
-    assert 'error.flow' in str(got[0].url)
+    assert 'error.flow' in str(got[0].httpx_request().url)
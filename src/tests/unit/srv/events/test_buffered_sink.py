@@ -0,0 +1,93 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from collections.abc import Sequence
+from typing import TypeAlias, final, override
+
+from app_types.fk_log_sink import FkLogSink
+from srv.events.batch_sink import BatchSink
+from srv.events.buffered_sink import BufferedSink
+
+Batch: TypeAlias = tuple[str, list[dict]]
+
+
+@final
+class FkBatchSink(BatchSink):
+
+    def __init__(self) -> None:
+        self.batches: list[Batch] = []
+
+    @override
+    async def send_batch(self, queue_name: str, events_data: Sequence[dict], event_name: str, version: int) -> None:
+        self.batches.append((event_name, list(events_data)))
+
+
+def _messages(*message_ids: int) -> dict:
+    return {'messages': [{'message_id': message_id} for message_id in message_ids]}
+
+
+async def test_flush_by_size() -> None:
+    origin = FkBatchSink()
+    sink = BufferedSink(origin, 3, 60, FkLogSink())
+    await sink.send('queue', _messages(1), 'Messages.Created', 1)
+    await sink.send('queue', _messages(2), 'Messages.Created', 1)
+
+    assert origin.batches == []
+
+    await sink.send('queue', _messages(3), 'Messages.Created', 1)
+
+    assert origin.batches == [('Messages.Created', [_messages(1, 2, 3)])]
+
+
+async def test_flush_by_time() -> None:
+    origin = FkBatchSink()
+    sink = BufferedSink(origin, 100, 0.01, FkLogSink())
+    await sink.send('queue', _messages(1), 'Messages.Created', 1)
+    await sink.send('queue', {'json': '{}'}, 'Button.Pushed', 1)  # noqa: P103 it is empty json
+    await asyncio.sleep(0.05)
+
+    assert origin.batches == [
+        ('Messages.Created', [_messages(1)]),
+        ('Button.Pushed', [{'json': '{}'}]),  # noqa: P103 it is empty json
+    ]
+
+
+async def test_flush_on_shutdown() -> None:
+    origin = FkBatchSink()
+    sink = BufferedSink(origin, 100, 60, FkLogSink())
+    await sink.send('queue', _messages(1, 2), 'Messages.Created', 1)
+    await sink.send('queue', _messages(), 'Messages.Created', 1)
+    await sink.flush()
+    await sink.flush()
+
+    assert origin.batches == [('Messages.Created', [_messages(1, 2)])]
+
+
+async def test_large_event_split() -> None:
+    origin = FkBatchSink()
+    sink = BufferedSink(origin, 2, 60, FkLogSink())
+    await sink.send('queue', _messages(1, 2, 3), 'Messages.Created', 1)
+
+    assert origin.batches == [
+        ('Messages.Created', [_messages(1, 2), _messages(3)]),
+    ]
@@ -0,0 +1,111 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+# flake8: noqa: WPS202
+
+from collections.abc import Callable
+from importlib.resources import files
+from pathlib import Path
+
+import pytest
+from quranbot_schema_registry import validate_schema
+
+from srv.events.cached_schema_validation import CachedSchemaValidation
+
+
+@pytest.fixture()
+def event() -> dict:
+    return {
+        'event_id': 'e7b8c1d2-5a4f-4c3e-9b1a-2f6d8e0c4a71',
+        'event_version': 1,
+        'event_name': 'Messages.Created',
+        'event_time': '1700000000',
+        'producer': 'quranbot',
+        'data': {
+            'messages': [{
+                'message_json': '{}',  # noqa: P103 it is empty json
+                'is_unknown': False,
+                'trigger_message_id': None,
+                'trigger_callback_id': None,
+                'mailing_id': None,
+            }],
+        },
+    }
+
+
+def test_valid(event: dict) -> None:
+    validation = CachedSchemaValidation()
+    validation.validate(event, 'Messages.Created', 1)
+    validation.validate(event, 'Messages.Created', 1)
+    validate_schema(event, 'Messages.Created', 1)
+
+
+def test_invalid(event: dict) -> None:
+    del event['data']['messages']  # noqa: WPS420
+    with pytest.raises(TypeError):
+        validate_schema(event, 'Messages.Created', 1)
+    with pytest.raises(TypeError, match='messages'):
+        CachedSchemaValidation().validate(event, 'Messages.Created', 1)
+
+
+def test_not_found(event: dict) -> None:
+    with pytest.raises(TypeError, match='Schema file for event Messages.Created version: 99 not found'):
+        CachedSchemaValidation().validate(event, 'Messages.Created', 99)
+
+
+def _shipped_schemas() -> list[tuple[str, int]]:
+    schemas_dir = Path(str(files('quranbot_schema_registry').joinpath('schemas')))
+    return sorted(
+        (
+            '.'.join(
+                ''.join(word.capitalize() for word in name_part.split('_'))
+                for name_part in schema_path.parent.relative_to(schemas_dir).parts
+            ),
+            int(schema_path.stem),
+        )
+        for schema_path in schemas_dir.rglob('*.json')
+    )
+
+
+def _error(validation: Callable[[], None]) -> str:
+    try:
+        validation()
+    except TypeError as err:
+        return str(err)
+    return ''
+
+
+def test_shipped_schemas_collected() -> None:
+    assert ('Messages.Created', 1) in _shipped_schemas()
+
+
+@pytest.mark.parametrize(('event_name', 'version'), _shipped_schemas())
+@pytest.mark.parametrize('event', [
+    {},
+    {'event_id': 'e7b8c1d2-5a4f-4c3e-9b1a-2f6d8e0c4a71', 'event_time': '1700000000', 'producer': 'quranbot'},
+])
+def test_same_as_registry(event: dict, event_name: str, version: int) -> None:
+    registry_error = _error(lambda: validate_schema(event, event_name, version))
+    cached_error = _error(lambda: CachedSchemaValidation().validate(event, event_name, version))
+
+    assert 'not found' not in cached_error
+    assert bool(cached_error) == bool(registry_error)
@@ -0,0 +1,90 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import cast, final, override
+
+import aio_pika
+import ujson
+from aio_pika.abc import AbstractChannel
+from eljson.json_doc import JsonDoc
+
+from app_types.fk_log_sink import FkLogSink
+from srv.events.amqp_channels import AmqpChannels
+from srv.events.dead_letter_event import DeadLetterEvent
+
+
+@final
+class FkExchange:
+
+    def __init__(self, calls: list[tuple]) -> None:
+        self._calls = calls
+
+    async def publish(self, message: aio_pika.Message, routing_key: str) -> None:
+        body = ujson.loads(message.body)
+        self._calls.append(('publish', routing_key, body, message.delivery_mode))
+
+
+@final
+class FkChannel:
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.default_exchange = FkExchange(self.calls)
+
+    async def declare_queue(self, name: str, *, durable: bool) -> None:
+        self.calls.append(('declare', name, durable))
+
+
+@final
+class FkAmqpChannels(AmqpChannels):
+
+    def __init__(self) -> None:
+        self.fk_channel = FkChannel()
+
+    @override
+    @asynccontextmanager
+    async def channel(self) -> AsyncIterator[AbstractChannel]:
+        yield cast(AbstractChannel, self.fk_channel)
+
+    @override
+    async def close(self) -> None:
+        """Закрыть соединение."""
+
+
+async def test() -> None:
+    channels = FkAmqpChannels()
+    event = DeadLetterEvent(channels, 'dead-letter-events', FkLogSink())
+
+    await event.process(JsonDoc({'event_name': 'Unknown.Event', 'event_version': 1}))
+
+    assert channels.fk_channel.calls == [
+        ('declare', 'dead-letter-events', True),
+        (
+            'publish',
+            'dead-letter-events',
+            {'event_name': 'Unknown.Event', 'event_version': 1},
+            aio_pika.DeliveryMode.PERSISTENT,
+        ),
+    ]
+    assert event.count() == 1
@@ -0,0 +1,108 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import pytest
+from eljson.exceptions import NodeNotFoundError
+from eljson.json import Json
+from eljson.json_doc import JsonDoc
+
+from services.json_path_cache import JsonPathCache
+from srv.events.compiled_paths_json import CompiledPathsJson
+from srv.events.event_route import EventRoute
+from srv.events.event_routes import EventRoutes
+from srv.events.recieved_event import ReceivedEvent
+
+JSON_PATHS = JsonPathCache(max_size=10)
+
+
+@final
+class FkEvent(ReceivedEvent):
+
+    def __init__(self) -> None:
+        self.processed: list[str] = []
+
+    @override
+    async def process(self, json_doc: Json) -> None:
+        self.processed.append(json_doc.path('$.event_id')[0])
+
+
+def _event(name: str, version: int) -> Json:
+    return CompiledPathsJson(
+        {
+            'event_id': '{0}_{1}'.format(name, version),
+            'event_name': name,
+            'event_version': version,
+        },
+        JSON_PATHS,
+    )
+
+
+async def test_route() -> None:
+    ayat_changed, messages_deleted, dead_letter = FkEvent(), FkEvent(), FkEvent()
+    routes = EventRoutes.routes_ctor(
+        dead_letter,
+        EventRoute('Ayat.Changed', 1, ayat_changed),
+        EventRoute('Messages.Deleted', 2, messages_deleted),
+    )
+    await routes.process(_event('Messages.Deleted', 2))
+    await routes.process(_event('Ayat.Changed', 1))
+
+    assert ayat_changed.processed == ['Ayat.Changed_1']
+    assert messages_deleted.processed == ['Messages.Deleted_2']
+    assert dead_letter.processed == []
+
+
+@pytest.mark.parametrize(('name', 'version'), [('Ayat.Changed', 2), ('Unknown', 1)])
+async def test_dead_letter(name: str, version: int) -> None:
+    dead_letter = FkEvent()
+    routes = EventRoutes.routes_ctor(dead_letter, EventRoute('Ayat.Changed', 1, FkEvent()))
+    await routes.process(_event(name, version))
+
+    assert dead_letter.processed == ['{0}_{1}'.format(name, version)]
+
+
+async def test_same_key_routes() -> None:
+    first, second = FkEvent(), FkEvent()
+    await EventRoutes.routes_ctor(
+        FkEvent(),
+        EventRoute('Ayat.Changed', 1, first),
+        EventRoute('Ayat.Changed', 1, second),
+    ).process(_event('Ayat.Changed', 1))
+
+    assert first.processed == second.processed == ['Ayat.Changed_1']
+
+
+@pytest.mark.parametrize('query', ['$.event_name', '$.data.ids[*]', '$', '$..id'])
+def test_compiled_paths_json(query: str) -> None:
+    nested = [{'id': 3}, {'id': 4}]
+    event_data = {'ids': [1, 2], 'items': nested}
+    body = {'event_name': 'Messages.Deleted', 'data': event_data}
+    got = CompiledPathsJson(body, JSON_PATHS).path(query)
+
+    assert got == JsonDoc(body).path(query)
+
+
+def test_compiled_paths_json_not_found() -> None:
+    with pytest.raises(NodeNotFoundError):
+        CompiledPathsJson({}, JSON_PATHS).path('$.data')
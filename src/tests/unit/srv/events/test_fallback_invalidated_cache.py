@@ -0,0 +1,73 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+from app_types.fk_log_sink import FkLogSink
+from srv.events.fallback_invalidated_cache import FallbackInvalidatedCache
+from srv.events.invalidated_cache import InvalidatedCache
+
+
+@final
+class KeyFailedCache(InvalidatedCache):
+
+    def __init__(self) -> None:
+        self.flushes = 0
+
+    @override
+    async def invalidate(self, key: str) -> None:
+        raise ValueError
+
+    @override
+    async def flush(self) -> None:
+        self.flushes += 1
+
+
+@final
+class FailedCache(InvalidatedCache):
+
+    @override
+    async def invalidate(self, key: str) -> None:
+        raise ValueError
+
+    @override
+    async def flush(self) -> None:
+        raise ValueError
+
+
+async def test_flush_on_failed_invalidate():
+    logger = FkLogSink()
+    cache = KeyFailedCache()
+    await FallbackInvalidatedCache(cache, 'ayats', logger).invalidate('3067bdc4')
+
+    assert cache.flushes == 1
+    assert logger.stack == ['ERROR Fail on invalidate ayats, flush cache']
+
+
+async def test_failed_flush():
+    logger = FkLogSink()
+    await FallbackInvalidatedCache(FailedCache(), 'ayats', logger).invalidate('3067bdc4')
+
+    assert logger.stack == [
+        'ERROR Fail on invalidate ayats, flush cache',
+        'ERROR Fail on flush ayats',
+    ]
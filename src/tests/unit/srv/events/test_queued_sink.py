@@ -0,0 +1,93 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import asyncio
+from typing import final, override
+
+from app_types.fk_log_sink import FkLogSink
+from srv.events.queued_sink import QueuedSink
+from srv.events.sink import Sink
+
+
+@final
+class BlockedSink(Sink):
+
+    def __init__(self, release: asyncio.Event) -> None:
+        self._release = release
+        self.started = asyncio.Event()
+        self.events: list[str] = []
+
+    @override
+    async def send(self, queue_name: str, event_data: dict, event_name: str, version: int) -> None:
+        self.started.set()
+        await self._release.wait()
+        self.events.append(event_name)
+
+
+async def test_send_not_wait_origin() -> None:
+    release = asyncio.Event()
+    origin = BlockedSink(release)
+    sink = QueuedSink(origin, 10, 1, FkLogSink())
+    await asyncio.wait_for(sink.send('queue', {}, 'Messages.Created', 1), 0.1)
+    await asyncio.wait_for(origin.started.wait(), 1)
+
+    assert origin.events == []
+
+    release.set()
+    await sink.flush()
+
+    assert origin.events == ['Messages.Created']
+
+
+async def test_drop_on_full_queue() -> None:
+    logger = FkLogSink()
+    sink = QueuedSink(BlockedSink(asyncio.Event()), 2, 0.01, logger)
+    for _ in range(5):
+        await sink.send('queue', {}, 'Messages.Created', 1)
+
+    assert sink.dropped() == 3
+    assert sink.depth() == 2
+    assert logger.stack[-1] == 'ERROR Events queue is full, Messages.Created dropped. Total dropped: 3'
+
+    await sink.flush()
+
+
+async def test_flush() -> None:
+    release = asyncio.Event()
+    release.set()
+    origin = BlockedSink(release)
+    sink = QueuedSink(origin, 10, 1, FkLogSink())
+    await sink.send('queue', {}, 'Messages.Created', 1)
+    await sink.send('queue', {}, 'Button.Pushed', 1)
+    await sink.flush()
+
+    assert origin.events == ['Messages.Created', 'Button.Pushed']
+    assert sink.depth() == 0
+
+
+async def test_flush_timeout() -> None:
+    logger = FkLogSink()
+    sink = QueuedSink(BlockedSink(asyncio.Event()), 10, 0.01, logger)
+    await sink.send('queue', {}, 'Messages.Created', 1)
+    await sink.flush()
+
+    assert logger.stack[-1].startswith('ERROR Events queue not drained')
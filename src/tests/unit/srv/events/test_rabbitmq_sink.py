@@ -0,0 +1,104 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import cast, final, override
+
+import aio_pika
+import pytest
+import ujson
+from aio_pika.abc import AbstractChannel
+
+from app_types.fk_log_sink import FkLogSink
+from srv.events.amqp_channels import AmqpChannels
+from srv.events.cached_schema_validation import CachedSchemaValidation
+from srv.events.rabbitmq_sink import RabbitmqSink
+
+
+@final
+class FkExchange:
+
+    def __init__(self) -> None:
+        self.published: list[tuple[str, dict]] = []
+
+    async def publish(self, message: aio_pika.Message, routing_key: str) -> None:
+        self.published.append((routing_key, ujson.loads(message.body)))
+
+
+@final
+class FkChannel:
+
+    def __init__(self) -> None:
+        self.default_exchange = FkExchange()
+
+
+@final
+class FkAmqpChannels(AmqpChannels):
+
+    def __init__(self) -> None:
+        self.fk_channel = FkChannel()
+        self.borrowed = 0
+
+    @override
+    @asynccontextmanager
+    async def channel(self) -> AsyncIterator[AbstractChannel]:
+        self.borrowed += 1
+        yield cast(AbstractChannel, self.fk_channel)
+
+    @override
+    async def close(self) -> None:
+        """Закрыть соединение."""
+
+
+async def test_send() -> None:
+    channels = FkAmqpChannels()
+    await RabbitmqSink(
+        channels, CachedSchemaValidation(), FkLogSink(),
+    ).send('quranbot.mailings', {}, 'Mailing.DailyAyats', 1)
+    published = channels.fk_channel.default_exchange.published
+
+    assert len(published) == 1
+    assert published[0][0] == 'quranbot.mailings'
+    assert published[0][1]['event_name'] == 'Mailing.DailyAyats'
+
+
+async def test_send_batch_one_channel() -> None:
+    channels = FkAmqpChannels()
+    await RabbitmqSink(
+        channels, CachedSchemaValidation(), FkLogSink(),
+    ).send_batch('quranbot.mailings', [{}, {}, {}], 'Mailing.DailyAyats', 1)
+    published = channels.fk_channel.default_exchange.published
+
+    assert channels.borrowed == 1
+    assert len(published) == 3
+    assert len({event['event_id'] for _, event in published}) == 3
+
+
+@pytest.mark.parametrize('event_name', ['Unknown.Event', 'Mailing.DailyAyats'])
+async def test_invalid_events_not_published(event_name: str) -> None:
+    channels = FkAmqpChannels()
+    await RabbitmqSink(
+        channels, CachedSchemaValidation(), FkLogSink(),
+    ).send('quranbot.mailings', {'unexpected': 1}, event_name, 99)
+
+    assert channels.borrowed == 0
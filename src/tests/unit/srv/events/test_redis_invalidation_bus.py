@@ -0,0 +1,155 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+# flake8: noqa: WPS202
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from typing import final, override
+
+import pytest
+from fakeredis import FakeServer, aioredis
+
+from app_types.fk_log_sink import FkLogSink
+from srv.events.invalidated_cache import InvalidatedCache
+from srv.events.redis_invalidation_bus import RedisInvalidationBus
+
+
+@final
+class MemoryCache(InvalidatedCache):
+
+    def __init__(self) -> None:
+        self.invalidated: list[str] = []
+        self.flushes = 0
+
+    @override
+    async def invalidate(self, key: str) -> None:
+        self.invalidated.append(key)
+
+    @override
+    async def flush(self) -> None:
+        self.flushes += 1
+
+
+@final
+class FailedCache(InvalidatedCache):
+
+    @override
+    async def invalidate(self, key: str) -> None:
+        raise ValueError
+
+    @override
+    async def flush(self) -> None:
+        raise ValueError
+
+
+async def _until(done: Callable[[], bool]) -> None:
+    for _ in range(100):
+        if done():
+            return
+        await asyncio.sleep(0.001)
+
+
+async def _cancelled(listening: asyncio.Task) -> None:
+    listening.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await listening
+
+
+@pytest.fixture()
+async def listened_bus(fake_redis):
+    bus = RedisInvalidationBus(fake_redis, 0.01, FkLogSink())
+    cache = MemoryCache()
+    bus.subscribe('ayats', cache)
+    listening = asyncio.create_task(bus.listen())
+    while not cache.flushes:  # noqa: ASYNC110
+        await asyncio.sleep(0.001)
+    yield bus, cache
+    await _cancelled(listening)
+
+
+async def test_invalidate(listened_bus):
+    bus, cache = listened_bus
+    await bus.publish('ayats', '3067bdc4')
+    await bus.publish('prayers', '1')
+    await _until(lambda: bool(cache.invalidated))
+
+    assert cache.invalidated == ['3067bdc4']
+    assert cache.flushes == 1
+
+
+async def test_reconnect():
+    server = FakeServer()
+    server.connected = False
+    logger = FkLogSink()
+    bus = RedisInvalidationBus(aioredis.FakeRedis(server=server), 0.01, logger)
+    cache = MemoryCache()
+    bus.subscribe('ayats', cache)
+    listening = asyncio.create_task(bus.listen())
+    await asyncio.sleep(0.02)
+    server.connected = True
+    await _until(lambda: bool(cache.flushes))
+    await _cancelled(listening)
+
+    assert cache.flushes == 1
+    assert logger.stack[0].startswith('ERROR Invalidation channel lost')
+
+
+async def test_failed_flush_not_stop_listen(fake_redis):
+    logger = FkLogSink()
+    bus = RedisInvalidationBus(fake_redis, 0.01, logger)
+    cache = MemoryCache()
+    bus.subscribe('ayats', FailedCache())
+    bus.subscribe('ayats', cache)
+    listening = asyncio.create_task(bus.listen())
+    while not cache.flushes:  # noqa: ASYNC110
+        await asyncio.sleep(0.001)
+    await bus.publish('ayats', '3067bdc4')
+    await _until(lambda: bool(cache.invalidated))
+    await _cancelled(listening)
+
+    assert cache.invalidated == ['3067bdc4']
+    assert logger.stack == [
+        'ERROR Fail on flush ayats',
+        'ERROR Fail on invalidate ayats, flush cache',
+        'ERROR Fail on flush ayats',
+    ]
+
+
+async def test_unexpected_message_not_stop_listen(fake_redis):
+    logger = FkLogSink()
+    bus = RedisInvalidationBus(fake_redis, 0.01, logger)
+    cache = MemoryCache()
+    bus.subscribe('ayats', cache)
+    listening = asyncio.create_task(bus.listen())
+    while not cache.flushes:  # noqa: ASYNC110
+        await asyncio.sleep(0.001)
+    await fake_redis.publish(b'quranbot:invalidation:\xff', '1')
+    await _until(lambda: cache.flushes > 1)
+    await bus.publish('ayats', '3067bdc4')
+    await _until(lambda: bool(cache.invalidated))
+    await _cancelled(listening)
+
+    assert cache.flushes == 2
+    assert cache.invalidated == ['3067bdc4']
+    assert logger.stack[0].startswith('ERROR Fail on invalidation channel')
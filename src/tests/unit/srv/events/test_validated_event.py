@@ -0,0 +1,85 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from typing import final, override
+
+import pytest
+from eljson.json import Json
+
+from app_types.fk_log_sink import FkLogSink
+from services.json_path_cache import JsonPathCache
+from srv.events.compiled_paths_json import CompiledPathsJson
+from srv.events.disabled_schema_validation import DisabledSchemaValidation
+from srv.events.recieved_event import ReceivedEvent
+from srv.events.schema_validation import SchemaValidation
+from srv.events.validated_event import ValidatedEvent
+
+JSON_PATHS = JsonPathCache(max_size=10)
+
+
+@final
+class FkEvent(ReceivedEvent):
+
+    def __init__(self) -> None:
+        self.processed: list[str] = []
+
+    @override
+    async def process(self, json_doc: Json) -> None:
+        self.processed.append(json_doc.path('$.event_id')[0])
+
+
+@final
+class SchemaNotFound(SchemaValidation):
+
+    @override
+    def validate(self, event: dict, event_name: str, version: int) -> None:
+        msg = 'Schema file for event {0} version: {1} not found'.format(event_name, version)
+        raise TypeError(msg)
+
+
+@pytest.fixture()
+def event() -> Json:
+    return CompiledPathsJson(
+        {'event_id': 'some-id', 'event_name': 'Unknown.Event', 'event_version': 1},
+        JSON_PATHS,
+    )
+
+
+async def test(event: Json) -> None:
+    origin, invalid = FkEvent(), FkEvent()
+
+    await ValidatedEvent(origin, DisabledSchemaValidation(), invalid, FkLogSink()).process(event)
+
+    assert origin.processed == ['some-id']
+    assert invalid.processed == []
+
+
+async def test_invalid(event: Json) -> None:
+    origin, invalid, logger = FkEvent(), FkEvent(), FkLogSink()
+
+    await ValidatedEvent(origin, SchemaNotFound(), invalid, logger).process(event)
+
+    assert origin.processed == []
+    assert invalid.processed == ['some-id']
+    assert logger.stack == [
+        'ERROR Schema of event: some-id invalid. Schema file for event Unknown.Event version: 1 not found',
+    ]
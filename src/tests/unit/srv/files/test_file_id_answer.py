@@ -22,12 +22,12 @@
 
 from typing import final, override
 
-import httpx
 from pyeo import elegant
 
 from app_types.fk_update import FkUpdate
 from integrations.tg.tg_answers import TgAnswer
 from integrations.tg.tg_answers.fk_answer import FkAnswer
+from integrations.tg.tg_answers.tg_api_request import TgApiRequest
 from srv.files.file_id_answer import TelegramFileIdAnswer
 from srv.files.fk_file import FkFile
 
@@ -39,7 +39,7 @@ class FakeAnswer(TgAnswer):
     @override
     async def build(self, update):
         return [
-            httpx.Request('GET', 'https://some.domain'),
+            TgApiRequest('https://some.domain'),
         ]
 
 
@@ -48,4 +48,4 @@ async def test():
         FkAnswer(), FkFile('file_id', ''),
     ).build(FkUpdate.empty_ctor())
 
-    assert got[0].url.query.decode('utf-8') == 'audio=file_id'
+    assert got[0].fields() == {'audio': 'file_id'}
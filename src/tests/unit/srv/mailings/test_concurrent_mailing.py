@@ -0,0 +1,325 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+# flake8: noqa: WPS202
+
+from collections.abc import AsyncIterator, Sequence
+from typing import final, override
+
+import httpx
+import pytest
+import ujson
+
+from app_types.fk_log_sink import FkLogSink
+from app_types.fk_throttle_stats import FkThrottleStats
+from integrations.tg.aimd_concurrency_limit import AimdConcurrencyLimit
+from integrations.tg.tg_answers import TgAnswer, TgChatIdAnswer, TgMessageAnswer, TgTextAnswer
+from integrations.tg.tg_answers.fk_answer import FkAnswer
+from srv.mailings.concurrent_mailing import ConcurrentMailing
+from srv.mailings.mailing_checkpoint import MailingCheckpoint
+from srv.mailings.mailing_journal import MailingJournal
+from srv.mailings.mailing_messages import MailingMessages
+
+
+@final
+class FkMailingMessages(MailingMessages):
+
+    def __init__(self, chat_ids: list[int]) -> None:
+        self._chat_ids = chat_ids
+
+    @override
+    async def count(self, after: int) -> int:
+        return len([chat_id for chat_id in self._chat_ids if chat_id > after])
+
+    @override
+    async def iterate(self, after: int) -> AsyncIterator[tuple[int, TgAnswer]]:
+        for chat_id in sorted(chat_id for chat_id in self._chat_ids if chat_id > after):
+            answer = TgChatIdAnswer(TgMessageAnswer(FkAnswer()), chat_id)
+            yield chat_id, TgTextAnswer.str_ctor(answer, 'Hello')
+
+
+@final
+class FkMailingJournal(MailingJournal):
+
+    def __init__(self) -> None:
+        self.sent_messages: list[dict] = []
+        self.unsubscribed_chat_ids: list[int] = []
+        self.flushed = False
+
+    @override
+    async def sent(self, responses: list[dict]) -> None:
+        self.sent_messages.extend(responses)
+
+    @override
+    async def unsubscribed(self, chat_id: int) -> None:
+        self.unsubscribed_chat_ids.append(chat_id)
+
+    @override
+    async def flush(self) -> None:
+        self.flushed = True
+
+
+@final
+class FkMailingCheckpoint(MailingCheckpoint):
+
+    def __init__(self, last_chat_id: int) -> None:
+        self._last_chat_id = last_chat_id
+        self.batches: list[list[int]] = []
+
+    @override
+    async def last_chat_id(self) -> int:
+        return self._last_chat_id
+
+    @override
+    async def save(self, chat_ids: Sequence[int]) -> None:
+        self.batches.append(sorted(chat_ids))
+        self._last_chat_id = max(chat_ids, default=self._last_chat_id)
+
+
+def _response(request: httpx.Request) -> httpx.Response:
+    chat_id = ujson.loads(request.content)['chat_id']
+    if chat_id == 3:
+        return httpx.Response(403, json={
+            'ok': False, 'error_code': 403, 'description': 'Forbidden: bot was blocked by the user',
+        })
+    if chat_id == 4:
+        return httpx.Response(400, json={
+            'ok': False, 'error_code': 400, 'description': 'Bad Request: message is too long',
+        })
+    message = {'chat': {'id': chat_id}}
+    return httpx.Response(200, json={'ok': True, 'result': message})
+
+
+def _chat_ids(messages: list[dict]) -> list[int]:
+    return sorted(message['result']['chat']['id'] for message in messages)
+
+
+@pytest.fixture()
+async def mock_client():
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_response)) as client:
+        yield client
+
+
+async def test(mock_client):
+    journal = FkMailingJournal()
+    log_sink = FkLogSink()
+    await ConcurrentMailing(
+        'Test',
+        FkMailingMessages(list(range(1, 11))),
+        journal,
+        FkMailingCheckpoint(0),
+        FkAnswer(),
+        mock_client,
+        FkThrottleStats(),
+        [100],
+        AimdConcurrencyLimit(1, 100, 1, 3),
+        5,
+        log_sink,
+    ).send()
+
+    assert _chat_ids(journal.sent_messages) == [1, 2, *range(5, 11)]
+    assert journal.unsubscribed_chat_ids == [3]
+    assert journal.flushed
+    assert all(
+        line in log_sink.stack[-1]
+        for line in (
+            'Доставлено: 8, отписались: 1, ошибок: 1',
+            'Ожидали лимитов телеграма: 0 (0.0 сек.), повторов после 429: 0',
+            'Bad Request: message is too long: 1',
+        )
+    )
+
+
+async def test_admin_report():
+    requests: list[dict] = []
+
+    def _responder(request: httpx.Request) -> httpx.Response:  # noqa: WPS430
+        requests.append(ujson.loads(request.content))
+        return httpx.Response(200, json={'ok': True, 'result': {}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_responder)) as client:
+        await ConcurrentMailing(
+            'Test',
+            FkMailingMessages([1]),
+            FkMailingJournal(),
+            FkMailingCheckpoint(0),
+            FkAnswer(),
+            client,
+            FkThrottleStats(),
+            [100, 101],
+            AimdConcurrencyLimit(1, 100, 1, 1),
+            10,
+            FkLogSink(),
+        ).send()
+
+    assert [request['chat_id'] for request in requests] == [1, 100, 101]
+    assert requests[1]['text'].startswith('Рассылка "Test" завершена')
+
+
+async def test_resume(mock_client):
+    journal = FkMailingJournal()
+    checkpoint = FkMailingCheckpoint(4)
+    await ConcurrentMailing(
+        'Test',
+        FkMailingMessages(list(range(1, 11))),
+        journal,
+        checkpoint,
+        FkAnswer(),
+        mock_client,
+        FkThrottleStats(),
+        [],
+        AimdConcurrencyLimit(1, 100, 1, 2),
+        4,
+        FkLogSink(),
+    ).send()
+
+    assert _chat_ids(journal.sent_messages) == [5, 6, 7, 8, 9, 10]
+    assert checkpoint.batches == [[5, 6, 7, 8], [9, 10]]
+
+
+@final
+class BrokenMailingJournal(MailingJournal):
+
+    def __init__(self, broken_chat_id: int) -> None:
+        self._broken_chat_id = broken_chat_id
+        self.sent_messages: list[dict] = []
+
+    @override
+    async def sent(self, responses: list[dict]) -> None:
+        if responses[0]['result']['chat']['id'] == self._broken_chat_id:
+            raise OSError
+        self.sent_messages.extend(responses)
+
+    @override
+    async def unsubscribed(self, chat_id: int) -> None:
+        raise OSError
+
+    @override
+    async def flush(self) -> None:
+        """Nothing to flush."""
+
+
+async def test_journal_failure(mock_client):
+    journal = BrokenMailingJournal(2)
+    log_sink = FkLogSink()
+    await ConcurrentMailing(
+        'Test',
+        FkMailingMessages(list(range(1, 11))),
+        journal,
+        FkMailingCheckpoint(0),
+        FkAnswer(),
+        mock_client,
+        FkThrottleStats(),
+        [],
+        AimdConcurrencyLimit(1, 100, 1, 3),
+        5,
+        log_sink,
+    ).send()
+
+    assert _chat_ids(journal.sent_messages) == [1, 5, 6, 7, 8, 9, 10]
+    assert 'ERROR Fail journal mailing message to 2' in log_sink.stack
+    assert 'ERROR Fail journal mailing message to 3' in log_sink.stack
+    assert 'Доставлено: 8, отписались: 1, ошибок: 1' in log_sink.stack[-1]
+
+
+async def test_progress_lines(mock_client, monkeypatch):
+    monkeypatch.setattr('srv.mailings.concurrent_mailing.REPORT_EVERY', 2)
+    log_sink = FkLogSink()
+    await ConcurrentMailing(
+        'Test',
+        FkMailingMessages(list(range(1, 11))),
+        FkMailingJournal(),
+        FkMailingCheckpoint(0),
+        FkAnswer(),
+        mock_client,
+        FkThrottleStats(),
+        [],
+        AimdConcurrencyLimit(1, 100, 1, 3),
+        5,
+        log_sink,
+    ).send()
+
+    assert len([line for line in log_sink.stack if line.startswith('INFO Mailing "Test" progress')]) == 5
+
+
+async def test_too_many_requests_decrease_limit():
+    sent: list[int] = []
+
+    def _responder(request: httpx.Request) -> httpx.Response:  # noqa: WPS430
+        sent.append(ujson.loads(request.content)['chat_id'])
+        return httpx.Response(429, json={'ok': False, 'error_code': 429, 'description': 'Too Many Requests'})
+
+    limit = AimdConcurrencyLimit(1, 100, 10, 4)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_responder)) as client:
+        await ConcurrentMailing(
+            'Test',
+            FkMailingMessages(list(range(1, 11))),
+            FkMailingJournal(),
+            FkMailingCheckpoint(0),
+            FkAnswer(),
+            client,
+            FkThrottleStats(),
+            [],
+            limit,
+            10,
+            FkLogSink(),
+        ).send()
+
+    assert limit.current() == 2
+    assert sorted(sent) == list(range(1, 11))
+
+
+@final
+class UnflushedMailingJournal(MailingJournal):
+
+    @override
+    async def sent(self, responses: list[dict]) -> None:
+        """Nothing to remember."""
+
+    @override
+    async def unsubscribed(self, chat_id: int) -> None:
+        """Nothing to remember."""
+
+    @override
+    async def flush(self) -> None:
+        raise OSError
+
+
+async def test_journal_flush_failure(mock_client):
+    checkpoint = FkMailingCheckpoint(0)
+    log_sink = FkLogSink()
+    await ConcurrentMailing(
+        'Test',
+        FkMailingMessages(list(range(1, 7))),
+        UnflushedMailingJournal(),
+        checkpoint,
+        FkAnswer(),
+        mock_client,
+        FkThrottleStats(),
+        [],
+        AimdConcurrencyLimit(1, 100, 1, 3),
+        3,
+        log_sink,
+    ).send()
+
+    assert checkpoint.batches == [[1, 2, 3], [4, 5, 6], []]
+    assert log_sink.stack.count('ERROR Fail flush mailing "Test" journal') == 3
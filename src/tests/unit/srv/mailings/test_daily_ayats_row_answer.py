@@ -0,0 +1,65 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import ujson
+
+from app_types.fk_update import FkUpdate
+from integrations.tg.tg_answers.fk_answer import FkAnswer
+from srv.mailings.daily_ayats_row_answer import DailyAyatsRowAnswer
+from srv.mailings.pg_day_ayats_text import DAILY_AYATS_TEMPLATE
+from srv.mailings.text_row_answer import TextRowAnswer
+
+
+async def test() -> None:
+    text = DAILY_AYATS_TEMPLATE.render({
+        'ayats': [
+            {'sura_id': 1, 'ayat_number': '1', 'content': 'First ayat content'},
+            {'sura_id': 1, 'ayat_number': '2', 'content': 'Second ayat content'},
+        ],
+        'sura_link': '/sura-1',
+    })
+    got = await DailyAyatsRowAnswer(
+        FkAnswer(), {1: text, 2: 'another day'}, TextRowAnswer(FkAnswer(), 'missing day'),
+    ).answer(
+        {'chat_id': 358610865, 'day': 1},  # type: ignore [arg-type]
+    ).build(FkUpdate.empty_ctor())
+
+    assert ujson.loads(got[0].httpx_request().content) == {
+        'chat_id': 358610865,
+        'text': '<b>1:1)</b> First ayat content\n<b>1:2)</b> Second ayat content\n\nhttps://umma.ru/sura-1',
+        'parse_mode': 'html',
+        'link_preview_options': '{"is_disabled":true}',
+    }
+
+
+async def test_missing_day() -> None:
+    got = await DailyAyatsRowAnswer(
+        FkAnswer(), {1: 'first day'}, TextRowAnswer(FkAnswer(), 'missing day'),
+    ).answer(
+        {'chat_id': 358610865, 'day': 3},  # type: ignore [arg-type]
+    ).build(FkUpdate.empty_ctor())
+
+    assert ujson.loads(got[0].httpx_request().content) == {
+        'chat_id': 358610865,
+        'text': 'missing day',
+        'parse_mode': 'html',
+    }
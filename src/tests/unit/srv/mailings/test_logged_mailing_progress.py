@@ -0,0 +1,39 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from app_types.fk_log_sink import FkLogSink
+from srv.mailings.logged_mailing_progress import LoggedMailingProgress
+from srv.mailings.timed_mailing_progress import TimedMailingProgress
+
+
+def test():
+    log_sink = FkLogSink()
+    progress = LoggedMailingProgress(TimedMailingProgress(10), 'Test', 2, log_sink)
+    progress.sent()
+    progress.unsubscribed()
+    progress.failed('Bad Request')
+    progress.limited(1, 0.5, 0)
+    progress.sent()
+
+    assert progress.processed() == 4
+    assert len(log_sink.stack) == 2
+    assert all(line.startswith('INFO Mailing "Test" progress:') for line in log_sink.stack)
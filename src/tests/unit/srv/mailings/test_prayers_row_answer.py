@@ -0,0 +1,79 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import uuid
+
+import pytest
+import ujson
+
+from app_types.fk_update import FkUpdate
+from integrations.tg.tg_answers.fk_answer import FkAnswer
+from srv.mailings.prayers_row_answer import PrayersRowAnswer
+from srv.mailings.text_row_answer import TextRowAnswer
+
+
+async def test() -> None:
+    city_id = uuid.UUID('e22d9142-a39b-4e99-92f7-2082766f0987')
+    got = await PrayersRowAnswer(
+        FkAnswer(),
+        {city_id: 'Время намаза для г. Kazan'},
+        {
+            (358610865, city_id): [
+                {'prayer_at_user_id': 1, 'is_read': False}, {'prayer_at_user_id': 2, 'is_read': True},
+            ],
+        },
+        TextRowAnswer(FkAnswer(), 'missing'),
+    ).answer(
+        {'chat_id': 358610865, 'city_id': city_id},  # type: ignore [arg-type]
+    ).build(FkUpdate.empty_ctor())
+
+    assert ujson.loads(got[0].httpx_request().content) == {
+        'chat_id': 358610865,
+        'text': 'Время намаза для г. Kazan',
+        'parse_mode': 'html',
+        'reply_markup': ujson.dumps({
+            'inline_keyboard': [[
+                {'text': '❌', 'callback_data': 'mark_readed(1)'},
+                {'text': '✅', 'callback_data': 'mark_not_readed(2)'},
+            ]],
+        }),
+    }
+
+
+@pytest.mark.parametrize('row', [
+    {'chat_id': 358610865, 'city_id': uuid.UUID('3e1e4a5c-0a5d-4b8a-9a6f-8a3a1c9b6d2e')},
+    {'chat_id': 206497847, 'city_id': uuid.UUID('e22d9142-a39b-4e99-92f7-2082766f0987')},
+])
+async def test_missing(row) -> None:
+    city_id = uuid.UUID('e22d9142-a39b-4e99-92f7-2082766f0987')
+    got = await PrayersRowAnswer(
+        FkAnswer(),
+        {city_id: 'Время намаза для г. Kazan'},
+        {(358610865, city_id): [{'prayer_at_user_id': 1, 'is_read': False}]},
+        TextRowAnswer(FkAnswer(), 'missing'),
+    ).answer(row).build(FkUpdate.empty_ctor())
+
+    assert ujson.loads(got[0].httpx_request().content) == {
+        'chat_id': row['chat_id'],
+        'text': 'missing',
+        'parse_mode': 'html',
+    }
@@ -0,0 +1,41 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+from srv.mailings.timed_mailing_progress import TimedMailingProgress
+
+
+def test():
+    progress = TimedMailingProgress(10)
+    progress.sent()
+    progress.sent()
+    progress.unsubscribed()
+    progress.failed('Bad Request: message is too long')
+    progress.limited(1, 0.5, 0)
+    progress.limited(1, 1, 1)
+
+    got = progress.report()
+
+    assert progress.processed() == 4
+    assert 'Обработано: 4/10' in got
+    assert 'Доставлено: 2, отписались: 1, ошибок: 1' in got
+    assert 'Ожидали лимитов телеграма: 2 (1.5 сек.), повторов после 429: 1' in got
+    assert 'Bad Request: message is too long: 1' in got
@@ -23,13 +23,12 @@
 import uuid
 from typing import override
 
-import httpx
-
 from app_types.fk_update import FkUpdate
 from app_types.update import Update
 from exceptions.content_exceptions import CityNotSupportedError
 from integrations.tg.tg_answers import TgAnswer
 from integrations.tg.tg_answers.fk_answer import FkAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.prayers.change_city_answer import ChangeCityAnswer
 from srv.prayers.city_not_supported_answer import CityNotSupportedAnswer
 from srv.prayers.fk_city import FkCity
@@ -39,7 +38,7 @@ from srv.prayers.fk_updated_user_city import FkUpdateUserCity
 class _Answer(TgAnswer):
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         raise CityNotSupportedError
 
 
@@ -50,10 +49,10 @@ async def test():
         FkCity(uuid.uuid4(), 'Казань'),
     ).build(FkUpdate.empty_ctor())
 
-    assert got[0].url.params['text'] == 'Вам будет приходить время намаза для города Казань'
+    assert got[0].fields()['text'] == 'Вам будет приходить время намаза для города Казань'
 
 
 async def test_city_not_supported():
     got = await CityNotSupportedAnswer(_Answer(), FkAnswer()).build(FkUpdate.empty_ctor())
 
-    assert got[0].url.params['text'] == 'Этот город не поддерживается'
+    assert got[0].fields()['text'] == 'Этот город не поддерживается'
@@ -22,7 +22,6 @@
 
 from typing import override
 
-import httpx
 import ujson
 
 from app_types.fk_log_sink import FkLogSink
@@ -31,6 +30,7 @@ from app_types.update import Update
 from exceptions.content_exceptions import UserHasNotCityIdError
 from integrations.tg.tg_answers import TgAnswer
 from integrations.tg.tg_answers.fk_answer import FkAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.prayers.invite_set_city_answer import InviteSetCityAnswer
 from srv.prayers.user_without_city_safe_answer import UserWithoutCitySafeAnswer
 
@@ -38,14 +38,14 @@ from srv.prayers.user_without_city_safe_answer import UserWithoutCitySafeAnswer
 class FkOrigin(TgAnswer):
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         raise UserHasNotCityIdError
 
 
 async def test_exception():
     got = await UserWithoutCitySafeAnswer(FkOrigin(), FkAnswer()).build(FkUpdate.empty_ctor())
 
-    assert got[0].url == 'https://some.domain'
+    assert got[0].httpx_request().url == 'https://some.domain'
 
 
 async def test_invite_set_city_answer(fake_redis):
@@ -53,7 +53,7 @@ async def test_invite_set_city_answer(fake_redis):
         FkAnswer(), fake_redis, FkLogSink(),
     ).build(FkUpdate('{"chat":{"id":1}}'))
 
-    assert got[0].url.params['reply_markup'] == ujson.dumps({
+    assert got[0].fields()['reply_markup'] == ujson.dumps({
         'inline_keyboard': [[
             {'text': 'Поиск города', 'switch_inline_query_current_chat': ''},
         ]],
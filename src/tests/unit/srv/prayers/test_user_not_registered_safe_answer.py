@@ -22,13 +22,12 @@
 
 from typing import final, override
 
-import httpx
-
 from app_types.fk_update import FkUpdate
 from app_types.update import Update
 from exceptions.internal_exceptions import UserNotFoundError
 from integrations.tg.tg_answers import TgAnswer
 from integrations.tg.tg_answers.fk_answer import FkAnswer
+from integrations.tg.tg_answers.tg_request import TgRequest
 from srv.prayers.user_not_registered_safe_answer import UserNotRegisteredSafeAnswer
 from srv.users.fk_new_user import FkNewUser
 
@@ -41,7 +40,7 @@ class UserNotFoundAnswer(TgAnswer):
         self._counter = 0
 
     @override
-    async def build(self, update: Update) -> list[httpx.Request]:
+    async def build(self, update: Update) -> list[TgRequest]:
         if self._counter == 0:
             self._counter += 1
             raise UserNotFoundError
@@ -54,7 +53,7 @@ async def test():
         FkAnswer(),
     ).build(FkUpdate.empty_ctor())
 
-    assert got[0].url == 'https://some.domain'
+    assert got[0].httpx_request().url == 'https://some.domain'
 
 
 async def test_user_not_found():
@@ -63,4 +62,4 @@ async def test_user_not_found():
         UserNotFoundAnswer(FkAnswer()),
     ).build(FkUpdate.empty_ctor())
 
-    assert got[0].url == 'https://some.domain'
+    assert got[0].httpx_request().url == 'https://some.domain'
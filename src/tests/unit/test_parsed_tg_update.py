@@ -0,0 +1,101 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+# flake8: noqa: WPS202
+
+import jsonpath_ng
+import pytest
+import ujson
+from pytest_lazy_fixtures import lf
+
+from app_types.parsed_tg_update import ParsedTgUpdate
+from settings import BASE_DIR
+
+
+@pytest.fixture()
+def message_update(message_update_factory):
+    return message_update_factory('hello', 358610865)
+
+
+@pytest.fixture()
+def callback_update(callback_update_factory):
+    return callback_update_factory(chat_id=358610865, callback_data='getAyat(1)')
+
+
+@pytest.fixture()
+def inline_query_update(inline_query_update_factory):
+    return inline_query_update_factory('Казань')
+
+
+@pytest.fixture()
+def coordinates_update():
+    return (BASE_DIR / 'tests' / 'fixtures' / 'coordinates.json').read_text()
+
+
+@pytest.mark.parametrize('raw_update', [
+    lf('message_update'),
+    lf('callback_update'),
+    lf('inline_query_update'),
+    lf('coordinates_update'),
+])
+@pytest.mark.parametrize(('attribute', 'json_path'), [
+    ('update_id', '$..update_id'),
+    ('chat_id', '$..chat.id'),
+    ('from_id', '$..from.id'),
+    ('message_id', '$..message.message_id'),
+    ('message_text', '$..message.text'),
+    ('message_audio', '$..message.audio'),
+    ('callback_query_data', '$..callback_query.data'),
+    ('inline_query_id', '$..inline_query.id'),
+    ('inline_query', '$..query'),
+    ('latitude', '$..[latitude]'),
+    ('longitude', '$..[longitude]'),
+    ('date', '$..date'),
+])
+def test_same_as_json_path(raw_update, attribute, json_path):
+    update_dict = ujson.loads(raw_update)
+    match = jsonpath_ng.parse(json_path).find(update_dict)
+
+    expected = match[0].value if match else None
+
+    got = getattr(ParsedTgUpdate.dict_ctor(update_dict), attribute)
+
+    assert got == expected
+
+
+def test_callback_query(callback_update, message_update):
+    assert ParsedTgUpdate.dict_ctor(ujson.loads(callback_update)).is_callback_query
+    assert not ParsedTgUpdate.dict_ctor(ujson.loads(message_update)).is_callback_query
+
+
+def test_callback_query_word_in_text(message_update_factory):
+    got = ParsedTgUpdate.dict_ctor(ujson.loads(message_update_factory('callback_query')))
+
+    assert not got.is_callback_query
+    assert got.message_text == 'callback_query'
+
+
+def test_message_audio():
+    got = ParsedTgUpdate.dict_ctor({'callback_query': {'message': {'audio': {'file_id': 'file-id'}}}})
+
+    assert got.message_audio == {'file_id': 'file-id'}
+    assert got.message_text is None
@@ -0,0 +1,41 @@
+# The MIT License (MIT).
+#
+# Copyright (c) 2018-2024 Almaz Ilaletdinov <a.ilaletdinov@yandex.ru>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+# OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from handlers.podcast_message_text_not_exists_safe_answer import PodcastMessageTextNotExistsSafeAnswer
+from integrations.tg.tg_answers.fk_answer import FkAnswer
+from integrations.tg.update import TgUpdate
+
+
+@pytest.mark.parametrize(('update', 'expected'), [
+    ({'callback_query': {'message': {'text': 'podcast'}}}, 'https://edited.domain'),
+    ({'callback_query': {'message': {'audio': {'file_id': 'file-id'}}}}, 'https://edited.domain'),
+    ({'callback_query': {'message': {'message_id': 1}}}, 'https://new.domain'),
+])
+async def test(update, expected):
+    got = await PodcastMessageTextNotExistsSafeAnswer(
+        FkAnswer('https://edited.domain'),
+        FkAnswer('https://new.domain'),
+    ).build(TgUpdate(update))
+
+    assert str(got[0].httpx_request().url).startswith(expected)
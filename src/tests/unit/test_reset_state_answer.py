@@ -52,9 +52,10 @@ async def test_origin_answer_not_modificated(fake_redis):
         FkAnswer(),
         RedisUserState(fake_redis, 123, FkLogSink()),
     ).build(TgUpdate({'from': {'id': 123}}))
-    origin = (await FkAnswer().build(FkUpdate.empty_ctor()))[0].url
+    origin = (await FkAnswer().build(FkUpdate.empty_ctor()))[0]
 
-    assert got[0].url == origin
+    assert got[0].httpx_request().url == origin.httpx_request().url
+    assert got[0].fields() == origin.fields()
 
 
 async def test_read_cached(fake_redis):